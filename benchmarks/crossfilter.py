@@ -0,0 +1,83 @@
+"""
+Crossfilter brushing cost
+=========================
+
+Time to move one brush of a ``Crossfilter`` with three linked scatter plots and three histograms of a table with
+six columns. Every step moves the brush on one column by a small amount while the other columns are filtered. The
+incremental engine is compared to recomputing the boolean masks of all filters and writing the alpha of every row
+of every view, which is what linking selectors with event handlers does. Nothing is rendered, the time includes
+marking the changed parts of the buffers for upload.
+
+Usage::
+
+    python benchmarks/crossfilter.py --rows 10000000
+"""
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+
+import fastplotlib as fpl
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--steps", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    names = list("abcdef")
+    table = {name: rng.normal(size=args.rows).astype(np.float32) for name in names}
+
+    figure = fpl.Figure(shape=(2, 3))
+
+    t0 = perf_counter()
+    crossfilter = fpl.Crossfilter(table)
+    views = list()
+    for i in range(3):
+        x, y = names[2 * i], names[2 * i + 1]
+        scatter = figure[0, i].add_scatter(
+            np.column_stack([table[x], table[y]]), sizes=1
+        )
+        crossfilter.add_view(scatter)
+        views.append(scatter)
+        crossfilter.add_histogram(names[i], figure[1, i])
+
+    # filters on the other columns
+    for name in names[1:]:
+        crossfilter.filter_range(name, (-2, 2))
+    crossfilter.filter_range("a", (-1, 0))
+    t_setup = perf_counter() - t0
+
+    # brush on "a" moving by 0.1% of the standard deviation per step
+    t_incremental = list()
+    for step in range(args.steps):
+        lo = -1 + step * 0.001
+        t0 = perf_counter()
+        crossfilter.filter_range("a", (lo, lo + 1))
+        t_incremental.append(perf_counter() - t0)
+
+    t_naive = list()
+    for step in range(min(args.steps, 5)):
+        lo = -1 + step * 0.001
+        t0 = perf_counter()
+        mask = (table["a"] >= lo) & (table["a"] <= lo + 1)
+        for name in names[1:]:
+            mask &= (table[name] >= -2) & (table[name] <= 2)
+        alpha = np.where(mask, 1.0, 0.1)
+        for scatter in views:
+            scatter.colors.value[:, 3] = alpha
+            scatter.colors.buffer.update_full()
+        for name in names[:3]:
+            np.histogram(table[name][mask], bins=100)
+        t_naive.append(perf_counter() - t0)
+
+    print(f"rows: {args.rows}, setup and sort: {t_setup:.2f} s")
+    print(f"incremental brush step: {np.median(t_incremental) * 1e3:.2f} ms")
+    print(f"recomputed brush step: {np.median(t_naive) * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+LineCollection construction time
+================================
+
+Time to construct a ``LineCollection`` and ``LineStack`` from a ``[n_lines, n_points]`` array, for the default
+collection of ``LineGraphic`` and for a packed collection. Nothing is rendered, this only measures construction.
+
+Usage::
+
+    python benchmarks/line_collection_construction.py --n-points 100 --max-lines 100000
+
+The default collections are only timed up to ``--max-lines-default`` lines since they create one
+``LineGraphic`` per line and become very slow.
+"""
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+
+import fastplotlib as fpl
+
+
+def time_construction(cls, data, repeats: int, **kwargs) -> float:
+    """minimum time in seconds over ``repeats`` constructions"""
+    times = list()
+    for i in range(repeats):
+        t0 = perf_counter()
+        collection = cls(data, **kwargs)
+        times.append(perf_counter() - t0)
+        del collection
+
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--n-points", type=int, default=100, help="points per line")
+    parser.add_argument("--max-lines", type=int, default=100_000)
+    parser.add_argument("--max-lines-default", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    n_lines = [n for n in (100, 1_000, 10_000, 100_000) if n <= args.max_lines]
+
+    rng = np.random.default_rng(0)
+
+    print(
+        f"{'n_lines':>8} {'collection':>12} {'cmap':>8} {'default (s)':>12} {'packed (s)':>12}"
+    )
+
+    for n in n_lines:
+        data = rng.standard_normal((n, args.n_points)).astype(np.float32)
+
+        for cls in (fpl.LineCollection, fpl.LineStack):
+            for cmap in (None, "viridis"):
+                if n <= args.max_lines_default:
+                    t_default = time_construction(cls, data, args.repeats, cmap=cmap)
+                    t_default = f"{t_default:12.4f}"
+                else:
+                    t_default = f"{'-':>12}"
+
+                t_packed = time_construction(
+                    cls, data, args.repeats, cmap=cmap, packed=True
+                )
+
+                print(
+                    f"{n:>8} {cls.__name__:>12} {str(cmap):>8} {t_default} {t_packed:12.4f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Nearest line hover cost
+=======================
+
+Time to find the line nearest to the pointer in a ``LineCollection`` of many traces, which is the work done for
+every pointer move by the ``"pointer_nearest"`` event. ``LineCollection.nearest`` queries a BVH of the line
+segments, it is compared to computing the distance to every segment with numpy. The time to build the BVH on the
+first query and to refit it after the data of one line changes is also reported.
+
+Usage::
+
+    python benchmarks/line_collection_nearest.py --lines 10000 --points 1000
+"""
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+
+import fastplotlib as fpl
+
+
+def brute_force_nearest(xy: np.ndarray, point: np.ndarray) -> int:
+    """index of the nearest segment of [n_lines, n_points, 2] lines"""
+    a, b = xy[:, :-1], xy[:, 1:]
+    v, w = b - a, point - a
+    t = np.clip((w * v).sum(axis=-1) / (v * v).sum(axis=-1), 0, 1)
+    d = ((w - t[..., None] * v) ** 2).sum(axis=-1)
+    return int(np.nanargmin(d))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--lines", type=int, default=10_000)
+    parser.add_argument("--points", type=int, default=1000)
+    parser.add_argument("--moves", type=int, default=200)
+    parser.add_argument(
+        "--unpacked", action="store_true", help="one LineGraphic per line"
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    xs = np.arange(args.points, dtype=np.float32)
+    ys = np.sin(xs / 50) + rng.normal(size=(args.lines, args.points)) * 0.1
+    data = np.stack([np.broadcast_to(xs, ys.shape), ys], axis=-1).astype(np.float32)
+
+    figure = fpl.Figure()
+    lines = figure[0, 0].add_line_stack(data, separation=1, packed=not args.unpacked)
+
+    # pointer positions within the stack
+    bbox = lines._fpl_bounding_box()
+    pointer = rng.uniform(bbox[0, :2], bbox[1, :2], size=(args.moves, 2))
+
+    t0 = perf_counter()
+    lines.nearest(pointer[0])
+    t_build = perf_counter() - t0
+
+    t_bvh = list()
+    for p in pointer:
+        t0 = perf_counter()
+        lines.nearest(p)
+        t_bvh.append(perf_counter() - t0)
+
+    # the positions with the offsets of the stack applied
+    offsets = lines.offsets[:, None, :2].astype(np.float32)
+    stacked = data + offsets
+
+    t_brute = list()
+    for p in pointer[:5]:
+        t0 = perf_counter()
+        brute_force_nearest(stacked, p)
+        t_brute.append(perf_counter() - t0)
+
+    t_refit = list()
+    for i in range(5):
+        line = lines[int(rng.integers(args.lines))]
+        line.data[:, 1] = line.data[:, 1] + 0.1
+        t0 = perf_counter()
+        lines.nearest(pointer[i])
+        t_refit.append(perf_counter() - t0)
+
+    print(
+        f"lines: {args.lines}, points per line: {args.points}, "
+        f"{'unpacked' if args.unpacked else 'packed'}"
+    )
+    print(f"BVH build on the first query: {t_build:.2f} s")
+    print(f"BVH query per pointer move: {np.median(t_bvh) * 1e3:.3f} ms")
+    print(f"brute force per pointer move: {np.median(t_brute) * 1e3:.1f} ms")
+    print(
+        f"query after changing the data of one line: {np.median(t_refit) * 1e3:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Selector event handling cost
+============================
+
+Time spent handling pointer events and render cycles with many ``LinearRegionSelector`` on one subplot, for
+example one selector per trial. Events are dispatched through the renderer the same way as canvas events, but
+without a target, i.e. the pointer is not over any selector. One selector is dragged while the pointer moves.
+Nothing is rendered, only the event handlers and the animation functions of the subplot are timed.
+
+Usage::
+
+    python benchmarks/selector_events.py --max-selectors 1000
+"""
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+import pygfx
+
+import fastplotlib as fpl
+
+
+def time_per_call(func, repeats: int) -> float:
+    """minimum time in microseconds of ``func()`` over ``repeats`` calls"""
+    times = list()
+    for i in range(repeats):
+        t0 = perf_counter()
+        func()
+        times.append(perf_counter() - t0)
+
+    return min(times) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--max-selectors", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    n_selectors = [n for n in (1, 10, 100, 200, 1000) if n <= args.max_selectors]
+
+    print(
+        f"{'selectors':>10} {'idle move (us)':>15} {'drag move (us)':>15} {'key (us)':>10} {'frame (us)':>11}"
+    )
+
+    for n in n_selectors:
+        figure = fpl.Figure()
+        subplot = figure[0, 0]
+
+        line = subplot.add_line(np.column_stack([np.arange(1000), np.zeros(1000)]))
+        selectors = [
+            line.add_linear_region_selector(selection=(i, i + 1)) for i in range(n)
+        ]
+
+        renderer = subplot.renderer
+        x, y = subplot.viewport.rect[:2]
+
+        def pointer_move():
+            renderer.dispatch_event(
+                pygfx.PointerEvent("pointer_move", x=x + 10, y=y + 10)
+            )
+
+        def key():
+            renderer.dispatch_event(pygfx.KeyboardEvent("key_down", key="ArrowLeft"))
+            renderer.dispatch_event(pygfx.KeyboardEvent("key_up", key="ArrowLeft"))
+
+        def frame():
+            subplot._call_animate_functions(subplot._animate_funcs_pre)
+
+        t_idle = time_per_call(pointer_move, args.repeats)
+
+        # same state as a pointer press on the fill of the first selector
+        selectors[0]._move_start(
+            selectors[0].fill, pygfx.PointerEvent("pointer_down", x=x, y=y)
+        )
+        t_drag = time_per_call(pointer_move, args.repeats)
+        renderer.dispatch_event(pygfx.PointerEvent("pointer_up", x=x, y=y))
+
+        t_key = time_per_call(key, args.repeats)
+        t_frame = time_per_call(frame, args.repeats)
+
+        print(f"{n:>10} {t_idle:15.1f} {t_drag:15.1f} {t_key:10.1f} {t_frame:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 Highlight nearest circle
 ========================
 
-Shows how to use the "pointer_move" event to get the nearest circle and highlight it.
+Shows how to use the "pointer_nearest" event of a line collection to highlight the circle nearest to the pointer.
 
 """
 
@@ -28,26 +28,30 @@ circles = list()
 for center in product(range(0, spatial_dims[0], 15), range(0, spatial_dims[1], 15)):
     circles.append(make_circle(center, 5, n_points=75))
 
-pos_xy = np.vstack(circles)
-
 figure = fpl.Figure(size=(700, 560))
 
 line_collection = figure[0, 0].add_line_collection(circles, colors="w", thickness=5)
 
 
-@figure.renderer.add_event_handler("pointer_move")
+highlighted = None
+
+
+# the "pointer_nearest" event is emitted by the line nearest to the pointer every time the pointer moves,
+# the nearest line is found using a spatial index of the line segments
+@line_collection.add_event_handler("pointer_nearest")
 def highlight_nearest(ev: pygfx.PointerEvent):
-    line_collection.colors = "w"
+    global highlighted
 
-    pos = figure[0, 0].map_screen_to_world(ev)
-    if pos is None:
+    nearest = ev.graphic
+    if nearest is highlighted:
         return
 
-    # get_nearest_graphics() is a helper function
-    # sorted the passed array or collection of graphics from nearest to furthest from the passed `pos`
-    nearest = fpl.utils.get_nearest_graphics(pos, line_collection)[0]
+    # only the previous and the new nearest lines are recolored
+    if highlighted is not None:
+        highlighted.colors = "w"
 
     nearest.colors = "r"
+    highlighted = nearest
 
 
 # remove clutter
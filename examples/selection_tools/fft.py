@@ -50,8 +50,10 @@ iw.figure["not-selected"].graphics[0].vmin, iw.figure["not-selected"].graphics[0
 
 iw.show()
 
-# create a rectangle selector
-rs = iw.managed_graphics[1].add_rectangle_selector(edge_color="w", edge_thickness=2.0)
+# create a rectangle selector, the FFTs are recomputed at most once per frame while it is dragged
+rs = iw.managed_graphics[1].add_rectangle_selector(
+    edge_color="w", edge_thickness=2.0, event_policy="per_frame"
+)
 
 
 @rs.add_event_handler("selection")
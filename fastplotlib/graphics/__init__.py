@@ -1,16 +1,19 @@
 from ._base import Graphic
 from .line import LineGraphic
+from .line_segments import LineSegmentsGraphic
 from .scatter import ScatterGraphic
 from .image import ImageGraphic
 from .text import TextGraphic
-from .line_collection import LineCollection, LineStack
+from .line_collection import LineCollection, LineStack, PackedLine
 
 
 __all__ = [
     "LineGraphic",
+    "LineSegmentsGraphic",
     "ScatterGraphic",
     "ImageGraphic",
     "TextGraphic",
     "LineCollection",
     "LineStack",
+    "PackedLine",
 ]
@@ -462,7 +462,7 @@ class Axes:
 
         else:
             # set ruler start and end positions based on scene bbox
-            bbox = self._plot_area._fpl_graphics_scene.get_world_bounding_box()
+            bbox = self._plot_area._fpl_scene_bounds()
 
         if self.intersection is None:
             if self._plot_area.camera.fov == 0:
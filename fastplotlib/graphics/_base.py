@@ -33,6 +33,40 @@ HexStr: TypeAlias = str
 WORLD_OBJECTS: dict[HexStr, pygfx.WorldObject] = dict()  #: {hex id str: WorldObject}
 
 
+def union_bounding_boxes(boxes: list[np.ndarray | None]) -> np.ndarray | None:
+    """union of [2, 3] bounding boxes, ``None`` boxes are ignored"""
+    boxes = [b for b in boxes if b is not None]
+
+    if len(boxes) == 0:
+        return None
+
+    boxes = np.stack(boxes)
+
+    return np.array([boxes[:, 0].min(axis=0), boxes[:, 1].max(axis=0)])
+
+
+class BoundingBoxUnion:
+    """
+    Cached union of bounding boxes, only recomputed when one of the boxes is a different array. The bounding
+    boxes of graphics are cached and a new array is only created when a bounding box changes.
+    """
+
+    def __init__(self):
+        self._boxes: list[np.ndarray | None] = list()
+        self._bbox: np.ndarray | None = None
+
+    def __call__(self, boxes: list[np.ndarray | None]) -> np.ndarray | None:
+        if len(boxes) == len(self._boxes) and all(
+            a is b for a, b in zip(boxes, self._boxes)
+        ):
+            return self._bbox
+
+        self._boxes = boxes
+        self._bbox = union_bounding_boxes(boxes)
+
+        return self._bbox
+
+
 PYGFX_EVENTS = [
     "key_down",
     "key_up",
@@ -59,6 +93,7 @@ class Graphic:
             .replace("graphic", "")
             .replace("collection", "_collection")
             .replace("stack", "_stack")
+            .replace("segments", "_segments")
         )
 
         # set of all features
@@ -126,6 +161,14 @@ class Graphic:
 
         self._right_click_menu = None
 
+        # cached world bounding box and the (local bounds, world transform) it was computed from
+        self._fpl_bbox = None
+        self._fpl_bbox_key = None
+
+        # cached screen padding used for frustum culling
+        self._fpl_padding = None
+        self._fpl_padding_key = None
+
     @property
     def supported_events(self) -> tuple[str]:
         """events supported by this graphic"""
@@ -204,6 +247,77 @@ class Graphic:
         if not all(self.world_object.world.rotation == self.rotation):
             self.rotation = self.rotation
 
+    def _fpl_bounding_box(self) -> np.ndarray | None:
+        """
+        World space bounding box of the graphic, array of shape [2, 3]. ``None`` if the graphic does not take up
+        space. Subclasses with vertex positions return a bounding box that is cached and maintained from the
+        data instead of computing it from the world object.
+        """
+        return WORLD_OBJECTS[self._fpl_address].get_world_bounding_box()
+
+    def _fpl_transform_bounds(
+        self, bounds: np.ndarray | None, world_object: pygfx.WorldObject
+    ) -> np.ndarray | None:
+        """
+        Transform the local ``bounds`` to world space, the result is cached until ``bounds`` is a different
+        array or the world transform of ``world_object`` changes.
+        """
+        key = self._fpl_bbox_key
+        last_modified = world_object.world.last_modified
+
+        if key is None or key[0] is not bounds or key[1] != last_modified:
+            if bounds is None:
+                self._fpl_bbox = None
+            else:
+                self._fpl_bbox = la.aabb_transform(bounds, world_object.world.matrix)
+
+            self._fpl_bbox_key = (bounds, last_modified)
+
+        return self._fpl_bbox
+
+    def _fpl_world_bounds(self) -> np.ndarray | None:
+        """
+        World space bounding box of the graphic used for frustum culling, ``None`` if the graphic must never
+        be culled.
+        """
+        wo = WORLD_OBJECTS[self._fpl_address]
+
+        if not isinstance(wo, (pygfx.Line, pygfx.Points, pygfx.Mesh)):
+            return None
+
+        return self._fpl_bounding_box()
+
+    def _fpl_screen_padding(self) -> float | None:
+        """
+        Padding in screen pixels that the rendered graphic can extend beyond its bounding box, for example half
+        the thickness of a line. Returns ``None`` if the extent is not in screen space and the padding is unknown.
+        """
+        wo = WORLD_OBJECTS[self._fpl_address]
+        material = wo.material
+
+        if isinstance(wo, pygfx.Mesh):
+            return 1.0
+
+        if isinstance(wo, pygfx.Line):
+            if material.thickness_space != "screen":
+                return None
+            return material.thickness / 2 + 1
+
+        if material.size_space != "screen":
+            return None
+
+        if material.size_mode != "vertex":
+            return material.size / 2 + 1
+
+        sizes = wo.geometry.sizes
+        key = (id(sizes), sizes.rev)
+
+        if key != self._fpl_padding_key:
+            self._fpl_padding = float(np.nanmax(sizes.data, initial=0)) / 2 + 1
+            self._fpl_padding_key = key
+
+        return self._fpl_padding
+
     def unshare_property(self, feature: str):
         raise NotImplementedError
 
@@ -391,26 +505,28 @@ class Graphic:
         self.clear_event_handlers()
 
         # clear any attached event handlers and animation functions
-        for attr in dir(self):
-            try:
-                method = getattr(self, attr)
-            except:
-                continue
+        # nothing is attached if the graphic was never added to a plot area
+        if self._plot_area is not None:
+            for attr in dir(self):
+                try:
+                    method = getattr(self, attr)
+                except:
+                    continue
 
-            if not callable(method):
-                continue
+                if not callable(method):
+                    continue
+
+                for ev_type in PYGFX_EVENTS:
+                    try:
+                        self._plot_area.renderer.remove_event_handler(method, ev_type)
+                    except (KeyError, TypeError):
+                        pass
 
-            for ev_type in PYGFX_EVENTS:
                 try:
-                    self._plot_area.renderer.remove_event_handler(method, ev_type)
-                except (KeyError, TypeError):
+                    self._plot_area.remove_animation(method)
+                except KeyError:
                     pass
 
-            try:
-                self._plot_area.remove_animation(method)
-            except KeyError:
-                pass
-
         for child in self.world_object.children:
             child._event_handlers.clear()
 
@@ -456,7 +572,7 @@ class Graphic:
         self._axes.world_object.local.rotation = self.world_object.local.rotation
 
         self._plot_area.scene.add(self.axes.world_object)
-        self._axes.update_using_bbox(self.world_object.get_world_bounding_box())
+        self._axes.update_using_bbox(self._fpl_bounding_box())
 
     @property
     def right_click_menu(self):
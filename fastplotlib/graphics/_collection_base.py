@@ -2,8 +2,12 @@ from contextlib import suppress
 from typing import Any
 
 import numpy as np
+from numpy.lib.stride_tricks import as_strided
 
-from ._base import Graphic
+import pygfx
+
+from ._base import Graphic, BoundingBoxUnion, WORLD_OBJECTS
+from .features import BufferManager, GraphicFeatureEvent, VertexPositions
 
 
 class CollectionProperties:
@@ -196,6 +200,8 @@ class GraphicCollection(Graphic, CollectionProperties):
 
         self._iter = None
 
+        self._bounding_box_union = BoundingBoxUnion()
+
     @property
     def graphics(self) -> np.ndarray[Graphic]:
         """The Graphics within this collection."""
@@ -296,8 +302,10 @@ class GraphicCollection(Graphic, CollectionProperties):
     def _fpl_add_plot_area_hook(self, plot_area):
         super()._fpl_add_plot_area_hook(plot_area)
 
-        for g in self:
-            g._fpl_add_plot_area_hook(plot_area)
+        for g in self._graphics:
+            # graphics of collections that create them lazily may not exist yet
+            if g is not None:
+                g._fpl_add_plot_area_hook(plot_area)
 
     def _fpl_prepare_del(self):
         """
@@ -309,8 +317,15 @@ class GraphicCollection(Graphic, CollectionProperties):
         # clear any attached event handlers and animation functions
         self.world_object._event_handlers.clear()
 
-        for g in self:
-            g._fpl_prepare_del()
+        for g in self._graphics:
+            if g is not None:
+                g._fpl_prepare_del()
+
+    def _fpl_bounding_box(self) -> np.ndarray | None:
+        # graphics of collections that create them lazily may not exist yet
+        return self._bounding_box_union(
+            [g._fpl_bounding_box() for g in self._graphics if g is not None]
+        )
 
     def __getitem__(self, key) -> CollectionIndexer:
         if np.issubdtype(type(key), np.integer):
@@ -319,11 +334,14 @@ class GraphicCollection(Graphic, CollectionProperties):
         return self._indexer(selection=self.graphics[key], features=self._features)
 
     def __del__(self):
-        # detach children
-        self.world_object.clear()
-
-        for g in self.graphics:
-            g._fpl_prepare_del()
+        # the world object and graphics do not exist if an exception was raised during __init__
+        if hex(id(self)) in WORLD_OBJECTS:
+            # detach children
+            self.world_object.clear()
+
+        for g in getattr(self, "_graphics", ()):
+            if g is not None:
+                g._fpl_prepare_del()
             del g
 
         super().__del__()
@@ -370,5 +388,201 @@ class CollectionFeature:
         for fi in self._feature_instances:
             fi[key] = value
 
+    def _set_all(self, value):
+        """set the same value for every graphic"""
+        for g in self._selection:
+            setattr(g, self._feature, value)
+
+    def _set_per_graphic(self, values):
+        """set a different value for each graphic, values must have the same length as the selection"""
+        if not len(values) == len(self._selection):
+            raise IndexError
+
+        for g, v in zip(self._selection, values):
+            setattr(g, self._feature, v)
+
     def __repr__(self):
         return f"Collection feature for: <{self._feature}>"
+
+
+class PackedCollectionFeature(CollectionFeature):
+    """
+    Collection feature of graphics whose features are views of the same length into one packed buffer, such as
+    the lines of a packed ``LineCollection``.
+
+    Indexing applies the key to every graphic, like ``CollectionFeature``, and returns a view of the packed
+    buffer with shape [n_graphics, n_points, ...] when the graphics are evenly spaced within the buffer.
+    Setting values is a single vectorized assignment and one range of the buffer is marked for upload.
+
+    If the packed values include per-graphic ``offsets``, such as the offsets of the lines of a packed
+    ``LineCollection``, values are returned and set without the offsets.
+    """
+
+    def __init__(
+        self,
+        selection: list[Graphic | None],
+        feature: str,
+        buffer_manager: BufferManager,
+        starts: np.ndarray,
+        n_points: int,
+        offsets: np.ndarray = None,
+    ):
+        """
+        selection: list of Graphics
+            the selected Graphics, ``None`` for graphics that have not been created yet. Event handlers of the
+            features of the existing graphics are called when values are set.
+
+        feature: str
+            feature of Graphics in the GraphicCollection being indexed
+
+        buffer_manager: BufferManager
+            feature whose buffer contains the packed values of all graphics
+
+        starts: np.ndarray
+            first row of every selected graphic within the packed buffer
+
+        n_points: int
+            number of rows of every graphic
+
+        offsets: np.ndarray, optional
+            [n_graphics, n_columns] offsets of the selected graphics that are included in the packed values
+
+        """
+        self._selection = selection
+        self._feature = feature
+        self._offsets = offsets
+
+        self._buffer_manager = buffer_manager
+        self._buffer = buffer_manager.buffer
+        self._starts = np.asarray(starts, dtype=np.int64)
+        self._n_points = n_points
+
+        steps = np.diff(self._starts)
+        if steps.size == 0:
+            self._step = self._n_points
+        elif steps[0] > 0 and (steps == steps[0]).all():
+            self._step = int(steps[0])
+        else:
+            # the selection cannot be represented as a strided view
+            self._step = None
+
+    @property
+    def value(self) -> np.ndarray:
+        """
+        values of the selected graphics, array of shape [n_graphics, n_points, ...]. A view of the packed buffer
+        if the graphics are evenly spaced within the buffer and have no offsets, otherwise a copy.
+        """
+        value = self._packed_value
+
+        if self._offsets is not None and self._offsets.any():
+            return value - self._offsets[:, None].astype(value.dtype)
+
+        return value
+
+    @property
+    def _packed_value(self) -> np.ndarray:
+        """values of the selected graphics in the packed buffer, including the offsets"""
+        data = self._buffer.data
+
+        if self._step is None:
+            return data[self._rows]
+
+        return as_strided(
+            data[self._starts[0] :],
+            shape=(self._starts.size, self._n_points, *data.shape[1:]),
+            strides=(self._step * data.strides[0], *data.strides),
+        )
+
+    @property
+    def _rows(self) -> np.ndarray:
+        """rows of the packed buffer, array of shape [n_graphics, n_points]"""
+        return self._starts[:, None] + np.arange(self._n_points)
+
+    def _graphics_key(self, key) -> tuple:
+        """apply the key to every graphic, i.e. to all but the first dimension"""
+        if not isinstance(key, tuple):
+            key = (key,)
+
+        return (slice(None), *key)
+
+    def _parse_value(self, value):
+        if isinstance(value, str) or (
+            isinstance(value, (list, tuple)) and isinstance(value[0], str)
+        ):
+            # str colors
+            return np.asarray(
+                [pygfx.Color(c) for c in np.atleast_1d(value)], dtype=np.float32
+            ).squeeze()
+
+        return value
+
+    def _write(self, key: tuple, value):
+        """single vectorized assignment into the packed buffer, marks one range for upload"""
+        values = self._packed_value
+
+        if self._offsets is not None:
+            # the packed values include the offset of every graphic
+            offsets = np.broadcast_to(self._offsets[:, None], values.shape)
+            value = np.asarray(value) + offsets[key]
+
+        values[key] = value
+
+        if self._step is None:
+            # a copy of the rows
+            self._buffer.data[self._rows] = values
+
+        offset = int(self._starts.min())
+        size = int(self._starts.max()) + self._n_points - offset
+
+        if isinstance(self._buffer_manager, VertexPositions):
+            # graphics outside of the written rows keep their cached bounds
+            self._buffer_manager._invalidate_bounds(offset, offset + size)
+
+        self._buffer.update_range(offset, size)
+
+    def _emit_events(self, key, values, per_graphic: bool):
+        for i, g in enumerate(self._selection):
+            if g is None:
+                continue
+
+            fi = getattr(g, self._feature)
+            if len(fi._event_handlers) < 1:
+                continue
+
+            value = values[i] if per_graphic else values
+
+            if self._feature == "colors":
+                info = {"key": key, "value": fi.value[key], "user_value": value}
+                fi._call_event_handlers(GraphicFeatureEvent("colors", info=info))
+            else:
+                fi._emit_event(self._feature, key, value)
+
+    def __getitem__(self, item):
+        return self.value[self._graphics_key(item)]
+
+    def __setitem__(self, key, value):
+        self._write(self._graphics_key(key), self._parse_value(value))
+        self._emit_events(key, value, per_graphic=False)
+
+    def _set_all(self, value):
+        self[:] = value
+
+    def _set_per_graphic(self, values):
+        if not len(values) == self._starts.size:
+            raise IndexError
+
+        parsed = np.asarray(
+            [self._parse_value(v) for v in values]
+            if isinstance(values[0], str)
+            else values
+        )
+
+        if parsed.ndim == self._buffer.data.ndim:
+            # one value per graphic, for example one color per line
+            parsed = parsed[:, None]
+
+        self._write((slice(None), slice(None)), parsed)
+        self._emit_events(slice(None), values, per_graphic=True)
+
+    def __repr__(self):
+        return f"Packed collection feature for: <{self._feature}>"
@@ -0,0 +1,147 @@
+import numpy as np
+
+import pygfx
+from pygfx.renderers.wgpu import register_wgpu_render_function, Binding
+from pygfx.renderers.wgpu.shaders.lineshader import LineShader, ThinLineShader
+from pygfx.utils import array_from_shadertype
+from pygfx.utils.bounds import Bounds
+
+
+# replaces pygfx's accessor of the positions buffer, the buffer only contains y values
+COMPACT_POSITIONS_WGSL = """
+fn load_compact_position(i: i32) -> vec3<f32> {
+    return vec3<f32>(u_compact.x0 + f32(i) * u_compact.dx, load_s_positions(i), u_compact.z);
+}
+"""
+
+
+class CompactLine(pygfx.Line):
+    def __init__(
+        self,
+        geometry: pygfx.Geometry,
+        material: pygfx.LineMaterial,
+        positions: pygfx.Buffer,
+        compact_buffer: pygfx.Buffer,
+        **kwargs,
+    ):
+        """
+        Line whose positions buffer only contains y values, x is ``x0 + i * dx`` and z is constant. The x and z
+        values are computed in the vertex shader from ``compact_buffer``, a uniform buffer with the fields
+        ``x0``, ``dx`` and ``z``.
+
+        Parameters
+        ----------
+        geometry: pygfx.Geometry
+            geometry without positions
+
+        material: pygfx.LineMaterial
+            line material, ``LineMaterial`` or ``LineThinMaterial``
+
+        positions: pygfx.Buffer
+            1D float32 buffer of y values, set as the positions of the geometry
+
+        compact_buffer: pygfx.Buffer
+            uniform buffer with ``x0``, ``dx`` and ``z``
+
+        """
+        # set after creating the geometry since pygfx.Geometry only accepts [n, 3] positions
+        geometry.positions = positions
+
+        super().__init__(geometry=geometry, material=material, **kwargs)
+        self.compact_buffer = compact_buffer
+
+    def _get_bounds_from_geometry(self):
+        # pygfx computes the bounds from [n, 3] positions, compute them from x0, dx, z and the y range instead
+        positions = self.geometry.positions
+        key = (positions.rev, self.compact_buffer.rev)
+
+        if self._bounds_geometry_rev == key:
+            return self._bounds_geometry
+
+        y = positions.data
+        finite = y[np.isfinite(y)]
+
+        if finite.size == 0:
+            self._bounds_geometry = None
+        else:
+            compact = self.compact_buffer.data
+            x0, dx, z = float(compact["x0"]), float(compact["dx"]), float(compact["z"])
+            aabb = np.array(
+                [
+                    [x0, finite.min(), z],
+                    [x0 + (y.size - 1) * dx, finite.max(), z],
+                ]
+            )
+            self._bounds_geometry = Bounds(aabb, None)
+
+        self._bounds_geometry_rev = key
+        return self._bounds_geometry
+
+
+def _compact_code(code: str) -> str:
+    return (
+        code.replace("load_s_positions(", "load_compact_position(")
+        + COMPACT_POSITIONS_WGSL
+    )
+
+
+def _compact_bindings(bindings: list[Binding], wobject: CompactLine) -> list[Binding]:
+    return [*bindings, Binding("u_compact", "buffer/uniform", wobject.compact_buffer)]
+
+
+@register_wgpu_render_function(CompactLine, pygfx.LineMaterial)
+class CompactLineShader(LineShader):
+    """pygfx ``LineShader`` for a ``CompactLine``, x and z are computed from the vertex index"""
+
+    def get_bindings(self, wobject, shared):
+        material = wobject.material
+        geometry = wobject.geometry
+
+        # same as LineShader, which requires [n, 3] positions
+        uniform_buffer = pygfx.Buffer(
+            array_from_shadertype(dict(last_i="i4")), force_contiguous=True
+        )
+        uniform_buffer.data["last_i"] = geometry.positions.nitems - 1
+
+        rbuffer = "buffer/read_only_storage"
+        bindings = [
+            Binding("u_stdinfo", "buffer/uniform", shared.uniform_buffer),
+            Binding("u_wobject", "buffer/uniform", wobject.uniform_buffer),
+            Binding("u_material", "buffer/uniform", material.uniform_buffer),
+            Binding("u_renderer", "buffer/uniform", uniform_buffer),
+            Binding("s_positions", rbuffer, geometry.positions, "VERTEX"),
+        ]
+
+        if self["color_mode"] in ("vertex", "face"):
+            bindings.append(Binding("s_colors", rbuffer, geometry.colors, "VERTEX"))
+        elif self["color_mode"] in ("vertex_map", "face_map"):
+            bindings.append(
+                Binding("s_texcoords", rbuffer, geometry.texcoords, "VERTEX")
+            )
+            bindings.extend(
+                self.define_generic_colormap(material.map, geometry.texcoords)
+            )
+
+        bindings = dict(enumerate(_compact_bindings(bindings, wobject)))
+        self.define_bindings(0, bindings)
+
+        return {0: bindings}
+
+    def get_code(self):
+        return _compact_code(super().get_code())
+
+
+@register_wgpu_render_function(CompactLine, pygfx.LineThinMaterial)
+class CompactThinLineShader(ThinLineShader):
+    """pygfx ``ThinLineShader`` for a ``CompactLine``, x and z are computed from the vertex index"""
+
+    def get_bindings(self, wobject, shared):
+        bindings = super().get_bindings(wobject, shared)[0]
+
+        bindings = dict(enumerate(_compact_bindings(list(bindings.values()), wobject)))
+        self.define_bindings(0, bindings)
+
+        return {0: bindings}
+
+    def get_code(self):
+        return _compact_code(super().get_code())
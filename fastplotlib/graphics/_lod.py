@@ -0,0 +1,216 @@
+import numpy as np
+
+
+class MinMaxPyramid:
+    def __init__(self, values: np.ndarray, block_size: int = 16, factor: int = 4):
+        """
+        Pyramid of the indices of the min and max values within blocks of a 1D array, used for viewport-aware
+        M4 (first, min, max, last) decimation of line data. The first level contains the min and max indices
+        of blocks of ``block_size`` values, every following level combines ``factor`` blocks of the previous
+        level.
+
+        Parameters
+        ----------
+        values: np.ndarray
+            1D array of values, usually the y values of line data that is sorted along x
+
+        block_size: int, default 16
+            number of values per block in the first level of the pyramid
+
+        factor: int, default 4
+            number of blocks of a level that are combined into one block of the next level
+
+        """
+        values = np.asarray(values)
+
+        if values.ndim != 1:
+            raise ValueError(
+                f"values must be 1D, you passed an array with shape: {values.shape}"
+            )
+
+        self._values = values
+        self._n = values.shape[0]
+        self._factor = factor
+
+        # int32 indices halve the memory of the pyramid for arrays with less than 2^31 values
+        self._dtype = np.int32 if self._n < 2**31 else np.int64
+
+        self._block_sizes: list[int] = list()
+        self._imin: list[np.ndarray] = list()
+        self._imax: list[np.ndarray] = list()
+
+        if self._n < block_size:
+            return
+
+        # first level from the values
+        imin, imax = self._reduce_values(block_size)
+        self._append_level(block_size, imin, imax)
+
+        # combine blocks until there is a single block
+        while self._imin[-1].size > 1:
+            imin = self._reduce_level(self._imin[-1], factor, np.argmin)
+            imax = self._reduce_level(self._imax[-1], factor, np.argmax)
+            self._append_level(self._block_sizes[-1] * factor, imin, imax)
+
+    def _append_level(self, block_size: int, imin: np.ndarray, imax: np.ndarray):
+        self._block_sizes.append(block_size)
+        self._imin.append(imin.astype(self._dtype, copy=False))
+        self._imax.append(imax.astype(self._dtype, copy=False))
+
+    def _reduce_values(
+        self, block_size: int, start: int = 0, stop: int = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """min and max indices of the blocks of ``values[start:stop]``, ``start`` must be at the start of a block"""
+        values = self._values[start:stop]
+        n = values.shape[0]
+
+        n_full = n // block_size
+        blocks = values[: n_full * block_size].reshape(n_full, block_size)
+
+        starts = np.arange(n_full, dtype=np.int64) * block_size + start
+        imin = blocks.argmin(axis=1) + starts
+        imax = blocks.argmax(axis=1) + starts
+
+        if n % block_size:
+            # last partial block
+            tail = values[n_full * block_size :]
+            imin = np.append(imin, tail.argmin() + n_full * block_size + start)
+            imax = np.append(imax, tail.argmax() + n_full * block_size + start)
+
+        return imin, imax
+
+    def _reduce_level(self, indices: np.ndarray, factor: int, arg) -> np.ndarray:
+        n_full = indices.size // factor
+        candidates = indices[: n_full * factor].reshape(n_full, factor)
+
+        selected = np.take_along_axis(
+            candidates, arg(self._values[candidates], axis=1)[:, None], axis=1
+        )[:, 0]
+
+        if indices.size % factor:
+            tail = indices[n_full * factor :]
+            selected = np.append(selected, tail[arg(self._values[tail])])
+
+        return selected
+
+    def update(self, start: int, stop: int):
+        """
+        Update the pyramid after ``values[start:stop]`` were changed, only the blocks of every level that
+        contain the changed values are computed again.
+
+        Parameters
+        ----------
+        start: int
+            start index of the changed values
+
+        stop: int
+            stop index of the changed values, exclusive
+
+        """
+        start, stop = max(int(start), 0), min(int(stop), self._n)
+
+        if stop <= start or len(self._block_sizes) == 0:
+            return
+
+        # blocks of the first level from the values
+        block_size = self._block_sizes[0]
+        first_block, stop_block = start // block_size, (stop - 1) // block_size + 1
+
+        imin, imax = self._reduce_values(
+            block_size, first_block * block_size, stop_block * block_size
+        )
+        self._imin[0][first_block:stop_block] = imin
+        self._imax[0][first_block:stop_block] = imax
+
+        # blocks of every following level from the changed blocks of the previous level
+        factor = self._factor
+        for level in range(1, len(self._block_sizes)):
+            first_block, stop_block = (
+                first_block // factor,
+                (stop_block - 1) // factor + 1,
+            )
+            lower = slice(first_block * factor, stop_block * factor)
+
+            self._imin[level][first_block:stop_block] = self._reduce_level(
+                self._imin[level - 1][lower], factor, np.argmin
+            )
+            self._imax[level][first_block:stop_block] = self._reduce_level(
+                self._imax[level - 1][lower], factor, np.argmax
+            )
+
+    @property
+    def block_sizes(self) -> tuple[int, ...]:
+        """block size of each level of the pyramid"""
+        return tuple(self._block_sizes)
+
+    @property
+    def nbytes(self) -> int:
+        """memory used by the pyramid in bytes"""
+        return sum(a.nbytes for a in self._imin) + sum(a.nbytes for a in self._imax)
+
+    @property
+    def extrema(self) -> tuple[int, int]:
+        """indices of the global min and max values"""
+        if len(self._imin) == 0:
+            return int(np.argmin(self._values)), int(np.argmax(self._values))
+
+        return int(self._imin[-1][0]), int(self._imax[-1][0])
+
+    def decimate(self, start: int, stop: int, n_buckets: int) -> np.ndarray:
+        """
+        Indices of the M4 decimation of ``values[start:stop]`` into approximately ``n_buckets`` buckets, usually
+        the width of the viewport in pixels. The first, last, min and max values of every block of the
+        pyramid level whose block size is closest to, but not larger than, the bucket size are kept. Returns
+        all indices in the range if it is small enough to not require decimation.
+
+        Parameters
+        ----------
+        start: int
+            start index of the range
+
+        stop: int
+            stop index of the range, exclusive
+
+        n_buckets: int
+            number of buckets
+
+        Returns
+        -------
+        np.ndarray
+            sorted indices into ``values``
+
+        """
+        start, stop = max(int(start), 0), min(int(stop), self._n)
+
+        if stop <= start:
+            return np.zeros(0, dtype=np.int64)
+
+        bucket_size = (stop - start) / max(n_buckets, 1)
+
+        levels = [i for i, b in enumerate(self._block_sizes) if b <= bucket_size]
+
+        if len(levels) == 0:
+            return np.arange(start, stop)
+
+        level = levels[-1]
+        block_size = self._block_sizes[level]
+
+        first_block, stop_block = start // block_size, (stop - 1) // block_size + 1
+
+        block_starts = np.arange(first_block, stop_block, dtype=np.int64) * block_size
+        block_lasts = np.minimum(block_starts + block_size, self._n) - 1
+
+        indices = np.concatenate(
+            [
+                [start, stop - 1],
+                block_starts,
+                self._imin[level][first_block:stop_block],
+                self._imax[level][first_block:stop_block],
+                block_lasts,
+            ]
+        ).astype(np.int64)
+
+        # blocks at the edges may extend outside of the range
+        indices = indices[(indices >= start) & (indices < stop)]
+
+        return np.unique(indices)
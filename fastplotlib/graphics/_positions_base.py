@@ -3,7 +3,7 @@ from typing import Any
 import numpy as np
 
 import pygfx
-from ._base import Graphic
+from ._base import Graphic, WORLD_OBJECTS
 from .features import (
     VertexPositions,
     VertexColors,
@@ -102,7 +102,7 @@ class PositionsGraphic(Graphic):
                     self._colors._shared += 1
                 else:
                     # create vertex colors buffer
-                    self._colors = VertexColors("w", n_colors=self._data.value.shape[0])
+                    self._colors = VertexColors("w", n_colors=len(self._data))
                     # make cmap using vertex colors buffer
                     self._cmap = VertexCmap(
                         self._colors,
@@ -140,7 +140,7 @@ class PositionsGraphic(Graphic):
                 else:
                     self._colors = VertexColors(
                         colors,
-                        n_colors=self._data.value.shape[0],
+                        n_colors=len(self._data),
                         alpha=alpha,
                     )
                     self._cmap = VertexCmap(
@@ -150,6 +150,12 @@ class PositionsGraphic(Graphic):
         self._size_space = SizeSpace(size_space)
         super().__init__(*args, **kwargs)
 
+    def _fpl_bounding_box(self) -> np.ndarray | None:
+        # the bounds of the data are maintained when the data is set, only the transform is applied here
+        return self._fpl_transform_bounds(
+            self._data.bounds, WORLD_OBJECTS[self._fpl_address]
+        )
+
     def unshare_property(self, property: str):
         """unshare a shared property. Experimental and untested!"""
         if not isinstance(property, str):
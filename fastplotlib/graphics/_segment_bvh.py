@@ -0,0 +1,322 @@
+import numpy as np
+
+from ._spatial_index import _expand_ranges
+
+
+def _part1by1(v: np.ndarray) -> np.ndarray:
+    """spread the lower 16 bits of ``v`` to the even bits"""
+    v = v.astype(np.uint32)
+    v = (v | (v << 8)) & 0x00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F
+    v = (v | (v << 2)) & 0x33333333
+    v = (v | (v << 1)) & 0x55555555
+    return v
+
+
+def _reduce_boxes(boxes: np.ndarray, size: int) -> np.ndarray:
+    """
+    [n, 4] boxes (xmin, ymin, xmax, ymax) of groups of ``size`` consecutive boxes, NaN boxes are ignored and
+    groups without finite boxes are NaN
+    """
+    n_groups = -(-boxes.shape[0] // size)
+
+    # reduce the columns separately, along contiguous memory
+    padded = np.full((4, n_groups * size), np.nan, dtype=boxes.dtype)
+    padded[:, : boxes.shape[0]] = boxes.T
+    padded = padded.reshape(4, n_groups, size)
+
+    reduced = np.empty((n_groups, 4), dtype=boxes.dtype)
+    reduced[:, :2] = np.fmin.reduce(padded[:2], axis=2).T
+    reduced[:, 2:] = np.fmax.reduce(padded[2:], axis=2).T
+
+    return reduced
+
+
+def _children(nodes: np.ndarray, size: int, n_children: int) -> np.ndarray:
+    """indices of the ``size`` consecutive children of each node that exist"""
+    children = (nodes[:, None] * size + np.arange(size)).ravel()
+    return children[children < n_children]
+
+
+class SegmentBVH:
+    def __init__(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        starts: np.ndarray,
+        n_points: np.ndarray,
+        leaf_size: int = 16,
+        branching: int = 8,
+    ):
+        """
+        Bounding volume hierarchy over the segments of many lines, used to find the lines nearest to a point.
+
+        The segments are sorted along a Z-order curve of their midpoints and grouped into leaves of ``leaf_size``
+        consecutive segments, the nodes of every level above the leaves bound ``branching`` consecutive nodes of
+        the level below. The tree is implicit, only the bounding boxes of each level are stored, and a query visits
+        one level at a time for all candidate nodes at once.
+
+        When points move, :meth:`refit` updates the bounding boxes of the leaves that contain their segments and
+        of the ancestors of these leaves, the segments are not sorted again.
+
+        Parameters
+        ----------
+        x, y: np.ndarray
+            1D arrays of the x and y values of the points of all lines, not copied
+
+        starts: np.ndarray
+            first point of each line in ``x`` and ``y``
+
+        n_points: np.ndarray
+            number of points of each line, segment ``i`` of a line joins its points ``i`` and ``i + 1``
+
+        leaf_size: int, default 16
+            number of segments per leaf
+
+        branching: int, default 8
+            number of children per node
+
+        """
+        self._x = x
+        self._y = y
+        self._starts = np.asarray(starts, dtype=np.int64)
+        self._leaf_size = leaf_size
+        self._branching = branching
+
+        n_segments = np.maximum(np.asarray(n_points, dtype=np.int64) - 1, 0)
+
+        # first point of every segment and the line it belongs to
+        segments = _expand_ranges(self._starts, n_segments)
+        lines = np.repeat(np.arange(n_segments.size), n_segments)
+
+        # sort along a Z-order curve of the midpoints, segments with NaN points are last
+        mx = (x[segments] + x[segments + 1]) / 2
+        my = (y[segments] + y[segments + 1]) / 2
+        finite = np.isfinite(mx) & np.isfinite(my)
+
+        code = np.full(segments.size, np.iinfo(np.uint32).max, dtype=np.uint32)
+        if finite.any():
+            x0, x1 = mx[finite].min(), mx[finite].max()
+            y0, y1 = my[finite].min(), my[finite].max()
+            qx = (mx[finite] - x0) * (65535 / max(x1 - x0, 1e-30))
+            qy = (my[finite] - y0) * (65535 / max(y1 - y0, 1e-30))
+            code[finite] = _part1by1(qx) | (_part1by1(qy) << 1)
+
+        order = np.argsort(code, kind="stable")
+        self._segments = segments[order]
+        self._lines = lines[order]
+
+        # positions of the segments of each line in the sorted order, used to refit lines
+        self._line_order = np.argsort(self._lines, kind="stable")
+        self._line_offsets = np.cumsum(n_segments) - n_segments
+        self._n_segments = n_segments
+
+        # bounding boxes of each level, from the root level to the leaves
+        self._levels: list[np.ndarray] = list()
+        self.refit()
+
+    @property
+    def n_segments(self) -> int:
+        """number of segments"""
+        return self._segments.size
+
+    def _segment_boxes(self, positions: np.ndarray) -> np.ndarray:
+        """[n, 4] boxes of the segments at ``positions`` of the sorted order, NaN if a point is not finite"""
+        segments = self._segments[positions]
+        xa, xb = self._x[segments], self._x[segments + 1]
+        ya, yb = self._y[segments], self._y[segments + 1]
+
+        # np.minimum and np.maximum propagate NaN
+        return np.column_stack(
+            [
+                np.minimum(xa, xb),
+                np.minimum(ya, yb),
+                np.maximum(xa, xb),
+                np.maximum(ya, yb),
+            ]
+        ).astype(np.float64)
+
+    def refit(self, lines: np.ndarray = None):
+        """
+        Update the bounding boxes after points were moved.
+
+        Parameters
+        ----------
+        lines: np.ndarray, optional
+            indices of the lines whose points moved, by default all bounding boxes are recomputed
+
+        """
+        size, branching = self._leaf_size, self._branching
+
+        if lines is None or len(self._levels) == 0:
+            boxes = _reduce_boxes(self._segment_boxes(np.arange(self.n_segments)), size)
+            levels = [boxes]
+            while boxes.shape[0] > branching:
+                boxes = _reduce_boxes(boxes, branching)
+                levels.append(boxes)
+
+            self._levels = levels[::-1]
+            return
+
+        lines = np.asarray(lines, dtype=np.int64)
+        positions = self._line_order[
+            _expand_ranges(self._line_offsets[lines], self._n_segments[lines])
+        ]
+
+        # leaves that contain the segments of the lines
+        nodes = np.unique(positions // size)
+        self._levels[-1][nodes] = _reduce_boxes(
+            self._segment_boxes_padded(nodes, size), size
+        )
+
+        # ancestors of the leaves
+        for depth in range(len(self._levels) - 2, -1, -1):
+            children = self._levels[depth + 1]
+            nodes = np.unique(nodes // branching)
+
+            rows = nodes[:, None] * branching + np.arange(branching)
+            boxes = np.full((rows.size, 4), np.nan)
+            valid = rows.ravel() < children.shape[0]
+            boxes[valid] = children[rows.ravel()[valid]]
+
+            self._levels[depth][nodes] = _reduce_boxes(boxes, branching)
+
+    def _segment_boxes_padded(self, leaves: np.ndarray, size: int) -> np.ndarray:
+        """boxes of all segment slots of ``leaves``, NaN for the slots after the last segment"""
+        positions = (leaves[:, None] * size + np.arange(size)).ravel()
+        valid = positions < self.n_segments
+
+        boxes = np.full((positions.size, 4), np.nan)
+        boxes[valid] = self._segment_boxes(positions[valid])
+
+        return boxes
+
+    def _candidates(
+        self, px: float, py: float, sx: float, sy: float, r2: float, tighten: bool
+    ) -> tuple[np.ndarray, float]:
+        """
+        positions of the segments in leaves within the squared distance ``r2`` of the point. If ``tighten``,
+        ``r2`` is lowered to the distance within which there is at least one segment at every level.
+        """
+        nodes = np.arange(self._levels[0].shape[0])
+
+        for depth, boxes in enumerate(self._levels):
+            b = boxes[nodes]
+
+            dx = np.maximum(np.maximum(b[:, 0] - px, px - b[:, 2]), 0) / sx
+            dy = np.maximum(np.maximum(b[:, 1] - py, py - b[:, 3]), 0) / sy
+            min_d2 = dx * dx + dy * dy
+
+            if tighten:
+                # every segment in a box is closer than its farthest corner
+                fx = np.maximum(np.abs(px - b[:, 0]), np.abs(px - b[:, 2])) / sx
+                fy = np.maximum(np.abs(py - b[:, 1]), np.abs(py - b[:, 3])) / sy
+                r2 = min(r2, float(np.fmin.reduce(fx * fx + fy * fy, initial=np.inf)))
+
+            # NaN boxes do not contain any segment and are dropped
+            nodes = nodes[min_d2 <= r2]
+
+            if depth + 1 < len(self._levels):
+                nodes = _children(
+                    nodes, self._branching, self._levels[depth + 1].shape[0]
+                )
+
+        return _children(nodes, self._leaf_size, self.n_segments), r2
+
+    def _line_distances(
+        self, positions: np.ndarray, px: float, py: float, sx: float, sy: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(lines, segment positions, squared distances) of the nearest segment of each line in ``positions``"""
+        segments = self._segments[positions]
+        ax = self._x[segments].astype(np.float64)
+        ay = self._y[segments].astype(np.float64)
+
+        vx = (self._x[segments + 1] - ax) / sx
+        vy = (self._y[segments + 1] - ay) / sy
+        wx = (px - ax) / sx
+        wy = (py - ay) / sy
+
+        # projection of the point on each segment, clamped to the segment
+        length2 = vx * vx + vy * vy
+        t = np.divide(
+            wx * vx + wy * vy, length2, out=np.zeros_like(length2), where=length2 > 0
+        )
+        t = np.clip(t, 0, 1)
+        d2 = (wx - t * vx) ** 2 + (wy - t * vy) ** 2
+
+        finite = np.isfinite(d2)
+        positions, d2 = positions[finite], d2[finite]
+        lines = self._lines[positions]
+
+        # nearest segment of each line
+        order = np.lexsort((d2, lines))
+        first = np.ones(order.size, dtype=bool)
+        first[1:] = lines[order[1:]] != lines[order[:-1]]
+        order = order[first]
+
+        return lines[order], positions[order], d2[order]
+
+    def nearest(
+        self,
+        point: tuple[float, float],
+        k: int = 1,
+        scale: tuple[float, float] = (1.0, 1.0),
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The ``k`` lines nearest to ``point`` and their nearest segments.
+
+        Parameters
+        ----------
+        point: (float, float)
+            x and y of the point
+
+        k: int, default 1
+            number of lines
+
+        scale: (float, float), default (1.0, 1.0)
+            distances along x and y are divided by the scale, for example the size of a screen pixel in data units
+            so that distances are in pixels
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray, np.ndarray)
+            line indices, segment indices within the lines and distances, sorted by distance. Less than ``k``
+            lines if there are less lines with finite segments.
+
+        """
+        if k < 1:
+            raise ValueError(f"k must be >= 1, you passed: {k}")
+
+        px, py = float(point[0]), float(point[1])
+        sx, sy = float(scale[0]), float(scale[1])
+
+        if self.n_segments == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, np.zeros(0)
+
+        # the nearest line is within the distance that bounds the nearest box at every level
+        positions, r2 = self._candidates(px, py, sx, sy, np.inf, tighten=True)
+        lines, positions, d2 = self._line_distances(positions, px, py, sx, sy)
+
+        if k > 1:
+            # distance to the farthest corner of the root boxes, every segment is within this distance
+            root = self._levels[0]
+            fx = np.fmax.reduce(
+                np.maximum(np.abs(px - root[:, 0]), np.abs(px - root[:, 2]))
+            )
+            fy = np.fmax.reduce(
+                np.maximum(np.abs(py - root[:, 1]), np.abs(py - root[:, 3]))
+            )
+            farthest = (fx / sx) ** 2 + (fy / sy) ** 2
+
+            # grow the radius until it contains k lines
+            r2 = max(r2, farthest * 1e-6)
+            while np.count_nonzero(d2 <= r2) < k and r2 < farthest:
+                r2 *= 4
+                positions, _ = self._candidates(px, py, sx, sy, r2, tighten=False)
+                lines, positions, d2 = self._line_distances(positions, px, py, sx, sy)
+
+        nearest = np.argsort(d2, kind="stable")[:k]
+        lines, positions, d2 = lines[nearest], positions[nearest], d2[nearest]
+
+        return lines, self._segments[positions] - self._starts[lines], np.sqrt(d2)
@@ -0,0 +1,650 @@
+import threading
+
+import numpy as np
+
+
+def _expand_ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """concatenated ``arange(start, start + length)`` of each range"""
+    total = int(lengths.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    shift = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return np.arange(total, dtype=np.int64) + shift
+
+
+def polygon_edges(vertices: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    (xa, ya, xb, yb, slope) of the edges of the closed polygon, each edge is oriented so that ``ya < yb``.
+    Horizontal edges are dropped, they are never crossed by a horizontal ray.
+
+    The orientation makes the crossing test of an edge independent of the order of its vertices, so the parity
+    of a polygon is exactly the XOR of the parities of the triangles of a fan triangulation.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)[:, :2]
+    a, b = vertices, np.roll(vertices, -1, axis=0)
+
+    flip = a[:, 1] > b[:, 1]
+    a, b = np.where(flip[:, None], b, a), np.where(flip[:, None], a, b)
+
+    keep = a[:, 1] < b[:, 1]
+    a, b = a[keep], b[keep]
+    slope = (b[:, 0] - a[:, 0]) / (b[:, 1] - a[:, 1])
+
+    return a[:, 0], a[:, 1], b[:, 0], b[:, 1], slope
+
+
+def _crossing_parity(x: np.ndarray, y: np.ndarray, edges: tuple) -> np.ndarray:
+    """crossing number parity of each point, ``True`` if the point is inside the polygon"""
+    xa, ya, xb, yb, slope = edges
+
+    # with the points sorted by y, the points within the y range of an edge are a contiguous slice
+    order = np.argsort(y)
+    ys, xs = y[order].astype(np.float64), x[order]
+
+    lo = np.searchsorted(ys, ya, side="left")
+    hi = np.searchsorted(ys, yb, side="left")
+
+    parity = np.zeros(x.size, dtype=bool)
+    for i in np.flatnonzero(hi > lo):
+        s = slice(lo[i], hi[i])
+        parity[s] ^= xs[s] < xa[i] + (ys[s] - ya[i]) * slope[i]
+
+    inside = np.empty(x.size, dtype=bool)
+    inside[order] = parity
+    return inside
+
+
+def _scanline_parity(
+    edges: tuple, x0: float, dx: float, nx: int, y0: float, dy: float, ny: int
+) -> np.ndarray:
+    """
+    [ny, nx] crossing number parity of the samples ``(x0 + i * dx, y0 + j * dy)`` of a regular grid. The crossings
+    of each row are counted with a cumulative sum instead of testing every sample against every edge.
+    """
+    xa, ya, xb, yb, slope = edges
+
+    # rows within [ya, yb) of each edge
+    r0 = np.clip(np.ceil((ya - y0) / dy), 0, ny).astype(np.int64)
+    r1 = np.clip(np.ceil((yb - y0) / dy), 0, ny).astype(np.int64)
+    lengths = np.maximum(r1 - r0, 0)
+
+    edge = np.repeat(np.arange(lengths.size), lengths)
+    rows = _expand_ranges(r0, lengths)
+    crossing = xa[edge] + (y0 + rows * dy - ya[edge]) * slope[edge]
+
+    # number of samples to the left of the crossing, these samples are crossed by a ray to +x
+    n_left = np.clip(np.ceil((crossing - x0) / dx), 0, nx).astype(np.int64)
+
+    hits = np.zeros((ny, nx + 1), dtype=np.int32)
+    np.add.at(hits, (rows, n_left), 1)
+
+    # number of crossings to the right of each sample
+    right = np.cumsum(hits[:, ::-1], axis=1)[:, ::-1]
+    return (right[:, 1:] % 2).astype(bool)
+
+
+def polygon_mask(vertices: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+    """
+    Mask of the pixels of an image whose centers are inside a polygon, pixel ``[row, col]`` is centered at
+    ``x = col, y = row``.
+
+    Parameters
+    ----------
+    vertices: np.ndarray
+        [n_vertices, 2] vertices of the polygon, the polygon is closed from the last to the first vertex
+
+    shape: (int, int)
+        (rows, cols) of the image
+
+    Returns
+    -------
+    np.ndarray
+        [rows, cols] bool mask
+
+    """
+    rows, cols = shape
+    return _scanline_parity(polygon_edges(vertices), 0, 1, cols, 0, 1, rows)
+
+
+def _polygon_cell_classes(
+    edges: tuple, grid: tuple, cx0: int, cx1: int, cy0: int, cy1: int
+) -> np.ndarray:
+    """
+    class of the cells [cy0:cy1 + 1, cx0:cx1 + 1] of a grid, 0 outside the polygon, 1 inside and 2 if an edge
+    passes through the cell or a neighbouring cell, the points of these cells must be tested individually
+    """
+    x0, y0, inv_w, inv_h = grid[:4]
+    nx, ny = cx1 - cx0 + 1, cy1 - cy0 + 1
+
+    # cells that are not crossed by an edge are entirely inside or outside, test the cell centers
+    classes = _scanline_parity(
+        edges,
+        x0 + (cx0 + 0.5) / inv_w,
+        1 / inv_w,
+        nx,
+        y0 + (cy0 + 0.5) / inv_h,
+        1 / inv_h,
+        ny,
+    ).astype(np.int8)
+
+    xa, ya, xb, yb, slope = edges
+    cell = SpatialIndex._cell_coords
+
+    # rows of the cells crossed by each edge
+    r0 = cell(ya, y0, inv_h, grid[5]) - cy0
+    r1 = cell(yb, y0, inv_h, grid[5]) - cy0
+    r0, r1 = np.clip(r0, 0, ny - 1), np.clip(r1, 0, ny - 1)
+    lengths = r1 - r0 + 1
+
+    edge = np.repeat(np.arange(lengths.size), lengths)
+    rows = _expand_ranges(r0, lengths)
+
+    # x range of the edge within the y range of each row
+    ylo = np.maximum(y0 + (rows + cy0) / inv_h, ya[edge])
+    yhi = np.minimum(y0 + (rows + cy0 + 1) / inv_h, yb[edge])
+    xlo = xa[edge] + (ylo - ya[edge]) * slope[edge]
+    xhi = xa[edge] + (yhi - ya[edge]) * slope[edge]
+
+    # one neighbouring cell on each side for rounding
+    c0 = cell(np.minimum(xlo, xhi), x0, inv_w, grid[4]) - cx0 - 1
+    c1 = cell(np.maximum(xlo, xhi), x0, inv_w, grid[4]) - cx0 + 1
+    c0, c1 = np.clip(c0, 0, nx - 1), np.clip(c1, 0, nx - 1)
+
+    # and one row above and below
+    for shift in (-1, 0, 1):
+        r = np.clip(rows + shift, 0, ny - 1)
+        flat = _expand_ranges(r * nx + c0, c1 - c0 + 1)
+        classes.reshape(-1)[flat] = 2
+
+    return classes
+
+
+def points_in_polygon(
+    x: np.ndarray, y: np.ndarray, vertices: np.ndarray, points_per_cell: int = 4
+) -> np.ndarray:
+    """
+    Indices of the points inside a polygon, by the crossing number of a horizontal ray. Points outside the bounding
+    box of the polygon are rejected first, the remaining points are binned into a grid over the bounding box and
+    only the points in cells that are crossed by an edge are tested against the edges.
+
+    Parameters
+    ----------
+    x, y: np.ndarray
+        1D arrays of the x and y values of the points
+
+    vertices: np.ndarray
+        [n_vertices, 2] vertices of the polygon, the polygon is closed from the last to the first vertex
+
+    points_per_cell: int, default 4
+        average number of points in the bounding box per grid cell
+
+    Returns
+    -------
+    np.ndarray
+        sorted indices of the points inside the polygon
+
+    """
+    edges = polygon_edges(vertices)
+
+    if edges[0].size == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    xmin, xmax = min(edges[0].min(), edges[2].min()), max(
+        edges[0].max(), edges[2].max()
+    )
+    ymin, ymax = edges[1].min(), edges[3].max()
+
+    rows = np.flatnonzero((x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax))
+    xs, ys = x[rows], y[rows]
+
+    # grid over the bounding box with the aspect ratio of the bounding box
+    width, height = max(xmax - xmin, 1e-12), max(ymax - ymin, 1e-12)
+    n_cells = np.clip(rows.size / points_per_cell, 1, 2**22)
+    nx = int(np.clip(np.sqrt(n_cells * width / height), 1, 2**12))
+    ny = int(np.clip(n_cells / nx, 1, 2**12))
+    grid = (xmin, ymin, nx / width, ny / height, nx, ny)
+
+    classes = _polygon_cell_classes(edges, grid, 0, nx - 1, 0, ny - 1)
+
+    cell = SpatialIndex._cell_coords
+    cells = cell(ys, ymin, grid[3], ny)
+    cells *= nx
+    cells += cell(xs, xmin, grid[2], nx)
+    point_classes = classes.reshape(-1)[cells]
+
+    inside = point_classes == 1
+    test = np.flatnonzero(point_classes == 2)
+    inside[test] = _crossing_parity(xs[test], ys[test], edges)
+
+    return rows[inside]
+
+
+class SpatialIndex:
+    def __init__(
+        self,
+        positions: np.ndarray,
+        points_per_cell: int = 16,
+        rebuild_fraction: float = 0.05,
+        background: bool = True,
+    ):
+        """
+        Uniform grid over the x and y values of points, used to query the points within a rectangle or radius and
+        the nearest points without a GPU pick pass. The points are sorted by grid cell, the points of a range of
+        cells along x are a contiguous slice of the sorted indices.
+
+        The grid is built in a background thread, queries test all points until it is ready. Rows that are
+        written after the grid is built are marked with :meth:`mark_dirty`, they are excluded from the grid and
+        tested individually until the grid is rebuilt. The grid is rebuilt in the background once more than
+        ``rebuild_fraction`` of the points are dirty.
+
+        Parameters
+        ----------
+        positions: np.ndarray
+            [n_points, 2] or [n_points, 3] array of the points, not copied, only x and y are indexed.
+            Points with non-finite x or y are never returned.
+
+        points_per_cell: int, default 16
+            average number of points per grid cell
+
+        rebuild_fraction: float, default 0.05
+            rebuild the grid once this fraction of the points is dirty
+
+        background: bool, default True
+            build the grid in a background thread, if ``False`` the grid is built before returning
+
+        """
+        positions = np.asarray(positions)
+
+        if positions.ndim != 2 or positions.shape[1] not in (2, 3):
+            raise ValueError(
+                f"positions must be of shape [n_points, 2] or [n_points, 3], you passed an array with shape: "
+                f"{positions.shape}"
+            )
+
+        self._positions = positions
+        self._points_per_cell = points_per_cell
+        self._rebuild_fraction = rebuild_fraction
+        self._background = background
+
+        # (x0, y0, inverse cell width, inverse cell height, nx, ny, sorted indices, start of each cell)
+        self._grid: tuple | None = None
+
+        n = positions.shape[0]
+        self._dirty = np.zeros(n, dtype=bool)
+        self._dirty_rows: np.ndarray | None = np.zeros(0, dtype=np.int64)
+        self._n_dirty = 0
+
+        # rows written while the grid is being built, they are dirty in the new grid
+        self._building_dirty: np.ndarray | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+        self.rebuild()
+
+    @property
+    def ready(self) -> bool:
+        """``True`` once the grid has been built, queries test all points until then"""
+        return self._grid is not None
+
+    @property
+    def n_dirty(self) -> int:
+        """number of points that were written after the grid was built"""
+        return self._n_dirty
+
+    def wait(self, timeout: float = None):
+        """wait for the grid to finish building"""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def rebuild(self):
+        """build the grid again from the current positions, in a background thread if ``background`` is set"""
+        with self._lock:
+            if self._building_dirty is not None:
+                # already building, rows written since then are dirty in the new grid
+                return
+            self._building_dirty = np.zeros(self._positions.shape[0], dtype=bool)
+
+        if not self._background:
+            self._build()
+            return
+
+        self._thread = threading.Thread(target=self._build, daemon=True)
+        self._thread.start()
+
+    def mark_dirty(self, rows: int | slice | np.ndarray):
+        """
+        Mark rows of the positions as written, they are tested individually until the grid is rebuilt.
+
+        Parameters
+        ----------
+        rows: int, slice, or array
+            rows that were written, any key that indexes the first dimension of the positions
+
+        """
+        with self._lock:
+            if self._building_dirty is not None:
+                self._building_dirty[rows] = True
+
+            self._dirty[rows] = True
+            self._dirty_rows = None
+            n_dirty = self._n_dirty = int(np.count_nonzero(self._dirty))
+
+        if n_dirty > self._rebuild_fraction * self._dirty.size:
+            self.rebuild()
+
+    def _build(self):
+        positions = self._positions
+        n = positions.shape[0]
+
+        # finite bounds of the points
+        x0, y0, x1, y1 = np.inf, np.inf, -np.inf, -np.inf
+        for chunk in self._chunks(n):
+            xy = positions[chunk, :2]
+            finite = np.isfinite(xy).all(axis=1)
+            if finite.any():
+                xy = xy[finite]
+                x0, y0 = min(x0, xy[:, 0].min()), min(y0, xy[:, 1].min())
+                x1, y1 = max(x1, xy[:, 0].max()), max(y1, xy[:, 1].max())
+
+        if not np.isfinite(x0):
+            x0, y0, x1, y1 = 0.0, 0.0, 1.0, 1.0
+
+        # cells with the aspect ratio of the bounds, ~points_per_cell points per cell
+        width, height = max(float(x1 - x0), 1e-12), max(float(y1 - y0), 1e-12)
+        n_cells = max(n / self._points_per_cell, 1)
+        nx = int(np.clip(np.sqrt(n_cells * width / height), 1, 2**15))
+        ny = int(np.clip(n_cells / nx, 1, 2**15))
+        inv_w, inv_h = nx / width, ny / height
+
+        # non-finite points are sorted after all cells
+        cells = np.empty(n, dtype=np.int32 if nx * ny < 2**31 - 1 else np.int64)
+        for chunk in self._chunks(n):
+            cells[chunk] = self._cells(
+                positions[chunk, :2], x0, y0, inv_w, inv_h, nx, ny
+            )
+
+        # the order within a cell does not matter, query results are sorted
+        order = np.argsort(cells).astype(np.int32 if n < 2**31 else np.int64)
+        starts = np.zeros(nx * ny + 2, dtype=np.int64)
+        np.cumsum(np.bincount(cells, minlength=nx * ny + 1), out=starts[1:])
+
+        with self._lock:
+            self._grid = (x0, y0, inv_w, inv_h, nx, ny, order, starts)
+            self._dirty = self._building_dirty
+            self._dirty_rows = None
+            self._n_dirty = int(np.count_nonzero(self._dirty))
+            self._building_dirty = None
+
+    @staticmethod
+    def _chunks(n: int, size: int = 2**20):
+        for start in range(0, n, size):
+            yield slice(start, min(start + size, n))
+
+    @staticmethod
+    def _cell_coords(values, origin, inverse_size, n_cells) -> np.ndarray:
+        # same float64 computation for the points and the queries, so a point in a cell that is between the
+        # cells of two query bounds is always within the bounds
+        coords = np.subtract(values, origin, dtype=np.float64)
+        coords *= inverse_size
+        np.floor(coords, out=coords)
+        np.clip(coords, 0, n_cells - 1, out=coords)
+        # non-finite values are replaced by the caller
+        with np.errstate(invalid="ignore"):
+            return coords.astype(np.int64)
+
+    def _cells(self, xy, x0, y0, inv_w, inv_h, nx, ny) -> np.ndarray:
+        cells = self._cell_coords(xy[:, 1], y0, inv_h, ny)
+        cells *= nx
+        cells += self._cell_coords(xy[:, 0], x0, inv_w, nx)
+        cells[~np.isfinite(xy).all(axis=1)] = nx * ny
+        return cells
+
+    def _get_dirty_rows(self) -> np.ndarray:
+        with self._lock:
+            if self._dirty_rows is None:
+                self._dirty_rows = np.flatnonzero(self._dirty)
+            return self._dirty_rows
+
+    def _ranges(self, order: np.ndarray, starts: np.ndarray, stops: np.ndarray):
+        """concatenated ``order[start:stop]`` slices"""
+        lengths = stops - starts
+        keep = lengths > 0
+        starts, lengths = starts[keep], lengths[keep]
+
+        return order[_expand_ranges(starts, lengths)]
+
+    def _sorted(self, indices: np.ndarray) -> np.ndarray:
+        # sorting the int32 indices of the grid is ~2x faster than int64
+        dtype = self._grid[6].dtype
+        return np.sort(indices.astype(dtype, copy=False)).astype(np.int64)
+
+    def _in_rect(self, rows, xmin, xmax, ymin, ymax) -> np.ndarray:
+        """``rows`` within the rectangle, all rows if ``None``"""
+        xy = self._positions[:, :2] if rows is None else self._positions[rows, :2]
+        inside = (
+            (xy[:, 0] >= xmin)
+            & (xy[:, 0] <= xmax)
+            & (xy[:, 1] >= ymin)
+            & (xy[:, 1] <= ymax)
+        )
+        return np.flatnonzero(inside) if rows is None else rows[inside]
+
+    def query_rect(
+        self, xmin: float, xmax: float, ymin: float, ymax: float
+    ) -> np.ndarray:
+        """
+        Indices of the points within a rectangle, bounds included.
+
+        Parameters
+        ----------
+        xmin, xmax, ymin, ymax: float
+            bounds of the rectangle
+
+        Returns
+        -------
+        np.ndarray
+            sorted indices of the points within the rectangle
+
+        """
+        grid = self._grid
+
+        if grid is None:
+            # not built yet
+            return self._in_rect(None, xmin, xmax, ymin, ymax)
+
+        if xmin > xmax or ymin > ymax:
+            return np.zeros(0, dtype=np.int64)
+
+        x0, y0, inv_w, inv_h, nx, ny, order, starts = grid
+
+        cx0, cx1 = self._cell_coords([xmin, xmax], x0, inv_w, nx)
+        cy0, cy1 = self._cell_coords([ymin, ymax], y0, inv_h, ny)
+
+        rows = np.arange(cy0, cy1 + 1, dtype=np.int64) * nx
+
+        n_candidates = starts[rows + cx1 + 1].sum() - starts[rows + cx0].sum()
+        if n_candidates > self._positions.shape[0] // 8:
+            # testing all points is faster than gathering the points of the cells for large selections
+            return self._in_rect(None, xmin, xmax, ymin, ymax)
+
+        # cells between the cells of the bounds are entirely within the rectangle, interior rows are tested
+        # only in their first and last cell, the first and last row are tested in all cells
+        interior = rows[1:-1]
+        accepted = self._ranges(
+            order, starts[interior + cx0 + 1], starts[interior + cx1]
+        )
+
+        edge_rows = rows[[0, -1]] if rows.size > 1 else rows
+        # first and last cell of the interior rows, once if they are the same cell
+        edge_cells = [cx0] if cx0 == cx1 else [cx0, cx1]
+        candidates = self._ranges(
+            order,
+            np.concatenate(
+                [starts[edge_rows + cx0], *(starts[interior + c] for c in edge_cells)]
+            ),
+            np.concatenate(
+                [
+                    starts[edge_rows + cx1 + 1],
+                    *(starts[interior + c + 1] for c in edge_cells),
+                ]
+            ),
+        )
+
+        dirty_rows = self._get_dirty_rows()
+        if dirty_rows.size > 0:
+            # dirty points can be in the wrong cell, test them individually
+            dirty = self._dirty
+            accepted = accepted[~dirty[accepted]]
+            candidates = np.concatenate([candidates[~dirty[candidates]], dirty_rows])
+
+        return self._sorted(
+            np.concatenate(
+                [accepted, self._in_rect(candidates, xmin, xmax, ymin, ymax)]
+            )
+        )
+
+    def query_polygon(self, vertices: np.ndarray) -> np.ndarray:
+        """
+        Indices of the points inside a polygon, by the crossing number of a horizontal ray. Cells that are not
+        crossed by an edge of the polygon are entirely selected or rejected, only the points of the cells that
+        are crossed by an edge are tested.
+
+        Parameters
+        ----------
+        vertices: np.ndarray
+            [n_vertices, 2] vertices of the polygon, the polygon is closed from the last to the first vertex
+
+        Returns
+        -------
+        np.ndarray
+            sorted indices of the points inside the polygon
+
+        """
+        grid = self._grid
+        x, y = self._positions[:, 0], self._positions[:, 1]
+
+        if grid is None:
+            # not built yet
+            return points_in_polygon(x, y, vertices)
+
+        edges = polygon_edges(vertices)
+        if edges[0].size == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        x0, y0, inv_w, inv_h, nx, ny, order, starts = grid
+
+        xmin = min(edges[0].min(), edges[2].min())
+        xmax = max(edges[0].max(), edges[2].max())
+        cx0, cx1 = self._cell_coords([xmin, xmax], x0, inv_w, nx)
+        cy0, cy1 = self._cell_coords([edges[1].min(), edges[3].max()], y0, inv_h, ny)
+
+        classes = _polygon_cell_classes(edges, grid, cx0, cx1, cy0, cy1)
+
+        # ids of the cells of each class in the full grid
+        cy, cx = np.nonzero(classes == 1)
+        inside = (cy + cy0) * nx + cx + cx0
+        cy, cx = np.nonzero(classes == 2)
+        crossed = (cy + cy0) * nx + cx + cx0
+
+        accepted = self._ranges(order, starts[inside], starts[inside + 1])
+        candidates = self._ranges(order, starts[crossed], starts[crossed + 1])
+
+        dirty_rows = self._get_dirty_rows()
+        if dirty_rows.size > 0:
+            # dirty points can be in the wrong cell, test them individually
+            dirty = self._dirty
+            accepted = accepted[~dirty[accepted]]
+            candidates = np.concatenate([candidates[~dirty[candidates]], dirty_rows])
+
+        candidates = candidates[_crossing_parity(x[candidates], y[candidates], edges)]
+
+        return self._sorted(np.concatenate([accepted, candidates]))
+
+    def query_radius(self, center: tuple[float, float], radius: float) -> np.ndarray:
+        """
+        Indices of the points within ``radius`` of ``center``.
+
+        Parameters
+        ----------
+        center: (float, float)
+            x and y of the center
+
+        radius: float
+            radius around the center, inclusive
+
+        Returns
+        -------
+        np.ndarray
+            sorted indices of the points within the radius
+
+        """
+        x, y = center[0], center[1]
+        rows = self.query_rect(x - radius, x + radius, y - radius, y + radius)
+
+        xy = self._positions[rows, :2]
+        distance = (xy[:, 0] - x) ** 2 + (xy[:, 1] - y) ** 2
+
+        return rows[distance <= radius**2]
+
+    def nearest(self, point: tuple[float, float], k: int = 1) -> np.ndarray:
+        """
+        Indices of the ``k`` nearest points to ``point``.
+
+        Parameters
+        ----------
+        point: (float, float)
+            x and y of the point
+
+        k: int, default 1
+            number of points
+
+        Returns
+        -------
+        np.ndarray
+            indices of the nearest points, sorted by distance, less than ``k`` if there are less points
+
+        """
+        if k < 1:
+            raise ValueError(f"k must be >= 1, you passed: {k}")
+
+        x, y = float(point[0]), float(point[1])
+        grid = self._grid
+
+        if grid is None:
+            rows = np.arange(self._positions.shape[0])
+        else:
+            x0, y0, inv_w, inv_h, nx, ny = grid[:6]
+            x1, y1 = x0 + nx / inv_w, y0 + ny / inv_h
+
+            # start with the radius that contains ~k points if they are evenly distributed
+            radius = np.sqrt(max(k / self._points_per_cell, 1) / (inv_w * inv_h))
+
+            # distance to the farthest corner of the grid, all points in the grid are within this radius
+            farthest = np.hypot(
+                max(abs(x - x0), abs(x - x1)), max(abs(y - y0), abs(y - y1))
+            )
+
+            while True:
+                rows = self.query_radius((x, y), radius)
+                # the k nearest points are within the radius once it contains k points
+                if rows.size >= k or radius > farthest:
+                    break
+                radius *= 2
+
+            if rows.size < k:
+                # dirty points can be outside the grid
+                rows = np.union1d(rows, self._get_dirty_rows())
+
+        xy = self._positions[rows, :2]
+        distance = (xy[:, 0] - x) ** 2 + (xy[:, 1] - y) ** 2
+
+        finite = np.isfinite(distance)
+        rows, distance = rows[finite], distance[finite]
+
+        if rows.size > k:
+            nearest = np.argpartition(distance, k - 1)[:k]
+            rows, distance = rows[nearest], distance[nearest]
+
+        return rows[np.argsort(distance, kind="stable")]
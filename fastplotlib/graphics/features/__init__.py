@@ -5,6 +5,9 @@ from ._positions_graphics import (
     SizeSpace,
     Thickness,
     VertexPositions,
+    CompactVertexPositions,
+    SegmentPositions,
+    SegmentColors,
     PointsSizesFeature,
     VertexCmap,
 )
@@ -36,8 +39,15 @@ from ._selection_features import (
     LinearRegionSelectionFeature,
     RectangleSelectionFeature,
 )
-from ._common import Name, Offset, Rotation, Visible, Deleted
-
+from ._common import (
+    Name,
+    Offset,
+    Rotation,
+    Visible,
+    Deleted,
+    VertexOffset,
+    VertexVisible,
+)
 
 __all__ = [
     "VertexColors",
@@ -46,6 +56,9 @@ __all__ = [
     "SizeSpace",
     "Thickness",
     "VertexPositions",
+    "CompactVertexPositions",
+    "SegmentPositions",
+    "SegmentColors",
     "PointsSizesFeature",
     "VertexCmap",
     "TextureArray",
@@ -67,5 +80,7 @@ __all__ = [
     "Rotation",
     "Visible",
     "Deleted",
+    "VertexOffset",
+    "VertexVisible",
     "GraphicFeatureEvent",
 ]
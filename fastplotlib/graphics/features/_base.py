@@ -169,11 +169,51 @@ class BufferManager(GraphicFeature):
 
         self._shared: int = 0
 
+        # rows of the buffer managed by this feature, None if it manages the entire buffer
+        self._view: slice | None = None
+
     @property
     def value(self) -> np.ndarray:
         """numpy array object representing the data managed by this buffer"""
+        if self._view is not None:
+            return self.buffer.data[self._view]
+
         return self.buffer.data
 
+    def view(self, start: int, stop: int):
+        """
+        Create a feature of the same type that manages the rows ``start:stop`` of this feature's buffer.
+        The view does not copy any data, indexing and setting the view reads and writes the shared buffer
+        and only the rows of the view are marked for upload to the GPU.
+
+        Parameters
+        ----------
+        start: int
+            first row of the buffer managed by the view
+
+        stop: int
+            stop row, exclusive
+
+        """
+        view = object.__new__(self.__class__)
+        GraphicFeature.__init__(view)
+
+        view._buffer = self.buffer
+        view._shared = 0
+
+        offset = 0 if self._view is None else self._view.start
+        view._view = slice(offset + start, offset + stop)
+
+        return view
+
+    @property
+    def view_range(self) -> tuple[int, int]:
+        """(start, stop) rows of the buffer managed by this feature"""
+        if self._view is None:
+            return 0, self.buffer.data.shape[0]
+
+        return self._view.start, self._view.stop
+
     def set_value(self, graphic, value):
         """Sets values on entire array"""
         self[:] = value
@@ -196,7 +236,7 @@ class BufferManager(GraphicFeature):
         )
 
     def __getitem__(self, item):
-        return self.buffer.data[item]
+        return self.value[item]
 
     def __setitem__(self, key, value):
         raise NotImplementedError
@@ -300,6 +340,10 @@ class BufferManager(GraphicFeature):
             key: int | np.ndarray[int | bool] | slice = key[0]
 
         offset, size = self._parse_offset_size(key, upper_bound)
+
+        if self._view is not None:
+            offset += self._view.start
+
         self.buffer.update_range(offset=offset, size=size)
 
     def _emit_event(self, type: str, key, value):
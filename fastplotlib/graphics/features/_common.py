@@ -27,8 +27,12 @@ class Name(GraphicFeature):
         if graphic._plot_area is not None:
             graphic._plot_area._check_graphic_name_exists(value)
 
+        old_name = self._value
         self._value = value
 
+        if graphic._plot_area is not None:
+            graphic._plot_area._fpl_rename_graphic(graphic, old_name)
+
         event = GraphicFeatureEvent(type="name", info={"value": value})
         self._call_event_handlers(event)
 
@@ -179,3 +183,62 @@ class Deleted(GraphicFeature):
         self._value = value
         event = GraphicFeatureEvent(type="deleted", info={"value": value})
         self._call_event_handlers(event)
+
+
+class VertexOffset(Offset):
+    """
+    Offset of a graphic that shares its world object with other graphics, such as a line in a packed
+    ``LineCollection``. The offset is applied directly to the vertex positions of the graphic in the buffer,
+    the ``data`` of the graphic is a view with this offset and does not include it.
+    """
+
+    def __init__(self, value: np.ndarray | list | tuple):
+        super().__init__(value)
+
+        if isinstance(value, np.ndarray) and value.dtype == np.float64:
+            # use the array without a copy, a collection can keep the offsets of all its graphics in one array
+            self._value = value
+
+    @block_reentrance
+    def set_value(self, graphic, value: np.ndarray | list | tuple):
+        self._validate(value)
+        value = np.asarray(value, dtype=np.float64)
+
+        delta = value - self._value
+        if np.any(delta != 0):
+            graphic.data._move_view(delta)
+
+        self._value[:] = value
+
+        event = GraphicFeatureEvent(type="offset", info={"value": value})
+        self._call_event_handlers(event)
+
+
+class VertexVisible(Visible):
+    """
+    Visibility of a graphic that shares its world object with other graphics, such as a line in a packed
+    ``LineCollection``. Hiding the graphic sets the alpha of its vertex colors to zero, showing the graphic
+    restores the alpha values.
+    """
+
+    def __init__(self, value: bool):
+        super().__init__(value)
+        # alpha values of the vertex colors while the graphic is hidden
+        self._alpha: np.ndarray | None = None
+
+    @block_reentrance
+    def set_value(self, graphic, value: bool):
+        value = bool(value)
+
+        if value != self._value:
+            if value:
+                graphic.colors[:, -1] = self._alpha
+                self._alpha = None
+            else:
+                self._alpha = graphic.colors.value[:, -1].copy()
+                graphic.colors[:, -1] = 0.0
+
+        self._value = value
+
+        event = GraphicFeatureEvent(type="visible", info={"value": value})
+        self._call_event_handlers(event)
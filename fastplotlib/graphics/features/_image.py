@@ -6,6 +6,7 @@ import numpy as np
 
 import pygfx
 from ._base import GraphicFeature, GraphicFeatureEvent, block_reentrance
+from ._summed_area_table import SummedAreaTable
 
 from ...utils import (
     make_colors,
@@ -72,6 +73,8 @@ class TextureArray(GraphicFeature):
 
         self._shared: int = 0
 
+        self._summed_area_table: SummedAreaTable | None = None
+
     @property
     def value(self) -> np.ndarray:
         return self._value
@@ -103,6 +106,22 @@ class TextureArray(GraphicFeature):
     def shared(self) -> int:
         return self._shared
 
+    @property
+    def summed_area_table(self) -> SummedAreaTable | None:
+        """
+        Get the :class:`SummedAreaTable` of the data, ``None`` if disabled.
+        Set ``True`` or ``False`` to enable or disable it, the tables are built on the first query.
+        """
+        return self._summed_area_table
+
+    @summed_area_table.setter
+    def summed_area_table(self, enable: bool):
+        if enable and self._summed_area_table is None:
+            self._summed_area_table = SummedAreaTable(self.value)
+
+        elif not enable:
+            self._summed_area_table = None
+
     def _fix_data(self, data):
         if data.ndim not in (2, 3):
             raise ValueError(
@@ -150,8 +169,17 @@ class TextureArray(GraphicFeature):
 
     @block_reentrance
     def __setitem__(self, key, value):
+        table = self._summed_area_table
+        if table is not None:
+            # the previous values of the written region are needed to patch the tables
+            region = table.written_region(key)
+            old_values = None if region is None else self.value[region].copy()
+
         self.value[key] = value
 
+        if table is not None:
+            table.mark_written(region, old_values)
+
         for texture in self.buffer.ravel():
             texture.update_range((0, 0, 0), texture.size)
 
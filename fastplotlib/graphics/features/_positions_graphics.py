@@ -1,7 +1,10 @@
+from bisect import bisect_left, bisect_right
+from collections import deque
 from typing import Any
 
 import numpy as np
 import pygfx
+from pygfx.utils import array_from_shadertype
 
 from ...utils import (
     parse_cmap_values,
@@ -16,6 +19,165 @@ from ._base import (
 from .utils import parse_colors
 
 
+def _reduce_points(ufunc: np.ufunc, points: np.ndarray) -> np.ndarray:
+    """reduce [n, k] points along the first axis"""
+    k = points.shape[1]
+    n = points.shape[0] // 1024 * 1024
+
+    if n == 0:
+        return ufunc.reduce(points, axis=0)
+
+    # reducing rows of 1024 contiguous points is much faster than reducing along the first axis
+    blocks = ufunc.reduce(points[:n].reshape(-1, 1024 * k), axis=0).reshape(1024, k)
+
+    return ufunc.reduce(np.concatenate([blocks, points[n:]]), axis=0)
+
+
+def _points_bounds(points: np.ndarray) -> np.ndarray | None:
+    """[2, 3] min and max of the finite coordinates of the points, ``None`` if there are no finite points"""
+    points = points.reshape(-1, points.shape[-1])
+
+    if points.shape[0] == 0:
+        return None
+
+    # fmin and fmax ignore NaNs, which separate the lines of packed collections
+    aabb = np.array(
+        [_reduce_points(np.fmin, points), _reduce_points(np.fmax, points)],
+        dtype=np.float64,
+    )
+
+    if not np.isfinite(aabb).all():
+        # infinite values or coordinates that are NaN for all points
+        points = points[np.isfinite(points).all(axis=1)]
+
+        if points.shape[0] == 0:
+            return None
+
+        aabb = np.array([points.min(axis=0), points.max(axis=0)], dtype=np.float64)
+
+    return aabb
+
+
+def _union_bounds(a: np.ndarray | None, b: np.ndarray | None) -> np.ndarray | None:
+    if a is None:
+        return b
+
+    if b is None:
+        return a
+
+    return np.array([np.minimum(a[0], b[0]), np.maximum(a[1], b[1])])
+
+
+class AxisIndex:
+    def __init__(self, values: np.ndarray):
+        """
+        Index of the values along one axis of the vertex positions, answers range and nearest queries in
+        O(log n). Sorted values are searched directly without a copy, a sorted permutation is built once for
+        values that are not sorted or contain NaNs. NaN values are never returned.
+
+        Parameters
+        ----------
+        values: np.ndarray
+            1D array of the values along the axis, usually a view of a column of the positions buffer
+
+        """
+        # comparisons with NaN are False, so values with NaNs use the permutation
+        if values.size < 2 or bool(np.all(values[1:] >= values[:-1])):
+            self._order = None
+            self._sorted = values
+            self._n = values.size
+        else:
+            order = np.argsort(values, kind="stable")
+            self._sorted = values[order]
+            # NaNs are sorted to the end
+            self._n = int(np.count_nonzero(~np.isnan(self._sorted)))
+            self._order = order.astype(np.int32) if order.size < 2**31 else order
+
+    @property
+    def sorted(self) -> bool:
+        """``True`` if the values are sorted and no permutation was built"""
+        return self._order is None
+
+    def _search(self, value: float, side: str) -> int:
+        if self._sorted.flags.c_contiguous:
+            return int(np.searchsorted(self._sorted[: self._n], value, side=side))
+
+        # searchsorted copies arrays that are not contiguous, such as a column of the positions
+        if side == "left":
+            return bisect_left(self._sorted, value, 0, self._n)
+
+        return bisect_right(self._sorted, value, 0, self._n)
+
+    def searchsorted(self, value: float, side: str = "left") -> int:
+        """position of ``value`` in the sorted finite values, same as ``np.searchsorted`` without copying them"""
+        return self._search(value, side)
+
+    def indices_in_range(self, vmin: float, vmax: float) -> np.ndarray:
+        """sorted indices of the values with ``vmin <= value <= vmax``"""
+        start = self._search(vmin, "left")
+        stop = max(start, self._search(vmax, "right"))
+
+        if self._order is None:
+            return np.arange(start, stop)
+
+        return np.sort(self._order[start:stop])
+
+    def nearest(self, value: float) -> int:
+        """index of the finite value closest to ``value``"""
+        if self._n == 0:
+            raise ValueError(
+                "cannot find the nearest value, there are no finite values along the axis"
+            )
+
+        i = self._search(value, "left")
+
+        if i == self._n or (
+            i > 0 and value - self._sorted[i - 1] < self._sorted[i] - value
+        ):
+            i -= 1
+
+        if self._order is None:
+            return i
+
+        return int(self._order[i])
+
+
+def _key_range(key, n: int) -> tuple[int, int]:
+    """(first, stop) of the smallest range of rows that contains the rows in ``key``, first == stop if empty"""
+    if isinstance(key, slice):
+        indices = range(*key.indices(n))
+
+        if len(indices) == 0:
+            return 0, 0
+
+        return min(indices[0], indices[-1]), max(indices[0], indices[-1]) + 1
+
+    indices = np.atleast_1d(np.asarray(key))
+
+    if indices.dtype == bool:
+        indices = np.flatnonzero(indices)
+
+    if indices.size == 0 or n == 0:
+        return 0, 0
+
+    indices = indices % n
+    return int(indices.min()), int(indices.max()) + 1
+
+
+def _segment_rows(feature: BufferManager, key) -> tuple[int, int] | None:
+    """offset and size of the buffer rows of the segments in ``key``, each segment is two consecutive rows"""
+    if isinstance(key, tuple):
+        key = key[0]
+
+    offset_size = feature._parse_offset_size(key, len(feature))
+
+    if offset_size is None:
+        return None
+
+    offset, size = offset_size
+    return feature.view_range[0] + 2 * int(offset), 2 * int(size)
+
+
 class VertexColors(BufferManager):
     property_name = "colors"
     event_info_spec = [
@@ -105,10 +267,10 @@ class VertexColors(BufferManager):
 
             if key.dtype == bool:
                 # make sure len is same
-                if not key.size == self.buffer.data.shape[0]:
+                if not key.size == self.value.shape[0]:
                     raise IndexError(
                         f"Length of array for fancy indexing must match number of datapoints.\n"
-                        f"There are {len(self.buffer.data.shape[0])} datapoints and you have passed {key.size} indices"
+                        f"There are {self.value.shape[0]} datapoints and you have passed {key.size} indices"
                     )
                 n_colors = np.count_nonzero(key)
 
@@ -128,7 +290,7 @@ class VertexColors(BufferManager):
                 f"fancy indexing using an array of integers or bool"
             )
 
-        self.buffer.data[key] = value
+        self.value[key] = value
 
         self._update_range(key)
 
@@ -145,7 +307,7 @@ class VertexColors(BufferManager):
         self._call_event_handlers(event)
 
     def __len__(self):
-        return len(self.buffer.data)
+        return len(self.value)
 
 
 class UniformColor(GraphicFeature):
@@ -259,6 +421,25 @@ class VertexPositions(BufferManager):
         },
     ]
 
+    # class attributes so that views, which are created without __init__, also have them
+    # cached bounds and the version (see `_version()`) at which they are valid, None if they must be recomputed
+    _bounds: np.ndarray | None = None
+    _bounds_version: tuple | None = None
+    # feature that this feature is a view of
+    _bounds_parent: "VertexPositions" = None
+    # AxisIndex of each dimension that was queried and the version at which it is valid
+    _axis_indices: dict[int, tuple[tuple, AxisIndex]] | None = None
+    # incremented every time the positions are written, the buffer revision does not change when the buffer
+    # is written again before a pending full upload
+    _n_writes: int = 0
+    # (write number, start, stop) of the last rows of the buffer that were written through this feature or its
+    # views, views check it to only invalidate their cached values when their own rows were written
+    _write_log: deque | None = None
+    _write_log_size: int = 64
+    # offset that is included in the rows of the buffer managed by a view, such as the offset of a line in a
+    # packed collection. `value` is without the offset and the offset is added to the values that are set
+    _view_offset: np.ndarray | None = None
+
     def __init__(self, data: Any, isolated_buffer: bool = True):
         """
         Manages the vertex positions buffer shown in the graphic.
@@ -268,7 +449,8 @@ class VertexPositions(BufferManager):
         data = self._fix_data(data)
         super().__init__(data, isolated_buffer=isolated_buffer)
 
-    def _fix_data(self, data):
+    @staticmethod
+    def _fix_data(data):
         # data = to_gpu_supported_dtype(data)
 
         if data.ndim == 1:
@@ -293,17 +475,639 @@ class VertexPositions(BufferManager):
         key: int | slice | np.ndarray[int | bool] | tuple[slice, ...],
         value: np.ndarray | float | list[float],
     ):
+        rows = key[0] if isinstance(key, tuple) else key
+        previous = self._bounds_before_set(rows)
+
         # directly use the key to slice the buffer
-        self.buffer.data[key] = value
+        self._write_value(key, value)
 
         # _update_range handles parsing the key to
         # determine offset and size for GPU upload
         self._update_range(key)
 
+        self._bounds_after_set(rows, previous)
+        self._update_axis_indices(
+            key[1] if isinstance(key, tuple) and len(key) > 1 else slice(None)
+        )
+
+        self._emit_event("data", key, value)
+
+    def __len__(self):
+        return self._buffer_value.shape[0]
+
+    @property
+    def value(self) -> np.ndarray:
+        """
+        numpy array of the positions, a view of the buffer. A new array for a view with an offset since the
+        rows of the buffer include the offset.
+        """
+        value = self._buffer_value
+
+        if self._view_offset is not None and self._view_offset.any():
+            return value - self._view_offset.astype(value.dtype)
+
+        return value
+
+    @property
+    def _buffer_value(self) -> np.ndarray:
+        """rows of the buffer managed by this feature, including the offset of a view"""
+        return super().value
+
+    def _write_value(self, key, value):
+        """write ``value`` at ``key`` to the buffer, the offset of a view is added to the values"""
+        if self._view_offset is None:
+            self.value[key] = value
+            return
+
+        buffer_value = self._buffer_value
+        offset = np.broadcast_to(self._view_offset, buffer_value.shape)
+        buffer_value[key] = np.asarray(value) + offset[key]
+
+    def _move_view(self, delta: np.ndarray):
+        """
+        add ``delta`` to the rows of the buffer managed by a view with an offset, used when its offset changes.
+        ``value`` of the view does not change.
+        """
+        self._buffer_value[:] += delta.astype(self._buffer_value.dtype)
+        self._update_range(slice(None))
+
+        if self._bounds_parent is not None:
+            # the values of the view do not change, only the features it is a view of are invalidated
+            start = self.view_range[0]
+            self._bounds_parent._invalidate_bounds(start, start)
+
+    def axis_index(self, dim: int) -> AxisIndex:
+        """
+        :class:`AxisIndex` of the values along dimension ``dim``, used by selectors for range and nearest
+        queries. It is created when it is first used and is kept until the values along ``dim`` are set.
+        """
+        if self._axis_indices is None:
+            self._axis_indices = dict()
+
+        version, index = self._axis_indices.get(dim, (None, None))
+
+        if version != self._version():
+            index = self._make_axis_index(dim)
+            self._axis_indices[dim] = (self._version(), index)
+
+        return index
+
+    def _make_axis_index(self, dim: int) -> AxisIndex:
+        return AxisIndex(self[:, dim])
+
+    def _update_axis_indices(self, columns):
+        """drop the axis indices of the ``columns`` that were set, the others remain valid at the new version"""
+        if not self._axis_indices:
+            return
+
+        written = np.atleast_1d(np.arange(3)[columns])
+
+        for dim, (version, index) in list(self._axis_indices.items()):
+            if dim in written:
+                del self._axis_indices[dim]
+            else:
+                self._axis_indices[dim] = (self._version(), index)
+
+    @property
+    def bounds(self) -> np.ndarray | None:
+        """
+        Bounding box of the points, array of shape [2, 3] with the min and max of x, y and z, NaN values are
+        ignored. ``None`` if there are no finite points. The bounding box is cached and updated from the
+        rows that are set, it is only recomputed from all points when rows on its boundary move inwards.
+        """
+        if self._bounds_version != self._version():
+            self._bounds = self._rows_bounds(slice(None))
+            self._bounds_version = self._version()
+
+        return self._bounds
+
+    def _version(self) -> tuple:
+        """
+        Changes every time the positions are written, used to validate cached values. A view includes the
+        version of its rows in the features it is a view of, which only changes when the shared buffer is
+        written at these rows, writes to other rows do not invalidate the cached values of the view.
+        """
+        parent = self._bounds_parent
+
+        if parent is None:
+            return self.buffer.rev, self._n_writes
+
+        return self._n_writes, parent._rows_version(*self.view_range)
+
+    def _rows_version(self, start: int, stop: int) -> tuple:
+        """
+        Number of the last write to the rows ``start:stop`` of the buffer through this feature and the features
+        it is a view of. When older writes are no longer in the write log the oldest write that is logged is
+        used, so that the version changes whenever the rows might have been written.
+        """
+        version = 0
+
+        if self._write_log:
+            if len(self._write_log) == self._write_log.maxlen:
+                version = self._write_log[0][0]
+
+            for n_write, write_start, write_stop in reversed(self._write_log):
+                if write_start < stop and start < write_stop:
+                    version = n_write
+                    break
+
+        if self._bounds_parent is None:
+            return (version,)
+
+        return (version, *self._bounds_parent._rows_version(start, stop))
+
+    def _record_write(self, start: int, stop: int):
+        """count a write and log the rows ``start:stop`` of the buffer that were written"""
+        self._n_writes += 1
+
+        if start >= stop:
+            return
+
+        if self._write_log is None:
+            self._write_log = deque(maxlen=self._write_log_size)
+
+        self._write_log.append((self._n_writes, start, stop))
+
+    def _written_rows(self, rows) -> tuple[int, int]:
+        """(start, stop) rows of the buffer that are written when ``rows`` of this feature are set"""
+        first, stop = _key_range(rows, len(self))
+        offset = self.view_range[0]
+
+        return offset + first, offset + stop
+
+    def _rows_bounds(self, rows) -> np.ndarray | None:
+        """bounding box of the finite points in ``rows``"""
+        bounds = _points_bounds(self._buffer_value[rows])
+
+        if bounds is None or self._view_offset is None:
+            return bounds
+
+        # from the rows of the buffer without copying them
+        return bounds - self._view_offset
+
+    def view(self, start: int, stop: int, offset: np.ndarray = None):
+        """
+        Create a feature that manages the rows ``start:stop`` of this feature's buffer, see
+        :meth:`BufferManager.view`.
+
+        Parameters
+        ----------
+        start: int
+            first row of the buffer managed by the view
+
+        stop: int
+            stop row, exclusive
+
+        offset: np.ndarray, optional
+            offset of shape [3] that is included in the rows of the buffer, such as the offset of a line in a
+            packed collection. The array is not copied, when it changes the rows must be moved with
+            ``_move_view()``. ``value`` of the view is without the offset and it is added to values that are set.
+
+        """
+        view = super().view(start, stop)
+
+        # setting the view changes the bounds of this feature
+        view._bounds_parent = self
+        view._view_offset = offset
+
+        return view
+
+    def _invalidate_bounds(self, start: int = None, stop: int = None):
+        """
+        Recompute the bounds and axis indices the next time they are used, must be called when the rows
+        ``start:stop`` of the buffer are written to directly, by default all rows of this feature. Other views
+        of the buffer keep their cached values if their rows were not written, ``start == stop`` only
+        invalidates this feature and the features it is a view of.
+        """
+        if start is None:
+            start, stop = self.view_range
+
+        self._bounds_version = None
+        self._axis_indices = None
+        self._record_write(start, stop)
+
+        if self._bounds_parent is not None:
+            self._bounds_parent._invalidate_bounds(start, stop)
+
+    def _bounds_before_set(self, rows) -> tuple[np.ndarray, np.ndarray] | None:
+        """cached bounds and the bounds of ``rows`` before they are set, ``None`` if not useful"""
+        if self._bounds_version != self._version() or (
+            isinstance(rows, slice) and rows == slice(None)
+        ):
+            return None
+
+        return self._bounds, self._rows_bounds(rows)
+
+    def _bounds_after_set(self, rows, previous: tuple[np.ndarray, np.ndarray] | None):
+        """incrementally update the bounds after ``rows`` were set"""
+        start, stop = self._written_rows(rows)
+        self._record_write(start, stop)
+
+        if self._bounds_parent is not None:
+            self._bounds_parent._invalidate_bounds(start, stop)
+
+        if isinstance(rows, slice) and rows == slice(None):
+            # all points were set
+            self._bounds = self._rows_bounds(rows)
+            self._bounds_version = self._version()
+            return
+
+        if previous is None:
+            self._bounds_version = None
+            return
+
+        bounds, old = previous
+        new = self._rows_bounds(rows)
+
+        if bounds is not None and old is not None:
+            new_min = np.full(3, np.inf) if new is None else new[0]
+            new_max = np.full(3, -np.inf) if new is None else new[1]
+
+            # the box shrinks if points that were on its boundary move inwards
+            if ((old[0] <= bounds[0]) & (new_min > bounds[0])).any() or (
+                (old[1] >= bounds[1]) & (new_max < bounds[1])
+            ).any():
+                self._bounds_version = None
+                return
+
+        self._bounds = _union_bounds(bounds, new)
+        self._bounds_version = self._version()
+
+
+class CompactVertexPositions(VertexPositions):
+    def __init__(
+        self,
+        data: Any,
+        x0: float = 0.0,
+        dx: float = 1.0,
+        z: float = 0.0,
+        isolated_buffer: bool = True,
+    ):
+        """
+        Vertex positions of uniformly sampled line data that only stores the y values, one float32 per point.
+        The x values are ``x0 + i * dx`` and z is constant, they are computed in the shader and are not stored
+        in the buffer.
+
+        Parameters
+        ----------
+        data: array-like
+            | 1D array of y values, x is computed from ``x0`` and ``dx``
+            | [n_points, 2] or [n_points, 3] array with uniformly spaced x values and constant z,
+              ``x0``, ``dx`` and ``z`` are determined from the data and the arguments are ignored
+
+        x0: float, default 0.0
+            x value of the first point
+
+        dx: float, default 1.0
+            spacing between points along x, must be positive
+
+        z: float, default 0.0
+            z value of all points
+
+        isolated_buffer: bool, default True
+            copy the y values into a new array that is used as the buffer
+
+        """
+        data = np.asarray(data)
+
+        if data.ndim == 2 and data.shape[1] in (2, 3):
+            x0, dx, z = self._parse_uniform(data)
+            data = data[:, 1]
+
+        elif data.ndim != 1:
+            raise ValueError(
+                f"compact line data must be 1D y values or [n_points, 2 | 3] data with uniformly spaced x, "
+                f"you passed data of shape: {data.shape}"
+            )
+
+        if not dx > 0:
+            raise ValueError(f"`dx` must be positive, you passed: {dx}")
+
+        BufferManager.__init__(
+            self, data.astype(np.float32, copy=False), isolated_buffer=isolated_buffer
+        )
+
+        # uniform buffer that the shader uses to compute x and z
+        self._uniform_buffer = pygfx.Buffer(
+            array_from_shadertype({"x0": "f4", "dx": "f4", "z": "f4"}),
+            force_contiguous=True,
+        )
+
+        self._x0, self._dx, self._z = float(x0), float(dx), float(z)
+        self._uniform_buffer.data["x0"] = self._x0
+        self._uniform_buffer.data["dx"] = self._dx
+        self._uniform_buffer.data["z"] = self._z
+
+    @staticmethod
+    def _parse_uniform(data: np.ndarray) -> tuple[float, float, float]:
+        """x0, dx and z of data with uniformly spaced x and constant z"""
+        x = data[:, 0].astype(np.float64)
+        x0 = x[0]
+        dx = (x[-1] - x0) / max(x.size - 1, 1)
+
+        if not np.allclose(
+            x, x0 + np.arange(x.size) * dx, rtol=1e-5, atol=1e-6 * abs(dx)
+        ):
+            raise ValueError("x values of compact line data must be uniformly spaced")
+
+        z = 0.0
+        if data.shape[1] == 3:
+            z = data[0, 2]
+            if not (data[:, 2] == z).all():
+                raise ValueError("z values of compact line data must be constant")
+
+        return x0, dx, z
+
+    @property
+    def x0(self) -> float:
+        """x value of the first point"""
+        return self._x0
+
+    @property
+    def dx(self) -> float:
+        """spacing between points along x"""
+        return self._dx
+
+    @property
+    def z(self) -> float:
+        """z value of all points"""
+        return self._z
+
+    @property
+    def uniform_buffer(self) -> pygfx.Buffer:
+        """uniform buffer with ``x0``, ``dx`` and ``z`` used by the shader"""
+        return self._uniform_buffer
+
+    @property
+    def y(self) -> np.ndarray:
+        """the y values, view of the buffer"""
+        return self.buffer.data
+
+    @property
+    def x(self) -> np.ndarray:
+        """the x values, computed from ``x0`` and ``dx``"""
+        return (self._x0 + np.arange(len(self)) * self._dx).astype(np.float32)
+
+    @property
+    def value(self) -> np.ndarray:
+        """[n_points, 3] array of the positions, a new array since x and z are not stored"""
+        return self._positions(slice(None))
+
+    def _positions(self, rows) -> np.ndarray:
+        """[x, y, z] positions of the points selected by ``rows``"""
+        y = self.y[rows]
+        x = self._x0 + np.arange(len(self))[rows] * self._dx
+
+        return np.stack([x.astype(np.float32), y, np.full_like(y, self._z)], axis=-1)
+
+    def nearest_index(self, x: float) -> int:
+        """index of the point closest to ``x``"""
+        index = np.floor((x - self._x0) / self._dx + 0.5)
+        return int(np.clip(index, 0, len(self) - 1))
+
+    def indices_in_range(self, xmin: float, xmax: float) -> np.ndarray:
+        """indices of the points with ``xmin <= x <= xmax``"""
+        start = max(int(np.ceil((xmin - self._x0) / self._dx)), 0)
+        stop = min(int(np.floor((xmax - self._x0) / self._dx)) + 1, len(self))
+
+        return np.arange(start, max(start, stop))
+
+    @staticmethod
+    def _split_key(key) -> tuple[Any, Any]:
+        """split a key into the key for the points and the key for the columns"""
+        if isinstance(key, tuple):
+            if len(key) == 1:
+                return key[0], slice(None)
+
+            if len(key) == 2:
+                return key
+
+            raise IndexError(f"too many indices for compact line data: {key}")
+
+        return key, slice(None)
+
+    def __getitem__(self, item):
+        rows, columns = self._split_key(item)
+
+        if np.issubdtype(type(columns), np.integer) and columns % 3 == 1:
+            # only y
+            return self.y[rows]
+
+        return self._positions(rows)[..., columns]
+
+    @block_reentrance
+    def __setitem__(
+        self,
+        key: int | slice | np.ndarray[int | bool] | tuple[slice, ...],
+        value: np.ndarray | float | list[float],
+    ):
+        rows, columns = self._split_key(key)
+        value = np.asarray(value)
+
+        previous = self._bounds_before_set(rows)
+
+        if np.issubdtype(type(columns), np.integer) and columns % 3 == 1:
+            self.y[rows] = value
+
+        elif columns == slice(None):
+            if value.ndim == np.ndim(self.y[rows]) + 1 and value.shape[-1] in (2, 3):
+                # points with x, y (and z), only y is stored
+                self._check_xz(rows, value)
+                self.y[rows] = value[..., 1]
+            else:
+                # y values, for example `line.data = ys`
+                self.y[rows] = value
+
+        else:
+            raise ValueError(
+                "only the y values of compact line data can be set, "
+                "x and z are computed from `x0`, `dx` and `z`"
+            )
+
+        self._update_range(rows)
+
+        self._bounds_after_set(rows, previous)
+        self._update_axis_indices(1)
+
         self._emit_event("data", key, value)
 
+    def _check_xz(self, rows, value: np.ndarray):
+        """raise if the x or z values of points that are set differ from the x and z of the points at ``rows``"""
+        x = self._x0 + np.arange(len(self))[rows] * self._dx
+
+        if not np.allclose(value[..., 0], x, rtol=1e-5, atol=1e-6 * abs(self._dx)):
+            raise ValueError(
+                "x values set on compact line data must be `x0 + i * dx` of the points that are set, "
+                "only the y values are stored"
+            )
+
+        if value.shape[-1] == 3 and not (value[..., 2] == self._z).all():
+            raise ValueError(
+                "z values set on compact line data must be `z`, only the y values are stored"
+            )
+
+    def _rows_bounds(self, rows) -> np.ndarray | None:
+        # from the y values and indices, without creating the [n_points, 3] positions
+        y = np.atleast_1d(self.y[rows])
+        finite = np.isfinite(y)
+
+        if not finite.any():
+            return None
+
+        if isinstance(rows, slice):
+            indices = range(len(self))[rows]
+            first, last = np.argmax(finite), finite.size - 1 - np.argmax(finite[::-1])
+            indices = np.array([indices[first], indices[last]])
+        else:
+            indices = np.atleast_1d(np.arange(len(self))[rows])[finite]
+
+        x = self._x0 + indices * self._dx
+        ymin = np.min(y, where=finite, initial=np.inf)
+        ymax = np.max(y, where=finite, initial=-np.inf)
+
+        return np.array(
+            [[x.min(), ymin, self._z], [x.max(), ymax, self._z]], dtype=np.float64
+        )
+
+    def _update_range(self, key):
+        # same as BufferManager but without computing the [n_points, 3] value
+        self.buffer.update_range(*self._parse_offset_size(key, len(self)))
+
+    def __len__(self):
+        return self.buffer.data.shape[0]
+
+
+class SegmentPositions(VertexPositions):
+    event_info_spec = [
+        {
+            "dict key": "key",
+            "type": "slice, index (int) or numpy-like fancy index",
+            "description": "key at which segments were indexed/sliced",
+        },
+        {
+            "dict key": "value",
+            "type": "int | float | array-like",
+            "description": "new data values for segments that were changed",
+        },
+    ]
+
+    def __init__(self, data: Any, isolated_buffer: bool = True):
+        """
+        Manages the vertex positions of disconnected line segments, ``value`` is of shape [n_segments, 2, 3].
+        The two vertices of a segment are consecutive rows of a single [n_segments * 2, 3] buffer. Keys index
+        the segments, for example ``segments.data[10:20, 1] = [[0, 0, 0]]`` sets the second vertex of 10 segments.
+        """
+        super().__init__(data, isolated_buffer=isolated_buffer)
+
+    @staticmethod
+    def _fix_data(data):
+        data = np.asarray(data)
+
+        if data.ndim != 3 or data.shape[1] != 2 or data.shape[2] not in (2, 3):
+            raise ValueError(
+                f"segments data must be of shape [n_segments, 2, 2 | 3], you passed data of shape: {data.shape}"
+            )
+
+        if data.shape[2] == 2:
+            # zeros for z
+            data = np.concatenate(
+                [data, np.zeros((*data.shape[:2], 1), dtype=data.dtype)], axis=2
+            )
+
+        return to_gpu_supported_dtype(data.reshape(-1, 3))
+
+    @property
+    def value(self) -> np.ndarray:
+        """[n_segments, 2, 3] view of the buffer data"""
+        return super().value.reshape(-1, 2, 3)
+
+    @property
+    def midpoints(self) -> np.ndarray:
+        """midpoints of the segments, array of shape [n_segments, 3]"""
+        value = self.value
+        return (value[:, 0] + value[:, 1]) / 2
+
     def __len__(self):
-        return len(self.buffer.data)
+        return super().__len__() // 2
+
+    def view(self, start: int, stop: int):
+        # segments start:stop are the rows 2 * start:2 * stop
+        return super().view(2 * start, 2 * stop)
+
+    def _written_rows(self, rows) -> tuple[int, int]:
+        # each segment is two rows of the buffer
+        first, stop = _key_range(rows, len(self))
+        offset = self.view_range[0]
+
+        return offset + 2 * first, offset + 2 * stop
+
+    def _make_axis_index(self, dim: int) -> AxisIndex:
+        # segments are indexed by their midpoints
+        return AxisIndex(self.midpoints[:, dim])
+
+    def _update_axis_indices(self, columns):
+        # the midpoints change when any vertex is set
+        self._axis_indices = None
+
+    def _rows_bounds(self, rows) -> np.ndarray | None:
+        return _points_bounds(self.value[rows].reshape(-1, 3))
+
+    def _update_range(self, key):
+        rows = _segment_rows(self, key)
+
+        if rows is not None:
+            self.buffer.update_range(*rows)
+
+
+class SegmentColors(VertexColors):
+    def __init__(
+        self,
+        colors: str | np.ndarray | tuple[float] | list[float] | list[str],
+        n_segments: int,
+        alpha: float = None,
+    ):
+        """
+        Manages the colors of disconnected line segments, one color per segment. ``value`` is of shape
+        [n_segments, RGBA]. The buffer has a row for each vertex, the color of a segment is written to both of
+        its vertices.
+
+        Parameters
+        ----------
+        colors: str | np.ndarray | tuple[float, float, float, float] | list[str] | list[float] | int | float
+            specify colors as a single human-readable string, RGBA array,
+            or an iterable of strings or RGBA arrays
+
+        n_segments: int
+            number of segments
+
+        alpha: float, optional
+            alpha value for the colors
+
+        """
+        data = np.repeat(parse_colors(colors, n_segments, alpha), 2, axis=0)
+
+        BufferManager.__init__(self, data=data, isolated_buffer=False)
+
+    @property
+    def value(self) -> np.ndarray:
+        """[n_segments, RGBA] view of the colors of the first vertex of each segment"""
+        return super().value[::2]
+
+    def view(self, start: int, stop: int):
+        return super().view(2 * start, 2 * stop)
+
+    def _update_range(self, key):
+        rows = _segment_rows(self, key)
+
+        if rows is None:
+            return
+
+        # colors are set on the first vertex of each segment, copy them to the second vertex
+        offset, size = rows
+        data = self.buffer.data
+        data[offset + 1 : offset + size : 2] = data[offset : offset + size : 2]
+
+        self.buffer.update_range(offset, size)
 
 
 class PointsSizesFeature(BufferManager):
@@ -374,13 +1178,13 @@ class PointsSizesFeature(BufferManager):
         value: int | float | np.ndarray | list[int | float] | tuple[int | float],
     ):
         # this is a very simple 1D buffer, no parsing required, directly set buffer
-        self.buffer.data[key] = value
+        self.value[key] = value
         self._update_range(key)
 
         self._emit_event("sizes", key, value)
 
     def __len__(self):
-        return len(self.buffer.data)
+        return len(self.value)
 
 
 class Thickness(GraphicFeature):
@@ -436,6 +1240,9 @@ class VertexCmap(BufferManager):
 
         super().__init__(data=vertex_colors.buffer)
 
+        # manage the same rows as the vertex colors if it is a view into a larger buffer
+        self._view = vertex_colors._view
+
         self._vertex_colors = vertex_colors
         self._cmap_name = cmap_name
         self._transform = transform
@@ -475,7 +1282,7 @@ class VertexCmap(BufferManager):
             )
 
         # parse slice
-        start, stop, step = key.indices(self.value.shape[0])
+        start, stop, step = key.indices(len(self._vertex_colors))
         n_elements = len(range(start, stop, step))
 
         colors = parse_cmap_values(
@@ -514,7 +1321,9 @@ class VertexCmap(BufferManager):
         values = np.asarray(values)
 
         colors = parse_cmap_values(
-            n_colors=self.value.shape[0], cmap_name=self._cmap_name, transform=values
+            n_colors=len(self._vertex_colors),
+            cmap_name=self._cmap_name,
+            transform=values,
         )
 
         colors[:, -1] = self.alpha
@@ -13,6 +13,11 @@ class LinearSelectionFeature(GraphicFeature):
             "type": "float",
             "description": "new x or y value of selection",
         },
+        {
+            "dict key": "final",
+            "type": "bool",
+            "description": "False for events emitted while the selector is dragged, see ``event_policy``",
+        },
     ]
 
     event_extra_attrs = [
@@ -71,7 +76,7 @@ class LinearSelectionFeature(GraphicFeature):
         event = GraphicFeatureEvent("selection", {"value": value})
         event.get_selected_index = selector.get_selected_index
 
-        self._call_event_handlers(event)
+        selector._emit_selection_event(self, event)
 
 
 class LinearRegionSelectionFeature(GraphicFeature):
@@ -81,6 +86,11 @@ class LinearRegionSelectionFeature(GraphicFeature):
             "type": "np.ndarray",
             "description": "new [min, max] of selection",
         },
+        {
+            "dict key": "final",
+            "type": "bool",
+            "description": "False for events emitted while the selector is dragged, see ``event_policy``",
+        },
     ]
 
     event_extra_attrs = [
@@ -185,7 +195,7 @@ class LinearRegionSelectionFeature(GraphicFeature):
         event.get_selected_indices = selector.get_selected_indices
         event.get_selected_data = selector.get_selected_data
 
-        self._call_event_handlers(event)
+        selector._emit_selection_event(self, event)
         # TODO: user's selector event handlers can call event.graphic.get_selected_indices() to get the data index,
         #  and event.graphic.get_selected_data() to get the data under the selection
         #  this is probably a good idea so that the data isn't sliced until it's actually necessary
@@ -198,6 +208,11 @@ class RectangleSelectionFeature(GraphicFeature):
             "type": "np.ndarray",
             "description": "new [xmin, xmax, ymin, ymax] of selection",
         },
+        {
+            "dict key": "final",
+            "type": "bool",
+            "description": "False for events emitted while the selector is dragged, see ``event_policy``",
+        },
     ]
 
     event_extra_attrs = [
@@ -338,5 +353,5 @@ class RectangleSelectionFeature(GraphicFeature):
         event.get_selected_indices = selector.get_selected_indices
         event.get_selected_data = selector.get_selected_data
 
-        # calls any events
-        self._call_event_handlers(event)
+        # calls any events, according to the event policy of the selector
+        selector._emit_selection_event(self, event)
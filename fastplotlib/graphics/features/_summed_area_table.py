@@ -0,0 +1,458 @@
+import threading
+
+import numpy as np
+
+
+def region_stats(values: np.ndarray) -> dict[str, float | int | np.ndarray]:
+    """
+    sum, mean, standard deviation and number of the finite values of a [rows, cols] or [rows, cols, channels]
+    region of an image, computed directly from the values. Each statistic is an array of one value per channel
+    for RGB(A) images.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    finite = np.isfinite(values)
+    count = np.count_nonzero(finite, axis=(0, 1))
+
+    values = np.where(finite, values, 0)
+    total = values.sum(axis=(0, 1))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+        deviations = np.where(finite, values - mean, 0)
+        std = np.sqrt((deviations * deviations).sum(axis=(0, 1)) / count)
+
+    return _stats_dict(total, mean, std, count)
+
+
+def _stats_dict(total, mean, std, count) -> dict[str, float | int | np.ndarray]:
+    if np.ndim(count) == 0:
+        return {
+            "sum": float(total),
+            "mean": float(mean),
+            "std": float(std),
+            "count": int(count),
+        }
+
+    return {"sum": total, "mean": mean, "std": std, "count": count.astype(np.int64)}
+
+
+def _axis_bounds(index, n: int) -> tuple[int, int] | None:
+    """(start, stop) bounds of the elements along an axis of length ``n`` that ``index`` selects"""
+    if isinstance(index, slice):
+        selected = range(*index.indices(n))
+        if len(selected) == 0:
+            return 0, 0
+        return min(selected), max(selected) + 1
+
+    if isinstance(index, (int, np.integer)):
+        i = range(n)[index]
+        return i, i + 1
+
+    index = np.asarray(index)
+    if index.ndim != 1:
+        return None
+
+    if index.dtype == bool:
+        index = np.flatnonzero(index)
+    elif not np.issubdtype(index.dtype, np.integer):
+        return None
+
+    if index.size == 0:
+        return 0, 0
+
+    index = np.where(index < 0, index + n, index)
+    return int(index.min()), int(index.max()) + 1
+
+
+def _rect(table: np.ndarray, r0: int, r1: int, c0: int, c1: int):
+    """sum of the values [r0:r1, c0:c1] from their summed-area ``table``"""
+    return table[r1, c1] - table[r0, c1] - table[r1, c0] + table[r0, c0]
+
+
+class SummedAreaTable:
+    def __init__(
+        self,
+        values: np.ndarray,
+        rebuild_fraction: float = 0.05,
+        max_patches: int = 64,
+        background: bool = True,
+    ):
+        """
+        Summed-area tables (integral images) of the values, squared values and number of finite values of an
+        image. The sum, mean, standard deviation and number of the finite values within any rectangle are computed
+        from 4 elements of each table, independent of the size of the rectangle.
+
+        The tables are built lazily, in a background thread, on the first query. Queries compute the statistics
+        directly from the values until the tables are ready. Writes of small regions are patched: the summed-area
+        tables of the change of the region are kept and added to the queries that overlap it. The tables are
+        rebuilt once the patches cover more than ``rebuild_fraction`` of the image or once there are more than
+        ``max_patches`` patches. Writes of larger regions, such as a new frame, and writes that cannot be patched,
+        such as a write with a 2D mask, make the tables outdated until they are rebuilt on the next query.
+
+        The tables are float64 and have the shape of the image + 1 along rows and columns, the table of the number
+        of finite values is only created if the image has non-finite values. Sums are accumulated relative to the
+        mean of the image, the variance of a rectangle does not lose precision when the mean is large.
+
+        Parameters
+        ----------
+        values: np.ndarray
+            [rows, cols] or [rows, cols, channels] image, not copied. Writes must be marked with
+            :meth:`mark_written`.
+
+        rebuild_fraction: float, default 0.05
+            rebuild the tables once the patches cover this fraction of the image
+
+        max_patches: int, default 64
+            rebuild the tables once there are more patches
+
+        background: bool, default True
+            build the tables in a background thread, if ``False`` the tables are built on the first query before
+            it returns
+
+        """
+        if values.ndim not in (2, 3):
+            raise ValueError(
+                f"values must be of shape [rows, cols] or [rows, cols, channels], you passed an array with shape: "
+                f"{values.shape}"
+            )
+
+        self._values = values
+        self._rebuild_fraction = rebuild_fraction
+        self._max_patches = max_patches
+        self._background = background
+
+        # value that is subtracted before accumulating, one per channel
+        self._shift: np.ndarray | None = None
+
+        # tables are built from a copy of the values at a generation, patches of the writes after that
+        # generation are added to queries, writes that cannot be patched invalidate the older generations
+        self._generation = 0
+        self._valid_generation = 0
+        # (generation, sums, squares, counts or None)
+        self._tables: tuple | None = None
+        # (generation, row, col, sums, squares, counts or None)
+        self._patches: list[tuple] = list()
+
+        self._thread: threading.Thread | None = None
+        self._rebuild_pending = False
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """``True`` once the tables have been built, queries compute the statistics directly until then"""
+        return self._tables is not None
+
+    @property
+    def n_patches(self) -> int:
+        """number of writes that are patched until the tables are rebuilt"""
+        return len(self._patches)
+
+    def wait(self, timeout: float = None):
+        """wait for the tables to finish building"""
+        # a build can start another build if the values were written while building
+        while (thread := self._thread) is not None:
+            thread.join(timeout)
+            if timeout is not None:
+                return
+
+    def rebuild(self):
+        """build the tables again from the current values, in a background thread if ``background`` is set"""
+        with self._lock:
+            if self._thread is not None:
+                # already building, build again once it is done
+                self._rebuild_pending = True
+                return
+
+            if self._shift is None:
+                self._shift = self._mean(self._values)
+
+            self._generation += 1
+            generation = self._generation
+
+            if self._background:
+                # the tables are built from a copy so that writes while building can be patched
+                thread = threading.Thread(
+                    target=self._build_background,
+                    args=(self._values.copy(), generation),
+                    daemon=True,
+                )
+                self._thread = thread
+
+        if self._background:
+            thread.start()
+        else:
+            self._build(self._values, generation)
+
+    def stats(self, rows: slice, cols: slice) -> dict[str, float | int | np.ndarray]:
+        """
+        sum, mean, standard deviation and number of the finite values of ``values[rows, cols]``
+
+        Parameters
+        ----------
+        rows: slice
+            rows of the rectangle, the step must be 1
+
+        cols: slice
+            columns of the rectangle, the step must be 1
+
+        Returns
+        -------
+        dict
+            "sum", "mean", "std" and "count" of the finite values, each is an array of one value per channel for
+            RGB(A) images. The mean and standard deviation are NaN if there are no finite values.
+
+        """
+        r0, r1, step_rows = rows.indices(self._values.shape[0])
+        c0, c1, step_cols = cols.indices(self._values.shape[1])
+
+        if step_rows != 1 or step_cols != 1:
+            raise ValueError("the step of the rows and cols slices must be 1")
+
+        r1, c1 = max(r0, r1), max(c0, c1)
+
+        if self._tables is None and self._thread is None:
+            # built lazily, on the first query after the tables are outdated
+            self.rebuild()
+
+        with self._lock:
+            tables, patches, shift = self._tables, self._patches, self._shift
+
+        if tables is None:
+            return region_stats(self._values[r0:r1, c0:c1])
+
+        _, sums, squares, counts = tables
+        total = _rect(sums, r0, r1, c0, c1)
+        total_squares = _rect(squares, r0, r1, c0, c1)
+        if counts is None:
+            count = np.full(np.shape(total), (r1 - r0) * (c1 - c0), dtype=np.float64)
+        else:
+            count = _rect(counts, r0, r1, c0, c1)
+
+        for _, row, col, p_sums, p_squares, p_counts in patches:
+            # rectangle in the coordinates of the patch
+            h, w = p_sums.shape[0] - 1, p_sums.shape[1] - 1
+            pr0, pr1 = min(max(r0 - row, 0), h), min(max(r1 - row, 0), h)
+            pc0, pc1 = min(max(c0 - col, 0), w), min(max(c1 - col, 0), w)
+
+            if pr0 == pr1 or pc0 == pc1:
+                continue
+
+            total = total + _rect(p_sums, pr0, pr1, pc0, pc1)
+            total_squares = total_squares + _rect(p_squares, pr0, pr1, pc0, pc1)
+            if p_counts is not None:
+                count = count + _rect(p_counts, pr0, pr1, pc0, pc1)
+
+        # counts are exact integers, but sums of float64 can leave a small residual
+        count = np.rint(count)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / count
+            variance = np.maximum(total_squares / count - mean * mean, 0)
+
+            return _stats_dict(
+                np.where(count > 0, total + count * shift, 0),
+                mean + shift,
+                np.sqrt(variance),
+                count,
+            )
+
+    def written_region(self, key) -> tuple[slice, slice] | None:
+        """
+        rows and columns that contain all the elements that a write with ``key`` changes, ``None`` if the write
+        is not patched: if the region is larger than ``rebuild_fraction`` of the image or if it cannot be
+        determined, for example for a 2D mask
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+
+        if len(key) > 0 and key[0] is Ellipsis:
+            key = key[1:] if len(key) == self._values.ndim + 1 else (slice(None),)
+
+        rows = key[0] if len(key) > 0 else slice(None)
+        cols = key[1] if len(key) > 1 else slice(None)
+
+        if rows is Ellipsis:
+            rows = slice(None)
+
+        if cols is Ellipsis:
+            cols = slice(None)
+
+        try:
+            rows = _axis_bounds(rows, self._values.shape[0])
+            cols = _axis_bounds(cols, self._values.shape[1])
+        except (IndexError, TypeError):
+            return None
+
+        if rows is None or cols is None:
+            return None
+
+        size = self._values.shape[0] * self._values.shape[1]
+        if (rows[1] - rows[0]) * (cols[1] - cols[0]) > self._rebuild_fraction * size:
+            return None
+
+        return slice(*rows), slice(*cols)
+
+    def mark_written(
+        self, region: tuple[slice, slice] | None, old_values: np.ndarray | None
+    ):
+        """
+        Mark a region of the values as written, the change of the region is patched.
+
+        Parameters
+        ----------
+        region: (slice, slice) or None
+            rows and columns of the write from :meth:`written_region`, if ``None`` the tables are rebuilt on the
+            next query
+
+        old_values: np.ndarray or None
+            copy of ``values[region]`` before the write
+
+        """
+        with self._lock:
+            building = (
+                self._thread is not None and self._generation >= self._valid_generation
+            )
+
+        if self._tables is None and not building:
+            # not built yet, or outdated and rebuilt on the next query
+            return
+
+        if region is None or old_values is None:
+            self._invalidate()
+            return
+
+        rows, cols = region
+        size = self._values.shape[0] * self._values.shape[1]
+
+        if old_values.size == 0:
+            return
+
+        new_values = self._values[region]
+
+        old_sums, old_squares, old_counts = self._accumulated(old_values, self._shift)
+        new_sums, new_squares, new_counts = self._accumulated(new_values, self._shift)
+        counts = new_counts - old_counts
+        if not counts.any():
+            counts = None
+
+        with self._lock:
+            self._patches = self._patches + [
+                (
+                    self._generation,
+                    rows.start,
+                    cols.start,
+                    self._integral(new_sums - old_sums),
+                    self._integral(new_squares - old_squares),
+                    None if counts is None else self._integral(counts),
+                )
+            ]
+            patched_size = sum(
+                (p[3].shape[0] - 1) * (p[3].shape[1] - 1) for p in self._patches
+            )
+
+        if (
+            len(self._patches) > self._max_patches
+            or patched_size > self._rebuild_fraction * size
+        ):
+            self.rebuild()
+
+    def _invalidate(self):
+        """the tables are outdated, they are rebuilt on the next query"""
+        with self._lock:
+            # builds from copies that were made before this write are outdated
+            self._valid_generation = self._generation + 1
+            self._tables = None
+            self._patches = list()
+            self._rebuild_pending = False
+
+    def _build_background(self, values: np.ndarray, generation: int):
+        try:
+            self._build(values, generation)
+        finally:
+            with self._lock:
+                self._thread = None
+                pending, self._rebuild_pending = self._rebuild_pending, False
+
+            if pending:
+                self.rebuild()
+
+    def _build(self, values: np.ndarray, generation: int):
+        shift = self._shift
+        sums = np.zeros((values.shape[0] + 1, values.shape[1] + 1, *values.shape[2:]))
+        squares = np.zeros_like(sums)
+        counts = None
+
+        # accumulated along columns in chunks of rows, then along rows
+        for chunk in self._chunks(values.shape[0]):
+            rows = slice(chunk.start + 1, chunk.stop + 1)
+
+            chunk_sums, chunk_squares, chunk_counts = self._accumulated(
+                values[chunk], shift
+            )
+            np.cumsum(chunk_sums, axis=1, out=sums[rows, 1:])
+            np.cumsum(chunk_squares, axis=1, out=squares[rows, 1:])
+
+            if counts is None and not chunk_counts.all():
+                counts = np.zeros_like(sums)
+                # previous chunks are all finite
+                counts[1 : chunk.start + 1, 1:] = np.arange(
+                    1, values.shape[1] + 1
+                ).reshape(1, -1, *([1] * (values.ndim - 2)))
+
+            if counts is not None:
+                np.cumsum(chunk_counts, axis=1, out=counts[rows, 1:])
+
+        for table in (sums, squares, counts):
+            if table is None:
+                continue
+
+            for chunk in self._chunks(values.shape[0]):
+                rows = slice(chunk.start + 1, chunk.stop + 1)
+                np.cumsum(table[rows], axis=0, out=table[rows])
+                table[rows] += table[chunk.start]
+
+        with self._lock:
+            if generation < self._valid_generation:
+                # the values were written in a way that cannot be patched while building
+                return
+
+            if self._tables is not None and self._tables[0] > generation:
+                return
+
+            self._tables = (generation, sums, squares, counts)
+            # writes up to this generation are in the tables
+            self._patches = [p for p in self._patches if p[0] >= generation]
+
+    @staticmethod
+    def _accumulated(
+        values: np.ndarray, shift: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """values - shift, their squares and 1 for each finite value, 0 for non-finite values"""
+        values = np.subtract(values, shift, dtype=np.float64)
+        finite = np.isfinite(values)
+        values[~finite] = 0
+
+        return values, values * values, finite.astype(np.float64)
+
+    @staticmethod
+    def _integral(values: np.ndarray) -> np.ndarray:
+        """summed-area table of values, with a row and column of zeros before the first row and column"""
+        table = np.zeros((values.shape[0] + 1, values.shape[1] + 1, *values.shape[2:]))
+        np.cumsum(values, axis=0, out=table[1:, 1:])
+        np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+        return table
+
+    @staticmethod
+    def _mean(values: np.ndarray) -> np.ndarray:
+        """approximate mean of the finite values of each channel, from a subsample"""
+        step = max(int(np.sqrt(values.shape[0] * values.shape[1] / 2**16)), 1)
+        sample = values[::step, ::step].astype(np.float64)
+        finite = np.isfinite(sample)
+        count = np.count_nonzero(finite, axis=(0, 1))
+        total = np.where(finite, sample, 0).sum(axis=(0, 1))
+
+        return np.where(count > 0, total / np.maximum(count, 1), 0)
+
+    @staticmethod
+    def _chunks(n: int, size: int = 2**10):
+        for start in range(0, n, size):
+            yield slice(start, min(start + size, n))
@@ -89,6 +89,7 @@ class ImageGraphic(Graphic):
         interpolation: str = "nearest",
         cmap_interpolation: str = "linear",
         isolated_buffer: bool = True,
+        summed_area_table: bool = False,
         **kwargs,
     ):
         """
@@ -120,6 +121,10 @@ class ImageGraphic(Graphic):
             set the data, useful if the data arrays are ready-only such as memmaps.
             If False, the input array is itself used as the buffer.
 
+        summed_area_table: bool, default False
+            keep summed-area tables of the data, see ``TextureArray.summed_area_table``. Used by
+            ``RectangleSelector.get_selected_stats()`` to compute the statistics of a region in constant time.
+
         kwargs:
             additional keyword arguments passed to Graphic
 
@@ -131,6 +136,7 @@ class ImageGraphic(Graphic):
 
         # texture array that manages the textures on the GPU for displaying this image
         self._data = TextureArray(data, isolated_buffer=isolated_buffer)
+        self._data.summed_area_table = summed_area_table
 
         if (vmin is None) or (vmax is None):
             vmin, vmax = quick_min_max(data)
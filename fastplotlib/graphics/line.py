@@ -4,11 +4,15 @@ import numpy as np
 
 import pygfx
 
+from ._base import PYGFX_EVENTS
+from ._compact_line import CompactLine
+from ._lod import MinMaxPyramid
 from ._positions_base import PositionsGraphic
 from .selectors import LinearRegionSelector, LinearSelector, RectangleSelector
 from .features import (
     Thickness,
     VertexPositions,
+    CompactVertexPositions,
     VertexColors,
     UniformColor,
     VertexCmap,
@@ -37,6 +41,8 @@ class LineGraphic(PositionsGraphic):
         cmap_transform: np.ndarray | Iterable = None,
         isolated_buffer: bool = True,
         size_space: str = "screen",
+        lod: bool = False,
+        compact: bool = False,
         **kwargs,
     ):
         """
@@ -71,11 +77,32 @@ class LineGraphic(PositionsGraphic):
         size_space: str, default "screen"
             coordinate space in which the size is expressed ("screen", "world", "model")
 
+        lod: bool, default False
+            level of detail mode for very long lines, ``data`` must be sorted along x. A min/max pyramid of
+            the y values is computed once, and when the camera changes only the M4 (first, min, max, last)
+            decimation of the data in the visible x-range at the current viewport width in pixels is uploaded
+            to the GPU. The full data remains available in ``data`` and is used for picking and selectors.
+            Setting y values only updates the blocks of the pyramid that contain them, if setting x values
+            leaves the data unsorted along x, level of detail mode is turned off and the full data is shown.
+
+        compact: bool, default False
+            store only the y values of uniformly sampled data, one float per point instead of three. ``data``
+            must be 1D y values, or [n_points, 2 | 3] data with uniformly spaced x and constant z. x is computed
+            in the shader from the first x value and the spacing. Pass a :class:`.CompactVertexPositions` as
+            ``data`` to set the first x value and spacing of 1D data. Only the y values can be set after
+            creation, for example ``line.data[:, 1] = ys``.
+
         **kwargs
             passed to Graphic
 
         """
 
+        if compact and lod:
+            raise ValueError("`compact` and `lod` cannot be used together")
+
+        if compact and not isinstance(data, CompactVertexPositions):
+            data = CompactVertexPositions(data, isolated_buffer=isolated_buffer)
+
         super().__init__(
             data=data,
             colors=colors,
@@ -90,13 +117,27 @@ class LineGraphic(PositionsGraphic):
 
         self._thickness = Thickness(thickness)
 
+        self._lod = lod
+
+        if lod:
+            positions_buffer, colors_buffer = self._init_lod()
+        else:
+            positions_buffer = self._data.buffer
+            colors_buffer = self._colors.buffer if not uniform_color else None
+
         if thickness < 1.1:
             MaterialCls = pygfx.LineThinMaterial
         else:
             MaterialCls = pygfx.LineMaterial
 
+        if self.compact:
+            # pygfx.Geometry requires [n, 3] positions, CompactLine sets the buffer of y values
+            geometry_kwargs = dict()
+        else:
+            geometry_kwargs = dict(positions=positions_buffer)
+
         if uniform_color:
-            geometry = pygfx.Geometry(positions=self._data.buffer)
+            geometry = pygfx.Geometry(**geometry_kwargs)
             material = MaterialCls(
                 thickness=self.thickness,
                 color_mode="uniform",
@@ -111,14 +152,208 @@ class LineGraphic(PositionsGraphic):
                 pick_write=True,
                 thickness_space=self.size_space,
             )
-            geometry = pygfx.Geometry(
-                positions=self._data.buffer, colors=self._colors.buffer
+            geometry = pygfx.Geometry(colors=colors_buffer, **geometry_kwargs)
+
+        if self.compact:
+            world_object = CompactLine(
+                geometry=geometry,
+                material=material,
+                positions=positions_buffer,
+                compact_buffer=self._data.uniform_buffer,
             )
-
-        world_object: pygfx.Line = pygfx.Line(geometry=geometry, material=material)
+        else:
+            world_object: pygfx.Line = pygfx.Line(geometry=geometry, material=material)
 
         self._set_world_object(world_object)
 
+    @property
+    def compact(self) -> bool:
+        """``True`` if only the y values of the data are stored"""
+        return isinstance(self._data, CompactVertexPositions)
+
+    @property
+    def lod(self) -> bool:
+        """``True`` if only the M4 decimation of the visible data is uploaded to the GPU"""
+        return self._lod
+
+    def _init_lod(self) -> tuple[pygfx.Buffer, pygfx.Buffer | None]:
+        """create the min/max pyramid and the buffers for the decimated data shown in the world object"""
+        x = self._data.value[:, 0]
+        if np.any(x[1:] < x[:-1]):
+            raise ValueError("`lod` requires line data that is sorted along x")
+
+        self._lod_pyramid = MinMaxPyramid(self._data.value[:, 1])
+
+        # indices into the full data of the points in the display buffers
+        self._lod_indices = self._lod_decimate(0, self._data.value.shape[0], 2048)
+        # (start, stop, n_buckets) of the last update
+        self._lod_state: tuple[int, int, int] | None = None
+
+        positions = pygfx.Buffer(self._data.value[self._lod_indices])
+
+        if isinstance(self._colors, VertexColors):
+            colors = pygfx.Buffer(self._colors.value[self._lod_indices])
+            self._colors.add_event_handler(self._lod_invalidate)
+        else:
+            colors = None
+
+        self._data.add_event_handler(self._lod_data_changed)
+
+        return positions, colors
+
+    def _lod_decimate(self, start: int, stop: int, n_buckets: int) -> np.ndarray:
+        indices = self._lod_pyramid.decimate(start, stop, n_buckets)
+
+        # keep the first and last points and global extrema so that the bounding box is that of the full data,
+        # they are outside the visible range or already included so they do not change what is rendered
+        n = self._data.value.shape[0]
+        return np.unique(
+            np.concatenate([[0, n - 1], self._lod_pyramid.extrema, indices])
+        )
+
+    def _lod_data_changed(self, ev):
+        if not self.lod:
+            return
+
+        key = ev.info["key"]
+        rows = key[0] if isinstance(key, tuple) else key
+        columns = key[1] if isinstance(key, tuple) and len(key) > 1 else slice(None)
+
+        n = self._data.value.shape[0]
+        if np.issubdtype(type(rows), np.integer):
+            rows = rows % n
+
+        offset, size = self._data._parse_offset_size(rows, n)
+        start, stop = offset, min(offset + size, n)
+
+        written = np.atleast_1d(np.arange(3)[columns])
+
+        if 0 in written:
+            # x must remain sorted, including relative to the points on either side of the changed rows
+            x = self._data.value[max(start - 1, 0) : min(stop + 1, n), 0]
+            if np.any(x[1:] < x[:-1]):
+                self._disable_lod()
+                return
+
+        if 1 in written:
+            self._lod_pyramid.update(start, stop)
+
+        self._lod_invalidate(ev)
+
+    def _disable_lod(self):
+        """show the full data, used when the data is no longer sorted along x"""
+        self._lod = False
+        self._lod_pyramid = None
+
+        geometry = self.world_object.geometry
+        geometry.positions = self._data.buffer
+
+        if isinstance(self._colors, VertexColors):
+            geometry.colors = self._colors.buffer
+
+    def _lod_invalidate(self, ev=None):
+        self._lod_state = None
+
+    def _fpl_add_plot_area_hook(self, plot_area):
+        super()._fpl_add_plot_area_hook(plot_area)
+
+        if self.lod:
+            self._plot_area.add_animations(self._update_lod)
+
+    def _update_lod(self):
+        """upload the decimated data for the visible x-range, called before every render"""
+        if not self.lod:
+            return
+
+        xpos, ypos, width, height = self._plot_area.viewport.rect
+
+        if width < 1:
+            return
+
+        n = self._data.value.shape[0]
+
+        if self._plot_area.camera.fov == 0:
+            left = self._plot_area.map_screen_to_world(
+                (xpos, ypos + height / 2), allow_outside=True
+            )
+            right = self._plot_area.map_screen_to_world(
+                (xpos + width, ypos + height / 2), allow_outside=True
+            )
+
+            # visible x-range in the data space of this line
+            xmin, xmax = sorted((left[0], right[0]))
+            xmin -= self.world_object.world.position[0]
+            xmax -= self.world_object.world.position[0]
+
+            # np.searchsorted would copy and cast the whole x column of the positions every update, the axis
+            # index searches the column in place and is only checked again when x is set
+            index = self._data.axis_index(0)
+
+            if index.sorted:
+                # include one point on either side so that the line continues outside the viewport
+                start = max(index.searchsorted(xmin, side="left") - 1, 0)
+                stop = min(index.searchsorted(xmax, side="right") + 1, n)
+            else:
+                # NaN x values, the positions in the sorted values are not indices
+                start, stop = 0, n
+        else:
+            # perspective projection, use the full range
+            start, stop = 0, n
+
+        state = (start, stop, int(width))
+        if state == self._lod_state:
+            return
+
+        self._lod_state = state
+        self._lod_indices = self._lod_decimate(start, stop, int(width))
+
+        geometry = self.world_object.geometry
+        geometry.positions = self._lod_buffer(
+            geometry.positions, self._data.value, self._lod_indices
+        )
+
+        if isinstance(self._colors, VertexColors):
+            geometry.colors = self._lod_buffer(
+                geometry.colors, self._colors.value, self._lod_indices
+            )
+
+    def _lod_buffer(
+        self, buffer: pygfx.Buffer, values: np.ndarray, indices: np.ndarray
+    ) -> pygfx.Buffer:
+        """write ``values[indices]`` to the display buffer, a larger buffer is only allocated if it does not fit"""
+        size = indices.size
+
+        if buffer.nitems < size:
+            # grow geometrically to avoid reallocating while zooming
+            buffer = pygfx.Buffer(
+                np.zeros(
+                    (max(size, 2 * buffer.nitems), values.shape[1]), dtype=values.dtype
+                )
+            )
+
+        buffer.data[:size] = values[indices]
+        buffer.update_range(0, size)
+        buffer.draw_range = 0, size
+
+        return buffer
+
+    def _handle_event(self, callback, event: pygfx.Event):
+        if self.lod and event.type in PYGFX_EVENTS:
+            pick_info = getattr(event, "pick_info", None)
+            # the same event is passed to every handler, only map the index once
+            if (
+                pick_info is not None
+                and "vertex_index" in pick_info
+                and "display_vertex_index" not in pick_info
+            ):
+                # map the index in the decimated display buffer to the index in the full data
+                pick_info["display_vertex_index"] = pick_info["vertex_index"]
+                pick_info["vertex_index"] = int(
+                    self._lod_indices[pick_info["vertex_index"]]
+                )
+
+        super()._handle_event(callback, event)
+
     @property
     def thickness(self) -> float:
         """line thickness"""
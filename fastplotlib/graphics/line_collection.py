@@ -1,46 +1,205 @@
+from functools import partial
 from typing import *
 
 import numpy as np
+from pylinalg import vec_transform
 
 import pygfx
 
 from ..utils import parse_cmap_values
-from ._collection_base import CollectionIndexer, GraphicCollection, CollectionFeature
+from ._base import Graphic, PYGFX_EVENTS
+from ._collection_base import (
+    CollectionIndexer,
+    GraphicCollection,
+    CollectionFeature,
+    PackedCollectionFeature,
+)
+from .features import (
+    GraphicFeatureEvent,
+    Thickness,
+    VertexPositions,
+    VertexColors,
+    VertexCmap,
+    VertexOffset,
+    VertexVisible,
+)
 from .line import LineGraphic
+from ._segment_bvh import SegmentBVH
 from .selectors import LinearRegionSelector, LinearSelector, RectangleSelector
+from .selectors._collection_queries import _collection_columns
+
+
+class PackedLine(Graphic):
+    _features = {
+        "data": VertexPositions,
+        "colors": VertexColors,
+        "cmap": VertexCmap,
+        "thickness": Thickness,
+    }
+
+    def __init__(
+        self,
+        world_object: pygfx.Line,
+        data: VertexPositions,
+        colors: VertexColors,
+        thickness: Thickness,
+        cmap: str = None,
+        **kwargs,
+    ):
+        """
+        A single line within a packed :class:`.LineCollection`. All lines of a packed collection are stored in
+        one positions buffer and one colors buffer and are rendered by one ``pygfx.Line``, the ``data`` and
+        ``colors`` of a ``PackedLine`` are views into the rows of the packed buffers that belong to this line.
+
+        Since the world object is shared by all lines of the collection:
+
+        | the ``offset`` is applied directly to the vertex positions in the packed buffer, ``data`` does not
+          include the offset, reading it subtracts the offset and setting it adds the offset
+        | ``visible`` is implemented by setting the alpha of the vertex colors to zero
+        | ``thickness`` is shared by all lines in the collection
+        | per-line rotations are not supported
+
+        ``PackedLine`` instances are created by a packed ``LineCollection``, they are not meant to be created
+        directly.
+
+        Parameters
+        ----------
+        world_object: pygfx.Line
+            the world object of the packed collection
+
+        data: VertexPositions
+            view into the packed positions buffer with the offset of the line
+
+        colors: VertexColors
+            view into the packed colors buffer
+
+        thickness: Thickness
+            thickness feature shared by all lines in the collection
+
+        cmap: str, optional
+            name of the cmap that the collection already applied to the ``colors`` of this line
+
+        **kwargs
+            passed to Graphic
+
+        """
+        super().__init__(**kwargs)
+
+        self._data = data
+        self._colors = colors
+        self._cmap = VertexCmap(self._colors, cmap_name=None, transform=None)
+        if cmap is not None:
+            # colors were set from the cmap when the collection was packed
+            self._cmap._cmap_name = cmap
+
+        self._thickness = thickness
+
+        # the collection passes a row of the array that stores the offsets of all its lines, it is not copied
+        self._offset = VertexOffset(kwargs.get("offset", self._offset.value))
+        self._visible = VertexVisible(self._visible.value)
+
+        self._set_world_object(world_object)
+
+    @property
+    def data(self) -> VertexPositions:
+        """Get or set the vertex positions data, view into the packed positions buffer without the offset"""
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data[:] = value
+
+    @property
+    def colors(self) -> VertexColors:
+        """Get or set the colors data, view into the packed colors buffer"""
+        return self._colors
+
+    @colors.setter
+    def colors(self, value: str | np.ndarray | tuple[float] | list[float] | list[str]):
+        self._colors[:] = value
+
+    @property
+    def cmap(self) -> VertexCmap:
+        """Control the cmap, cmap transform, or cmap alpha"""
+        return self._cmap
+
+    @cmap.setter
+    def cmap(self, name: str):
+        self._cmap[:] = name
+
+    @property
+    def thickness(self) -> float:
+        """line thickness, shared by all lines in the packed collection"""
+        return self._thickness.value
+
+    @thickness.setter
+    def thickness(self, value: float):
+        self._thickness.set_value(self, value)
+
+    @property
+    def rotation(self) -> np.ndarray:
+        """Orientation of the line as a quaternion, always the identity for lines in a packed collection"""
+        return self._rotation.value
+
+    @rotation.setter
+    def rotation(self, value: np.ndarray | list | tuple):
+        raise TypeError(
+            "per-line rotations are not supported for lines in a packed LineCollection"
+        )
+
+    def _handle_event(self, callback, event: pygfx.Event):
+        if event.type in PYGFX_EVENTS:
+            # the world object is shared by all lines, only handle events that picked a vertex of this line
+            pick_info = getattr(event, "pick_info", None)
+            if pick_info is not None and "vertex_index" in pick_info:
+                start, stop = self._data.view_range
+                if not start <= pick_info["vertex_index"] < stop:
+                    return
+
+        super()._handle_event(callback, event)
+
+    def _fpl_world_bounds(self) -> None:
+        # the world object is shared by all lines and cannot be culled per line
+        return None
+
+    def _fpl_prepare_del(self):
+        # the world object and plot area are managed by the parent collection
+        self.deleted = True
+        self.clear_event_handlers()
 
 
 class _LineCollectionProperties:
     """Mix-in class for LineCollection properties"""
 
+    def _collection_feature(self, feature: str) -> CollectionFeature:
+        return CollectionFeature(self.graphics, feature)
+
     @property
     def colors(self) -> CollectionFeature:
-        """get or set colors of lines in the collection"""
-        return CollectionFeature(self.graphics, "colors")
+        """
+        get or set colors of lines in the collection. For packed collections with lines of the same length,
+        indexing returns a view of the packed colors buffer of shape [n_lines, n_points, 4].
+        """
+        return self._collection_feature("colors")
 
     @colors.setter
     def colors(self, values: str | np.ndarray | tuple[float] | list[float] | list[str]):
+        feature = self._collection_feature("colors")
+
         if isinstance(values, str):
             # set colors of all lines to one str color
-            for g in self:
-                g.colors = values
+            feature._set_all(values)
             return
 
         elif all(isinstance(v, str) for v in values):
             # individual str colors for each line
-            if not len(values) == len(self):
-                raise IndexError
-
-            for g, v in zip(self.graphics, values):
-                g.colors = v
-
+            feature._set_per_graphic(values)
             return
 
         if isinstance(values, np.ndarray):
             if values.ndim == 2:
                 # assume individual colors for each
-                for g, v in zip(self, values):
-                    g.colors = v
+                feature._set_per_graphic(values)
                 return
 
         elif len(values) == 4:
@@ -49,18 +208,20 @@ class _LineCollectionProperties:
 
         else:
             # assume individual colors for each
-            for g, v in zip(self, values):
-                g.colors = v
+            feature._set_per_graphic(values)
 
     @property
     def data(self) -> CollectionFeature:
-        """get or set data of lines in the collection"""
-        return CollectionFeature(self.graphics, "data")
+        """
+        get or set data of lines in the collection, without the offsets of the lines. For packed collections
+        with lines of the same length, indexing returns a view of the packed positions buffer of shape
+        [n_lines, n_points, 3] if the lines have no offsets, otherwise a copy.
+        """
+        return self._collection_feature("data")
 
     @data.setter
     def data(self, values):
-        for g, v in zip(self, values):
-            g.data = v
+        self._collection_feature("data")._set_per_graphic(values)
 
     @property
     def cmap(self) -> CollectionFeature:
@@ -114,7 +275,32 @@ class _LineCollectionProperties:
 class LineCollectionIndexer(CollectionIndexer, _LineCollectionProperties):
     """Indexer for line collections"""
 
-    pass
+    def _collection_feature(self, feature: str) -> CollectionFeature:
+        if feature in ("data", "colors") and all(
+            isinstance(g, PackedLine) for g in self._selection
+        ):
+            # lines of a packed collection, use a view of the packed buffer if the lines have the same length
+            features = [getattr(g, feature) for g in self._selection]
+            ranges = np.array([fi.view_range for fi in features])
+            n_points = ranges[:, 1] - ranges[:, 0]
+
+            if (n_points == n_points[0]).all() and all(
+                fi.buffer is features[0].buffer for fi in features
+            ):
+                return PackedCollectionFeature(
+                    list(self._selection),
+                    feature,
+                    features[0],
+                    ranges[:, 0],
+                    int(n_points[0]),
+                    offsets=(
+                        np.stack([g.offset for g in self._selection])
+                        if feature == "data"
+                        else None
+                    ),
+                )
+
+        return super()._collection_feature(feature)
 
 
 class LineCollection(GraphicCollection, _LineCollectionProperties):
@@ -136,6 +322,7 @@ class LineCollection(GraphicCollection, _LineCollectionProperties):
         metadatas: Sequence[Any] | np.ndarray = None,
         isolated_buffer: bool = True,
         kwargs_lines: list[dict] = None,
+        packed: bool = False,
         **kwargs,
     ):
         """
@@ -188,12 +375,38 @@ class LineCollection(GraphicCollection, _LineCollectionProperties):
         kwargs_lines: list[dict], optional
             list of kwargs passed to the individual lines, ``len(kwargs_lines)`` must equal ``len(data)``
 
+        packed: bool, default False
+            if ``True``, all lines are stored in a single contiguous positions buffer and colors buffer, separated
+            by a row of NaNs, and the entire collection is rendered with one draw call. The individual lines
+            are :class:`.PackedLine` instances whose ``data`` and ``colors`` are views into the packed buffers,
+            they are only created when they are accessed. Colors and cmaps are resolved for all lines at once
+            and ``data`` arrays of shape [n_lines, n_points] or [n_lines, n_points, xy | xyz] are packed without
+            a python loop over the lines. Useful for collections with a large number of lines. A packed
+            collection has a single ``thickness``, does not support ``uniform_colors`` or ``kwargs_lines``, and
+            lines cannot be added or removed.
+
         kwargs_collection
             kwargs for the collection, passed to GraphicCollection
 
         """
 
-        super().__init__(name=name, metadata=metadata, **kwargs)
+        if packed:
+            if uniform_colors:
+                raise ValueError(
+                    "`uniform_colors` is not supported for packed collections"
+                )
+
+            if kwargs_lines is not None:
+                raise ValueError(
+                    "`kwargs_lines` is not supported for packed collections"
+                )
+
+            if not isinstance(thickness, (float, int)):
+                if len(set(thickness)) > 1:
+                    raise ValueError(
+                        "packed collections must have a single thickness for all lines"
+                    )
+                thickness = thickness[0]
 
         if not isinstance(thickness, (float, int)):
             if len(thickness) != len(data):
@@ -220,8 +433,8 @@ class LineCollection(GraphicCollection, _LineCollectionProperties):
                     f"{len(kwargs_lines)} != {len(data)}"
                 )
 
-        self._cmap_transform = cmap_transform
-        self._cmap_str = cmap
+        # cmap is set to None below if it is a single cmap across lines
+        cmap_str = cmap
 
         # cmap takes priority over colors
         if cmap is not None:
@@ -290,8 +503,35 @@ class LineCollection(GraphicCollection, _LineCollectionProperties):
         if kwargs_lines is None:
             kwargs_lines = dict()
 
+        super().__init__(name=name, metadata=metadata, **kwargs)
+
+        self._packed = packed
+        self._cmap_transform = cmap_transform
+        self._cmap_str = cmap_str
+
+        # segment BVH used by nearest(), created when it is first queried
+        self._segment_bvh: SegmentBVH | None = None
+        # x and y of the points that the BVH was built from, with the offsets of the lines applied
+        self._segment_bvh_xy: tuple[np.ndarray, np.ndarray] | None = None
+        # writes to the packed positions when the BVH was updated, or the lines whose data or offset changed
+        self._segment_bvh_writes: int | None = None
+        self._segment_bvh_dirty: set[int] = set()
+        # (starts, n_points) of the lines in the x and y arrays of the BVH
+        self._segment_bvh_layout: tuple[np.ndarray, np.ndarray] | None = None
+        # (feature, handler) of the lines of a collection that is not packed
+        self._segment_bvh_handlers: list[tuple] = list()
+
+        # handlers of the "pointer_nearest" event
+        self._nearest_handlers: list[callable] = list()
+
         self._set_world_object(pygfx.Group())
 
+        if packed:
+            self._make_packed(
+                data, thickness, colors, single_color, cmap, names, metadatas
+            )
+            return
+
         for i, d in enumerate(data):
             if isinstance(thickness, list):
                 _s = thickness[i]
@@ -333,9 +573,575 @@ class LineCollection(GraphicCollection, _LineCollectionProperties):
 
             self.add_graphic(lg)
 
+    def _make_packed(
+        self, data, thickness, colors, single_color, cmap, names, metadatas
+    ):
+        """pack all lines into one positions and one colors buffer, rendered by a single pygfx.Line"""
+        if isinstance(data, np.ndarray) and data.ndim in (2, 3):
+            positions, n_points = self._pack_array(data)
+        else:
+            positions, n_points = self._pack_list(data)
+
+        # each line is followed by a row of NaNs which breaks the line strip
+        self._packed_stops = np.cumsum(n_points + 1) - 1
+        self._packed_starts = self._packed_stops - n_points
+
+        self._packed_data = VertexPositions(positions, isolated_buffer=False)
+        self._packed_colors = self._pack_colors(colors, single_color, cmap)
+        self._packed_thickness = Thickness(thickness)
+
+        if thickness < 1.1:
+            MaterialCls = pygfx.LineThinMaterial
+        else:
+            MaterialCls = pygfx.LineMaterial
+
+        material = MaterialCls(
+            thickness=thickness,
+            color_mode="vertex",
+            pick_write=True,
+        )
+        geometry = pygfx.Geometry(
+            positions=self._packed_data.buffer, colors=self._packed_colors.buffer
+        )
+
+        self.world_object.add(pygfx.Line(geometry=geometry, material=material))
+
+        # per-line attributes used when the PackedLine is created
+        self._packed_cmaps = cmap
+        self._packed_names = names
+        self._packed_metadatas = metadatas
+        self._packed_offsets = np.zeros((n_points.size, 3))
+        # number of points if all lines have the same length, the packed buffers can then be viewed as
+        # arrays of shape [n_lines, n_points, ...]
+        self._packed_n_points = (
+            int(n_points[0]) if (n_points == n_points[0]).all() else None
+        )
+
+        # PackedLine instances are created when they are first accessed
+        self._graphics = [None] * n_points.size
+        self._graphics_changed = True
+
+    def _pack_array(self, data: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """pack lines of the same length from an array of shape [n_lines, n_points] or [n_lines, n_points, xy | xyz]"""
+        n_lines, n_points = data.shape[:2]
+
+        packed = np.full((n_lines, n_points + 1, 3), np.nan, dtype=np.float32)
+
+        if data.ndim == 2:
+            # y-values
+            packed[:, :-1, 0] = np.arange(n_points)
+            packed[:, :-1, 1] = data
+            packed[:, :-1, 2] = 0
+
+        elif data.shape[2] in (2, 3):
+            packed[:, :-1, : data.shape[2]] = data
+            if data.shape[2] == 2:
+                packed[:, :-1, 2] = 0
+
+        else:
+            raise ValueError(f"Must pass 1D, 2D or 3D data")
+
+        # no separator after the last line
+        return packed.reshape(-1, 3)[:-1], np.full(n_lines, n_points, dtype=np.int64)
+
+    def _pack_list(self, data) -> tuple[np.ndarray, np.ndarray]:
+        """pack a list of lines that can have different lengths"""
+        lines = [VertexPositions._fix_data(np.asarray(d)) for d in data]
+
+        n_points = np.array([line.shape[0] for line in lines], dtype=np.int64)
+
+        positions = np.full(
+            (n_points.sum() + n_points.size - 1, 3), np.nan, dtype=np.float32
+        )
+
+        start = 0
+        for line in lines:
+            positions[start : start + line.shape[0]] = line
+            start += line.shape[0] + 1
+
+        return positions, n_points
+
+    def _pack_colors(self, colors, single_color: bool, cmap) -> VertexColors:
+        """resolve the colors of all lines into one packed colors buffer"""
+        n_rows = self._packed_stops[-1]
+
+        if cmap is None and single_color:
+            return VertexColors(colors, n_colors=n_rows)
+
+        if cmap is None:
+            # one color per line
+            if all(isinstance(c, str) for c in colors):
+                # parse every unique color str once
+                unique, inverse = np.unique(colors, return_inverse=True)
+                parsed = np.array([pygfx.Color(c) for c in unique], dtype=np.float32)
+                line_colors = parsed[inverse]
+            else:
+                # RGBA array for each line
+                line_colors = np.asarray(colors, dtype=np.float32)
+
+            # each line and its separator row
+            n_rows_line = self._packed_stops - self._packed_starts + 1
+            packed = np.repeat(line_colors, n_rows_line, axis=0)[:n_rows]
+
+        else:
+            # a cmap along each line, computed once for every unique cmap and line length
+            packed = np.ones((n_rows, 4), dtype=np.float32)
+
+            groups: dict[tuple[str, int], list[int]] = dict()
+            for i, (name, n) in enumerate(
+                zip(cmap, self._packed_stops - self._packed_starts)
+            ):
+                groups.setdefault((name, int(n)), list()).append(i)
+
+            for (name, n), lines in groups.items():
+                rows = self._packed_starts[lines][:, None] + np.arange(n)
+                packed[rows] = parse_cmap_values(n_colors=n, cmap_name=name)
+
+        return VertexColors(packed, n_colors=n_rows, isolated_buffer=False)
+
+    def _get_line(self, index: int) -> PackedLine:
+        """get a line of a packed collection, the ``PackedLine`` is created when it is first accessed"""
+        line = self._graphics[index]
+
+        if line is not None:
+            return line
+
+        start, stop = self._packed_starts[index], self._packed_stops[index]
+
+        line = PackedLine(
+            self.world_object.children[0],
+            data=self._packed_data.view(
+                start, stop, offset=self._packed_offsets[index]
+            ),
+            colors=self._packed_colors.view(start, stop),
+            thickness=self._packed_thickness,
+            cmap=self._packed_cmaps[index] if self._packed_cmaps is not None else None,
+            name=self._packed_names[index] if self._packed_names is not None else None,
+            metadata=(
+                self._packed_metadatas[index]
+                if self._packed_metadatas is not None
+                else None
+            ),
+            offset=self._packed_offsets[index],
+        )
+
+        if self._plot_area is not None:
+            line._fpl_add_plot_area_hook(self._plot_area)
+
+        self._graphics[index] = line
+
+        return line
+
+    @property
+    def graphics(self) -> np.ndarray[LineGraphic | PackedLine]:
+        """The Graphics within this collection."""
+        if self.packed:
+            return np.asarray([self._get_line(i) for i in range(len(self))])
+
+        return super().graphics
+
+    @property
+    def packed(self) -> bool:
+        """``True`` if all lines are packed into a single buffer and rendered with one draw call"""
+        return self._packed
+
+    def _fpl_bounding_box(self) -> np.ndarray | None:
+        if self.packed:
+            # offsets of packed lines are applied to the packed data
+            return self._fpl_transform_bounds(
+                self._packed_data.bounds, self.world_object.children[0]
+            )
+
+        return super()._fpl_bounding_box()
+
+    def _collection_feature(self, feature: str) -> CollectionFeature:
+        if (
+            self.packed
+            and feature in ("data", "colors")
+            and self._packed_n_points is not None
+        ):
+            return PackedCollectionFeature(
+                self._graphics,
+                feature,
+                getattr(self, f"_packed_{feature}"),
+                self._packed_starts,
+                self._packed_n_points,
+                offsets=self._packed_offsets if feature == "data" else None,
+            )
+
+        return super()._collection_feature(feature)
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """get or set the offset of the individual graphics in the collection"""
+        if self.packed:
+            return self._packed_offsets.copy()
+
+        return super().offsets
+
+    @offsets.setter
+    def offsets(self, values: np.ndarray | list[np.ndarray]):
+        if self.packed:
+            self._set_packed_offsets(values)
+            return
+
+        GraphicCollection.offsets.fset(self, values)
+
+    def _set_packed_offsets(self, values: np.ndarray | list[np.ndarray]):
+        """apply the offsets of all lines to the packed positions in one vectorized operation"""
+        values = np.asarray(values, dtype=np.float64)
+
+        if not values.shape == self._packed_offsets.shape:
+            raise IndexError
+
+        delta = (values - self._packed_offsets).astype(np.float32)
+
+        # offset of each line and its separator row
+        positions = self._packed_data.value
+        n_rows_line = self._packed_stops - self._packed_starts + 1
+        positions += np.repeat(delta, n_rows_line, axis=0)[: positions.shape[0]]
+        self._packed_data.buffer.update_full()
+        # the data of the PackedLine views is without the offsets and does not change
+        self._packed_data._invalidate_bounds(0, 0)
+
+        # the PackedLine offset features are views of these rows
+        self._packed_offsets[:] = values
+
+        changed = np.any(delta != 0, axis=1)
+
+        for line, line_changed in zip(self._graphics, changed):
+            if line is None or not line_changed:
+                continue
+
+            line.data._emit_event("data", slice(None), line.data.value)
+
+            event = GraphicFeatureEvent(type="offset", info={"value": line.offset})
+            line._offset._call_event_handlers(event)
+
+    @property
+    def rotations(self) -> np.ndarray:
+        """get or set the rotation of the individual graphics in the collection"""
+        if self.packed:
+            # per-line rotations are not supported for packed lines
+            return np.tile(np.array([0.0, 0.0, 0.0, 1.0]), (len(self), 1))
+
+        return super().rotations
+
+    @rotations.setter
+    def rotations(self, values: np.ndarray | list[np.ndarray]):
+        GraphicCollection.rotations.fset(self, values)
+
+    @property
+    def visibles(self) -> np.ndarray[bool]:
+        """get or set the offsets of the individual graphics in the collection"""
+        if self.packed:
+            # lines that have not been created are visible
+            visibles = np.ones(len(self), dtype=bool)
+            for i, line in enumerate(self._graphics):
+                if line is not None:
+                    visibles[i] = line.visible
+
+            return visibles
+
+        return super().visibles
+
+    @visibles.setter
+    def visibles(self, values: np.ndarray[bool] | list[bool]):
+        GraphicCollection.visibles.fset(self, values)
+
+    def add_graphic(self, graphic: LineGraphic):
+        if self.packed:
+            raise TypeError("Cannot add lines to a packed LineCollection")
+
+        self._clear_segment_bvh()
+        super().add_graphic(graphic)
+
+    def remove_graphic(self, graphic: LineGraphic):
+        if self.packed:
+            raise TypeError("Cannot remove lines from a packed LineCollection")
+
+        self._clear_segment_bvh()
+        super().remove_graphic(graphic)
+
+    def _clear_segment_bvh(self):
+        """drop the segment BVH, it is rebuilt the next time it is queried"""
+        for feature, handler in self._segment_bvh_handlers:
+            feature.remove_event_handler(handler)
+
+        self._segment_bvh_handlers.clear()
+        self._segment_bvh = None
+        self._segment_bvh_xy = None
+
+    def _segment_bvh_line_changed(self, index: int, ev):
+        self._segment_bvh_dirty.add(index)
+
+    def _get_segment_bvh(self) -> SegmentBVH:
+        """the segment BVH, built when it is first used and refit for the lines that changed since"""
+        if self._segment_bvh is None:
+            columns, starts, n_points = _collection_columns(self, [0, 1])
+            # the BVH keeps references to these arrays, the lines that change are copied into them
+            self._segment_bvh_xy = tuple(np.ascontiguousarray(c) for c in columns)
+            self._segment_bvh = SegmentBVH(*self._segment_bvh_xy, starts, n_points)
+            self._segment_bvh_layout = (starts, n_points)
+            self._segment_bvh_dirty.clear()
+
+            if self.packed:
+                self._segment_bvh_writes = self._packed_data._n_writes
+            else:
+                for i, graphic in enumerate(self._graphics):
+                    handler = partial(self._segment_bvh_line_changed, i)
+                    for feature in (graphic._data, graphic._offset):
+                        feature.add_event_handler(handler)
+                        self._segment_bvh_handlers.append((feature, handler))
+
+            return self._segment_bvh
+
+        x, y = self._segment_bvh_xy
+
+        if self.packed:
+            if self._segment_bvh_writes == self._packed_data._n_writes:
+                return self._segment_bvh
+
+            # the packed buffer can be written through the collection, the lines, or directly, find the rows
+            # that changed by comparing the bits of the values, so that NaN rows that are still NaN are equal
+            positions = self._packed_data.value
+            changed = x.view(np.int32) != positions[:, 0].view(np.int32)
+            changed |= y.view(np.int32) != positions[:, 1].view(np.int32)
+
+            rows = np.flatnonzero(changed)
+            lines = np.unique(
+                np.searchsorted(self._packed_starts, rows, side="right") - 1
+            )
+
+            x[rows] = positions[rows, 0]
+            y[rows] = positions[rows, 1]
+            self._segment_bvh_writes = self._packed_data._n_writes
+
+        else:
+            if len(self._segment_bvh_dirty) == 0:
+                return self._segment_bvh
+
+            lines = np.array(sorted(self._segment_bvh_dirty))
+            self._segment_bvh_dirty.clear()
+
+            starts, n_points = self._segment_bvh_layout
+            for i in lines:
+                graphic = self._graphics[i]
+                points = graphic.data[:]
+
+                if points.shape[0] != n_points[i]:
+                    # the number of points changed, the segments must be sorted again
+                    self._clear_segment_bvh()
+                    return self._get_segment_bvh()
+
+                rows = slice(starts[i], starts[i] + n_points[i])
+                x[rows] = points[:, 0] + graphic.offset[0]
+                y[rows] = points[:, 1] + graphic.offset[1]
+
+        if lines.size > len(self) // 2:
+            self._segment_bvh.refit()
+        elif lines.size > 0:
+            self._segment_bvh.refit(lines)
+
+        return self._segment_bvh
+
+    def _data_space(self) -> pygfx.WorldObject:
+        """world object whose local space is the space of the points returned by ``_collection_columns``"""
+        if self.packed:
+            return self.world_object.children[0]
+
+        return self.world_object
+
+    def nearest(
+        self, position: tuple[float, float] | np.ndarray, k: int = 1
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find the ``k`` lines nearest to a position in the x-y plane. The distance to a line is the distance to
+        its nearest segment.
+
+        The segments of all lines are indexed by a bounding volume hierarchy that is built when this is first
+        called. When the data or offsets of lines change, only the parts of the hierarchy that contain their
+        segments are updated. Per-line rotations are not taken into account.
+
+        Parameters
+        ----------
+        position: (float, float) or np.ndarray
+            (x, y) or (x, y, z) position in world space
+
+        k: int, default 1
+            number of lines
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray, np.ndarray)
+            indices of the lines, index of the nearest segment of each line, segment ``i`` joins the points ``i``
+            and ``i + 1``, and the distances in world units, sorted by distance. Fewer than ``k`` lines are
+            returned if the collection has fewer lines with finite segments.
+
+        """
+        position = np.asarray(position, dtype=np.float64)
+        if position.shape not in [(2,), (3,)]:
+            raise ValueError(
+                f"`position` must be an (x, y) or (x, y, z) position, you passed an array of shape: {position.shape}"
+            )
+        position = np.append(position, np.zeros(3 - position.size))
+        x, y = vec_transform(position, self._data_space().world.inverse_matrix)[:2]
+
+        return self._get_segment_bvh().nearest((x, y), k=k)
+
+    @property
+    def supported_events(self) -> tuple[str]:
+        """events supported by this collection"""
+        return (*super().supported_events, "pointer_nearest")
+
+    def add_event_handler(self, *args):
+        """
+        Register an event handler, see :meth:`.GraphicCollection.add_event_handler`.
+
+        LineCollections also support the ``"pointer_nearest"`` event, it is emitted by the line nearest to the
+        pointer each time the pointer moves within the plot area. The nearest line is found with
+        :meth:`nearest`, ``event.graphic`` is the line and ``event.pick_info`` contains the ``"line_index"``,
+        the ``"segment_index"`` and the ``"distance"`` from the pointer in screen pixels.
+
+        Can also be used as a decorator.
+        """
+        decorating = not callable(args[0])
+        types = args if decorating else args[1:]
+
+        def decorator(_callback):
+            other_types = [t for t in types if t != "pointer_nearest"]
+            if len(other_types) > 0:
+                GraphicCollection.add_event_handler(self, _callback, *other_types)
+
+            if "pointer_nearest" in types and _callback not in self._nearest_handlers:
+                self._nearest_handlers.append(_callback)
+
+                if self._plot_area is not None and len(self._nearest_handlers) == 1:
+                    self._plot_area.renderer.add_event_handler(
+                        self._pointer_nearest, "pointer_move"
+                    )
+
+            return _callback
+
+        if decorating:
+            return decorator
+
+        return decorator(args[0])
+
+    def remove_event_handler(self, callback, *types):
+        other_types = [t for t in types if t != "pointer_nearest"]
+        if len(other_types) > 0:
+            super().remove_event_handler(callback, *other_types)
+
+        if "pointer_nearest" in types:
+            if callback not in self._nearest_handlers:
+                raise KeyError(
+                    f"event type: pointer_nearest with callback: {callback} is not registered"
+                )
+
+            self._nearest_handlers.remove(callback)
+
+            if self._plot_area is not None and len(self._nearest_handlers) == 0:
+                self._plot_area.renderer.remove_event_handler(
+                    self._pointer_nearest, "pointer_move"
+                )
+
+    def clear_event_handlers(self):
+        super().clear_event_handlers()
+
+        for callback in list(self._nearest_handlers):
+            self.remove_event_handler(callback, "pointer_nearest")
+
+    def _pointer_nearest(self, ev: pygfx.PointerEvent):
+        if len(self._nearest_handlers) == 0 or len(self) == 0:
+            return
+
+        plot_area = self._plot_area
+        pointer = plot_area.map_screen_to_world(ev)
+
+        if pointer is None:
+            # outside the viewport
+            return
+
+        # pointer position and the size of a pixel in the data space of the lines
+        inverse = self._data_space().world.inverse_matrix
+        x, y = vec_transform(pointer, inverse)[:2]
+        dx, dy = np.abs(
+            vec_transform(
+                plot_area.map_screen_to_world((ev.x + 1, ev.y + 1), allow_outside=True),
+                inverse,
+            )[:2]
+            - (x, y)
+        )
+
+        if dx == 0 or dy == 0:
+            return
+
+        # distances in screen pixels, the scale of x and y can be different
+        lines, segments, distances = self._get_segment_bvh().nearest(
+            (x, y), scale=(dx, dy)
+        )
+
+        if lines.size == 0:
+            return
+
+        index = int(lines[0])
+        line = self._get_line(index) if self.packed else self._graphics[index]
+
+        event = pygfx.PointerEvent(
+            "pointer_nearest",
+            x=ev.x,
+            y=ev.y,
+            button=ev.button,
+            buttons=ev.buttons,
+            modifiers=ev.modifiers,
+            pick_info={
+                "world_object": line.world_object,
+                "line_index": index,
+                "segment_index": int(segments[0]),
+                "distance": float(distances[0]),
+            },
+        )
+
+        for handler in list(self._nearest_handlers):
+            line._handle_event(handler, event)
+
+    def _fpl_add_plot_area_hook(self, plot_area):
+        super()._fpl_add_plot_area_hook(plot_area)
+
+        if len(self._nearest_handlers) > 0:
+            plot_area.renderer.add_event_handler(self._pointer_nearest, "pointer_move")
+
+    def _fpl_prepare_del(self):
+        if self._plot_area is not None and len(self._nearest_handlers) > 0:
+            self._plot_area.renderer.remove_event_handler(
+                self._pointer_nearest, "pointer_move"
+            )
+
+        self._nearest_handlers.clear()
+        self._clear_segment_bvh()
+
+        super()._fpl_prepare_del()
+
     def __getitem__(self, item) -> LineCollectionIndexer:
+        if self.packed:
+            if np.issubdtype(type(item), np.integer):
+                return self._get_line(item)
+
+            # only create the lines that are selected
+            indices = np.arange(len(self))[item]
+            selection = np.asarray([self._get_line(i) for i in np.atleast_1d(indices)])
+
+            return self._indexer(selection=selection, features=self._features)
+
         return super().__getitem__(item)
 
+    def __next__(self) -> LineGraphic | PackedLine:
+        if self.packed:
+            return self._get_line(next(self._iter))
+
+        return super().__next__()
+
     def add_linear_selector(
         self, selection: float = None, padding: float = 0.0, axis: str = "x", **kwargs
     ) -> LinearSelector:
@@ -461,7 +1267,7 @@ class LineCollection(GraphicCollection, _LineCollectionProperties):
         selection: (float, float, float, float), optional
             initial (xmin, xmax, ymin, ymax) of the selection
         """
-        bbox = self.world_object.get_world_bounding_box()
+        bbox = self._fpl_bounding_box()
 
         xdata = np.array(self.data[:, 0])
         xmin, xmax = (np.nanmin(xdata), np.nanmax(xdata))
@@ -490,7 +1296,7 @@ class LineCollection(GraphicCollection, _LineCollectionProperties):
 
     def _get_linear_selector_init_args(self, axis, padding):
         # use bbox to get size and center
-        bbox = self.world_object.get_world_bounding_box()
+        bbox = self._fpl_bounding_box()
 
         if axis == "x":
             xdata = np.array(self.data[:, 0])
@@ -539,6 +1345,7 @@ class LineStack(LineCollection):
         separation: float = 10.0,
         separation_axis: str = "y",
         kwargs_lines: list[dict] = None,
+        packed: bool = False,
         **kwargs,
     ):
         """
@@ -598,6 +1405,10 @@ class LineStack(LineCollection):
         kwargs_lines: list[dict], optional
             list of kwargs passed to the individual lines, ``len(kwargs_lines)`` must equal ``len(data)``
 
+        packed: bool, default False
+            if ``True``, all lines are stored in a single buffer and rendered with one draw call, see
+            :class:`.LineCollection`. The separation is applied to the vertex positions of each line.
+
         kwargs_collection
             kwargs for the collection, passed to GraphicCollection
 
@@ -615,9 +1426,16 @@ class LineStack(LineCollection):
             metadatas=metadatas,
             isolated_buffer=isolated_buffer,
             kwargs_lines=kwargs_lines,
+            packed=packed,
             **kwargs,
         )
 
+        self.separation = separation
+
+        if packed:
+            self._stack_packed(separation, separation_axis)
+            return
+
         axis_zero = 0
         for i, line in enumerate(self.graphics):
             if separation_axis == "x":
@@ -630,4 +1448,20 @@ class LineStack(LineCollection):
                 axis_zero + line.data.value[:, axes[separation_axis]].max() + separation
             )
 
-        self.separation = separation
+    def _stack_packed(self, separation: float, separation_axis: str):
+        """apply the separation to the vertex positions of all lines in one vectorized operation"""
+        axis = axes[separation_axis]
+        positions = self._packed_data.value
+
+        # max of each line without its offset, fmax ignores the NaN rows that separate the lines
+        line_max = (
+            np.fmax.reduceat(positions[:, axis], self._packed_starts)
+            - self._packed_offsets[:, axis]
+        )
+        axis_zero = np.concatenate(
+            [[0], np.cumsum(line_max.astype(np.float64) + separation)[:-1]]
+        )
+
+        offsets = self.offsets
+        offsets[:, axis] = axis_zero
+        self.offsets = offsets
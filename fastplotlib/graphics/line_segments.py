@@ -0,0 +1,223 @@
+from typing import *
+
+import numpy as np
+
+import pygfx
+
+from ._base import PYGFX_EVENTS
+from ._positions_base import PositionsGraphic
+from .line import LineGraphic
+from .selectors import RectangleSelector
+from .features import (
+    Thickness,
+    SegmentPositions,
+    SegmentColors,
+    UniformColor,
+    VertexCmap,
+    SizeSpace,
+)
+
+
+class LineSegmentsGraphic(PositionsGraphic):
+    _features = {
+        "data": SegmentPositions,
+        "colors": (SegmentColors, UniformColor),
+        "cmap": (VertexCmap, None),  # none if UniformColor
+        "thickness": Thickness,
+        "size_space": SizeSpace,
+    }
+
+    def __init__(
+        self,
+        data: Any,
+        thickness: float = 2.0,
+        colors: str | np.ndarray | Iterable = "w",
+        uniform_color: bool = False,
+        alpha: float = 1.0,
+        cmap: str = None,
+        cmap_transform: np.ndarray | Iterable = None,
+        isolated_buffer: bool = True,
+        size_space: str = "screen",
+        **kwargs,
+    ):
+        """
+        Create a Graphic of disconnected line segments, for example vector fields, graph edges or error bars.
+        All segments are drawn by a single world object from one positions buffer, without a vertex to separate
+        the segments.
+
+        Parameters
+        ----------
+        data: array-like
+            segments data of shape [n_segments, 2, 2] or [n_segments, 2, 3], the start and end point of each segment
+
+        thickness: float, optional, default 2.0
+            thickness of the segments
+
+        colors: str, array, or iterable, default "w"
+            specify colors as a single human-readable string, a single RGBA array,
+            or an iterable of strings or RGBA arrays with one color per segment
+
+        uniform_color: bool, default ``False``
+            if True, uses a uniform buffer for the color of all segments,
+            basically saves GPU VRAM when all segments have a single color
+
+        alpha: float, optional, default 1.0
+            alpha value for the colors
+
+        cmap: str, optional
+            apply a colormap to the segments instead of assigning colors manually, this
+            overrides any argument passed to "colors"
+
+        cmap_transform: 1D array-like of numerical values, optional
+            if provided, these values are used to map the colors from the cmap, one value per segment
+
+        size_space: str, default "screen"
+            coordinate space in which the size is expressed ("screen", "world", "model")
+
+        **kwargs
+            passed to Graphic
+
+        """
+
+        if not isinstance(data, SegmentPositions):
+            data = SegmentPositions(data, isolated_buffer=isolated_buffer)
+
+        if not uniform_color and not isinstance(cmap, VertexCmap):
+            if cmap_transform is not None and cmap is None:
+                raise ValueError("must pass `cmap` if passing `cmap_transform`")
+
+            # one color per segment, the cmap is applied to the segments and not to the vertices
+            cmap = VertexCmap(
+                SegmentColors(colors, n_segments=len(data), alpha=alpha),
+                cmap_name=cmap,
+                transform=cmap_transform,
+                alpha=alpha,
+            )
+            cmap_transform = None
+
+        super().__init__(
+            data=data,
+            colors=colors,
+            uniform_color=uniform_color,
+            alpha=alpha,
+            cmap=cmap,
+            cmap_transform=cmap_transform,
+            isolated_buffer=isolated_buffer,
+            size_space=size_space,
+            **kwargs,
+        )
+
+        self._thickness = Thickness(thickness)
+
+        if thickness < 1.1:
+            MaterialCls = pygfx.LineThinSegmentMaterial
+        else:
+            MaterialCls = pygfx.LineSegmentMaterial
+
+        if uniform_color:
+            geometry = pygfx.Geometry(positions=self._data.buffer)
+            material = MaterialCls(
+                thickness=self.thickness,
+                color_mode="uniform",
+                color=self.colors,
+                pick_write=True,
+                thickness_space=self.size_space,
+            )
+        else:
+            geometry = pygfx.Geometry(
+                positions=self._data.buffer, colors=self._colors.buffer
+            )
+            material = MaterialCls(
+                thickness=self.thickness,
+                color_mode="vertex",
+                pick_write=True,
+                thickness_space=self.size_space,
+            )
+
+        world_object: pygfx.Line = pygfx.Line(geometry=geometry, material=material)
+
+        self._set_world_object(world_object)
+
+    @property
+    def thickness(self) -> float:
+        """thickness of the segments"""
+        return self._thickness.value
+
+    @thickness.setter
+    def thickness(self, value: float):
+        self._thickness.set_value(self, value)
+
+    def _handle_event(self, callback, event: pygfx.Event):
+        if event.type in PYGFX_EVENTS:
+            pick_info = getattr(event, "pick_info", None)
+            if pick_info is not None and "vertex_index" in pick_info:
+                # each segment has two vertices
+                pick_info["segment_index"] = int(pick_info["vertex_index"]) // 2
+
+        super()._handle_event(callback, event)
+
+    # the linear selectors only use the selector init args, which are computed from the bounds of the segments
+    add_linear_selector = LineGraphic.add_linear_selector
+    add_linear_region_selector = LineGraphic.add_linear_region_selector
+
+    def add_rectangle_selector(
+        self,
+        selection: tuple[float, float, float, float] = None,
+        **kwargs,
+    ) -> RectangleSelector:
+        """
+        Add a :class:`.RectangleSelector`, segments are selected by their midpoints.
+
+        Parameters
+        ----------
+        selection: (float, float, float, float), optional
+            initial (xmin, xmax, ymin, ymax) of the selection
+        """
+        (xmin, ymin, _), (xmax, ymax, _) = self._selector_bounds()
+
+        # default selection is 25% of the x range
+        if selection is None:
+            selection = (xmin, xmin + (xmax - xmin) / 4, ymin, ymax)
+
+        # min/max limits
+        limits = (xmin, xmax, ymin * 1.5, ymax * 1.5)
+
+        selector = RectangleSelector(
+            selection=selection,
+            limits=limits,
+            parent=self,
+            **kwargs,
+        )
+
+        self._plot_area.add_graphic(selector, center=False)
+
+        return selector
+
+    def _selector_bounds(self) -> np.ndarray:
+        bounds = self._data.bounds
+
+        if bounds is None:
+            raise ValueError("cannot add a selector to segments without finite data")
+
+        return bounds
+
+    def _get_linear_selector_init_args(
+        self, axis: str, padding
+    ) -> tuple[tuple[float, float], tuple[float, float], float, float]:
+        bounds = self._selector_bounds()
+
+        if axis == "x":
+            axis_vals, magn_vals = bounds[:, 0], bounds[:, 1]
+        elif axis == "y":
+            axis_vals, magn_vals = bounds[:, 1], bounds[:, 0]
+
+        bounds_init = axis_vals[0], axis_vals[0] + (axis_vals[1] - axis_vals[0]) / 4
+        limits = axis_vals[0], axis_vals[1]
+
+        # width or height of selector
+        size = int((magn_vals[1] - magn_vals[0]) * 1.5 + padding)
+
+        # center of selector along the other axis
+        center = (magn_vals[0] + magn_vals[1]) / 2
+
+        return bounds_init, limits, size, center
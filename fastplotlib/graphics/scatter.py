@@ -2,8 +2,11 @@ from typing import *
 
 import numpy as np
 import pygfx
+from pylinalg import vec_transform
 
 from ._positions_base import PositionsGraphic
+from ._spatial_index import SpatialIndex
+from .selectors import RectangleSelector
 from .features import (
     PointsSizesFeature,
     UniformSize,
@@ -14,6 +17,15 @@ from .features import (
     VertexCmap,
 )
 
+# pointer events that are emitted by cpu picking
+CPU_PICK_EVENTS = [
+    "pointer_down",
+    "pointer_move",
+    "pointer_up",
+    "click",
+    "double_click",
+]
+
 
 class ScatterGraphic(PositionsGraphic):
     _features = {
@@ -36,6 +48,8 @@ class ScatterGraphic(PositionsGraphic):
         sizes: float | np.ndarray | Iterable[float] = 1,
         uniform_size: bool = False,
         size_space: str = "screen",
+        spatial_index: bool = False,
+        picking: str = "gpu",
         **kwargs,
     ):
         """
@@ -78,6 +92,16 @@ class ScatterGraphic(PositionsGraphic):
         size_space: str, default "screen"
             coordinate space in which the size is expressed ("screen", "world", "model")
 
+        spatial_index: bool, default False
+            build a :class:`SpatialIndex` of the x and y values of the points in a background thread, used by
+            rectangle selectors and CPU picking. Recommended for large scatters, it is kept up to date when
+            the data is modified.
+
+        picking: str, default "gpu"
+            | "gpu": pointer events are determined by the GPU pick pass
+            | "cpu": pointer events are determined by the spatial index, the nearest point within
+              ``pick_radius`` screen pixels of the pointer is picked, implies ``spatial_index``
+
         kwargs
             passed to Graphic
 
@@ -98,7 +122,21 @@ class ScatterGraphic(PositionsGraphic):
         n_datapoints = self.data.value.shape[0]
 
         geo_kwargs = {"positions": self._data.buffer}
-        material_kwargs = {"pick_write": True}
+        if picking not in ("gpu", "cpu"):
+            raise ValueError(
+                f"`picking` must be one of 'gpu' or 'cpu', you passed: {picking}"
+            )
+
+        self._spatial_index: SpatialIndex | None = None
+        if spatial_index or picking == "cpu":
+            self.spatial_index = True
+
+        self._picking = picking
+        self._pick_radius = 5.0
+        # index of the point under the pointer with cpu picking
+        self._hover_index: int | None = None
+
+        material_kwargs = {"pick_write": picking == "gpu"}
         self._size_space = SizeSpace(size_space)
 
         if uniform_color:
@@ -141,3 +179,201 @@ class ScatterGraphic(PositionsGraphic):
 
         elif isinstance(self._sizes, UniformSize):
             self._sizes.set_value(self, value)
+
+    @property
+    def spatial_index(self) -> SpatialIndex | None:
+        """
+        Get the :class:`SpatialIndex` of the points, ``None`` if disabled.
+        Set ``True`` or ``False`` to enable or disable the spatial index.
+        """
+        return self._spatial_index
+
+    @spatial_index.setter
+    def spatial_index(self, enable: bool):
+        if enable and self._spatial_index is None:
+            self._spatial_index = SpatialIndex(self._data.value)
+            self._data.add_event_handler(self._spatial_index_data_changed)
+
+        elif not enable and self._spatial_index is not None:
+            if self.picking == "cpu":
+                raise ValueError("`picking` 'cpu' requires the spatial index")
+
+            self._data.remove_event_handler(self._spatial_index_data_changed)
+            self._spatial_index = None
+
+    def _spatial_index_data_changed(self, ev):
+        key = ev.info["key"]
+
+        if isinstance(key, tuple):
+            rows = key[0]
+            if len(key) > 1 and not (np.arange(3)[key[1]] < 2).any():
+                # only z was written
+                return
+        else:
+            rows = key
+
+        self._spatial_index.mark_dirty(rows)
+
+    @property
+    def picking(self) -> str:
+        """
+        Get or set how pointer events are determined, "gpu" for the GPU pick pass or "cpu" for the spatial index.
+        With "cpu" the nearest point within ``pick_radius`` screen pixels of the pointer is picked,
+        ``pointer_enter`` and ``pointer_leave`` events are emitted when the picked point changes.
+        """
+        return self._picking
+
+    @picking.setter
+    def picking(self, value: str):
+        if value not in ("gpu", "cpu"):
+            raise ValueError(
+                f"`picking` must be one of 'gpu' or 'cpu', you passed: {value}"
+            )
+
+        if value == "cpu":
+            self.spatial_index = True
+
+        self._picking = value
+        self._hover_index = None
+        self.world_object.material.pick_write = value == "gpu"
+
+        if value == "cpu" and self._plot_area is not None:
+            self._add_cpu_pick_handlers()
+
+    @property
+    def pick_radius(self) -> float:
+        """Get or set the radius in screen pixels around the pointer within which points are picked by cpu picking"""
+        return self._pick_radius
+
+    @pick_radius.setter
+    def pick_radius(self, value: float):
+        self._pick_radius = float(value)
+
+    def _fpl_add_plot_area_hook(self, plot_area):
+        super()._fpl_add_plot_area_hook(plot_area)
+
+        if self.picking == "cpu":
+            self._add_cpu_pick_handlers()
+
+    def _add_cpu_pick_handlers(self):
+        for ev_type in CPU_PICK_EVENTS:
+            self._plot_area.renderer.add_event_handler(self._cpu_pick, ev_type)
+
+    def _pick_nearest(self, ev: pygfx.PointerEvent) -> int | None:
+        """index of the nearest point within ``pick_radius`` screen pixels of the pointer"""
+        plot_area = self._plot_area
+        pointer = plot_area.map_screen_to_world(ev)
+
+        if pointer is None:
+            # outside the viewport
+            return None
+
+        # pointer position and the size of a pixel in the data space of this graphic
+        inverse = self.world_object.world.inverse_matrix
+        x, y = vec_transform(pointer, inverse)[:2]
+        dx, dy = np.abs(
+            vec_transform(
+                plot_area.map_screen_to_world((ev.x + 1, ev.y + 1), allow_outside=True),
+                inverse,
+            )[:2]
+            - (x, y)
+        )
+
+        if dx == 0 or dy == 0:
+            return None
+
+        radius = self._pick_radius
+        rows = self._spatial_index.query_rect(
+            x - radius * dx, x + radius * dx, y - radius * dy, y + radius * dy
+        )
+
+        if rows.size == 0:
+            return None
+
+        # distance in screen pixels, the scale of x and y can be different
+        xy = self._data.value[rows, :2]
+        distance = ((xy[:, 0] - x) / dx) ** 2 + ((xy[:, 1] - y) / dy) ** 2
+        nearest = distance.argmin()
+
+        if distance[nearest] > radius**2:
+            return None
+
+        return int(rows[nearest])
+
+    def _cpu_pick(self, ev: pygfx.PointerEvent):
+        if self.picking != "cpu" or not isinstance(ev, pygfx.PointerEvent):
+            return
+
+        handlers = self.world_object._event_handlers
+        if not any(
+            handlers.get(t) for t in ("pointer_enter", "pointer_leave", ev.type)
+        ):
+            return
+
+        index = self._pick_nearest(ev)
+
+        if ev.type == "pointer_move" and index != self._hover_index:
+            if self._hover_index is not None:
+                self._dispatch_pointer_event("pointer_leave", ev, self._hover_index)
+            if index is not None:
+                self._dispatch_pointer_event("pointer_enter", ev, index)
+            self._hover_index = index
+
+        if index is not None:
+            self._dispatch_pointer_event(ev.type, ev, index)
+
+    def _dispatch_pointer_event(self, ev_type: str, ev: pygfx.PointerEvent, index: int):
+        # same pick info as the GPU pick pass, without the coordinate within the point
+        event = pygfx.PointerEvent(
+            ev_type,
+            x=ev.x,
+            y=ev.y,
+            button=ev.button,
+            buttons=ev.buttons,
+            modifiers=ev.modifiers,
+            clicks=ev.clicks,
+            pick_info={"world_object": self.world_object, "vertex_index": index},
+        )
+        event._target = self.world_object
+
+        for handler in list(self.world_object._event_handlers.get(ev_type, ())):
+            handler(event)
+
+    def add_rectangle_selector(
+        self,
+        selection: tuple[float, float, float, float] = None,
+        **kwargs,
+    ) -> RectangleSelector:
+        """
+        Add a :class:`.RectangleSelector`. Points are selected using the spatial index if it is enabled.
+
+        Parameters
+        ----------
+        selection: (float, float, float, float), optional
+            initial (xmin, xmax, ymin, ymax) of the selection
+        """
+        bounds = self._data.bounds
+
+        if bounds is None:
+            raise ValueError("cannot add a selector to a scatter without finite data")
+
+        (xmin, ymin, _), (xmax, ymax, _) = bounds
+
+        # default selection is 25% of the x range
+        if selection is None:
+            selection = (xmin, xmin + (xmax - xmin) / 4, ymin, ymax)
+
+        # min/max limits, padded along y by half the y range
+        padding = (ymax - ymin) / 2
+        limits = (xmin, xmax, ymin - padding, ymax + padding)
+
+        selector = RectangleSelector(
+            selection=selection,
+            limits=limits,
+            parent=self,
+            **kwargs,
+        )
+
+        self._plot_area.add_graphic(selector, center=False)
+
+        return selector
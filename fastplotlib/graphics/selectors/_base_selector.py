@@ -1,3 +1,6 @@
+import re
+from copy import copy
+from time import perf_counter
 from typing import *
 from dataclasses import dataclass
 from functools import partial
@@ -38,6 +41,10 @@ key_bind_direction = {
 }
 
 
+# "throttle(<milliseconds>)" event policy
+THROTTLE_POLICY = re.compile(r"^throttle\((\d+(?:\.\d+)?)\)$")
+
+
 # Selector base class
 class BaseSelector(Graphic):
     @property
@@ -117,6 +124,7 @@ class BaseSelector(Graphic):
         arrow_keys_modifier: str = None,
         axis: str = None,
         parent: Graphic = None,
+        event_policy: str = "every",
         **kwargs,
     ):
         if edges is None:
@@ -157,7 +165,7 @@ class BaseSelector(Graphic):
         # if not False, moves the slider on every render cycle
         self._key_move_value = False
         self.step: float = 1.0  #: step size for moving selector using the arrow keys
-        self.arrow_key_events_enabled = False
+        self._arrow_key_events_enabled = False
 
         self._move_info: MoveInfo = None
 
@@ -174,8 +182,125 @@ class BaseSelector(Graphic):
 
         self._parent = parent
 
+        # (feature, event) of the latest selection event during a drag that has not been emitted yet
+        self._pending_selection_event = None
+        # (feature, event) of the latest selection event of the current drag, emitted again on release
+        self._drag_selection_event = None
+        self._last_selection_event_time: float = 0.0
+        self.event_policy = event_policy
+
         Graphic.__init__(self, **kwargs)
 
+    @property
+    def arrow_key_events_enabled(self) -> bool:
+        """Get or set whether the selector can be moved using the arrow keys, toggled by double-clicking the selector"""
+        return self._arrow_key_events_enabled
+
+    @arrow_key_events_enabled.setter
+    def arrow_key_events_enabled(self, enabled: bool):
+        self._arrow_key_events_enabled = bool(enabled)
+
+        if not enabled:
+            # stop moving if an arrow key is held
+            self._key_move_value = False
+
+        if self._plot_area is not None:
+            self._plot_area._selector_manager.set_arrow_keys(self, enabled)
+
+    @property
+    def event_policy(self) -> str:
+        """
+        Get or set when "selection" events are emitted while the selector is dragged with the pointer, the selector
+        itself is updated on every pointer move.
+
+        | "every": on every pointer move
+        | "per_frame": the latest selection, at most once per rendered frame
+        | "throttle(ms)": the latest selection, at most once every ``ms`` milliseconds, for example "throttle(50)"
+        | "on_release": only when the pointer is released
+
+        With the policies other than "every", an event with the final selection is emitted when the pointer is
+        released. ``event.info["final"]`` is ``False`` for events emitted during a drag. Selections that are set
+        programmatically or with the arrow keys are always emitted immediately.
+        """
+        return self._event_policy
+
+    @event_policy.setter
+    def event_policy(self, policy: str):
+        throttle = THROTTLE_POLICY.match(policy)
+
+        if throttle is None and policy not in ("every", "per_frame", "on_release"):
+            raise ValueError(
+                f"`event_policy` must be one of 'every', 'per_frame', 'throttle(ms)' or 'on_release', "
+                f"you passed: {policy}"
+            )
+
+        # milliseconds between events, None if not throttled
+        self._throttle_ms = None if throttle is None else float(throttle.group(1))
+        self._event_policy = policy
+
+        # a pending event would be lost when switching to "every"
+        self._flush_selection_event()
+
+    def _emit_selection_event(self, feature, event):
+        """called by the selection feature to emit ``event`` according to the event policy"""
+        dragging = self._moving and self._move_info is not None
+        event.info["final"] = not dragging
+
+        if not dragging or self._event_policy == "every":
+            feature._call_event_handlers(event)
+            return
+
+        self._pending_selection_event = (feature, event)
+        self._drag_selection_event = (feature, event)
+
+        if self._throttle_ms is not None:
+            self._flush_throttled_selection_event()
+
+        if self._pending_selection_event is not None:
+            # emitted on a following render cycle
+            self._plot_area._selector_manager.schedule_selection_event(self)
+
+    def _flush_throttled_selection_event(self):
+        elapsed = (perf_counter() - self._last_selection_event_time) * 1000
+        if elapsed >= self._throttle_ms:
+            self._flush_selection_event()
+
+    def _flush_selection_event(self):
+        if self._pending_selection_event is None:
+            return
+
+        feature, event = self._pending_selection_event
+        self._pending_selection_event = None
+        self._last_selection_event_time = perf_counter()
+
+        feature._call_event_handlers(event)
+
+    def _selection_event_frame(self):
+        """emit the pending selection event of a drag once per frame with the "per_frame" and "throttle" policies"""
+        if self._pending_selection_event is None:
+            return
+
+        if self._event_policy == "per_frame":
+            self._flush_selection_event()
+
+        elif self._throttle_ms is not None:
+            self._flush_throttled_selection_event()
+
+    def _emit_final_selection_event(self):
+        """emit the final selection of a drag on release"""
+        if self._drag_selection_event is None:
+            return
+
+        feature, event = self._drag_selection_event
+        self._drag_selection_event = None
+        self._pending_selection_event = None
+
+        event = copy(event)
+        event.info = {**event.info, "final": True}
+        self._last_selection_event_time = perf_counter()
+
+        feature._call_event_handlers(event)
+
     def get_selected_index(self):
         """Not implemented for this selector"""
         raise NotImplementedError
@@ -216,29 +341,17 @@ class BaseSelector(Graphic):
 
         for fill in self._fill:
             if fill.material.color_is_transparent:
+                # pointer presses on a transparent fill are checked against the fill bounds
                 self._pfunc_fill = partial(self._check_fill_pointer_event, fill)
-                self._plot_area.renderer.add_event_handler(
-                    self._pfunc_fill, "pointer_down"
-                )
-
-        # when the pointer moves
-        self._plot_area.renderer.add_event_handler(self._move, "pointer_move")
-
-        # when the pointer is released
-        self._plot_area.renderer.add_event_handler(self._move_end, "pointer_up")
-
-        # move directly to location of center mouse button click
-        self._plot_area.renderer.add_event_handler(self._move_to_pointer, "click")
 
         # mouse hover color events
         for wo in self._hover_responsive:
             wo.add_event_handler(self._pointer_enter, "pointer_enter")
             wo.add_event_handler(self._pointer_leave, "pointer_leave")
 
-        # arrow key bindings
-        self._plot_area.renderer.add_event_handler(self._key_down, "key_down")
-        self._plot_area.renderer.add_event_handler(self._key_up, "key_up")
-        self._plot_area.add_animations(self._key_hold)
+        # pointer moves and releases during a drag, middle mouse button clicks, arrow keys and render cycles are
+        # dispatched by the manager of the plot area, which only calls the selectors that need the event
+        self._plot_area._selector_manager.add(self)
 
     def _check_fill_pointer_event(self, event_source: WorldObject, ev):
         if self._edge_hovered:
@@ -289,6 +402,7 @@ class BaseSelector(Graphic):
             source=event_source,
         )
         self._moving = True
+        self._plot_area._selector_manager.move_started(self)
 
         self._initial_controller_state = self._plot_area.controller.enabled
 
@@ -330,6 +444,8 @@ class BaseSelector(Graphic):
         self._move_info = None
         self._moving = False
 
+        self._emit_final_selection_event()
+
         # Reset hover state
         for wo, color in self._hover_colors.items():
             wo.material.color = color
@@ -471,9 +587,9 @@ class BaseSelector(Graphic):
             self._key_move_value = False
 
     def _fpl_prepare_del(self):
+        if self._plot_area is not None:
+            self._plot_area._selector_manager.remove(self)
+
         if hasattr(self, "_pfunc_fill"):
-            self._plot_area.renderer.remove_event_handler(
-                self._pfunc_fill, "pointer_down"
-            )
             del self._pfunc_fill
         super()._fpl_prepare_del()
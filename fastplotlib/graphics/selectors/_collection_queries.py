@@ -0,0 +1,210 @@
+from typing import Sequence
+
+import numpy as np
+
+from .._collection_base import GraphicCollection
+from .._spatial_index import points_in_polygon
+
+
+class RaggedIndices(Sequence):
+    def __init__(self, indices: np.ndarray, offsets: np.ndarray, lengths: np.ndarray):
+        """
+        Selected indices of each graphic in a collection, stored as a single array. Indexing returns a view of
+        the indices of one graphic, so it can be used like a list of arrays, for example ``ixs[i].size``.
+
+        Parameters
+        ----------
+        indices: np.ndarray
+            selected indices of all graphics, concatenated
+
+        offsets: np.ndarray
+            start of the indices of each graphic in ``indices``
+
+        lengths: np.ndarray
+            number of selected indices of each graphic
+
+        """
+        self._indices = indices
+        self._offsets = offsets
+        self._lengths = lengths
+
+    @property
+    def indices(self) -> np.ndarray:
+        """selected indices of all graphics, concatenated"""
+        return self._indices
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """start of the indices of each graphic in ``indices``"""
+        return self._offsets
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """number of selected indices of each graphic"""
+        return self._lengths
+
+    def ranges(self) -> tuple[np.ndarray, np.ndarray]:
+        """(start, stop) arrays, the first and last + 1 selected index of each graphic, (0, 0) if none are selected"""
+        start = np.zeros(len(self), dtype=np.int64)
+        stop = np.zeros(len(self), dtype=np.int64)
+
+        selected = self._lengths > 0
+        first = self._offsets[selected]
+
+        start[selected] = self._indices[first]
+        stop[selected] = self._indices[first + self._lengths[selected] - 1] + 1
+
+        return start, stop
+
+    def __len__(self) -> int:
+        return self._lengths.size
+
+    def __getitem__(self, index: int | slice) -> np.ndarray | list[np.ndarray]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+
+        # also checks the bounds and handles negative indices
+        index = range(len(self))[index]
+
+        start = self._offsets[index]
+        return self._indices[start : start + self._lengths[index]]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} of {len(self)} graphics, {self._indices.size} indices selected"
+
+
+def _collection_columns(
+    collection: GraphicCollection, dims: list[int]
+) -> tuple[list[np.ndarray], np.ndarray, np.ndarray]:
+    """
+    values along ``dims`` of the points of all graphics in the collection as 1D arrays with the offsets of the
+    graphics applied, the row of the first point of each graphic in these arrays and the number of points
+    """
+    if getattr(collection, "packed", False):
+        # the offsets of packed lines are applied to the packed data, the NaN rows that separate the lines
+        # are never within the bounds
+        positions = collection._packed_data.value
+        starts = collection._packed_starts
+
+        return (
+            [positions[:, d] for d in dims],
+            starts,
+            collection._packed_stops - starts,
+        )
+
+    graphics = collection.graphics
+    # [n_points, 3] array of each graphic, computed for compact lines
+    points = [g.data[:] for g in graphics]
+    n_points = np.array([p.shape[0] for p in points], dtype=np.int64)
+    offsets = np.array([g.offset for g in graphics], dtype=np.float64).reshape(-1, 3)
+
+    columns = list()
+    for d in dims:
+        values = np.concatenate([p[:, d] for p in points])
+
+        if (offsets[:, d] == offsets[0, d]).all():
+            # usually the case along the axis that the lines of a stack are not separated
+            values += offsets[0, d]
+        else:
+            values += np.repeat(offsets[:, d], n_points).astype(values.dtype)
+
+        columns.append(values)
+
+    return columns, np.cumsum(n_points) - n_points, n_points
+
+
+def select_in_bounds(
+    collection: GraphicCollection, bounds: dict[int, tuple[float, float]]
+) -> RaggedIndices:
+    """
+    Indices of the points of each graphic in ``collection`` that are within ``bounds``, a ``(min, max)`` for each
+    dimension. All graphics are queried at once, the offsets of the graphics are applied to their data.
+    """
+    if len(collection) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return RaggedIndices(empty, empty, empty)
+
+    columns, starts, n_points = _collection_columns(collection, list(bounds.keys()))
+
+    mask = None
+    for values, (vmin, vmax) in zip(columns, bounds.values()):
+        if mask is None:
+            mask = np.greater_equal(values, vmin)
+        else:
+            np.logical_and(mask, values >= vmin, out=mask)
+
+        np.logical_and(mask, values <= vmax, out=mask)
+
+    return _ragged_indices(np.flatnonzero(mask), starts, mask.size)
+
+
+def select_in_polygon(
+    collection: GraphicCollection, vertices: np.ndarray
+) -> RaggedIndices:
+    """
+    Indices of the points of each graphic in ``collection`` that are inside the polygon with ``vertices``.
+    All graphics are queried at once, the offsets of the graphics are applied to their data.
+    """
+    if len(collection) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return RaggedIndices(empty, empty, empty)
+
+    (x, y), starts, n_points = _collection_columns(collection, [0, 1])
+
+    return _ragged_indices(points_in_polygon(x, y, vertices), starts, x.size)
+
+
+def _ragged_indices(rows: np.ndarray, starts: np.ndarray, size: int) -> RaggedIndices:
+    """split the sorted selected ``rows`` of the concatenated points of all graphics into the indices of each"""
+    # number of selected points of each graphic, the selected rows are sorted and the rows of a graphic start at
+    # ``starts``, the rows between graphics that are not points of a graphic are never selected
+    lengths = np.diff(np.searchsorted(rows, np.append(starts, size)))
+
+    return RaggedIndices(
+        rows - np.repeat(starts, lengths), np.cumsum(lengths) - lengths, lengths
+    )
+
+
+def _without_offset(points: np.ndarray, offset: np.ndarray) -> np.ndarray:
+    """points of a packed line without its offset, a view if the offset is zero"""
+    if not offset.any():
+        return points
+
+    return points - offset.astype(points.dtype)
+
+
+def collection_data(
+    collection: GraphicCollection, start: np.ndarray, stop: np.ndarray
+) -> list[np.ndarray]:
+    """data ``start[i]:stop[i]`` of each graphic in ``collection``, does not create packed lines"""
+    if getattr(collection, "packed", False):
+        positions = collection._packed_data.value
+        rows = collection._packed_starts
+        # the packed positions include the offsets of the lines, the data of a line does not
+        data = [
+            _without_offset(positions[r + s : r + e], o)
+            for r, s, e, o in zip(rows, start, stop, collection._packed_offsets)
+        ]
+    else:
+        data = [g.data[s:e] for g, s, e in zip(collection.graphics, start, stop)]
+
+    # empty selections
+    for i in np.flatnonzero(start == stop):
+        data[i] = np.array([], dtype=np.float32).reshape(0, 3)
+
+    return data
+
+
+def collection_points(
+    collection: GraphicCollection, indices: RaggedIndices
+) -> list[np.ndarray]:
+    """data of the selected ``indices`` of each graphic in ``collection``, does not create packed lines"""
+    if getattr(collection, "packed", False):
+        positions = collection._packed_data.value
+        rows = collection._packed_starts
+        return [
+            _without_offset(positions[r + ixs], o)
+            for r, ixs, o in zip(rows, indices, collection._packed_offsets)
+        ]
+
+    return [g.data[ixs] for g, ixs in zip(collection.graphics, indices)]
@@ -1,4 +1,3 @@
-import math
 from numbers import Real
 from typing import Sequence
 
@@ -7,6 +6,7 @@ import pygfx
 
 from .._base import Graphic
 from .._collection_base import GraphicCollection
+from ..features import CompactVertexPositions
 from ..features._selection_features import LinearSelectionFeature
 from ._base_selector import BaseSelector, MoveInfo
 
@@ -82,6 +82,7 @@ class LinearSelector(BaseSelector):
         edge_color: str | Sequence[float] | np.ndarray = "w",
         thickness: float = 2.5,
         arrow_keys_modifier: str = "Shift",
+        event_policy: str = "every",
         name: str = None,
     ):
         """
@@ -118,6 +119,10 @@ class LinearSelector(BaseSelector):
         edge_color: str | tuple | np.ndarray, default "w"
             color of the selector
 
+        event_policy: str, default "every"
+            when "selection" events are emitted while the selector is dragged, one of "every", "per_frame",
+            "throttle(ms)" or "on_release", see ``BaseSelector.event_policy``
+
         name: str, optional
             name of linear selector
 
@@ -188,6 +193,7 @@ class LinearSelector(BaseSelector):
             edges=(line_inner, self.line_outer),
             hover_responsive=(line_inner, self.line_outer),
             arrow_keys_modifier=arrow_keys_modifier,
+            event_policy=event_policy,
             axis=axis,
             parent=parent,
             name=name,
@@ -235,30 +241,18 @@ class LinearSelector(BaseSelector):
         return self._get_selected_index(source)
 
     def _get_selected_index(self, graphic):
-        # the array to search for the closest value along that axis
-        if self.axis == "x":
-            data = graphic.data[:, 0]
-        elif self.axis == "y":
-            data = graphic.data[:, 1]
+        if self.axis == "x" and isinstance(graphic.data, CompactVertexPositions):
+            # x is uniformly sampled, compute the index directly
+            return graphic.data.nearest_index(self.selection)
 
         if (
             "Line" in graphic.__class__.__name__
             or "Scatter" in graphic.__class__.__name__
         ):
-            # we want to find the index of the data closest to the selector position
-            find_value = self.selection
-
-            # get closest data index to the world space position of the selector
-            idx = np.searchsorted(data, find_value, side="left")
-
-            if idx > 0 and (
-                idx == len(data)
-                or math.fabs(find_value - data[idx - 1])
-                < math.fabs(find_value - data[idx])
-            ):
-                return round(idx - 1)
-            else:
-                return round(idx)
+            # index of the data closest to the selector position, the axis index is created once and reused
+            # until the data along the axis changes, segments are indexed by their midpoints
+            dim = 0 if self.axis == "x" else 1
+            return graphic.data.axis_index(dim).nearest(self.selection)
 
         if "Image" in graphic.__class__.__name__:
             # indices map directly to grid geometry for image data buffer
@@ -6,8 +6,10 @@ import pygfx
 
 from .._base import Graphic
 from .._collection_base import GraphicCollection
+from ..features import CompactVertexPositions, SegmentPositions
 from ..features._selection_features import LinearRegionSelectionFeature
 from ._base_selector import BaseSelector, MoveInfo
+from ._collection_queries import RaggedIndices, select_in_bounds, collection_data
 
 
 class LinearRegionSelector(BaseSelector):
@@ -66,6 +68,7 @@ class LinearRegionSelector(BaseSelector):
         edge_color: str | Sequence[float] = (0.8, 0.6, 0),
         edge_thickness: float = 8,
         arrow_keys_modifier: str = "Shift",
+        event_policy: str = "every",
         name: str = None,
     ):
         """
@@ -112,6 +115,10 @@ class LinearRegionSelector(BaseSelector):
             modifier key that must be pressed to initiate movement using arrow keys, must be one of:
             "Control", "Shift", "Alt" or ``None``
 
+        event_policy: str, default "every"
+            when "selection" events are emitted while the selector is dragged, one of "every", "per_frame",
+            "throttle(ms)" or "on_release", see ``BaseSelector.event_policy``
+
         name: str, optional
             name of this selector graphic
 
@@ -229,6 +236,7 @@ class LinearRegionSelector(BaseSelector):
             fill=(self.fill,),
             hover_responsive=self.edges,
             arrow_keys_modifier=arrow_keys_modifier,
+            event_policy=event_policy,
             axis=axis,
             parent=parent,
             name=name,
@@ -272,23 +280,11 @@ class LinearRegionSelector(BaseSelector):
         if "Line" in source.__class__.__name__:
             if isinstance(source, GraphicCollection):
                 # this will return a list of views of the arrays, therefore no copy operations occur
-                # it's fine and fast even as a list of views because there is no re-allocating of memory
-                # this is fast even for slicing a 10,000 x 5,000 LineStack
-                data_selections: list[np.ndarray] = list()
-
-                for i, g in enumerate(source.graphics):
-                    if ixs[i].size == 0:
-                        data_selections.append(
-                            np.array([], dtype=np.float32).reshape(0, 3)
-                        )
-                    else:
-                        s = slice(
-                            ixs[i][0], ixs[i][-1] + 1
-                        )  # add 1 because these are direct indices
-                        # slices n_datapoints dim
-                        data_selections.append(g.data[s])
-
-                return data_selections
+                # the first and last selected index of all lines are computed at once
+                return collection_data(source, *ixs.ranges())
+            elif isinstance(source.data, SegmentPositions):
+                # segments are not sorted, the selected segments are not a contiguous range
+                return source.data[ixs]
             else:
                 if ixs.size == 0:
                     # empty selection
@@ -314,7 +310,7 @@ class LinearRegionSelector(BaseSelector):
 
     def get_selected_indices(
         self, graphic: Graphic = None
-    ) -> np.ndarray | list[np.ndarray]:
+    ) -> np.ndarray | RaggedIndices:
         """
         Returns the indices of the ``Graphic`` data bounded by the current selection.
 
@@ -327,8 +323,9 @@ class LinearRegionSelector(BaseSelector):
 
         Returns
         -------
-        Union[np.ndarray, List[np.ndarray]]
-            data indices of the selection, list of np.ndarray if graphic is a collection
+        np.ndarray | RaggedIndices
+            data indices of the selection, a :class:`RaggedIndices` that can be indexed like a list of arrays if
+            the graphic is a collection
 
         """
         # we get the indices from the source graphic
@@ -351,16 +348,11 @@ class LinearRegionSelector(BaseSelector):
             # data is [n_datapoints, xyz], so we return
             # indices that can be used to slice `n_datapoints`
             if isinstance(source, GraphicCollection):
-                ixs = list()
-                for g in source.graphics:
-                    # indices for each graphic in the collection
-                    data = g.data[:, dim]
-                    g_ixs = np.where((data >= bounds[0]) & (data <= bounds[1]))[0]
-                    ixs.append(g_ixs)
+                # all graphics in the collection are queried at once, with their offsets applied
+                ixs = select_in_bounds(source, {dim: bounds})
             else:
                 # map this only this graphic
-                data = source.data[:, dim]
-                ixs = np.where((data >= bounds[0]) & (data <= bounds[1]))[0]
+                ixs = self._get_graphic_indices(source, dim, bounds)
 
             return ixs
 
@@ -368,6 +360,15 @@ class LinearRegionSelector(BaseSelector):
             # indices map directly to grid geometry for image data buffer
             return np.arange(*bounds, dtype=int)
 
+    def _get_graphic_indices(self, graphic, dim: int, bounds) -> np.ndarray:
+        if dim == 0 and isinstance(graphic.data, CompactVertexPositions):
+            # x is uniformly sampled, compute the range of indices directly
+            return graphic.data.indices_in_range(*bounds)
+
+        # O(log n) search of the axis index, which is created once and reused until the data along the axis
+        # changes, segments are selected by their midpoints
+        return graphic.data.axis_index(dim).indices_in_range(*bounds)
+
     def _move_graphic(self, move_info: MoveInfo):
 
         # If this the first move in this drag, store initial selection
@@ -381,7 +382,7 @@ class LinearRegionSelector(BaseSelector):
         cur_min, cur_max = move_info.start_selection
 
         # move entire selector if event source was fill
-        if self._move_info.source == self.fill:
+        if move_info.source == self.fill:
             # Limit the delta to avoid weird resizine behavior
             min_delta = self.limits[0] - cur_min
             max_delta = self.limits[1] - cur_max
@@ -396,12 +397,12 @@ class LinearRegionSelector(BaseSelector):
 
         # if event source was an edge and selector is resizable,
         # move the edge that caused the event
-        if self._move_info.source == self.edges[0]:
+        if move_info.source == self.edges[0]:
             # change only left or bottom bound
             new_min = min(cur_min + delta, cur_max)
             self._selection.set_value(self, (new_min, cur_max))
 
-        elif self._move_info.source == self.edges[1]:
+        elif move_info.source == self.edges[1]:
             # change only right or top bound
             new_max = max(cur_max + delta, cur_min)
             self._selection.set_value(self, (cur_min, new_max))
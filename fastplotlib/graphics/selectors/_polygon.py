@@ -5,7 +5,11 @@ import numpy as np
 import pygfx
 
 from ._base_selector import BaseSelector, MoveInfo
+from ._collection_queries import RaggedIndices, select_in_polygon, collection_points
 from .._base import Graphic
+from .._collection_base import GraphicCollection
+from .._spatial_index import points_in_polygon, polygon_mask
+from ..features import SegmentPositions
 
 
 class PolygonSelector(BaseSelector):
@@ -16,7 +20,7 @@ class PolygonSelector(BaseSelector):
         parent: Graphic = None,
         name: str = None,
     ):
-        self.parent = parent
+        BaseSelector.__init__(self, parent=parent, name=name)
 
         group = pygfx.Group()
 
@@ -25,11 +29,21 @@ class PolygonSelector(BaseSelector):
         self.edge_color = edge_color
         self.edge_width = edge_width
 
-        self._move_info: MoveInfo = None
-
         self._current_mode = None
 
-        BaseSelector.__init__(self, name=name)
+        # True once the polygon is closed by a double click
+        self._finished = False
+
+        # (graphic, polygon vertices, mask of the selected points) of the last selection, it is updated
+        # incrementally when vertices are added or moved, the vertices and mask are None after a data change
+        self._selection_cache: (
+            tuple[Graphic, np.ndarray | None, np.ndarray | None] | None
+        ) = None
+
+    @property
+    def parent(self) -> Graphic | None:
+        """Graphic that selector is associated with."""
+        return self._parent
 
     def get_vertices(self) -> np.ndarray:
         """Get the vertices for the polygon"""
@@ -39,6 +53,147 @@ class PolygonSelector(BaseSelector):
 
         return np.vstack(vertices)
 
+    def _polygon_vertices(self) -> np.ndarray:
+        """[n, 2] vertices of the polygon, including the moving endpoint of the segment that is being drawn"""
+        children = self.world_object.children
+        if len(children) == 0:
+            return np.zeros((0, 2))
+
+        vertices = [child.geometry.positions.data[0, :2] for child in children]
+        if not self._finished:
+            vertices.append(children[-1].geometry.positions.data[1, :2])
+
+        return np.array(vertices, dtype=np.float64)
+
+    def get_selected_indices(
+        self, graphic: Graphic = None
+    ) -> np.ndarray | RaggedIndices:
+        """
+        Returns the indices of the ``Graphic`` data inside the polygon, by the crossing number of each point. The
+        polygon is closed from the last to the first vertex, while it is being drawn the endpoint of the current
+        segment is the last vertex.
+
+        Parameters
+        ----------
+        graphic: Graphic, default ``None``
+            If provided, returns the selection indices from this graphic instead of the graphic set as ``parent``
+
+        Returns
+        -------
+        np.ndarray | RaggedIndices
+            data indices of the selection
+            | [rows, cols] bool mask of the pixels whose centers are inside the polygon if the graphic is an image
+            | :class:`RaggedIndices` of the indices of each line if graphic is a line collection
+            | array of the indices of the segments whose midpoints are inside the polygon for line segments
+            | array of the indices of the points inside the polygon for lines and scatters
+        """
+        source = self._get_source(graphic)
+        vertices = self._polygon_vertices()
+
+        if "Image" in source.__class__.__name__:
+            return polygon_mask(vertices, source.data.value.shape[:2])
+
+        if isinstance(source, GraphicCollection):
+            # all graphics in the collection are queried at once, with their offsets applied
+            return select_in_polygon(source, vertices)
+
+        if isinstance(source.data, SegmentPositions):
+            # segments are selected by their midpoints
+            midpoints = source.data.midpoints
+            return points_in_polygon(midpoints[:, 0], midpoints[:, 1], vertices)
+
+        return np.flatnonzero(self._selection_mask(source, vertices))
+
+    def get_selected_data(
+        self, graphic: Graphic = None
+    ) -> np.ndarray | list[np.ndarray]:
+        """
+        Get the ``Graphic`` data inside the polygon, see :meth:`get_selected_indices`.
+
+        Parameters
+        ----------
+        graphic: Graphic, default ``None``
+            If provided, returns the data selection from this graphic instead of the graphic set as ``parent``
+
+        Returns
+        -------
+        np.ndarray | list[np.ndarray]
+            data of the selected points or pixels, list of the data of each line for a line collection
+        """
+        source = self._get_source(graphic)
+        ixs = self.get_selected_indices(source)
+
+        if "Image" in source.__class__.__name__:
+            return source.data.value[ixs]
+
+        if isinstance(source, GraphicCollection):
+            return collection_points(source, ixs)
+
+        return source.data[ixs]
+
+    def _query_polygon(self, source: Graphic, vertices: np.ndarray) -> np.ndarray:
+        index = getattr(source, "spatial_index", None)
+        if index is not None:
+            return index.query_polygon(vertices)
+
+        data = source.data.value
+        return points_in_polygon(data[:, 0], data[:, 1], vertices)
+
+    def _selection_mask(self, source: Graphic, vertices: np.ndarray) -> np.ndarray:
+        """mask of the points of ``source`` inside the polygon, updated from the previous selection if possible"""
+        cache = self._selection_cache
+
+        if cache is not None and cache[0] is source and cache[2] is not None:
+            _, previous, mask = cache
+
+            # number of leading vertices that did not change
+            n = min(len(previous), len(vertices))
+            changed = np.flatnonzero((previous[:n] != vertices[:n]).any(axis=1))
+            common = changed[0] if changed.size > 0 else n
+
+            n_changed = len(previous) + len(vertices) - 2 * common
+
+            if common > 0 and n_changed <= 16:
+                if n_changed > 0:
+                    # the parity of a point is the XOR of the crossings of the edges, the points whose selection
+                    # changes are inside the cycle of the removed and added edges, the area swept by the change
+                    cycle = np.vstack(
+                        [
+                            vertices[common - 1],
+                            previous[common:],
+                            vertices[0],
+                            vertices[common:][::-1],
+                        ]
+                    )
+                    mask[self._query_polygon(source, cycle)] ^= True
+
+                self._selection_cache = (source, vertices, mask)
+                return mask
+
+        mask = np.zeros(source.data.value.shape[0], dtype=bool)
+        mask[self._query_polygon(source, vertices)] = True
+
+        if cache is None or cache[0] is not source:
+            self._remove_selection_cache()
+            # the selection must be computed again when the data changes
+            source._data.add_event_handler(self._invalidate_selection_cache)
+
+        self._selection_cache = (source, vertices, mask)
+
+        return mask
+
+    def _invalidate_selection_cache(self, ev):
+        self._selection_cache = (self._selection_cache[0], None, None)
+
+    def _remove_selection_cache(self):
+        if self._selection_cache is None:
+            return
+
+        self._selection_cache[0]._data.remove_event_handler(
+            self._invalidate_selection_cache
+        )
+        self._selection_cache = None
+
     def _fpl_add_plot_area_hook(self, plot_area):
         self._plot_area = plot_area
 
@@ -150,3 +305,9 @@ class PolygonSelector(BaseSelector):
 
         for handler, event in handlers.items():
             self._plot_area.renderer.remove_event_handler(handler, event)
+
+        self._finished = True
+
+    def _fpl_prepare_del(self):
+        self._remove_selection_cache()
+        super()._fpl_prepare_del()
@@ -7,8 +7,10 @@ import pygfx
 from .._collection_base import GraphicCollection
 
 from .._base import Graphic
-from ..features import RectangleSelectionFeature
+from ..features import RectangleSelectionFeature, SegmentPositions
+from ..features._summed_area_table import region_stats
 from ._base_selector import BaseSelector, MoveInfo
+from ._collection_queries import RaggedIndices, select_in_bounds, collection_data
 
 
 class RectangleSelector(BaseSelector):
@@ -62,6 +64,7 @@ class RectangleSelector(BaseSelector):
         vertex_color=(0.7, 0.4, 0),
         vertex_thickness: float = 8,
         arrow_keys_modifier: str = "Shift",
+        event_policy: str = "every",
         name: str = None,
     ):
         """
@@ -95,6 +98,10 @@ class RectangleSelector(BaseSelector):
             modifier key that must be pressed to initiate movement using arrow keys, must be one of:
             "Control", "Shift", "Alt" or ``None``
 
+        event_policy: str, default "every"
+            when "selection" events are emitted while the selector is dragged, one of "every", "per_frame",
+            "throttle(ms)" or "on_release", see ``BaseSelector.event_policy``
+
         name: str
             name for this selector graphic
         """
@@ -284,6 +291,7 @@ class RectangleSelector(BaseSelector):
             vertices=self.vertices,
             hover_responsive=(*self.edges, *self.vertices),
             arrow_keys_modifier=arrow_keys_modifier,
+            event_policy=event_policy,
             parent=parent,
             name=name,
             offset=offset,
@@ -333,6 +341,12 @@ class RectangleSelector(BaseSelector):
 
             return source.data[row_slice, col_slice]
 
+        if "Scatter" in source.__class__.__name__ and not isinstance(
+            source, GraphicCollection
+        ):
+            # points are entirely selected or not at all
+            return source.data[ixs]
+
         if mode not in ["full", "partial", "ignore"]:
             raise ValueError(
                 f"`mode` must be one of 'full', 'partial', or 'ignore', you have passed {mode}"
@@ -340,49 +354,36 @@ class RectangleSelector(BaseSelector):
         if "Line" in source.__class__.__name__:
 
             if isinstance(source, GraphicCollection):
-                data_selections: List[np.ndarray] = list()
-
-                for i, g in enumerate(source.graphics):
-                    # want to keep same length as the original line collection
-                    if ixs[i].size == 0:
-                        data_selections.append(
-                            np.array([], dtype=np.float32).reshape(0, 3)
-                        )
-                    else:
-                        # s gives entire slice of data along the x
-                        s = slice(
-                            ixs[i][0], ixs[i][-1] + 1
-                        )  # add 1 because these are direct indices
-                        # slices n_datapoints dim
-
-                        # calculate missing ixs using set difference
-                        # then calculate shift
-                        missing_ixs = (
-                            np.setdiff1d(np.arange(ixs[i][0], ixs[i][-1] + 1), ixs[i])
-                            - ixs[i][0]
-                        )
-
-                        match mode:
-                            # take all ixs, ignore missing
-                            case "full":
-                                data_selections.append(g.data[s])
-                            # set missing ixs data to NaNs
-                            case "partial":
-                                if len(missing_ixs) > 0:
-                                    data = g.data[s].copy()
-                                    data[missing_ixs] = np.nan
-                                    data_selections.append(data)
-                                else:
-                                    data_selections.append(g.data[s])
-                            # ignore lines that do not have full ixs to start
-                            case "ignore":
-                                if len(missing_ixs) > 0:
-                                    data_selections.append(
-                                        np.array([], dtype=np.float32).reshape(0, 3)
-                                    )
-                                else:
-                                    data_selections.append(g.data[s])
+                # want to keep same length as the original line collection
+                start, stop = ixs.ranges()
+                data_selections = collection_data(source, start, stop)
+
+                # lines with indices between the first and last selected index that are not selected
+                missing = np.flatnonzero(stop - start > ixs.lengths)
+
+                match mode:
+                    # take all ixs, ignore missing
+                    case "full":
+                        pass
+                    # set missing ixs data to NaNs
+                    case "partial":
+                        for i in missing:
+                            data = data_selections[i].copy()
+                            selected = np.zeros(data.shape[0], dtype=bool)
+                            selected[ixs[i] - start[i]] = True
+                            data[~selected] = np.nan
+                            data_selections[i] = data
+                    # ignore lines that do not have full ixs to start
+                    case "ignore":
+                        for i in missing:
+                            data_selections[i] = np.array([], dtype=np.float32).reshape(
+                                0, 3
+                            )
+
                 return data_selections
+            elif isinstance(source.data, SegmentPositions):
+                # segments are selected by their midpoints, they are entirely selected or not at all
+                return source.data[ixs]
             else:  # for lines
                 if ixs.size == 0:
                     # empty selection
@@ -423,7 +424,7 @@ class RectangleSelector(BaseSelector):
 
     def get_selected_indices(
         self, graphic: Graphic = None
-    ) -> np.ndarray | tuple[np.ndarray]:
+    ) -> np.ndarray | tuple[np.ndarray] | RaggedIndices:
         """
         Returns the indices of the ``Graphic`` data bounded by the current selection.
 
@@ -436,11 +437,13 @@ class RectangleSelector(BaseSelector):
 
         Returns
         -------
-        Union[np.ndarray, List[np.ndarray]]
+        np.ndarray | tuple[np.ndarray] | RaggedIndices
             data indicies of the selection
             | tuple of [row_indices, col_indices] if the graphic is an image
-            | list of indices along the x-dimension for each line if graphic is a line collection
+            | :class:`RaggedIndices` of the indices of each line if graphic is a line collection, it can be indexed
+              like a list of arrays
             | array of indices along the x-dimension if graphic is a line
+            | array of the indices of the points within the selection if graphic is a scatter
         """
         # get indices from source
         source = self._get_source(graphic)
@@ -455,21 +458,31 @@ class RectangleSelector(BaseSelector):
             row_ixs = np.arange(ymin, ymax, dtype=int)
             return row_ixs, col_ixs
 
+        if "Scatter" in source.__class__.__name__ and not isinstance(
+            source, GraphicCollection
+        ):
+            if source.spatial_index is not None:
+                return source.spatial_index.query_rect(xmin, xmax, ymin, ymax)
+
+            data = source.data.value
+            return np.where(
+                (data[:, 0] >= xmin)
+                & (data[:, 0] <= xmax)
+                & (data[:, 1] >= ymin)
+                & (data[:, 1] <= ymax)
+            )[0]
+
         if "Line" in source.__class__.__name__:
             if isinstance(source, GraphicCollection):
-                ixs = list()
-                for g in source.graphics:
-                    data = g.data.value
-                    g_ixs = np.where(
-                        (data[:, 0] >= xmin - g.offset[0])
-                        & (data[:, 0] <= xmax - g.offset[0])
-                        & (data[:, 1] >= ymin - g.offset[1])
-                        & (data[:, 1] <= ymax - g.offset[1])
-                    )[0]
-                    ixs.append(g_ixs)
+                # all graphics in the collection are queried at once, with their offsets applied
+                ixs = select_in_bounds(source, {0: (xmin, xmax), 1: (ymin, ymax)})
             else:
                 # map only this graphic
-                data = source.data.value
+                if isinstance(source.data, SegmentPositions):
+                    # segments are selected by their midpoints
+                    data = source.data.midpoints
+                else:
+                    data = source.data.value
                 ixs = np.where(
                     (data[:, 0] >= xmin)
                     & (data[:, 0] <= xmax)
@@ -479,6 +492,47 @@ class RectangleSelector(BaseSelector):
 
             return ixs
 
+    def get_selected_stats(
+        self, graphic: Graphic = None
+    ) -> dict[str, float | int | np.ndarray]:
+        """
+        Get the sum, mean, standard deviation and number of the finite values of the image data bounded by the
+        current selection. Non-finite values, such as NaNs, are excluded.
+
+        If the image has summed-area tables, see ``ImageGraphic(summed_area_table=True)``, these are computed in
+        constant time regardless of the size of the selection, otherwise they are computed from the selected data.
+
+        Parameters
+        ----------
+        graphic: ImageGraphic, optional, default ``None``
+            if provided, returns the statistics of this image instead of the graphic set as ``parent``
+
+        Returns
+        -------
+        dict
+            "sum", "mean", "std" and "count", each is an array of one value per channel for RGB(A) images.
+            The mean and standard deviation are NaN if there are no finite values.
+
+        """
+        source = self._get_source(graphic)
+
+        if "Image" not in source.__class__.__name__:
+            raise TypeError(
+                f"`get_selected_stats()` is only supported for images, you have passed a: "
+                f"{source.__class__.__name__}"
+            )
+
+        # same region as get_selected_data()
+        row_ixs, col_ixs = self.get_selected_indices(source)
+        rows = slice(row_ixs[0], row_ixs[-1] + 1) if row_ixs.size > 0 else slice(0, 0)
+        cols = slice(col_ixs[0], col_ixs[-1] + 1) if col_ixs.size > 0 else slice(0, 0)
+
+        table = source.data.summed_area_table
+        if table is None:
+            return region_stats(source.data[rows, cols])
+
+        return table.stats(rows, cols)
+
     def _move_graphic(self, move_info: MoveInfo):
 
         # If this the first move in this drag, store initial selection
@@ -492,7 +546,7 @@ class RectangleSelector(BaseSelector):
         xmin, xmax, ymin, ymax = move_info.start_selection
 
         # move entire selector if source is fill
-        if self._move_info.source == self.fill:
+        if move_info.source == self.fill:
             # Limit the delta to avoid weird resizine behavior
             min_deltax = self.limits[0] - xmin
             max_deltax = self.limits[1] - xmax
@@ -515,22 +569,22 @@ class RectangleSelector(BaseSelector):
         ymin_new = min(ymin + deltay, ymax)
         ymax_new = max(ymax + deltay, ymin)
 
-        if self._move_info.source == self.vertices[0]:  # bottom left
+        if move_info.source == self.vertices[0]:  # bottom left
             self._selection.set_value(self, (xmin_new, xmax, ymin_new, ymax))
-        if self._move_info.source == self.vertices[1]:  # bottom right
+        if move_info.source == self.vertices[1]:  # bottom right
             self._selection.set_value(self, (xmin, xmax_new, ymin_new, ymax))
-        if self._move_info.source == self.vertices[2]:  # top left
+        if move_info.source == self.vertices[2]:  # top left
             self._selection.set_value(self, (xmin_new, xmax, ymin, ymax_new))
-        if self._move_info.source == self.vertices[3]:  # top right
+        if move_info.source == self.vertices[3]:  # top right
             self._selection.set_value(self, (xmin, xmax_new, ymin, ymax_new))
         # if event source was an edge and selector is resizable, move the edge that caused the event
-        if self._move_info.source == self.edges[0]:
+        if move_info.source == self.edges[0]:
             self._selection.set_value(self, (xmin_new, xmax, ymin, ymax))
-        if self._move_info.source == self.edges[1]:
+        if move_info.source == self.edges[1]:
             self._selection.set_value(self, (xmin, xmax_new, ymin, ymax))
-        if self._move_info.source == self.edges[2]:
+        if move_info.source == self.edges[2]:
             self._selection.set_value(self, (xmin, xmax, ymin_new, ymax))
-        if self._move_info.source == self.edges[3]:
+        if move_info.source == self.edges[3]:
             self._selection.set_value(self, (xmin, xmax, ymin, ymax_new))
 
     def _move_to_pointer(self, ev):
@@ -0,0 +1,148 @@
+from typing import TYPE_CHECKING
+
+import pygfx
+
+if TYPE_CHECKING:
+    from ._base_selector import BaseSelector
+
+
+class SelectorManager:
+    def __init__(self, plot_area):
+        """
+        Dispatches the renderer events and render cycle updates of all selectors in a plot area.
+
+        The renderer event handlers and the animation function are registered once for all selectors, and events
+        are only routed to the selectors that need them: pointer moves and releases to the selectors that are being
+        dragged, key events to the selectors with arrow key movements enabled and render cycles to these and to the
+        selectors with pending selection events. Idle selectors are not called. Pointer presses on the fill or the
+        edges and hover events are handled by the world objects of the selectors.
+
+        Parameters
+        ----------
+        plot_area: PlotArea
+            plot area of the selectors
+
+        """
+        self._plot_area = plot_area
+
+        # dicts are used as insertion ordered sets
+        self._selectors: dict[BaseSelector, None] = dict()
+        # selectors with a transparent fill, pointer presses are checked against the fill bounds
+        self._fill_selectors: dict[BaseSelector, None] = dict()
+        self._moving: dict[BaseSelector, None] = dict()
+        self._arrow_keys: dict[BaseSelector, None] = dict()
+        # selectors with a selection event that is emitted on a following render cycle
+        self._pending: dict[BaseSelector, None] = dict()
+
+    @property
+    def selectors(self) -> tuple["BaseSelector", ...]:
+        """selectors managed by this manager"""
+        return tuple(self._selectors)
+
+    def add(self, selector: "BaseSelector"):
+        """add a selector, the event handlers are registered with the first selector"""
+        if len(self._selectors) == 0:
+            self._register()
+
+        self._selectors[selector] = None
+
+        if getattr(selector, "_pfunc_fill", None) is not None:
+            self._fill_selectors[selector] = None
+
+        if selector.arrow_key_events_enabled:
+            self._arrow_keys[selector] = None
+
+    def remove(self, selector: "BaseSelector"):
+        """remove a selector, the event handlers are removed with the last selector"""
+        if selector not in self._selectors:
+            return
+
+        for selectors in (
+            self._selectors,
+            self._fill_selectors,
+            self._moving,
+            self._arrow_keys,
+            self._pending,
+        ):
+            selectors.pop(selector, None)
+
+        if len(self._selectors) == 0:
+            self._unregister()
+
+    def move_started(self, selector: "BaseSelector"):
+        """called when a selector starts being dragged"""
+        self._moving[selector] = None
+
+    def set_arrow_keys(self, selector: "BaseSelector", enabled: bool):
+        """called when the arrow key movements of a selector are enabled or disabled"""
+        if enabled:
+            self._arrow_keys[selector] = None
+        else:
+            self._arrow_keys.pop(selector, None)
+
+    def schedule_selection_event(self, selector: "BaseSelector"):
+        """called when a selector has a selection event that is emitted on a following render cycle"""
+        self._pending[selector] = None
+
+    def _register(self):
+        renderer = self._plot_area.renderer
+
+        renderer.add_event_handler(self._pointer_down, "pointer_down")
+        renderer.add_event_handler(self._pointer_move, "pointer_move")
+        renderer.add_event_handler(self._pointer_up, "pointer_up")
+        renderer.add_event_handler(self._click, "click")
+        renderer.add_event_handler(self._key, "key_down", "key_up")
+
+        self._plot_area.add_animations(self._animate)
+
+    def _unregister(self):
+        renderer = self._plot_area.renderer
+
+        renderer.remove_event_handler(self._pointer_down, "pointer_down")
+        renderer.remove_event_handler(self._pointer_move, "pointer_move")
+        renderer.remove_event_handler(self._pointer_up, "pointer_up")
+        renderer.remove_event_handler(self._click, "click")
+        renderer.remove_event_handler(self._key, "key_down", "key_up")
+
+        self._plot_area.remove_animation(self._animate)
+
+    def _pointer_down(self, ev: pygfx.PointerEvent):
+        for selector in tuple(self._fill_selectors):
+            selector._pfunc_fill(ev)
+
+    def _pointer_move(self, ev: pygfx.PointerEvent):
+        # tuples since handlers of the selection events can add or remove selectors
+        for selector in tuple(self._moving):
+            selector._move(ev)
+
+    def _pointer_up(self, ev: pygfx.PointerEvent):
+        moving = tuple(self._moving)
+        self._moving.clear()
+
+        for selector in moving:
+            selector._move_end(ev)
+
+    def _click(self, ev: pygfx.PointerEvent):
+        # middle mouse button click moves the selectors to the pointer
+        if ev.button != 3:
+            return
+
+        for selector in tuple(self._selectors):
+            selector._move_to_pointer(ev)
+
+    def _key(self, ev: pygfx.KeyboardEvent):
+        for selector in tuple(self._arrow_keys):
+            if ev.type == "key_down":
+                selector._key_down(ev)
+            else:
+                selector._key_up(ev)
+
+    def _animate(self):
+        for selector in tuple(self._arrow_keys):
+            selector._key_hold()
+
+        for selector in tuple(self._pending):
+            selector._selection_event_frame()
+
+            if selector._pending_selection_event is None:
+                self._pending.pop(selector, None)
@@ -607,8 +607,13 @@ class Figure:
     def _call_animate_functions(self, funcs: list[callable]):
         for fn in funcs:
             try:
-                if len(getfullargspec(fn).args) > 0:
-                    fn(self)
+                args = getfullargspec(fn).args
+
+                if len(args) > 0:
+                    if args[0] == "self" and not len(args) > 1:
+                        fn()
+                    else:
+                        fn(self)
                 else:
                     fn()
             except (ValueError, TypeError):
@@ -32,6 +32,7 @@ class GraphicMethodsMixin:
         interpolation: str = "nearest",
         cmap_interpolation: str = "linear",
         isolated_buffer: bool = True,
+        summed_area_table: bool = False,
         **kwargs,
     ) -> ImageGraphic:
         """
@@ -64,6 +65,10 @@ class GraphicMethodsMixin:
             set the data, useful if the data arrays are ready-only such as memmaps.
             If False, the input array is itself used as the buffer.
 
+        summed_area_table: bool, default False
+            keep summed-area tables of the data, see ``TextureArray.summed_area_table``. Used by
+            ``RectangleSelector.get_selected_stats()`` to compute the statistics of a region in constant time.
+
         kwargs:
             additional keyword arguments passed to Graphic
 
@@ -78,6 +83,7 @@ class GraphicMethodsMixin:
             interpolation,
             cmap_interpolation,
             isolated_buffer,
+            summed_area_table,
             **kwargs,
         )
 
@@ -237,6 +243,73 @@ class GraphicMethodsMixin:
             **kwargs,
         )
 
+    def add_line_segments(
+        self,
+        data: Any,
+        thickness: float = 2.0,
+        colors: Union[str, numpy.ndarray, Iterable] = "w",
+        uniform_color: bool = False,
+        alpha: float = 1.0,
+        cmap: str = None,
+        cmap_transform: Union[numpy.ndarray, Iterable] = None,
+        isolated_buffer: bool = True,
+        size_space: str = "screen",
+        **kwargs,
+    ) -> LineSegmentsGraphic:
+        """
+
+        Create a Graphic of disconnected line segments, for example vector fields, graph edges or error bars.
+        All segments are drawn by a single world object from one positions buffer, without a vertex to separate
+        the segments.
+
+        Parameters
+        ----------
+        data: array-like
+            segments data of shape [n_segments, 2, 2] or [n_segments, 2, 3], the start and end point of each segment
+
+        thickness: float, optional, default 2.0
+            thickness of the segments
+
+        colors: str, array, or iterable, default "w"
+            specify colors as a single human-readable string, a single RGBA array,
+            or an iterable of strings or RGBA arrays with one color per segment
+
+        uniform_color: bool, default ``False``
+            if True, uses a uniform buffer for the color of all segments,
+            basically saves GPU VRAM when all segments have a single color
+
+        alpha: float, optional, default 1.0
+            alpha value for the colors
+
+        cmap: str, optional
+            apply a colormap to the segments instead of assigning colors manually, this
+            overrides any argument passed to "colors"
+
+        cmap_transform: 1D array-like of numerical values, optional
+            if provided, these values are used to map the colors from the cmap, one value per segment
+
+        size_space: str, default "screen"
+            coordinate space in which the size is expressed ("screen", "world", "model")
+
+        **kwargs
+            passed to Graphic
+
+
+        """
+        return self._create_graphic(
+            LineSegmentsGraphic,
+            data,
+            thickness,
+            colors,
+            uniform_color,
+            alpha,
+            cmap,
+            cmap_transform,
+            isolated_buffer,
+            size_space,
+            **kwargs,
+        )
+
     def add_line_stack(
         self,
         data: List[numpy.ndarray],
@@ -349,6 +422,8 @@ class GraphicMethodsMixin:
         sizes: Union[float, numpy.ndarray, Iterable[float]] = 1,
         uniform_size: bool = False,
         size_space: str = "screen",
+        spatial_index: bool = False,
+        picking: str = "gpu",
         **kwargs,
     ) -> ScatterGraphic:
         """
@@ -392,6 +467,16 @@ class GraphicMethodsMixin:
         size_space: str, default "screen"
             coordinate space in which the size is expressed ("screen", "world", "model")
 
+        spatial_index: bool, default False
+            build a :class:`SpatialIndex` of the x and y values of the points in a background thread, used by
+            rectangle selectors and CPU picking. Recommended for large scatters, it is kept up to date when
+            the data is modified.
+
+        picking: str, default "gpu"
+            | "gpu": pointer events are determined by the GPU pick pass
+            | "cpu": pointer events are determined by the spatial index, the nearest point within
+              ``pick_radius`` screen pixels of the pointer is picked, implies ``spatial_index``
+
         kwargs
             passed to Graphic
 
@@ -409,6 +494,8 @@ class GraphicMethodsMixin:
             sizes,
             uniform_size,
             size_space,
+            spatial_index,
+            picking,
             **kwargs,
         )
 
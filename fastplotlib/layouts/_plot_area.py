@@ -1,20 +1,22 @@
+from contextlib import contextmanager
 from inspect import getfullargspec
-from typing import Literal, Union
+from typing import Iterable, Literal, Union
 from warnings import warn
 
 import numpy as np
 
 import pygfx
-from pylinalg import vec_transform, vec_unproject
+from pylinalg import aabb_to_sphere, vec_transform, vec_unproject
 from rendercanvas import BaseRenderCanvas
 
 from ._utils import create_controller
-from ..graphics._base import Graphic
+from ..graphics._base import Graphic, WORLD_OBJECTS, BoundingBoxUnion
+from ..graphics._collection_base import GraphicCollection
 from ..graphics.selectors._base_selector import BaseSelector
+from ..graphics.selectors._selector_manager import SelectorManager
 from ._graphic_methods_mixin import GraphicMethodsMixin
 from ..legends import Legend
 
-
 try:
     get_ipython()
 except NameError:
@@ -92,17 +94,38 @@ class PlotArea(GraphicMethodsMixin):
 
         # selectors are in their own list so they can be excluded from scene bbox calculations
         self._selectors: list[BaseSelector] = list()
+        # dispatches the renderer events and render cycle updates of the selectors
+        self._selector_manager = SelectorManager(self)
 
         # legends, managed just like other graphics as explained above
         self._legends: list[Legend] = list()
 
+        # index of the names and identities of all graphics, selectors and legends for O(1) lookups
+        self._names: dict[str, Graphic] = dict()
+        self._object_set: set[Graphic] = set()
+
+        # tuples returned by the graphics, selectors, legends and objects properties, rebuilt when they change
+        self._object_tuples: dict[str, tuple] = dict()
+
         # keep all graphics in a separate group, makes bbox calculations etc. easier
         # this is the "real scene" excluding axes, selection tools etc.
         self._fpl_graphics_scene = pygfx.Group()
         self.scene.add(self._fpl_graphics_scene)
 
+        # cached bounding box of the graphics scene
+        self._scene_bounds = BoundingBoxUnion()
+
+        # (group, graphic) whose world objects are added to the scene when the outermost deferred() block exits
+        self._deferred_depth: int = 0
+        self._deferred_world_objects: list[tuple[pygfx.Group, Graphic]] = list()
+        self._deferred_center: bool = False
+
         self._name = name
 
+        # skip rendering graphics that are outside the camera frustum
+        self._culling = False
+        self._cull_stats = {"tested": 0, "culled": 0}
+
         # need to think about how to deal with children better
         self.children = list()
 
@@ -226,21 +249,63 @@ class PlotArea(GraphicMethodsMixin):
     @property
     def graphics(self) -> tuple[Graphic, ...]:
         """Graphics in the plot area."""
-        return tuple(self._graphics)
+        return self._objects_tuple("graphics")
 
     @property
     def selectors(self) -> tuple[BaseSelector, ...]:
         """Selectors in the plot area."""
-        return tuple(self._selectors)
+        return self._objects_tuple("selectors")
 
     @property
     def legends(self) -> tuple[Legend, ...]:
         """Legends in the plot area."""
-        return tuple(self._legends)
+        return self._objects_tuple("legends")
 
     @property
     def objects(self) -> tuple[Graphic | BaseSelector | Legend, ...]:
-        return *self.graphics, *self.selectors, *self.legends
+        return self._objects_tuple("objects")
+
+    def _objects_tuple(self, kind: str) -> tuple:
+        """cached tuple of the graphics, selectors, legends or all objects, rebuilt only after they change"""
+        if kind not in self._object_tuples:
+            if kind == "objects":
+                value = (*self._graphics, *self._selectors, *self._legends)
+            else:
+                value = tuple(getattr(self, f"_{kind}"))
+
+            self._object_tuples[kind] = value
+
+        return self._object_tuples[kind]
+
+    def _index_object(self, graphic: Graphic):
+        """add a graphic, selector or legend to the name and identity index"""
+        self._object_set.add(graphic)
+
+        if graphic.name is not None:
+            self._names[graphic.name] = graphic
+
+        self._object_tuples.clear()
+
+    def _unindex_object(self, graphic: Graphic):
+        """remove a graphic, selector or legend from the name and identity index"""
+        self._object_set.discard(graphic)
+
+        if self._names.get(graphic.name) is graphic:
+            del self._names[graphic.name]
+
+        self._object_tuples.clear()
+
+    def _fpl_rename_graphic(self, graphic: Graphic, old_name: str | None):
+        """update the name index after a graphic was renamed, called by the ``Name`` feature"""
+        if graphic not in self._object_set:
+            # for example a graphic within a collection
+            return
+
+        if self._names.get(old_name) is graphic:
+            del self._names[old_name]
+
+        if graphic.name is not None:
+            self._names[graphic.name] = graphic
 
     @property
     def name(self) -> str:
@@ -257,6 +322,31 @@ class PlotArea(GraphicMethodsMixin):
             raise TypeError("PlotArea `name` must be of type <str>")
         self._name = name
 
+    @property
+    def culling(self) -> bool:
+        """
+        Skip rendering graphics whose bounding box is entirely outside the camera frustum. The bounding boxes
+        are cached per graphic and only recomputed when the data or the transform of a graphic changes. Useful
+        for collections with a large number of graphics that are zoomed into. Graphics of a packed
+        ``LineCollection`` are rendered by a single world object and are not culled individually.
+
+        ``False`` by default, testing every graphic costs a pass over all graphics on every render, which
+        is slower than rendering them when there are few graphics or most of them are visible. Set to
+        ``True`` to opt in.
+        """
+        return self._culling
+
+    @culling.setter
+    def culling(self, value: bool):
+        self._culling = bool(value)
+
+    @property
+    def cull_stats(self) -> dict[str, int]:
+        """
+        Number of graphics that were ``"tested"`` and ``"culled"`` in the last render, for diagnostics.
+        """
+        return dict(self._cull_stats)
+
     @property
     def background_color(self) -> tuple[pygfx.Color, ...]:
         """background colors, (top left, top right, bottom right, bottom left)"""
@@ -311,14 +401,96 @@ class PlotArea(GraphicMethodsMixin):
     def _render(self):
         self._call_animate_functions(self._animate_funcs_pre)
 
+        self._cull_stats = {"tested": 0, "culled": 0}
+        culled = self._cull() if self.culling else list()
+
         # does not flush, flush must be implemented in user-facing Plot objects
         self.viewport.render(self.scene, self.camera)
 
+        # culling only applies to this render
+        for wo in culled:
+            wo.visible = True
+
         for child in self.children:
             child._render()
 
         self._call_animate_functions(self._animate_funcs_post)
 
+    def _cull(self) -> list[pygfx.WorldObject]:
+        """hide the world objects of graphics that are outside the camera frustum, returns the hidden world objects"""
+        width, height = self.viewport.logical_size
+        if width <= 0 or height <= 0:
+            return list()
+
+        graphics = list()
+        for graphic in self._graphics:
+            if isinstance(graphic, GraphicCollection):
+                # graphics of collections that create them lazily may not exist yet
+                graphics.extend(g for g in graphic._graphics if g is not None)
+            else:
+                graphics.append(graphic)
+
+        world_objects, bounds, padding = list(), list(), list()
+        for graphic in graphics:
+            wo = WORLD_OBJECTS[graphic._fpl_address]
+            if not wo.visible:
+                continue
+
+            bbox = graphic._fpl_world_bounds()
+            if bbox is None:
+                continue
+
+            pad = graphic._fpl_screen_padding()
+            if pad is None:
+                continue
+
+            world_objects.append(wo)
+            bounds.append(bbox)
+            padding.append(pad)
+
+        self._cull_stats["tested"] = len(world_objects)
+
+        if len(world_objects) == 0:
+            return list()
+
+        # same view size that the renderer sets on the camera
+        self.camera.set_view_size(width, height)
+        m = self.camera.camera_matrix
+
+        # padding of each graphic in NDC, shape [n, 1]
+        padding = np.asarray(padding)[:, None]
+        pad_x, pad_y = 2 * padding / width, 2 * padding / height
+
+        # frustum planes in world space from the rows of the camera matrix, shape [n, 6, 4]
+        # left, right, bottom, top are moved outwards by the padding, NDC depth range is [0, 1]
+        planes = np.stack(
+            np.broadcast_arrays(
+                m[0] + (1 + pad_x) * m[3],
+                -m[0] + (1 + pad_x) * m[3],
+                m[1] + (1 + pad_y) * m[3],
+                -m[1] + (1 + pad_y) * m[3],
+                m[2] + 0 * padding,
+                m[3] - m[2] + 0 * padding,
+            ),
+            axis=1,
+        )
+
+        # corner of each bounding box that is furthest along the normal of each plane
+        bounds = np.stack(bounds)
+        vertex = np.where(planes[..., :3] >= 0, bounds[:, None, 1], bounds[:, None, 0])
+        distance = (planes[..., :3] * vertex).sum(axis=-1) + planes[..., 3]
+
+        # outside if the furthest corner is behind any plane, NaN bounds are never culled
+        outside = (distance < 0).any(axis=1)
+
+        culled = [wo for wo, o in zip(world_objects, outside) if o]
+        for wo in culled:
+            wo.visible = False
+
+        self._cull_stats["culled"] = len(culled)
+
+        return culled
+
     def _call_animate_functions(self, funcs: list[callable]):
         for fn in funcs:
             try:
@@ -410,7 +582,7 @@ class PlotArea(GraphicMethodsMixin):
 
         if graphic in self:
             # graphic is already in this plot but was removed from the scene, add it back
-            self._fpl_graphics_scene.add(graphic.world_object)
+            self._add_to_scene(self._fpl_graphics_scene, graphic)
             return
 
         self._add_or_insert_graphic(graphic=graphic, center=center, action="add")
@@ -420,6 +592,121 @@ class PlotArea(GraphicMethodsMixin):
             # for perspective projections we assume the user wants full 3D control
             graphic.offset = (*graphic.offset[:-1], len(self))
 
+    def add_graphics(self, graphics: Iterable[Graphic], center: bool = True):
+        """
+        Add multiple Graphics to the scene. Equivalent to calling ``add_graphic()`` for every graphic, but the
+        names of all graphics are validated before any of them are added, all world objects are added to the
+        scene in one operation and the camera is centered on the scene once at the end.
+
+        Parameters
+        ----------
+        graphics: iterable of Graphic
+            Graphics or GraphicCollections to add to the plot area.
+            Note: these must be real Graphic instances and not proxies
+
+        center: bool, default True
+            Center the camera on the scene after all graphics have been added
+
+        """
+        graphics = list(graphics)
+
+        for graphic in graphics:
+            if not isinstance(graphic, Graphic):
+                raise TypeError(
+                    f"Can only add Graphic types to a PlotArea, you have passed a: {type(graphic)}"
+                )
+
+        # validate all names before adding any of the graphics
+        names = set()
+        for graphic in graphics:
+            if graphic.name is None or graphic in self:
+                continue
+
+            if graphic.name in self or graphic.name in names:
+                raise ValueError(
+                    f"Graphic with given name already exists in subplot or plot area: {graphic.name}\n"
+                    f"All graphics within a subplot or plot area must have a unique name."
+                )
+
+            names.add(graphic.name)
+
+        with self.deferred():
+            for graphic in graphics:
+                if graphic in self:
+                    # graphic is already in this plot but was removed from the scene, add it back
+                    self._add_to_scene(self._fpl_graphics_scene, graphic)
+                    continue
+
+                self._add_or_insert_graphic(
+                    graphic=graphic, center=False, action="add", check_name=False
+                )
+
+                if self.camera.fov == 0:
+                    # stack objects along the z-axis, same as add_graphic()
+                    graphic.offset = (*graphic.offset[:-1], len(self))
+
+            self._deferred_center = self._deferred_center or center
+
+    @contextmanager
+    def deferred(self):
+        """
+        Context manager that defers adding world objects to the scene and centering the camera until the end of
+        the block. All world objects are then added to the scene in one operation, and if any graphic was added
+        with ``center=True`` the camera is centered on the scene once instead of on every graphic. Useful when
+        adding a large number of graphics.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            with subplot.deferred():
+                for data in annotations:
+                    subplot.add_line(data, center=True)
+
+            # all lines were added to the scene and the scene was centered once
+
+        """
+        self._deferred_depth += 1
+
+        try:
+            yield
+        finally:
+            self._deferred_depth -= 1
+
+            if self._deferred_depth == 0:
+                self._flush_deferred()
+
+    def _add_to_scene(self, group: pygfx.Group, graphic: Graphic):
+        """add the world object of a graphic to a group of the scene, deferred within a deferred() block"""
+        if self._deferred_depth > 0:
+            self._deferred_world_objects.append((group, graphic))
+        else:
+            group.add(graphic.world_object)
+
+    def _remove_deferred(self, graphic: Graphic):
+        """remove a graphic whose world object is waiting to be added to the scene at the end of a deferred() block"""
+        self._deferred_world_objects = [
+            (group, g) for group, g in self._deferred_world_objects if g is not graphic
+        ]
+
+    def _flush_deferred(self):
+        pending = self._deferred_world_objects
+        self._deferred_world_objects = list()
+
+        groups: dict[int, tuple[pygfx.Group, list]] = dict()
+        for group, graphic in pending:
+            groups.setdefault(id(group), (group, list()))[1].append(
+                graphic.world_object
+            )
+
+        for group, world_objects in groups.values():
+            group.add(*world_objects)
+
+        if self._deferred_center:
+            self._deferred_center = False
+            self.center_scene()
+
     def insert_graphic(
         self,
         graphic: Graphic,
@@ -469,6 +756,7 @@ class PlotArea(GraphicMethodsMixin):
         center: bool = True,
         action: str = Literal["insert", "add"],
         index: int = 0,
+        check_name: bool = True,
     ):
         """Private method to handle inserting or adding a graphic to a PlotArea."""
         if not isinstance(graphic, Graphic):
@@ -476,20 +764,21 @@ class PlotArea(GraphicMethodsMixin):
                 f"Can only add Graphic types to a PlotArea, you have passed a: {type(graphic)}"
             )
 
-        if graphic.name is not None:  # skip for those that have no name
+        # skip for those that have no name, or if the names were already validated
+        if check_name and graphic.name is not None:
             self._check_graphic_name_exists(graphic.name)
 
         if isinstance(graphic, BaseSelector):
             obj_list = self._selectors
-            self.scene.add(graphic.world_object)
+            self._add_to_scene(self.scene, graphic)
 
         elif isinstance(graphic, Legend):
             obj_list = self._legends
-            self.scene.add(graphic.world_object)
+            self._add_to_scene(self.scene, graphic)
 
         elif isinstance(graphic, Graphic):
             obj_list = self._graphics
-            self._fpl_graphics_scene.add(graphic.world_object)
+            self._add_to_scene(self._fpl_graphics_scene, graphic)
 
         else:
             raise TypeError("graphic must be of type Graphic | BaseSelector | Legend")
@@ -501,8 +790,13 @@ class PlotArea(GraphicMethodsMixin):
         else:
             raise ValueError("valid actions are 'insert' | 'add'")
 
+        self._index_object(graphic)
+
         if center:
-            self.center_graphic(graphic)
+            if self._deferred_depth > 0:
+                self._deferred_center = True
+            else:
+                self.center_graphic(graphic)
 
         # if we don't use the weakref above, then the object lingers if a plot hook is used!
         graphic._fpl_add_plot_area_hook(self)
@@ -514,6 +808,20 @@ class PlotArea(GraphicMethodsMixin):
                 f"All graphics within a subplot or plot area must have a unique name."
             )
 
+    def _fpl_scene_bounds(self) -> np.ndarray | None:
+        """
+        World space bounding box of the graphics in the scene, excluding selectors and legends. Aggregated from
+        the cached bounding boxes of the graphics and only recomputed when one of them has changed.
+        """
+        return self._scene_bounds(
+            [
+                g._fpl_bounding_box()
+                for g in self._graphics
+                # removed graphics are not in the scene
+                if WORLD_OBJECTS[g._fpl_address].parent is not None
+            ]
+        )
+
     def center_graphic(self, graphic: Graphic, zoom: float = 1.0):
         """
         Center the camera w.r.t. the passed graphic
@@ -528,7 +836,13 @@ class PlotArea(GraphicMethodsMixin):
 
         """
 
-        self.camera.show_object(graphic.world_object)
+        bbox = graphic._fpl_bounding_box()
+
+        if bbox is None:
+            # graphic does not take up space, for example if all its data are NaN
+            return
+
+        self.camera.show_object(aabb_to_sphere(bbox))
 
         # camera.show_object can cause the camera width and height to increase so apply a zoom to compensate
         # probably because camera.show_object uses bounding sphere
@@ -545,13 +859,15 @@ class PlotArea(GraphicMethodsMixin):
 
         """
 
-        if not len(self._fpl_graphics_scene.children) > 0:
+        bbox = self._fpl_scene_bounds()
+
+        if bbox is None:
             return
 
         # scale all cameras associated with this controller
         # else it looks wonky
         for camera in self.controller.cameras:
-            camera.show_object(self._fpl_graphics_scene)
+            camera.show_object(aabb_to_sphere(bbox))
 
             # camera.show_object can cause the camera width and height to increase so apply a zoom to compensate
             # probably because camera.show_object uses bounding sphere
@@ -577,7 +893,9 @@ class PlotArea(GraphicMethodsMixin):
 
         """
 
-        if not len(self._fpl_graphics_scene.children) > 0:
+        bbox = self._fpl_scene_bounds()
+
+        if bbox is None:
             return
 
         self.center_scene()
@@ -589,12 +907,7 @@ class PlotArea(GraphicMethodsMixin):
         for camera in self.controller.cameras:
             camera.maintain_aspect = maintain_aspect
 
-        if len(self._fpl_graphics_scene.children) > 0:
-            width, height, depth = np.ptp(
-                self._fpl_graphics_scene.get_world_bounding_box(), axis=0
-            )
-        else:
-            width, height, depth = (1, 1, 1)
+        width, height, depth = np.ptp(bbox, axis=0)
 
         # make sure width and height are non-zero
         if width < 0.01:
@@ -622,6 +935,9 @@ class PlotArea(GraphicMethodsMixin):
 
         """
 
+        # graphic was added within a deferred() block and is not in the scene yet
+        self._remove_deferred(graphic)
+
         if isinstance(graphic, (BaseSelector, Legend)):
             self.scene.remove(graphic.world_object)
 
@@ -650,6 +966,9 @@ class PlotArea(GraphicMethodsMixin):
         elif isinstance(graphic, Graphic):
             self._graphics.remove(graphic)
 
+        self._unindex_object(graphic)
+        self._remove_deferred(graphic)
+
         # remove from scene if necessary
         if graphic.world_object in self.scene.children:
             self.scene.remove(graphic.world_object)
@@ -679,29 +998,17 @@ class PlotArea(GraphicMethodsMixin):
             self.delete_graphic(g)
 
     def __getitem__(self, name: str):
-        for graphic in self.objects:
-            if graphic.name == name:
-                return graphic
+        if name in self._names:
+            return self._names[name]
 
         raise IndexError(f"No graphic or selector of given name in plot area.\n")
 
     def __contains__(self, item: str | Graphic):
         if isinstance(item, Graphic):
-            if item in self.objects:
-                return True
-            else:
-                return False
+            return item in self._object_set
 
         elif isinstance(item, str):
-            for graphic in self.objects:
-                # only check named graphics
-                if graphic.name is None:
-                    continue
-
-                if graphic.name == item:
-                    return True
-
-            return False
+            return item in self._names
 
         raise TypeError("PlotArea `in` operator accepts only `Graphic` or `str` types")
 
@@ -1 +1,2 @@
 from ._histogram_lut import HistogramLUTTool
+from ._crossfilter import Crossfilter
@@ -0,0 +1,456 @@
+from typing import Sequence
+
+import numpy as np
+
+from ..graphics import LineGraphic, ScatterGraphic
+from ..graphics.features import VertexColors
+from ..graphics.selectors import LinearRegionSelector, RectangleSelector
+
+# one bit of the row filters per dimension
+MAX_DIMENSIONS = 32
+
+
+class _Dimension:
+    def __init__(self, values: np.ndarray, bit: int):
+        """column of the table, sorted on the first filter"""
+        self.values = values
+        self.bit = np.uint32(1 << bit)
+
+        # rows sorted by value, NaNs are last
+        self.order: np.ndarray | None = None
+        self.sorted: np.ndarray | None = None
+
+        # (start, stop) positions in ``order`` of the rows that pass the filter
+        self.range: tuple[int, int] = (0, values.shape[0])
+        self.value_range: tuple[float, float] | None = None
+
+    def sort(self):
+        if self.order is None:
+            self.order = np.argsort(self.values, kind="stable")
+            self.sorted = self.values[self.order]
+
+    def positions(self, lo: float, hi: float) -> tuple[int, int]:
+        """(start, stop) positions in ``order`` of the rows with values in the inclusive range [lo, hi]"""
+        self.sort()
+        dtype = self.sorted.dtype
+
+        # search with the dtype of the values, a float64 bound would cast the whole column
+        if np.issubdtype(dtype, np.floating):
+            lo_, hi_ = dtype.type(lo), dtype.type(hi)
+            # round the bounds inwards
+            if lo_ < lo:
+                lo_ = np.nextafter(lo_, dtype.type(np.inf))
+            if hi_ > hi:
+                hi_ = np.nextafter(hi_, dtype.type(-np.inf))
+            lo, hi = lo_, hi_
+
+        elif np.issubdtype(dtype, np.integer):
+            info = np.iinfo(dtype)
+            lo = dtype.type(np.clip(np.ceil(lo), info.min, info.max))
+            hi = dtype.type(np.clip(np.floor(hi), info.min, info.max))
+
+        return (
+            int(np.searchsorted(self.sorted, lo, side="left")),
+            int(np.searchsorted(self.sorted, hi, side="right")),
+        )
+
+
+class _RowView:
+    def __init__(self, graphic, filtered_alpha: float):
+        """graphic with one datapoint per row, the alpha of filtered rows is lowered"""
+        self.graphic = graphic
+        self.filtered_alpha = filtered_alpha
+
+        colors = graphic.colors
+        # alpha of the rows when they pass the filters
+        self.alpha = colors.value[:, 3].copy()
+        self.offset = colors.view_range[0]
+
+    def update(self, selected_rows: np.ndarray, filtered_rows: np.ndarray):
+        colors = self.graphic.colors
+        values = colors.value
+
+        values[selected_rows, 3] = self.alpha[selected_rows]
+        values[filtered_rows, 3] = self.filtered_alpha
+
+        # only the chunks of the buffer that contain changed rows are uploaded
+        rows = np.concatenate([selected_rows, filtered_rows])
+        if rows.size > 0:
+            colors.buffer.update_indices(rows + self.offset)
+
+
+class _HistogramView:
+    def __init__(self, dimension: _Dimension, graphic: LineGraphic, bins: np.ndarray):
+        """
+        step line of the number of rows per bin of a dimension, counting the rows that pass the filters of the
+        other dimensions
+        """
+        self.dimension = dimension
+        self.graphic = graphic
+        # bin of each row, rows with non-finite values are in the last bin which is not displayed
+        self.bins = bins
+        self.counts: np.ndarray | None = None
+
+    def update(self, added_rows: np.ndarray, removed_rows: np.ndarray):
+        n_bins = self.counts.size
+        self.counts += np.bincount(self.bins[added_rows], minlength=n_bins)
+        self.counts -= np.bincount(self.bins[removed_rows], minlength=n_bins)
+        self.draw()
+
+    def draw(self):
+        # two points per bin
+        self.graphic.data[:, 1] = np.repeat(self.counts[:-1], 2)
+
+
+class Crossfilter:
+    def __init__(self, data):
+        """
+        Linked filtering of the rows of one table across several graphics, for example points of a table shown in
+        several scatter plots and histograms of its columns.
+
+        Filters are ranges of values of the columns, or dimensions, of the table and are usually set by selectors,
+        see ``add_selector()``. Rows that pass all filters are selected. Graphics with one datapoint per row are
+        added with ``add_view()``, filtered rows are drawn with a lower alpha. Histograms of the selected rows are
+        added with ``add_histogram()``, the histogram of a dimension counts the rows that pass the filters of all
+        other dimensions, so that the histogram still shows the alternatives to its own filter.
+
+        The rows of a dimension are sorted once, when it is first filtered. Moving a filter only processes the rows
+        that enter or leave its range, and each view only writes and uploads the rows whose state changed, so the
+        cost of moving a brush depends on how far it moves and not on the size of the table.
+
+        Parameters
+        ----------
+        data: dict[str, np.ndarray] | DataFrame | structured array
+            table of equal length columns, anything that can be indexed with the column names
+
+        """
+        self._data = data
+
+        if isinstance(data, dict):
+            self._n_rows = len(next(iter(data.values())))
+        else:
+            self._n_rows = len(data)
+
+        self._dimensions: dict[str, _Dimension] = dict()
+
+        # bit i of a row is set when the row is filtered out by dimension i
+        self._filters = np.zeros(self._n_rows, dtype=np.uint32)
+
+        self._views: list[_RowView] = list()
+        self._histograms: list[_HistogramView] = list()
+        # selector -> (dimensions, event handler)
+        self._selectors: dict = dict()
+
+    @property
+    def n_rows(self) -> int:
+        """number of rows of the table"""
+        return self._n_rows
+
+    @property
+    def dimensions(self) -> tuple[str, ...]:
+        """dimensions that are filtered or have a histogram"""
+        return tuple(self._dimensions.keys())
+
+    @property
+    def filters(self) -> dict[str, tuple[float, float]]:
+        """(min, max) range of each filtered dimension"""
+        return {
+            name: dim.value_range
+            for name, dim in self._dimensions.items()
+            if dim.value_range is not None
+        }
+
+    @property
+    def selected(self) -> np.ndarray:
+        """bool array, ``True`` for the rows that pass all filters"""
+        return self._filters == 0
+
+    @property
+    def n_selected(self) -> int:
+        """number of rows that pass all filters"""
+        return int(np.count_nonzero(self.selected))
+
+    def get_selected_indices(self) -> np.ndarray:
+        """indices of the rows that pass all filters"""
+        return np.flatnonzero(self.selected)
+
+    def _get_dimension(self, name: str) -> _Dimension:
+        if name in self._dimensions:
+            return self._dimensions[name]
+
+        if len(self._dimensions) == MAX_DIMENSIONS:
+            raise ValueError(
+                f"A crossfilter can have at most {MAX_DIMENSIONS} dimensions"
+            )
+
+        values = np.asarray(self._data[name])
+        if values.ndim != 1:
+            raise ValueError(
+                f"dimensions must be 1D columns, the column: {name} has shape {values.shape}"
+            )
+
+        if values.shape[0] != self._n_rows:
+            raise ValueError(
+                f"all dimensions must have the same number of rows, the column: {name} has "
+                f"{values.shape[0]} rows, the table has {self._n_rows} rows"
+            )
+
+        dim = _Dimension(values, bit=len(self._dimensions))
+        self._dimensions[name] = dim
+
+        return dim
+
+    def filter_range(self, dimension: str, value_range: Sequence[float] | None):
+        """
+        Set the filter of a dimension, rows pass the filter if their value is within ``value_range``.
+
+        Parameters
+        ----------
+        dimension: str
+            name of the column
+
+        value_range: (float, float) | None
+            inclusive (min, max) range of values that pass the filter, ``None`` clears the filter
+
+        """
+        dim = self._get_dimension(dimension)
+
+        if value_range is None:
+            new_range = (0, self._n_rows)
+        else:
+            lo, hi = sorted(float(v) for v in value_range)
+            value_range = (lo, hi)
+            new_range = dim.positions(lo, hi)
+
+        dim.value_range = value_range
+
+        (a0, a1), (b0, b1) = dim.range, new_range
+        if (a0, a1) == (b0, b1):
+            return
+
+        dim.range = new_range
+
+        # at most two runs of sorted positions enter and two leave the range
+        entering = self._rows_in(dim, [(b0, min(b1, a0)), (max(b0, a1), b1)])
+        leaving = self._rows_in(dim, [(a0, min(a1, b0)), (max(a0, b1), a1)])
+
+        self._update(dim, entering, leaving)
+
+    def _rows_in(self, dim: _Dimension, runs: list[tuple[int, int]]) -> np.ndarray:
+        """rows at the positions of runs of the sorted order"""
+        runs = [(start, stop) for start, stop in runs if stop > start]
+
+        if len(runs) == 0:
+            return np.empty(0, dtype=np.intp)
+
+        return np.concatenate([dim.order[start:stop] for start, stop in runs])
+
+    def _update(self, dim: _Dimension, entering: np.ndarray, leaving: np.ndarray):
+        """update the filters of the rows that entered or left the range of a dimension and the views"""
+        filters = self._filters
+
+        # filters of the other dimensions
+        others_entering = filters[entering] & ~dim.bit
+        others_leaving = filters[leaving] & ~dim.bit
+
+        filters[entering] = others_entering
+        filters[leaving] = others_leaving | dim.bit
+
+        # rows whose selection changed pass the filters of all other dimensions
+        selected = entering[others_entering == 0]
+        filtered = leaving[others_leaving == 0]
+
+        for view in self._views:
+            view.update(selected, filtered)
+
+        for histogram in self._histograms:
+            if histogram.dimension is dim:
+                # a histogram is not affected by its own filter
+                continue
+
+            # rows that pass the filters of all dimensions other than the changed and the histogram dimension
+            mask = histogram.dimension.bit
+            histogram.update(
+                entering[(others_entering & ~mask) == 0],
+                leaving[(others_leaving & ~mask) == 0],
+            )
+
+    def add_view(self, graphic: ScatterGraphic | LineGraphic, filtered_alpha=0.1):
+        """
+        Add a graphic with one datapoint per row, rows that do not pass the filters are drawn with
+        ``filtered_alpha``.
+
+        Parameters
+        ----------
+        graphic: ScatterGraphic | LineGraphic
+            graphic with per-vertex colors, i.e. ``uniform_color=False``
+
+        filtered_alpha: float, default 0.1
+            alpha of the rows that do not pass the filters, 0 hides them
+
+        """
+        if not isinstance(graphic, (ScatterGraphic, LineGraphic)):
+            raise TypeError(
+                f"crossfilter views must be a ScatterGraphic or LineGraphic, you passed a: {type(graphic)}"
+            )
+
+        if not isinstance(graphic.colors, VertexColors):
+            raise TypeError(
+                "crossfilter views must have per-vertex colors, create the graphic with `uniform_color=False`"
+            )
+
+        n_datapoints = graphic.data.value.shape[0]
+        if n_datapoints != self._n_rows:
+            raise ValueError(
+                f"the graphic has {n_datapoints} datapoints, but the table has {self._n_rows} rows"
+            )
+
+        view = _RowView(graphic, filtered_alpha)
+        view.update(np.empty(0, dtype=np.intp), np.flatnonzero(self._filters))
+
+        self._views.append(view)
+
+    def add_histogram(
+        self,
+        dimension: str,
+        subplot,
+        bins: int = 100,
+        value_range: tuple[float, float] = None,
+        **kwargs,
+    ) -> LineGraphic:
+        """
+        Add a histogram of a dimension that counts the rows that pass the filters of the other dimensions. Add a
+        ``LinearRegionSelector`` to the histogram and pass it to ``add_selector()`` to filter the dimension.
+
+        Parameters
+        ----------
+        dimension: str
+            name of the column
+
+        subplot: Subplot
+            subplot to add the histogram to
+
+        bins: int, default 100
+            number of bins
+
+        value_range: (float, float), optional
+            (min, max) range of the bins, uses the range of the finite values by default
+
+        kwargs
+            passed to ``add_line()``
+
+        Returns
+        -------
+        LineGraphic
+            step line of the histogram, the x values are the values of the dimension
+
+        """
+        dim = self._get_dimension(dimension)
+        values = dim.values
+
+        if value_range is None:
+            finite = values[np.isfinite(values)]
+            value_range = (finite.min(), finite.max()) if finite.size > 0 else (0, 1)
+
+        lo, hi = value_range
+        if hi <= lo:
+            hi = lo + 1
+        edges = np.linspace(lo, hi, bins + 1)
+
+        # rows outside the range and non-finite values are in the extra last bin
+        row_bins = np.full(values.shape[0], bins, dtype=np.intp)
+        in_range = (values >= lo) & (values <= hi)
+        row_bins[in_range] = np.minimum(
+            ((values[in_range] - lo) * (bins / (hi - lo))).astype(np.intp), bins - 1
+        )
+
+        # step line, two points per bin
+        xs = np.column_stack([edges[:-1], edges[1:]]).ravel()
+        kwargs.setdefault("name", f"crossfilter-histogram-{dimension}")
+        graphic = subplot.add_line(np.column_stack([xs, np.zeros(xs.size)]), **kwargs)
+
+        histogram = _HistogramView(dim, graphic, row_bins)
+
+        passing = (self._filters & ~dim.bit) == 0
+        histogram.counts = np.bincount(row_bins[passing], minlength=bins + 1).astype(
+            np.int64
+        )
+        histogram.draw()
+
+        self._histograms.append(histogram)
+
+        return graphic
+
+    def add_selector(
+        self,
+        selector: LinearRegionSelector | RectangleSelector,
+        dimensions: str | Sequence[str | None],
+    ):
+        """
+        Use a selector as the filter of one or two dimensions. The filters are updated on every selection event
+        of the selector, use the ``event_policy`` of the selector to filter less often during drags, for example
+        ``"per_frame"``.
+
+        Parameters
+        ----------
+        selector: LinearRegionSelector | RectangleSelector
+            selector whose selection sets the filter ranges
+
+        dimensions: str | (str | None, str | None)
+            | LinearRegionSelector: name of the filtered dimension
+            | RectangleSelector: names of the dimensions filtered by the (x, y) ranges of the selection, ``None``
+              does not filter along that axis
+
+        """
+        if isinstance(selector, LinearRegionSelector):
+            if not isinstance(dimensions, str):
+                raise TypeError(
+                    "a LinearRegionSelector filters one dimension, pass the dimension name as a str"
+                )
+            dimensions = (dimensions,)
+
+        elif isinstance(selector, RectangleSelector):
+            if isinstance(dimensions, str) or len(dimensions) != 2:
+                raise TypeError(
+                    "a RectangleSelector filters two dimensions, pass a tuple of (x_dimension, y_dimension)"
+                )
+            dimensions = tuple(dimensions)
+
+        else:
+            raise TypeError(
+                f"crossfilter selectors must be a LinearRegionSelector or RectangleSelector, "
+                f"you passed a: {type(selector)}"
+            )
+
+        for name in dimensions:
+            if name is not None:
+                self._get_dimension(name)
+
+        def handler(ev):
+            self._apply_selection(dimensions, ev.info["value"])
+
+        selector.add_event_handler(handler, "selection")
+        self._selectors[selector] = (dimensions, handler)
+
+        self._apply_selection(dimensions, selector.selection)
+
+    def remove_selector(self, selector: LinearRegionSelector | RectangleSelector):
+        """stop using a selector as a filter and clear the filters that it set"""
+        dimensions, handler = self._selectors.pop(selector)
+        selector.remove_event_handler(handler, "selection")
+
+        for name in dimensions:
+            if name is not None:
+                self.filter_range(name, None)
+
+    def _apply_selection(self, dimensions: tuple, selection: np.ndarray):
+        # (min, max) for each dimension, i.e. (xmin, xmax, ymin, ymax) for a rectangle
+        for name, value_range in zip(dimensions, np.reshape(selection, (-1, 2))):
+            if name is not None:
+                self.filter_range(name, value_range)
+
+    def __repr__(self):
+        return (
+            f"Crossfilter(rows={self.n_rows}, dimensions={self.dimensions}, "
+            f"selected={self.n_selected})"
+        )
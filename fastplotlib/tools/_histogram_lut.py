@@ -1,4 +1,4 @@
-from math import ceil
+from collections import OrderedDict
 import weakref
 
 import numpy as np
@@ -12,6 +12,10 @@ from ..graphics._base import Graphic
 from ..graphics.selectors import LinearRegionSelector
 
 
+# number of texels in the colorbar, independent of the data range
+COLORBAR_SIZE = 256
+
+
 def _get_image_graphic_events(image_graphic: ImageGraphic) -> list[str]:
     """Small helper function to return the relevant events for an ImageGraphic"""
     events = ["vmin", "vmax"]
@@ -24,6 +28,53 @@ def _get_image_graphic_events(image_graphic: ImageGraphic) -> list[str]:
     return events
 
 
+def _fast_histogram(
+    data: np.ndarray, nbins: int, range: tuple[float, float] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Histogram with ``nbins`` uniform bins, same as ``np.histogram(data, bins=nbins, range=range)``.
+
+    Integer data is binned with ``np.bincount`` instead of the float ``np.histogram``. uint8 and uint16 values
+    are counted directly on the native dtype, other integers are binned with integer arithmetic.
+    """
+    data = np.asarray(data)
+
+    if range is None:
+        lo, hi = data.min(), data.max()
+    else:
+        lo, hi = range
+
+    if (
+        not np.issubdtype(data.dtype, np.integer)
+        or not float(lo).is_integer()
+        or not float(hi).is_integer()
+        or hi <= lo
+        or (hi - lo) * nbins >= 2**62
+    ):
+        return np.histogram(data, bins=nbins, range=range)
+
+    lo, hi = int(lo), int(hi)
+    span = hi - lo
+    edges = np.linspace(lo, hi, nbins + 1)
+    values = data.ravel()
+
+    if data.dtype in (np.uint8, np.uint16):
+        # count every value, then merge the value counts into the bins
+        counts = np.bincount(values, minlength=hi + 1)
+        value_range = np.arange(max(lo, 0), hi + 1)
+        bins = np.minimum((value_range - lo) * nbins // span, nbins - 1)
+        hist = np.bincount(bins, weights=counts[value_range], minlength=nbins)
+
+        return hist.astype(np.int64), edges
+
+    if range is not None:
+        values = values[(values >= lo) & (values <= hi)]
+
+    bins = np.minimum((values.astype(np.int64) - lo) * nbins // span, nbins - 1)
+
+    return np.bincount(bins, minlength=nbins), edges
+
+
 # TODO: This is a widget, we can think about a BaseWidget class later if necessary
 class HistogramLUTTool(Graphic):
     def __init__(
@@ -32,6 +83,8 @@ class HistogramLUTTool(Graphic):
         image_graphic: ImageGraphic,
         nbins: int = 100,
         flank_divisor: float = 5.0,
+        histogram_mode: str = "data",
+        histogram_scale: str = "linear",
         **kwargs,
     ):
         """
@@ -44,6 +97,14 @@ class HistogramLUTTool(Graphic):
             Total number of bins used in the histogram
         flank_divisor: float, default 5.0.
             Fraction of empty histogram bins on the tails of the distribution set `np.inf` for no flanks
+        histogram_mode: str, default "data"
+            | "data": histogram of ``data``
+            | "frame": histogram of the most recent frame passed to ``add_frame()``
+            | "running": histogram accumulated over all the frames passed to ``add_frame()``
+            | the "frame" and "running" histograms use the bin edges of the ``data`` histogram
+        histogram_scale: str, default "linear"
+            | "linear" or "log" scaling of the histogram counts. "log" keeps the tails of high-dynamic-range
+            | data, such as photon counts, visible next to a dominant background peak
         kwargs
         """
         super().__init__(**kwargs)
@@ -52,11 +113,31 @@ class HistogramLUTTool(Graphic):
         self._flank_divisor = flank_divisor
         self._image_graphic = image_graphic
 
+        self._histogram_mode = None
+        self.histogram_mode = histogram_mode
+
+        # per-frame histograms, {frame_key: hist}
+        self._frame_histograms: OrderedDict = OrderedDict()
+        # histogram over all visited frames and the keys of the frames that it includes
+        self._running_histogram = np.zeros(nbins, dtype=np.int64)
+        self._running_keys: set = set()
+        # histogram that will be displayed in the next render, updates are throttled to one per render
+        self._pending_histogram: np.ndarray | None = None
+
+        if histogram_scale not in ("linear", "log"):
+            raise ValueError(
+                f"`histogram_scale` must be one of 'linear' or 'log', you passed: {histogram_scale}"
+            )
+        self._histogram_scale = histogram_scale
+
         self._data = weakref.proxy(data)
 
         self._scale_factor: float = 1.0
 
         hist, edges, hist_scaled, edges_flanked = self._calculate_histogram(data)
+        self._data_histogram = hist
+        # histogram that is currently displayed
+        self._displayed_histogram = hist
 
         line_data = np.column_stack([hist_scaled, edges_flanked])
 
@@ -144,22 +225,20 @@ class HistogramLUTTool(Graphic):
             self._colorbar = None
             self._cmap = None
 
-    def _make_colorbar(self, edges_flanked) -> ImageGraphic:
-        # use the histogram edge values as data for an
-        # image with 2 columns, this will be our colorbar!
+    def _colorbar_data(self, edges_flanked) -> np.ndarray:
+        # use the histogram edge values as data for an image with 2 columns,
+        # fixed number of rows regardless of the data range
         colorbar_data = np.column_stack(
-            [
-                np.linspace(
-                    edges_flanked[0], edges_flanked[-1], ceil(np.ptp(edges_flanked))
-                )
-            ]
-            * 2
+            [np.linspace(edges_flanked[0], edges_flanked[-1], COLORBAR_SIZE)] * 2
         ).astype(np.float32)
 
         colorbar_data /= self._scale_factor
 
+        return colorbar_data
+
+    def _make_colorbar(self, edges_flanked) -> ImageGraphic:
         cbar = ImageGraphic(
-            data=colorbar_data,
+            data=self._colorbar_data(edges_flanked),
             vmin=self.vmin,
             vmax=self.vmax,
             cmap=self.image_graphic.cmap,
@@ -167,11 +246,19 @@ class HistogramLUTTool(Graphic):
             offset=(-55, edges_flanked[0], -1),
         )
 
-        cbar.world_object.world.scale_x = 20
+        # use the cmap texture of the image graphic instead of a separate texture
+        cbar._material.map = self.image_graphic._material.map
+
+        cbar.world_object.local.scale_x = 20
+        self._scale_colorbar(cbar, edges_flanked)
         self._cmap = self.image_graphic.cmap
 
         return cbar
 
+    def _scale_colorbar(self, cbar: ImageGraphic, edges_flanked):
+        """scale the colorbar rows so that they span the histogram edges in world space"""
+        cbar.world_object.local.scale_y = np.ptp(edges_flanked) / (COLORBAR_SIZE - 1)
+
     def _get_vmin_vmax_str(self) -> tuple[str, str]:
         if self.vmin < 0.001 or self.vmin > 99_999:
             vmin_str = f"{self.vmin:.2e}"
@@ -193,11 +280,16 @@ class HistogramLUTTool(Graphic):
         self._plot_area.auto_scale()
         self._plot_area.controller.enabled = True
 
+        self._plot_area.add_animations(self._update_histogram_line)
+
     def _calculate_histogram(self, data):
 
         # get a subsampled view of this array
         data_ss = subsample_array(data, max_size=int(1e6))  # 1e6 is default
-        hist, edges = np.histogram(data_ss, bins=self._nbins)
+        hist, edges = _fast_histogram(data_ss, self._nbins)
+
+        # unscaled edges, used as the fixed edges for frame histograms
+        self._edges = edges
 
         # used if data ptp <= 10 because event things get weird
         # with tiny world objects due to floating point error
@@ -210,6 +302,7 @@ class HistogramLUTTool(Graphic):
         bin_width = edges[1] - edges[0]
 
         flank_nbins = int(self._nbins / self._flank_divisor)
+        self._flank_nbins = flank_nbins
         flank_size = flank_nbins * bin_width
 
         flank_left = np.arange(edges[0] - flank_size, edges[0], bin_width)
@@ -219,8 +312,21 @@ class HistogramLUTTool(Graphic):
 
         edges_flanked = np.concatenate((flank_left, edges, flank_right))
 
+        hist_scaled = self._scale_histogram(hist)
+
+        if edges_flanked.size > hist_scaled.size:
+            # we don't care about accuracy here so if it's off by 1-2 bins that's fine
+            edges_flanked = edges_flanked[: hist_scaled.size]
+
+        return hist, edges, hist_scaled, edges_flanked
+
+    def _scale_histogram(self, hist: np.ndarray) -> np.ndarray:
+        """add the empty flanks and scale the histogram to 0 - 100"""
+        if self._histogram_scale == "log":
+            hist = np.log1p(hist)
+
         hist_flanked = np.concatenate(
-            (np.zeros(flank_nbins), hist, np.zeros(flank_nbins))
+            (np.zeros(self._flank_nbins), hist, np.zeros(self._flank_nbins))
         )
 
         # scale 0-100 to make it easier to see
@@ -228,13 +334,115 @@ class HistogramLUTTool(Graphic):
         hist_scale_value = hist_flanked.max()
         if np.allclose(hist_scale_value, 0):
             hist_scale_value = 1
-        hist_scaled = hist_flanked / (hist_scale_value / 100)
+        return hist_flanked / (hist_scale_value / 100)
 
-        if edges_flanked.size > hist_scaled.size:
-            # we don't care about accuracy here so if it's off by 1-2 bins that's fine
-            edges_flanked = edges_flanked[: hist_scaled.size]
+    @property
+    def histogram_scale(self) -> str:
+        """Get or set the scaling of the histogram counts, "linear" or "log"."""
+        return self._histogram_scale
+
+    @histogram_scale.setter
+    def histogram_scale(self, scale: str):
+        if scale not in ("linear", "log"):
+            raise ValueError(
+                f"`histogram_scale` must be one of 'linear' or 'log', you passed: {scale}"
+            )
 
-        return hist, edges, hist_scaled, edges_flanked
+        self._histogram_scale = scale
+        self._pending_histogram = self._displayed_histogram
+
+    @property
+    def histogram_mode(self) -> str:
+        """
+        Get or set the histogram that is displayed
+
+        | "data": histogram of the data
+        | "frame": histogram of the most recent frame passed to ``add_frame()``
+        | "running": histogram accumulated over all the frames passed to ``add_frame()``
+        """
+        return self._histogram_mode
+
+    @histogram_mode.setter
+    def histogram_mode(self, mode: str):
+        if mode not in ("data", "frame", "running"):
+            raise ValueError(
+                f"`histogram_mode` must be one of 'data', 'frame' or 'running', you passed: {mode}"
+            )
+
+        if self._histogram_mode is None:
+            # init
+            self._histogram_mode = mode
+            return
+
+        self._histogram_mode = mode
+
+        if mode == "data":
+            self._pending_histogram = self._data_histogram
+        elif mode == "running":
+            self._pending_histogram = self._running_histogram
+
+    def add_frame(self, frame: np.ndarray, key=None):
+        """
+        Add a frame to the "running" histogram and set it as the current "frame" histogram. Frame histograms
+        use the fixed bin edges of the data histogram and are cached by ``key``, a frame with a key that was
+        already added is not counted again in the running histogram.
+
+        The displayed histogram is updated at most once per render.
+
+        Parameters
+        ----------
+        frame: np.ndarray
+            frame data
+
+        key: hashable, optional
+            key that identifies the frame, such as the ``ImageWidget.current_index``
+
+        """
+        hist = self._frame_histograms.get(key) if key is not None else None
+
+        if hist is None:
+            frame_ss = subsample_array(frame, max_size=int(1e6))
+            hist, _ = _fast_histogram(
+                frame_ss, self._nbins, range=(self._edges[0], self._edges[-1])
+            )
+
+            if key is not None:
+                self._frame_histograms[key] = hist
+                if len(self._frame_histograms) > 1024:
+                    # least recently added
+                    self._frame_histograms.popitem(last=False)
+
+        if key is None or key not in self._running_keys:
+            self._running_histogram += hist
+            if key is not None:
+                self._running_keys.add(key)
+
+        match self.histogram_mode:
+            case "frame":
+                self._pending_histogram = hist
+            case "running":
+                self._pending_histogram = self._running_histogram
+
+    def clear_frame_histograms(self):
+        """clear the per-frame histogram cache and the running histogram"""
+        self._frame_histograms.clear()
+        self._running_histogram = np.zeros(self._nbins, dtype=np.int64)
+        self._running_keys.clear()
+
+        if self.histogram_mode == "running":
+            self._pending_histogram = self._running_histogram
+
+    def _update_histogram_line(self):
+        """set the histogram line data from the pending histogram, called once per render"""
+        if self._pending_histogram is None:
+            return
+
+        hist_scaled = self._scale_histogram(self._pending_histogram)
+        n = min(hist_scaled.size, self._histogram_line.data.value.shape[0])
+
+        self._histogram_line.data[:n, 0] = hist_scaled[:n]
+        self._displayed_histogram = self._pending_histogram
+        self._pending_histogram = None
 
     def _linear_region_handler(self, ev):
         # must use world coordinate values directly from selection()
@@ -311,6 +519,12 @@ class HistogramLUTTool(Graphic):
 
     def set_data(self, data, reset_vmin_vmax: bool = True):
         hist, edges, hist_scaled, edges_flanked = self._calculate_histogram(data)
+        self._data_histogram = hist
+        self._displayed_histogram = hist
+
+        # bin edges changed
+        self.clear_frame_histograms()
+        self._pending_histogram = None
 
         line_data = np.column_stack([hist_scaled, edges_flanked])
 
@@ -332,16 +546,23 @@ class HistogramLUTTool(Graphic):
 
         self._data = weakref.proxy(data)
 
-        if self._colorbar is not None:
-            self._colorbar.clear_event_handlers()
-            self.world_object.remove(self._colorbar.world_object)
+        if self._colorbar is not None and self.image_graphic.data.value.ndim != 3:
+            # the colorbar has a fixed size, update it in place
+            self._colorbar.data = self._colorbar_data(edges_flanked)
+            self._colorbar.offset = (-55, edges_flanked[0], -1)
+            self._scale_colorbar(self._colorbar, edges_flanked)
 
-        if self.image_graphic.data.value.ndim != 3:
+        elif self.image_graphic.data.value.ndim != 3:
             self._colorbar: ImageGraphic = self._make_colorbar(edges_flanked)
             self._colorbar.add_event_handler(self._open_cmap_picker, "click")
 
             self.world_object.add(self._colorbar.world_object)
+
         else:
+            if self._colorbar is not None:
+                self._colorbar.clear_event_handlers()
+                self.world_object.remove(self._colorbar.world_object)
+
             self._colorbar = None
             self._cmap = None
 
@@ -372,6 +593,10 @@ class HistogramLUTTool(Graphic):
 
         self.image_graphic.add_event_handler(self._image_cmap_handler, *ig_events)
 
+        if self._colorbar is not None and graphic.data.value.ndim != 3:
+            # share the cmap texture of the new image graphic
+            self._colorbar._material.map = graphic._material.map
+
     def disconnect_image_graphic(self):
         ig_events = _get_image_graphic_events(self._image_graphic)
         self._image_graphic.remove_event_handler(self._image_cmap_handler, *ig_events)
@@ -388,6 +613,7 @@ class HistogramLUTTool(Graphic):
         self._plot_area.get_figure().open_popup("colormap-picker", pos, lut_tool=self)
 
     def _fpl_prepare_del(self):
+        self._plot_area.remove_animation(self._update_histogram_line)
         self._linear_region_selector._fpl_prepare_del()
         self._histogram_line._fpl_prepare_del()
         del self._histogram_line
@@ -455,6 +455,10 @@ def subsample_array(
     np.ndarray
         subsample of the input array
     """
+    if hasattr(arr, "_fpl_subsample") and ignore_dims is None:
+        # chunked array-likes provide their own chunk-aligned subsampling
+        return arr._fpl_subsample(int(max_size))
+
     if np.prod(arr.shape) <= max_size:
         return arr  # no need to subsample if already below the threshold
 
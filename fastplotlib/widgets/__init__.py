@@ -1,3 +1,15 @@
-from .image_widget import ImageWidget
+from .image_widget import (
+    ImageWidget,
+    ChunkCache,
+    ChunkedArray,
+    TemporalProjection,
+    ROITrace,
+)
 
-__all__ = ["ImageWidget"]
+__all__ = [
+    "ImageWidget",
+    "ChunkCache",
+    "ChunkedArray",
+    "TemporalProjection",
+    "ROITrace",
+]
@@ -1,4 +1,7 @@
 from ...layouts import IMGUI
+from ._chunked import ChunkCache, ChunkedArray
+from ._projections import TemporalProjection
+from ._roi_trace import ROITrace
 
 if IMGUI:
     from ._widget import ImageWidget
@@ -0,0 +1,404 @@
+from collections import OrderedDict
+from itertools import count, product
+from threading import RLock
+
+import numpy as np
+
+# used to give every ChunkedArray a unique key prefix in a shared ChunkCache
+_array_ids = count()
+
+
+class ChunkCache:
+    def __init__(self, max_bytes: int = 512 * 1024**2):
+        """
+        Thread-safe least-recently-used cache of decoded chunks.
+
+        A single ``ChunkCache`` can be shared by many ``ChunkedArray`` instances, for example all the arrays
+        displayed in an ``ImageWidget``. Frame loading, window functions, prefetching and histogram
+        calculations then all read from the same pool of decoded chunks.
+
+        Parameters
+        ----------
+        max_bytes: int, default 512 MiB
+            maximum total size of the decoded chunks kept in the cache, least recently used chunks are evicted
+            once this size is exceeded
+
+        """
+        self._chunks: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._lock = RLock()
+
+        self._nbytes = 0
+        self._max_bytes = 0
+        self.max_bytes = max_bytes
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_bytes(self) -> int:
+        """Get or set the maximum number of bytes held by the cache"""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int):
+        if value < 0:
+            raise ValueError("`max_bytes` must be a positive int")
+
+        with self._lock:
+            self._max_bytes = int(value)
+            self._evict()
+
+    @property
+    def nbytes(self) -> int:
+        """total size of the chunks that are currently cached"""
+        return self._nbytes
+
+    @property
+    def hits(self) -> int:
+        """number of chunk requests that were served from the cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """number of chunk requests that had to be read from the source"""
+        return self._misses
+
+    def get(self, key: tuple) -> np.ndarray | None:
+        """get a cached chunk, returns ``None`` if the chunk is not cached"""
+        with self._lock:
+            chunk = self._chunks.get(key)
+
+            if chunk is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._chunks.move_to_end(key)
+
+            return chunk
+
+    def put(self, key: tuple, chunk: np.ndarray):
+        """add a decoded chunk to the cache"""
+        with self._lock:
+            if key in self._chunks:
+                self._nbytes -= self._chunks.pop(key).nbytes
+
+            if chunk.nbytes > self._max_bytes:
+                # would immediately evict everything else
+                return
+
+            self._chunks[key] = chunk
+            self._nbytes += chunk.nbytes
+            self._evict()
+
+    def invalidate(self, array_key: int):
+        """remove all chunks that belong to the array with the given key"""
+        with self._lock:
+            for key in [k for k in self._chunks.keys() if k[0] == array_key]:
+                self._nbytes -= self._chunks.pop(key).nbytes
+
+    def clear(self):
+        """remove all chunks from the cache"""
+        with self._lock:
+            self._chunks.clear()
+            self._nbytes = 0
+
+    def _evict(self):
+        while self._nbytes > self._max_bytes and len(self._chunks) > 0:
+            _, chunk = self._chunks.popitem(last=False)
+            self._nbytes -= chunk.nbytes
+
+    def __len__(self):
+        return len(self._chunks)
+
+    def __repr__(self):
+        return (
+            f"ChunkCache(chunks={len(self)}, nbytes={self.nbytes}, max_bytes={self.max_bytes}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+
+def _parse_chunks(chunks, shape: tuple[int, ...]) -> tuple[tuple[int, ...], ...]:
+    """
+    Get the chunk sizes along every dimension from a chunk layout.
+
+    Supports regular chunk shapes such as zarr arrays and h5py datasets, ``(c0, c1, ...)``, and
+    explicit chunk sizes such as dask arrays, ``((c00, c01, ...), (c10, c11, ...), ...)``. Arrays
+    without a chunk layout are read one index of the first dimension at a time.
+    """
+    if chunks is None:
+        # not chunked on disk, i.e. contiguous h5py datasets, read one frame at a time
+        chunks = (1, *shape[1:])
+
+    if len(chunks) != len(shape):
+        raise ValueError(
+            f"chunks: {chunks} do not match the number of dimensions of the array with shape: {shape}"
+        )
+
+    sizes = list()
+    for dim_chunks, dim_size in zip(chunks, shape):
+        if isinstance(dim_chunks, (tuple, list)):
+            # explicit chunk sizes
+            sizes.append(tuple(int(c) for c in dim_chunks))
+            continue
+
+        dim_chunks = max(1, int(dim_chunks))
+        n_full, remainder = divmod(dim_size, dim_chunks)
+        sizes.append((dim_chunks,) * n_full + ((remainder,) if remainder else ()))
+
+    return tuple(sizes)
+
+
+class ChunkedArray:
+    def __init__(
+        self,
+        source,
+        cache: ChunkCache = None,
+        chunks: tuple = None,
+    ):
+        """
+        Lazy array-like adapter that reads whole chunks from a chunked source and caches the decoded chunks.
+
+        Every read is aligned to the chunk boundaries of the ``source``, so each chunk is decoded at most
+        once as long as it stays in the ``cache``. Indexing is orthogonal, i.e. every index only applies to
+        its own dimension, like zarr's ``oindex``.
+
+        Parameters
+        ----------
+        source: array-like
+            array-like with ``shape``, ``ndim`` and ``__getitem__``, such as a zarr array, h5py dataset or dask
+            array. The chunk layout is read from ``source.chunks`` if it exists.
+
+        cache: ChunkCache, optional
+            cache for the decoded chunks, can be shared between many ``ChunkedArray`` instances. A new
+            ``ChunkCache`` is created if not provided.
+
+        chunks: tuple, optional
+            manually specify the chunk layout, in the same formats as zarr or dask ``chunks``
+
+        """
+        if isinstance(source, ChunkedArray):
+            # re-wrap the original source, keeping the chunk layout
+            if chunks is None:
+                chunks = source.chunks
+            source = source.source
+
+        self._source = source
+        self._shape = tuple(int(s) for s in source.shape)
+
+        if cache is None:
+            cache = ChunkCache()
+
+        self._cache = cache
+
+        if chunks is None:
+            chunks = getattr(source, "chunks", None)
+
+        self._chunk_sizes = _parse_chunks(chunks, self._shape)
+
+        # chunk boundaries along each dimension, [0, c0, c0 + c1, ..., dim_size]
+        self._bounds = tuple(
+            np.concatenate([[0], np.cumsum(sizes, dtype=np.int64)])
+            for sizes in self._chunk_sizes
+        )
+
+        self._key = next(_array_ids)
+
+    @property
+    def source(self):
+        """the wrapped array-like"""
+        return self._source
+
+    @property
+    def cache(self) -> ChunkCache:
+        """the decoded chunk cache used by this array"""
+        return self._cache
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._shape
+
+    @property
+    def ndim(self) -> int:
+        return len(self._shape)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(self._source.dtype)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self._shape))
+
+    @property
+    def chunks(self) -> tuple[tuple[int, ...], ...]:
+        """chunk sizes along each dimension, in the dask format"""
+        return self._chunk_sizes
+
+    @property
+    def chunk_bounds(self) -> tuple[np.ndarray, ...]:
+        """chunk boundaries along each dimension, ``[0, c0, c0 + c1, ..., dim_size]``"""
+        return self._bounds
+
+    def __len__(self):
+        return self._shape[0]
+
+    def __array__(self, dtype=None, copy=None):
+        a = self[...]
+        if dtype is not None:
+            return a.astype(dtype, copy=False)
+        return a
+
+    def _normalize_key(self, key) -> tuple[list[np.ndarray], list[bool]]:
+        """
+        Convert the key into an array of indices for every dimension.
+
+        Returns the indices and whether each dimension is dropped from the output, i.e. indexed with an int
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+
+        if any(k is Ellipsis for k in key):
+            ix = [i for i, k in enumerate(key) if k is Ellipsis]
+            if len(ix) > 1:
+                raise IndexError("an index can only have a single ellipsis ('...')")
+            n_missing = self.ndim - (len(key) - 1)
+            key = key[: ix[0]] + (slice(None),) * n_missing + key[ix[0] + 1 :]
+
+        if len(key) > self.ndim:
+            raise IndexError(
+                f"too many indices for array: array is {self.ndim}-dimensional, but {len(key)} were indexed"
+            )
+
+        key = key + (slice(None),) * (self.ndim - len(key))
+
+        indices = list()
+        drop = list()
+
+        for dim, (k, dim_size) in enumerate(zip(key, self._shape)):
+            if isinstance(k, (int, np.integer)):
+                k = int(k)
+                if k < 0:
+                    k += dim_size
+                if not 0 <= k < dim_size:
+                    raise IndexError(
+                        f"index {k} is out of bounds for axis {dim} with size {dim_size}"
+                    )
+                indices.append(np.array([k], dtype=np.int64))
+                drop.append(True)
+                continue
+
+            if isinstance(k, slice):
+                ixs = np.arange(*k.indices(dim_size), dtype=np.int64)
+
+            elif isinstance(k, (range, list, np.ndarray)):
+                ixs = np.asarray(k)
+                if ixs.dtype == bool:
+                    ixs = np.nonzero(ixs)[0]
+                ixs = ixs.astype(np.int64).ravel()
+                ixs[ixs < 0] += dim_size
+                if ixs.size > 0 and (ixs.min() < 0 or ixs.max() >= dim_size):
+                    raise IndexError(
+                        f"index out of bounds for axis {dim} with size {dim_size}"
+                    )
+
+            else:
+                raise TypeError(f"Unsupported index type for ChunkedArray: {type(k)}")
+
+            indices.append(ixs)
+            drop.append(False)
+
+        return indices, drop
+
+    def _chunk_ids(self, indices: list[np.ndarray]) -> list[np.ndarray]:
+        """unique chunk ids along each dimension that contain the given indices"""
+        return [
+            np.unique(np.searchsorted(bounds, ixs, side="right") - 1)
+            for bounds, ixs in zip(self._bounds, indices)
+        ]
+
+    def _read_chunk(self, chunk_index: tuple[int, ...]) -> np.ndarray:
+        """get the decoded chunk at the given chunk grid position, from the cache if possible"""
+        key = (self._key, chunk_index)
+
+        chunk = self._cache.get(key)
+        if chunk is not None:
+            return chunk
+
+        slices = tuple(
+            slice(int(bounds[c]), int(bounds[c + 1]))
+            for bounds, c in zip(self._bounds, chunk_index)
+        )
+
+        chunk = np.asarray(self._source[slices])
+        self._cache.put(key, chunk)
+
+        return chunk
+
+    def __getitem__(self, key) -> np.ndarray:
+        indices, drop = self._normalize_key(key)
+
+        out = np.empty(tuple(ixs.size for ixs in indices), dtype=self.dtype)
+
+        if out.size > 0:
+            for chunk_index in product(*self._chunk_ids(indices)):
+                chunk = self._read_chunk(chunk_index)
+
+                out_ix = list()
+                chunk_ix = list()
+                for bounds, c, ixs in zip(self._bounds, chunk_index, indices):
+                    start, stop = bounds[c], bounds[c + 1]
+                    in_chunk = np.nonzero((ixs >= start) & (ixs < stop))[0]
+                    out_ix.append(in_chunk)
+                    chunk_ix.append(ixs[in_chunk] - start)
+
+                out[np.ix_(*out_ix)] = chunk[np.ix_(*chunk_ix)]
+
+        # remove dims that were indexed with an int
+        return out.reshape(tuple(ixs.size for ixs, d in zip(indices, drop) if not d))
+
+    def prefetch(self, key):
+        """
+        Decode and cache all the chunks that are required for the given index, without assembling the output.
+        Safe to call from a background thread.
+        """
+        indices, _ = self._normalize_key(key)
+
+        for chunk_index in product(*self._chunk_ids(indices)):
+            self._read_chunk(chunk_index)
+
+    def _fpl_subsample(self, max_size: int) -> np.ndarray:
+        """
+        Chunk-aligned subsample used by ``subsample_array``. Reads whole chunks evenly spread over the chunk
+        grid instead of strided reads that would decode every chunk. Returns a flat array of values.
+        """
+        grid_shape = tuple(len(sizes) for sizes in self._chunk_sizes)
+        n_chunks = int(np.prod(grid_shape))
+
+        if self.size <= max_size:
+            return self[...].ravel()
+
+        chunk_size = max(1, int(np.prod([max(sizes) for sizes in self._chunk_sizes])))
+        n_read = int(min(n_chunks, max(1, np.ceil(max_size / chunk_size))))
+
+        flat_ids = np.unique(np.linspace(0, n_chunks - 1, n_read).astype(np.int64))
+
+        values = np.concatenate(
+            [
+                self._read_chunk(
+                    tuple(int(c) for c in np.unravel_index(i, grid_shape))
+                ).ravel()
+                for i in flat_ids
+            ]
+        )
+
+        if values.size > max_size:
+            values = values[:: int(np.ceil(values.size / max_size))]
+
+        return values
+
+    def __repr__(self):
+        return (
+            f"ChunkedArray(shape={self.shape}, dtype={self.dtype}, "
+            f"chunks={tuple(max(s) for s in self.chunks)}, source={type(self._source).__name__})"
+        )
@@ -0,0 +1,329 @@
+from hashlib import sha1
+import os
+from pathlib import Path
+from threading import Event, Lock, Thread
+
+import numpy as np
+
+from ...utils import subsample_array
+from ._chunked import ChunkedArray
+
+PROJECTIONS = ("mean", "max", "min", "std")
+
+
+def _source_path(data) -> Path | None:
+    """path of the file or directory that backs an array-like, such as a memmap, HDF5 dataset or Zarr array"""
+    if isinstance(data, ChunkedArray):
+        data = data.source
+
+    for path in (
+        getattr(data, "filename", None),
+        getattr(getattr(data, "file", None), "filename", None),
+        getattr(getattr(data, "store", None), "path", None),
+        getattr(getattr(data, "store", None), "root", None),
+    ):
+        if isinstance(path, (str, os.PathLike)) and os.path.exists(path):
+            return Path(path).resolve()
+
+    return None
+
+
+def _modified_time(path: Path) -> int:
+    """latest modification time of a file, or of the files in a directory such as a Zarr store, in ns"""
+    if path.is_file():
+        return path.stat().st_mtime_ns
+
+    return max(
+        [path.stat().st_mtime_ns]
+        + [p.stat().st_mtime_ns for p in path.rglob("*") if p.is_file()]
+    )
+
+
+def _data_fingerprint(data, cache_key: str = None) -> str:
+    """
+    Fingerprint of an array-like that is cheap to compute without reading the full array. Uses the shape,
+    dtype, the first and last frames along the first dimension, a subsample of the array and either the
+    ``cache_key`` or the path and modification time of the file that backs the array.
+    """
+    h = sha1()
+    h.update(str(tuple(data.shape)).encode())
+    h.update(str(np.dtype(data.dtype)).encode())
+
+    if cache_key is not None:
+        h.update(str(cache_key).encode())
+    else:
+        path = _source_path(data)
+        if path is None:
+            raise ValueError(
+                "a `cache_key` is required to cache the projection of data that is not backed by a file"
+            )
+        h.update(str(path).encode())
+        h.update(str(_modified_time(path)).encode())
+
+    for frame in (data[0], data[data.shape[0] - 1]):
+        h.update(np.ascontiguousarray(frame).tobytes())
+
+    h.update(np.ascontiguousarray(subsample_array(data, max_size=int(1e5))).tobytes())
+
+    return h.hexdigest()
+
+
+class TemporalProjection:
+    def __init__(
+        self,
+        data,
+        kind: str = "mean",
+        cache_dir: str | Path = None,
+        cache_key: str = None,
+        block_size: int = None,
+    ):
+        """
+        Projection of an image stack along the first ("t") dimension that is computed incrementally in a
+        background thread. Memory use is bounded by the size of one block of frames plus the running
+        accumulators, regardless of the stack length.
+
+        Partial results are available from ``result`` while the computation runs, and completed results can be
+        cached on disk keyed by a fingerprint of the data.
+
+        Parameters
+        ----------
+        data: array-like
+            stack of frames, the projection is computed over the first dimension. ``ChunkedArray`` data is read
+            one chunk along the first dimension at a time through its chunk cache.
+
+        kind: str, default "mean"
+            one of "mean", "max", "min" or "std"
+
+        cache_dir: str | Path, optional
+            directory used to cache completed projections, nothing is written to disk by default. The cached
+            result of data that is backed by a file, such as a memmap, HDF5 dataset or Zarr array, is invalidated
+            when the file is modified.
+
+        cache_key: str, optional
+            identifies the data in the disk cache, required to cache the projection of data that is not backed by
+            a file. Use a new key when the data changes.
+
+        block_size: int, optional
+            number of frames read per block if ``data`` is not a ``ChunkedArray``, by default this is chosen so
+            that a block is ~64 MiB
+
+        """
+        if kind not in PROJECTIONS:
+            raise ValueError(
+                f"projection `kind` must be one of: {PROJECTIONS}, you passed: {kind}"
+            )
+
+        self._data = data
+        self._kind = kind
+
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._cache_key = cache_key
+
+        if (
+            self._cache_dir is not None
+            and cache_key is None
+            and _source_path(data) is None
+        ):
+            raise ValueError(
+                "a `cache_key` is required to cache the projection of data that is not backed by a file"
+            )
+
+        n_frames = data.shape[0]
+
+        if isinstance(data, ChunkedArray):
+            # align the blocks with the chunks along the first dimension
+            self._block_bounds = data.chunk_bounds[0]
+        else:
+            if block_size is None:
+                frame_bytes = np.prod(data.shape[1:]) * np.dtype(data.dtype).itemsize
+                block_size = max(1, int(64 * 1024**2 // max(frame_bytes, 1)))
+            self._block_bounds = np.append(np.arange(0, n_frames, block_size), n_frames)
+
+        self._lock = Lock()
+        self._cancel = Event()
+        self._done = Event()
+        # set when the background thread exits, whether it completed, was cancelled or raised
+        self._stopped = Event()
+        self._thread: Thread | None = None
+
+        # running accumulators
+        self._n = 0
+        self._acc: np.ndarray | None = None
+        self._m2: np.ndarray | None = None
+
+        self._n_blocks_done = 0
+        self._from_cache = False
+        self._error: Exception | None = None
+
+        self._fingerprint: str | None = None
+
+    @property
+    def data(self):
+        """the stack that is projected"""
+        return self._data
+
+    @property
+    def kind(self) -> str:
+        """the kind of projection, "mean", "max", "min" or "std\" """
+        return self._kind
+
+    @property
+    def progress(self) -> float:
+        """fraction of the stack that has been processed, between 0 and 1"""
+        if self._from_cache:
+            return 1.0
+        return self._n_blocks_done / (self._block_bounds.size - 1)
+
+    @property
+    def n_frames(self) -> int:
+        """number of frames that have been processed"""
+        return self._n
+
+    @property
+    def done(self) -> bool:
+        """``True`` once the projection over the full stack is complete"""
+        return self._done.is_set()
+
+    @property
+    def from_cache(self) -> bool:
+        """``True`` if the result was loaded from the disk cache"""
+        return self._from_cache
+
+    @property
+    def error(self) -> Exception | None:
+        """exception raised in the background thread, if any"""
+        return self._error
+
+    @property
+    def cache_path(self) -> Path | None:
+        """path of the cached result on disk, ``None`` if the disk cache is disabled"""
+        if self._cache_dir is None:
+            return None
+
+        if self._fingerprint is None:
+            self._fingerprint = _data_fingerprint(self._data, self._cache_key)
+
+        return self._cache_dir.joinpath(f"{self._fingerprint}-{self.kind}.npy")
+
+    @property
+    def result(self) -> np.ndarray | None:
+        """
+        Copy of the current projection as a float32 array. This is a partial result computed over the frames
+        processed so far if the projection is not ``done`` yet, or ``None`` if no frames have been processed.
+        """
+        with self._lock:
+            if self._acc is None:
+                return None
+
+            match self.kind:
+                case "std":
+                    result = np.sqrt(self._m2 / self._n)
+                case _:
+                    result = self._acc
+
+            return result.astype(np.float32)
+
+    def start(self):
+        """start computing the projection in a background thread, loads the result if it's cached on disk"""
+        if self._thread is not None:
+            return
+
+        self._thread = Thread(
+            target=self._run, name=f"fpl-{self.kind}-projection", daemon=True
+        )
+        self._thread.start()
+
+    def _load_cached(self) -> bool:
+        """load the result from the disk cache, returns ``True`` if it was cached"""
+        cache_path = self.cache_path
+        if cache_path is None or not cache_path.is_file():
+            return False
+
+        result = np.load(cache_path).astype(np.float64)
+
+        with self._lock:
+            self._n = self._data.shape[0]
+            if self.kind == "std":
+                # the std is cached, rebuild the sum of squared differences from it
+                self._m2 = result**2 * self._n
+            self._acc = result
+
+        self._from_cache = True
+        return True
+
+    def cancel(self):
+        """stop the background computation, partial results remain available"""
+        self._cancel.set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """block until the background computation stops, returns ``done``"""
+        self._stopped.wait(timeout)
+        return self.done
+
+    def _run(self):
+        try:
+            if self._load_cached():
+                self._done.set()
+                return
+
+            for start, stop in zip(self._block_bounds[:-1], self._block_bounds[1:]):
+                if self._cancel.is_set():
+                    return
+
+                block = np.asarray(self._data[int(start) : int(stop)])
+                self._update(block)
+                self._n_blocks_done += 1
+
+            self._done.set()
+
+            cache_path = self.cache_path
+            if cache_path is not None:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                np.save(cache_path, self.result)
+
+        except Exception as e:
+            self._error = e
+            raise
+
+        finally:
+            self._stopped.set()
+
+    def _update(self, block: np.ndarray):
+        """merge a block of frames into the running accumulators"""
+        n_b = block.shape[0]
+
+        match self.kind:
+            case "mean" | "std":
+                block = block.astype(np.float64, copy=False)
+                mean_b = block.mean(axis=0)
+
+                if self.kind == "std":
+                    m2_b = ((block - mean_b) ** 2).sum(axis=0)
+
+                with self._lock:
+                    if self._acc is None:
+                        self._acc = mean_b
+                        if self.kind == "std":
+                            self._m2 = m2_b
+                    else:
+                        # Chan et al. parallel update of the mean and sum of squared differences
+                        n = self._n + n_b
+                        delta = mean_b - self._acc
+                        self._acc = self._acc + delta * (n_b / n)
+                        if self.kind == "std":
+                            self._m2 = self._m2 + m2_b + delta**2 * (self._n * n_b / n)
+                    self._n += n_b
+
+            case "max" | "min":
+                reduce = np.fmax if self.kind == "max" else np.fmin
+                block_reduced = reduce.reduce(block, axis=0).astype(np.float64)
+
+                with self._lock:
+                    if self._acc is None:
+                        self._acc = block_reduced
+                    else:
+                        self._acc = reduce(self._acc, block_reduced)
+                    self._n += n_b
+
+    def __repr__(self):
+        return f"TemporalProjection(kind={self.kind}, progress={self.progress:.0%}, done={self.done})"
@@ -0,0 +1,327 @@
+from collections import OrderedDict
+from threading import Event, Lock, Thread
+
+import numpy as np
+
+from ._chunked import ChunkedArray
+
+ROI_REDUCTIONS = ("mean", "sum", "max", "min", "std")
+
+
+def _normalize_roi(roi: tuple, shape: tuple[int, ...]) -> tuple:
+    """hashable form of a region key, ints stay ints and slices become (start, stop)"""
+    if not isinstance(roi, tuple):
+        roi = (roi,)
+
+    if len(roi) > len(shape):
+        raise IndexError(
+            f"too many indices for the region: frames are {len(shape)}-dimensional, but {len(roi)} were indexed"
+        )
+
+    normalized = list()
+    for index, size in zip(roi, shape):
+        if isinstance(index, (int, np.integer)):
+            normalized.append(range(size)[index])
+
+        elif isinstance(index, slice):
+            start, stop, step = index.indices(size)
+            if step != 1:
+                raise ValueError("the step of the slices of a region must be 1")
+            normalized.append((start, max(start, stop)))
+
+        else:
+            raise TypeError(
+                f"a region must be indexed with ints and slices, you passed a: {type(index)}"
+            )
+
+    return tuple(normalized)
+
+
+def _roi_key(roi: tuple) -> tuple:
+    """index of the region from its normalized form"""
+    return tuple(slice(*index) if isinstance(index, tuple) else index for index in roi)
+
+
+class ROITrace:
+    def __init__(
+        self,
+        data,
+        reduction: str = "mean",
+        block_size: int = None,
+        cache_size: int = 32,
+    ):
+        """
+        Reduction of a region of every frame of an image stack, such as the mean of a region of interest over time,
+        computed in a background thread. The region is read in blocks of frames, starting with the blocks closest
+        to ``focus``, and partial results are available from ``result`` while the computation runs.
+
+        Changing the ``roi`` abandons the current pass after the block that is being read and starts a pass over
+        the new region. The traces of the last ``cache_size`` regions are kept, including partial traces, so going
+        back to a previous region continues from the blocks that were already computed.
+
+        Parameters
+        ----------
+        data: array-like
+            stack of frames, the first dimension is "t". ``ChunkedArray`` data is read through its chunk cache, and
+            the blocks are aligned with its chunks along "t".
+
+        reduction: str, default "mean"
+            one of "mean", "sum", "max", "min" or "std", reduces the region of each frame to a single value
+
+        block_size: int, optional
+            number of frames read per block, the blocks of a ``ChunkedArray`` start at its chunk boundaries. By
+            default this is chosen so that the region in a block is ~16 MiB, with at most 1024 frames per block
+            so that a pass restarts quickly when the region changes.
+
+        cache_size: int, default 32
+            number of regions whose traces are kept
+
+        """
+        if reduction not in ROI_REDUCTIONS:
+            raise ValueError(
+                f"`reduction` must be one of: {ROI_REDUCTIONS}, you passed: {reduction}"
+            )
+
+        self._data = data
+        self._reduction = reduction
+        self._block_size = block_size
+        self._cache_size = cache_size
+
+        self._lock = Lock()
+        # set when the worker has a new region or data to process
+        self._wake = Event()
+        # set when the worker is done with the current region
+        self._idle = Event()
+        self._idle.set()
+        self._cancelled = False
+        self._thread: Thread | None = None
+        self._error: Exception | None = None
+
+        self._roi: tuple | None = None
+        self._focus = 0
+
+        # normalized region -> {"bounds", "result", "done", "n_frames"}
+        self._traces: OrderedDict[tuple, dict] = OrderedDict()
+
+    @property
+    def data(self):
+        """Get or set the stack, setting the data clears the cached traces"""
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        with self._lock:
+            self._data = data
+            self._traces.clear()
+
+            roi, self._roi = self._roi, None
+
+        if roi is not None:
+            self.roi = _roi_key(roi)
+
+    @property
+    def reduction(self) -> str:
+        """the reduction of the region of each frame, "mean", "sum", "max", "min" or "std\" """
+        return self._reduction
+
+    @property
+    def roi(self) -> tuple | None:
+        """
+        Get or set the region, an index of each frame with ints and slices, for example ``(rows, cols)`` or
+        ``(z, rows, cols)`` for "tzxy" data. Setting a new region restarts the computation.
+        """
+        if self._roi is None:
+            return None
+
+        return _roi_key(self._roi)
+
+    @roi.setter
+    def roi(self, roi: tuple):
+        roi = _normalize_roi(roi, tuple(self._data.shape[1:]))
+
+        with self._lock:
+            if roi == self._roi:
+                return
+
+            if self._cancelled:
+                raise RuntimeError("the ROI trace was cancelled")
+
+            self._roi = roi
+
+            if roi in self._traces:
+                self._traces.move_to_end(roi)
+            else:
+                self._traces[roi] = self._new_trace(roi)
+                while len(self._traces) > self._cache_size:
+                    self._traces.popitem(last=False)
+
+            self._idle.clear()
+            self._wake.set()
+
+        if self._thread is None:
+            self._thread = Thread(target=self._run, name="fpl-roi-trace", daemon=True)
+            self._thread.start()
+
+    @property
+    def focus(self) -> int:
+        """Get or set the frame whose block is computed first when a pass over a region starts"""
+        return self._focus
+
+    @focus.setter
+    def focus(self, index: int):
+        self._focus = int(index)
+
+    @property
+    def result(self) -> np.ndarray | None:
+        """
+        Copy of the trace of the current region as a float32 array with one value per frame, NaN for the frames
+        that have not been computed yet. ``None`` if no region is set.
+        """
+        with self._lock:
+            trace = self._traces.get(self._roi)
+            if trace is None:
+                return None
+
+            return trace["result"].astype(np.float32)
+
+    @property
+    def n_frames(self) -> int:
+        """number of frames of the current region that have been computed"""
+        trace = self._traces.get(self._roi)
+        return 0 if trace is None else trace["n_frames"]
+
+    @property
+    def progress(self) -> float:
+        """fraction of the frames of the current region that have been computed, between 0 and 1"""
+        return self.n_frames / max(self._data.shape[0], 1)
+
+    @property
+    def done(self) -> bool:
+        """``True`` once the trace of the current region is complete"""
+        trace = self._traces.get(self._roi)
+        return trace is not None and bool(trace["done"].all())
+
+    @property
+    def error(self) -> Exception | None:
+        """exception raised in the background thread, if any"""
+        return self._error
+
+    def cancel(self):
+        """stop the background computation, the traces computed so far remain available"""
+        with self._lock:
+            self._cancelled = True
+            self._wake.set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """block until the background thread is done with the current region, returns ``done``"""
+        self._idle.wait(timeout)
+        return self.done
+
+    def _new_trace(self, roi: tuple) -> dict:
+        n_frames = self._data.shape[0]
+
+        block_frames = self._block_size
+        if block_frames is None:
+            # bytes of the region of one frame
+            shape = [
+                index[1] - index[0] if isinstance(index, tuple) else 1 for index in roi
+            ]
+            shape += self._data.shape[1 + len(roi) :]
+            frame_bytes = int(np.prod(shape)) * np.dtype(self._data.dtype).itemsize
+            block_frames = int(np.clip(16 * 1024**2 // max(frame_bytes, 1), 1, 1024))
+
+        if isinstance(self._data, ChunkedArray):
+            # blocks of whole chunks along "t" with at least block_frames frames, unless the chunks are larger
+            chunk_bounds = self._data.chunk_bounds[0]
+            starts = chunk_bounds[
+                np.unique(
+                    np.searchsorted(
+                        chunk_bounds, np.arange(0, n_frames, block_frames), side="right"
+                    )
+                    - 1
+                )
+            ]
+            bounds = np.append(starts, n_frames)
+        else:
+            bounds = np.append(np.arange(0, n_frames, block_frames), n_frames)
+
+        return {
+            "bounds": bounds.astype(np.int64),
+            "result": np.full(n_frames, np.nan, dtype=np.float64),
+            "done": np.zeros(bounds.size - 1, dtype=bool),
+            "n_frames": 0,
+        }
+
+    def _run(self):
+        try:
+            while True:
+                self._wake.wait()
+
+                with self._lock:
+                    self._wake.clear()
+                    if self._cancelled:
+                        return
+
+                    roi = self._roi
+                    trace = self._traces[roi]
+                    data = self._data
+
+                bounds, done = trace["bounds"], trace["done"]
+
+                # blocks closest to the focus frame first
+                focus_block = np.searchsorted(bounds, self._focus, side="right") - 1
+                blocks = np.flatnonzero(~done)
+                blocks = blocks[np.argsort(np.abs(blocks - focus_block), kind="stable")]
+
+                for block in blocks:
+                    if self._wake.is_set():
+                        # new region, data or cancelled
+                        break
+
+                    start, stop = int(bounds[block]), int(bounds[block + 1])
+                    values = self._reduce(
+                        np.asarray(data[(slice(start, stop), *_roi_key(roi))])
+                    )
+
+                    with self._lock:
+                        trace["result"][start:stop] = values
+                        trace["done"][block] = True
+                        trace["n_frames"] += stop - start
+
+                with self._lock:
+                    if not self._wake.is_set():
+                        self._idle.set()
+
+        except Exception as e:
+            self._error = e
+            raise
+
+        finally:
+            # waiting is pointless once the thread has stopped
+            self._idle.set()
+
+    def _reduce(self, block: np.ndarray) -> np.ndarray:
+        """reduce the region of each frame of a block to a single value"""
+        values = block.reshape(block.shape[0], -1)
+
+        if values.shape[1] == 0:
+            # empty region
+            return np.full(values.shape[0], np.nan)
+
+        match self._reduction:
+            case "mean":
+                return values.mean(axis=1, dtype=np.float64)
+            case "sum":
+                return values.sum(axis=1, dtype=np.float64)
+            case "max":
+                return values.max(axis=1)
+            case "min":
+                return values.min(axis=1)
+            case "std":
+                return values.std(axis=1, dtype=np.float64)
+
+    def __repr__(self):
+        return (
+            f"ROITrace(reduction={self.reduction}, roi={self.roi}, progress={self.progress:.0%}, "
+            f"done={self.done})"
+        )
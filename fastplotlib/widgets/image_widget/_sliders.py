@@ -22,6 +22,23 @@ class ImageWidgetSliders(EdgeWindow):
         # last timepoint that a frame was displayed from a given dimension
         self._last_frame_time: dict[str, float] = {"t": 0, "z": 0}
 
+        # playback speed multiplier, applied on top of the framerate
+        self._speed: dict[str, float] = {"t": 1.0, "z": 1.0}
+
+        # playback clock, if True the index is computed from the wall-clock time since playback started
+        # and frames are skipped when rendering or loading can't keep up with the target framerate
+        self._realtime: dict[str, bool] = {"t": False, "z": False}
+
+        # wall-clock time and index when the playback clock was last (re)started
+        self._clock_start_time: dict[str, float] = {"t": 0, "z": 0}
+        self._clock_start_index: dict[str, int] = {"t": 0, "z": 0}
+
+        # playback stats: measured display framerate, latency for setting the index
+        # (loading + processing the frame) and the number of frames skipped by the playback clock
+        self._display_fps: dict[str, float] = {"t": 0.0, "z": 0.0}
+        self._load_latency: dict[str, float] = {"t": 0.0, "z": 0.0}
+        self._n_skipped: dict[str, int] = {"t": 0, "z": 0}
+
         self._loop = False
 
         if "RTD_BUILD" in os.environ.keys():
@@ -44,7 +61,67 @@ class ImageWidgetSliders(EdgeWindow):
                 return
 
         # set current_index
-        self._image_widget.current_index = {dim: min(index, max_index)}
+        t0 = perf_counter()
+        self._image_widget.current_index = {dim: index}
+        self._load_latency[dim] = perf_counter() - t0
+
+    def _reset_clock(self, dim: str, now: float):
+        """restart the playback clock from the current index"""
+        self._clock_start_time[dim] = now
+        self._clock_start_index[dim] = self._image_widget.current_index[dim]
+        self._last_frame_time[dim] = now
+
+    def _play(self, dim: str, now: float):
+        """advance the index of a dimension that is in play mode"""
+        current = self._image_widget.current_index[dim]
+
+        if self._realtime[dim]:
+            # compute the target index from the time elapsed since the clock started
+            elapsed = now - self._clock_start_time[dim]
+            target = self._clock_start_index[dim] + int(
+                elapsed * self._fps[dim] * self._speed[dim]
+            )
+
+            max_index = self._image_widget._dims_max_bounds[dim] - 1
+
+            if target > max_index:
+                if self._loop:
+                    # the frames until the end are skipped, restart the clock from the beginning
+                    self._n_skipped[dim] += max_index - current
+                    target = 0
+                    self._clock_start_time[dim] = now
+                    self._clock_start_index[dim] = 0
+                else:
+                    # show the last frame and stop playing
+                    self._n_skipped[dim] += max(max_index - current - 1, 0)
+                    self._playing[dim] = False
+                    if current == max_index:
+                        return
+                    target = max_index
+
+            elif target <= current:
+                return
+
+            else:
+                self._n_skipped[dim] += target - current - 1
+
+        else:
+            # if enough time has elapsed w.r.t. the desired framerate, increment the index by one
+            if (
+                now - self._last_frame_time[dim]
+                < self._frame_time[dim] / self._speed[dim]
+            ):
+                return
+
+            target = current + 1
+
+        # exponential moving average of the displayed framerate
+        interval = now - self._last_frame_time[dim]
+        if 0 < interval < 1:
+            self._display_fps[dim] = 0.9 * self._display_fps[dim] + 0.1 / interval
+
+        self.set_index(dim, target)
+        self._last_frame_time[dim] = now
 
     def update(self):
         """called on every render cycle to update the GUI elements"""
@@ -86,16 +163,16 @@ class ImageWidgetSliders(EdgeWindow):
                     # if pause button clicked, then set playing to false
                     self._playing[dim] = False
 
-                # if in play mode and enough time has elapsed w.r.t. the desired framerate, increment the index
-                if now - self._last_frame_time[dim] >= self._frame_time[dim]:
-                    self.set_index(dim, self._image_widget.current_index[dim] + 1)
-                    self._last_frame_time[dim] = now
+                self._play(dim, now)
 
             else:
                 # we are not playing, so display play button
                 if imgui.button(label=fa.ICON_FA_PLAY):
                     # if play button is clicked, set last frame time to 0 so that index increments on next render
+                    self._reset_clock(dim, now)
                     self._last_frame_time[dim] = 0
+                    self._display_fps[dim] = 0.0
+                    self._n_skipped[dim] = 0
                     # set playing to True since play button was clicked
                     self._playing[dim] = True
 
@@ -142,6 +219,38 @@ class ImageWidgetSliders(EdgeWindow):
                     value = 50
                 self._fps[dim] = value
                 self._frame_time[dim] = 1 / value
+                self._reset_clock(dim, now)
+
+            imgui.same_line()
+            imgui.set_next_item_width(80)
+            # playback speed multiplier
+            speed_changed, value = imgui.input_float(
+                label="x", v=self._speed[dim], step=0.5, step_fast=5, format="%.1f"
+            )
+            if imgui.is_item_hovered(0):
+                imgui.set_tooltip("playback speed multiplier")
+            if speed_changed:
+                self._speed[dim] = min(max(value, 0.1), 100.0)
+                self._reset_clock(dim, now)
+
+            imgui.same_line()
+            realtime_changed, self._realtime[dim] = imgui.checkbox(
+                label="skip frames", v=self._realtime[dim]
+            )
+            if imgui.is_item_hovered(0):
+                imgui.set_tooltip(
+                    "keep real-time playback by skipping frames when rendering or loading is too slow"
+                )
+            if realtime_changed:
+                self._reset_clock(dim, now)
+
+            if self._playing[dim]:
+                imgui.same_line()
+                imgui.text(
+                    f"display: {self._display_fps[dim]:.1f} fps, "
+                    f"load: {self._load_latency[dim] * 1000:.1f} ms, "
+                    f"skipped: {self._n_skipped[dim]}"
+                )
 
             val = self._image_widget.current_index[dim]
             vmax = self._image_widget._dims_max_bounds[dim] - 1
@@ -174,4 +283,9 @@ class ImageWidgetSliders(EdgeWindow):
             # if any slider dim changed set the new index of the image widget
             self._image_widget.current_index = new_index
 
+            for dim in self._image_widget.slider_dims:
+                if self._playing[dim]:
+                    # user moved the slider during playback, continue the clock from the new index
+                    self._reset_clock(dim, now)
+
         self.size = int(imgui.get_window_height())
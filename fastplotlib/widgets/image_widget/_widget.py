@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from typing import Callable
 from warnings import warn
@@ -7,11 +8,14 @@ import numpy as np
 from rendercanvas import BaseRenderCanvas
 
 from ...layouts import ImguiFigure as Figure
-from ...graphics import ImageGraphic
+from ...graphics import ImageGraphic, LineGraphic
+from ...graphics.selectors import RectangleSelector
 from ...utils import calculate_figure_shape, quick_min_max
 from ...tools import HistogramLUTTool
 from ._sliders import ImageWidgetSliders
-
+from ._chunked import ChunkCache, ChunkedArray
+from ._projections import TemporalProjection
+from ._roi_trace import ROITrace
 
 # Number of dimensions that represent one image/one frame
 # For grayscale shape will be [n_rows, n_cols], i.e. 2 dims
@@ -45,6 +49,13 @@ def _is_arraylike(obj) -> bool:
     return True
 
 
+def _is_chunked(obj) -> bool:
+    """
+    Checks if the array-like has a chunk layout, such as zarr arrays, dask arrays and chunked h5py datasets
+    """
+    return getattr(obj, "chunks", None) is not None
+
+
 class _WindowFunctions:
     """Stores window function and window size"""
 
@@ -65,6 +76,8 @@ class _WindowFunctions:
     def func(self, func: callable):
         self._func = func
 
+        self._image_widget._clear_frame_histograms()
+
         # force update
         self._image_widget.current_index = self._image_widget.current_index
 
@@ -96,6 +109,7 @@ class _WindowFunctions:
 
         self._window_size = ws
 
+        self._image_widget._clear_frame_histograms()
         self._image_widget.current_index = self._image_widget.current_index
 
     def __repr__(self):
@@ -115,8 +129,8 @@ class ImageWidget:
         """List of ``ImageWidget`` managed graphics."""
         iw_managed = list()
         for subplot in self.figure:
-            # empty subplots will not have any image widget data
-            if len(subplot.graphics) > 0:
+            # empty subplots, or subplots only used for projections, will not have any image widget data
+            if "image_widget_managed" in subplot:
                 iw_managed.append(subplot["image_widget_managed"])
         return iw_managed
 
@@ -152,9 +166,20 @@ class ImageWidget:
 
     @property
     def data(self) -> list[np.ndarray]:
-        """data currently displayed in the widget"""
+        """
+        data currently displayed in the widget, chunked array-likes are wrapped in a ``ChunkedArray``
+        that reads from the widget's ``chunk_cache``
+        """
         return self._data
 
+    @property
+    def chunk_cache(self) -> ChunkCache:
+        """
+        Decoded chunk cache shared by all the chunked data arrays in the widget. Frame loading, window functions,
+        prefetching and histogram calculations all read through this cache.
+        """
+        return self._chunk_cache
+
     @property
     def ndim(self) -> int:
         """Number of dimensions of grayscale data displayed in the widget (it will be 1 more for RGB(A) data)"""
@@ -214,11 +239,22 @@ class ImageWidget:
 
         self._current_index.update(index)
 
-        for i, (ig, data) in enumerate(zip(self.managed_graphics, self.data)):
+        for i, (ig, data, subplot) in enumerate(
+            zip(self.managed_graphics, self.data, self.figure)
+        ):
             frame = self._process_indices(data, self._current_index)
             frame = self._process_frame_apply(frame, i)
             ig.data = frame
 
+            if self._histogram_widget:
+                hlut = subplot.docks["right"]["histogram_lut"]
+                if hlut.histogram_mode != "data":
+                    # update the live frame histograms, cached by the index
+                    hlut.add_frame(frame, key=tuple(self._current_index.items()))
+
+            if isinstance(data, ChunkedArray):
+                self._prefetch_next_chunk(i)
+
         # call any event handlers
         for handler in self._current_index_changed_handlers:
             handler(self.current_index)
@@ -285,6 +321,7 @@ class ImageWidget:
         rgb: bool | list[bool] = None,
         cmap: str = "plasma",
         graphic_kwargs: dict = None,
+        chunk_cache: ChunkCache = None,
     ):
         """
         This widget facilitates high-level navigation through image stacks, which are arrays containing one or more
@@ -344,9 +381,41 @@ class ImageWidget:
         graphic_kwargs: Any
             passed to each ImageGraphic in the ImageWidget figure subplots
 
+        chunk_cache: ChunkCache, optional
+            | cache of decoded chunks used for data arrays that have a chunk layout, i.e. a ``chunks`` attribute
+            | such as zarr arrays, dask arrays and chunked h5py datasets. These arrays are wrapped in a
+            | ``ChunkedArray`` so that all reads are aligned to the chunk boundaries. A new cache is created
+            | if not provided, pass a cache to share it between several widgets.
+
         """
         self._initialized = False
 
+        if chunk_cache is None:
+            chunk_cache = ChunkCache()
+
+        self._chunk_cache = chunk_cache
+
+        # used to decode upcoming chunks in the background
+        self._prefetch_executor: ThreadPoolExecutor | None = None
+        # last prefetched chunk position for each data array
+        self._prefetched: dict[int, tuple] = dict()
+
+        # [(projection, graphic, data_index)], see add_projection()
+        self._projections: list[tuple[TemporalProjection, ImageGraphic, int]] = list()
+        # (n_frames, index) that is currently displayed for each projection graphic
+        self._projections_displayed: dict[ImageGraphic, tuple] = dict()
+        # the animation that updates the projections is added with the first projection and kept after they are removed
+        self._projections_animated: bool = False
+
+        # [(trace, selector, graphic, data_index)], see roi_trace()
+        self._roi_traces: list[tuple[ROITrace, RectangleSelector, LineGraphic, int]] = (
+            list()
+        )
+        # (roi, n_frames) that is currently displayed for each trace graphic
+        self._roi_traces_displayed: dict[LineGraphic, tuple] = dict()
+        # the animation that updates the traces is added with the first trace and kept after traces are removed
+        self._roi_traces_animated: bool = False
+
         if figure_kwargs is None:
             figure_kwargs = dict()
 
@@ -374,7 +443,7 @@ class ImageWidget:
                         f" Resetting figure shape to: {figure_shape}"
                     )
 
-                self._data: list[np.ndarray] = data
+                self._data: list[np.ndarray] = [self._wrap_chunked(d) for d in data]
 
                 # Establish number of image dimensions and number of scrollable dimensions for each array
                 if rgb is None:
@@ -588,6 +657,7 @@ class ImageWidget:
             frame_apply = dict()
 
         self._frame_apply = frame_apply
+        self._clear_frame_histograms()
         # force update image graphic
         self.current_index = self.current_index
 
@@ -648,6 +718,8 @@ class ImageWidget:
             for k in list(callable_dict.keys()):
                 self._window_funcs[k] = _WindowFunctions(self, *callable_dict[k])
 
+            self._clear_frame_histograms()
+
         else:
             raise TypeError(
                 f"`window_funcs` must be either Nonetype or dict."
@@ -767,6 +839,48 @@ class ImageWidget:
             )
             return indices_dim
 
+    def _wrap_chunked(self, array):
+        """wrap array-likes that have a chunk layout so that reads are chunk aligned and cached"""
+        if not _is_chunked(array):
+            return array
+
+        if isinstance(array, ChunkedArray) and array.cache is self.chunk_cache:
+            return array
+
+        return ChunkedArray(array, cache=self.chunk_cache)
+
+    def _prefetch_next_chunk(self, data_ix: int):
+        """decode the chunk after the current one along the first scrollable dimension in a background thread"""
+        n_scrollable = self.n_scrollable_dims[data_ix]
+        if n_scrollable == 0:
+            return
+
+        array: ChunkedArray = self.data[data_ix]
+        scrollable_format = SCROLLABLE_DIMS_ORDER[n_scrollable]
+
+        index = [self.current_index[dim] for dim in scrollable_format]
+
+        bounds = array.chunk_bounds[0]
+        next_chunk = int(np.searchsorted(bounds, index[0], side="right"))
+        if next_chunk >= bounds.size - 1:
+            # already in the last chunk
+            return
+
+        index[0] = int(bounds[next_chunk])
+        index = tuple(index)
+
+        if self._prefetched.get(data_ix) == index:
+            return
+
+        self._prefetched[data_ix] = index
+
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="fpl-image-widget-prefetch"
+            )
+
+        self._prefetch_executor.submit(array.prefetch, index)
+
     def _process_frame_apply(self, array, data_ix) -> np.ndarray:
         if callable(self._frame_apply):
             return self._frame_apply(array)
@@ -826,6 +940,337 @@ class ImageWidget:
         """Clear all registered event handlers"""
         self._current_index_changed_handlers.clear()
 
+    @property
+    def projections(self) -> list[TemporalProjection]:
+        """temporal projections that were added using ``add_projection()``"""
+        return [p for p, _, _ in self._projections]
+
+    def add_projection(
+        self,
+        kind: str = "mean",
+        data_index: int = 0,
+        subplot=None,
+        cache_dir=None,
+        cache_key=None,
+    ) -> TemporalProjection:
+        """
+        Compute a projection of a data array along the "t" dimension in a background thread. The partial result
+        is displayed in a subplot and refines as more frames are processed. Chunked arrays are read through the
+        widget's ``chunk_cache``.
+
+        Parameters
+        ----------
+        kind: str, default "mean"
+            one of "mean", "max", "min" or "std"
+
+        data_index: int, default 0
+            index of the data array in ``data``
+
+        subplot: Subplot, optional
+            subplot to display the projection in, uses the first empty subplot by default. Create a widget with
+            a ``figure_shape`` that has more subplots than data arrays to get empty subplots. Passing the subplot
+            of the data array overlays the projection on the frames.
+
+        cache_dir: str | Path, optional
+            directory used to cache completed projections on disk, nothing is written to disk by default. See
+            ``TemporalProjection``.
+
+        cache_key: str, optional
+            identifies the data in the disk cache, required with ``cache_dir`` if the data is not backed by a file
+
+        Returns
+        -------
+        TemporalProjection
+            the projection, it is cancelled when the widget is closed, when it is removed using
+            ``remove_projection()`` or when its data array is replaced using ``set_data()``
+
+        """
+        if self.n_scrollable_dims[data_index] == 0:
+            raise ValueError(
+                "projections can only be computed for data arrays that have a 't' dimension"
+            )
+
+        if subplot is None:
+            empty = [sp for sp in self.figure if len(sp.graphics) == 0]
+            if len(empty) == 0:
+                raise ValueError(
+                    "There are no empty subplots to display the projection, create the ImageWidget with a "
+                    "`figure_shape` that has more subplots than data arrays, or pass a `subplot`"
+                )
+            subplot = empty[0]
+
+        projection = TemporalProjection(
+            self.data[data_index], kind=kind, cache_dir=cache_dir, cache_key=cache_key
+        )
+
+        # frame shape, i.e. [rows, cols] or [rows, cols, rgb(a)]
+        frame_shape = self.data[data_index].shape[self.n_scrollable_dims[data_index] :]
+
+        graphic_kwargs = dict()
+        if not self._rgb[data_index]:
+            graphic_kwargs["cmap"] = self.managed_graphics[data_index].cmap
+
+        flip = not any(isinstance(g, ImageGraphic) for g in subplot.graphics)
+
+        # not named, names must be unique within a subplot and a data array can have several projections
+        graphic = ImageGraphic(
+            np.zeros(frame_shape, dtype=np.float32),
+            offset=(0, 0, 1),
+            **graphic_kwargs,
+        )
+        subplot.add_graphic(graphic)
+
+        if flip and self.figure._output is not None:
+            # the figure is already shown, so the y-axis for images was not flipped in show()
+            subplot.camera.local.scale_y *= -1
+
+        if not self._projections_animated:
+            self.figure.add_animations(self._update_projections)
+            self._projections_animated = True
+
+        self._projections.append((projection, graphic, data_index))
+        projection.start()
+
+        return projection
+
+    def remove_projection(self, projection: TemporalProjection):
+        """
+        Remove a projection that was added using ``add_projection()``, cancels its computation and deletes its
+        image.
+
+        Parameters
+        ----------
+        projection: TemporalProjection
+            the projection to remove
+
+        """
+        for j, (p, graphic, data_ix) in enumerate(self._projections):
+            if p is projection:
+                break
+        else:
+            raise KeyError(f"projection not found in the ImageWidget: {projection}")
+
+        projection.cancel()
+        self._projections.pop(j)
+        self._projections_displayed.pop(graphic, None)
+
+        if graphic._plot_area is not None and graphic in graphic._plot_area:
+            graphic._plot_area.delete_graphic(graphic)
+
+    def _update_projections(self):
+        """display the latest partial results of the projections, called before every render"""
+        for projection, graphic, data_ix in self._projections:
+            # for "tz" data the projection has a z dimension, display the current z plane
+            if self.n_scrollable_dims[data_ix] == 2:
+                index = (self.current_index["z"],)
+            else:
+                index = ()
+
+            displayed = (projection.n_frames, index)
+            if self._projections_displayed.get(graphic) == displayed:
+                continue
+
+            result = projection.result
+            if result is None:
+                continue
+
+            frame = result[index]
+            graphic.data = frame
+            graphic.vmin, graphic.vmax = quick_min_max(frame)
+
+            self._projections_displayed[graphic] = displayed
+
+    @property
+    def roi_traces(self) -> list[ROITrace]:
+        """ROI traces that were added using ``roi_trace()``"""
+        return [t for t, _, _, _ in self._roi_traces]
+
+    def roi_trace(
+        self,
+        selector: RectangleSelector,
+        reduction: str = "mean",
+        data_index: int = None,
+        subplot=None,
+    ) -> ROITrace:
+        """
+        Trace of a region of interest over the "t" dimension, the region of each frame that is under a
+        ``RectangleSelector`` is reduced to a single value, for example its mean. The trace is computed in a
+        background thread and displayed as a line while it is computed, starting with the frames around the
+        current index. Moving the selector restarts the computation for the new region, the traces of previous
+        regions are cached. Chunked arrays are read through the widget's ``chunk_cache``.
+
+        Parameters
+        ----------
+        selector: RectangleSelector
+            selector of the region, usually added to an image of the widget with ``add_rectangle_selector()``
+
+        reduction: str, default "mean"
+            one of "mean", "sum", "max", "min" or "std"
+
+        data_index: int, optional
+            index of the data array in ``data``, uses the data array of the image the selector was added to by
+            default
+
+        subplot: Subplot, optional
+            subplot to display the trace in, uses the bottom dock of the subplot of the data array by default
+
+        Returns
+        -------
+        ROITrace
+            the trace, it is cancelled when the widget is closed or when it is removed with ``remove_roi_trace()``
+
+        """
+        if not isinstance(selector, RectangleSelector):
+            raise TypeError(
+                f"ROI traces can only be computed for a RectangleSelector, you passed a: {type(selector)}"
+            )
+
+        if data_index is None:
+            if selector.parent not in self.managed_graphics:
+                raise ValueError(
+                    "The selector was not added to an image of this widget, pass the `data_index`"
+                )
+            data_index = self.managed_graphics.index(selector.parent)
+
+        if self.n_scrollable_dims[data_index] == 0:
+            raise ValueError(
+                "ROI traces can only be computed for data arrays that have a 't' dimension"
+            )
+
+        if subplot is None:
+            subplot = self.managed_graphics[data_index]._plot_area.docks["bottom"]
+            if subplot.size == 0:
+                subplot.size = 120
+
+        trace = ROITrace(self.data[data_index], reduction=reduction)
+        trace.focus = self.current_index["t"]
+        trace.roi = self._get_roi(selector, data_index)
+
+        graphic = self._make_roi_trace_graphic(trace, selector)
+        subplot.add_graphic(graphic)
+
+        if not self._roi_traces_animated:
+            self.figure.add_animations(self._update_roi_traces)
+            self._roi_traces_animated = True
+
+        self._roi_traces.append((trace, selector, graphic, data_index))
+
+        return trace
+
+    def remove_roi_trace(self, trace: ROITrace):
+        """
+        Remove a trace that was added using ``roi_trace()``, cancels its computation and deletes its line. Traces
+        are also removed when their selector is removed or deleted.
+
+        Parameters
+        ----------
+        trace: ROITrace
+            the trace to remove
+
+        """
+        for j, (t, selector, graphic, data_ix) in enumerate(self._roi_traces):
+            if t is trace:
+                break
+        else:
+            raise KeyError(f"ROI trace not found in the ImageWidget: {trace}")
+
+        trace.cancel()
+        self._roi_traces.pop(j)
+        self._roi_traces_displayed.pop(graphic, None)
+
+        if graphic._plot_area is not None and graphic in graphic._plot_area:
+            graphic._plot_area.delete_graphic(graphic)
+
+    def _make_roi_trace_graphic(
+        self, trace: ROITrace, selector: RectangleSelector
+    ) -> LineGraphic:
+        """line of the trace values over the frames, NaN until they are computed"""
+        n_frames = trace.data.shape[0]
+
+        # not named, names must be unique within a subplot and a data array can have several traces
+        return LineGraphic(
+            np.column_stack([np.arange(n_frames), np.full(n_frames, np.nan)]),
+            colors=selector.edge_color.rgba,
+        )
+
+    def _get_roi(self, selector: RectangleSelector, data_ix: int) -> tuple:
+        """region of the frames of a data array under a selector"""
+        row_ixs, col_ixs = selector.get_selected_indices(self.managed_graphics[data_ix])
+
+        roi = tuple(
+            slice(ixs[0], ixs[-1] + 1) if ixs.size > 0 else slice(0, 0)
+            for ixs in (row_ixs, col_ixs)
+        )
+
+        # for "tz" data the trace is computed in the current z plane
+        if self.n_scrollable_dims[data_ix] == 2:
+            roi = (self.current_index["z"], *roi)
+
+        return roi
+
+    def _update_roi_traces(self):
+        """restart the traces of selectors that moved and display their latest partial results"""
+        for trace, selector, graphic, data_ix in list(self._roi_traces):
+            if selector.deleted or (
+                selector._plot_area is not None and selector.world_object.parent is None
+            ):
+                # the selector was deleted or removed from the scene
+                self.remove_roi_trace(trace)
+                continue
+
+            # moving a selector during several renders only restarts the trace once per render
+            trace.focus = self.current_index["t"]
+            trace.roi = self._get_roi(selector, data_ix)
+
+            displayed = (trace.roi, trace.n_frames)
+            previous = self._roi_traces_displayed.get(graphic)
+            if previous == displayed:
+                continue
+
+            graphic.data[:, 1] = trace.result
+
+            self._roi_traces_displayed[graphic] = displayed
+
+            # fit the view to the first partial result of a region and to the complete trace
+            if (previous is None or previous[0] != displayed[0]) or trace.done:
+                if graphic._plot_area is not None and trace.n_frames > 0:
+                    graphic._plot_area.auto_scale(maintain_aspect=False)
+
+    @property
+    def histogram_mode(self) -> str | None:
+        """
+        Get or set the histogram displayed by the histogram LUT tools, ``None`` if there are no histogram tools
+
+        | "data": histogram of the full data array
+        | "frame": live histogram of the currently displayed frame
+        | "running": histogram accumulated over all the frames that have been displayed
+        """
+        if not self._histogram_widget:
+            return None
+
+        subplot = next(iter(self.figure))
+        return subplot.docks["right"]["histogram_lut"].histogram_mode
+
+    @histogram_mode.setter
+    def histogram_mode(self, mode: str):
+        if not self._histogram_widget:
+            raise AttributeError("ImageWidget was created without histogram LUT tools")
+
+        for subplot, _ in zip(self.figure, self.data):
+            subplot.docks["right"]["histogram_lut"].histogram_mode = mode
+
+        # add the current frames
+        self.current_index = self.current_index
+
+    def _clear_frame_histograms(self):
+        """frame histograms are no longer valid, called when window funcs or frame apply funcs change"""
+        if not self._initialized or not self._histogram_widget:
+            return
+
+        for subplot in self.figure:
+            if "histogram_lut" in subplot.docks["right"]:
+                subplot.docks["right"]["histogram_lut"].clear_frame_histograms()
+
     def reset_vmin_vmax(self):
         """
         Reset the vmin and vmax w.r.t. the full data
@@ -874,6 +1319,9 @@ class ImageWidget:
         reset_indices: bool, default ``True``
             reset the current index for all dimensions to 0
 
+        Projections of the data arrays that are replaced are removed, use ``add_projection()`` to compute them
+        for the new data.
+
         """
 
         if reset_indices:
@@ -916,7 +1364,30 @@ class ImageWidget:
         ):
             # check last two dims (x and y) to see if data shape is changing
             old_data_shape = self._data[i].shape[-self.n_img_dims[i] :]
+            new_array = self._wrap_chunked(new_array)
             self._data[i] = new_array
+            self._prefetched.pop(i, None)
+
+            # the projections are of the previous data and cached by its fingerprint or cache key
+            for projection, _, data_ix in list(self._projections):
+                if data_ix == i:
+                    self.remove_projection(projection)
+
+            for j, (trace, selector, graphic, data_ix) in enumerate(self._roi_traces):
+                if data_ix != i:
+                    continue
+
+                trace.data = new_array
+
+                if graphic.data.value.shape[0] != new_array.shape[0]:
+                    # the number of frames changed, replace the line
+                    plot_area = graphic._plot_area
+                    plot_area.delete_graphic(graphic)
+                    self._roi_traces_displayed.pop(graphic, None)
+
+                    graphic = self._make_roi_trace_graphic(trace, selector)
+                    plot_area.add_graphic(graphic)
+                    self._roi_traces[j] = (trace, selector, graphic, i)
 
             if old_data_shape != new_array.shape[-self.n_img_dims[i] :]:
                 frame = self._process_indices(
@@ -982,4 +1453,14 @@ class ImageWidget:
 
     def close(self):
         """Close Widget"""
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_executor = None
+
+        for projection in self.projections:
+            projection.cancel()
+
+        for trace in self.roi_traces:
+            trace.cancel()
+
         self.figure.close()
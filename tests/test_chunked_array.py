@@ -0,0 +1,183 @@
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+from fastplotlib.utils import subsample_array
+from fastplotlib.widgets.image_widget import ChunkCache, ChunkedArray
+
+
+class DirectoryChunkStore:
+    """minimal zarr-like array that stores every chunk as a separate .npy file in a directory"""
+
+    def __init__(self, path: Path, data: np.ndarray, chunks: tuple[int, ...]):
+        self.path = path
+        self.shape = data.shape
+        self.ndim = data.ndim
+        self.dtype = data.dtype
+        self.chunks = chunks
+
+        # number of chunk files decoded
+        self.n_reads = 0
+
+        self._grid = [range(0, s, c) for s, c in zip(self.shape, self.chunks)]
+        for starts in product(*self._grid):
+            slices = tuple(slice(st, st + c) for st, c in zip(starts, self.chunks))
+            np.save(self._chunk_path(starts), data[slices])
+
+    def _chunk_path(self, starts) -> Path:
+        return self.path.joinpath(
+            ".".join(str(s // c) for s, c in zip(starts, self.chunks)) + ".npy"
+        )
+
+    def __getitem__(self, key):
+        # only supports tuples of slices with step 1, which is all that ChunkedArray uses
+        key = tuple(k.indices(s)[:2] for k, s in zip(key, self.shape))
+
+        out = np.empty(tuple(stop - start for start, stop in key), dtype=self.dtype)
+
+        for starts in product(*self._grid):
+            ends = [st + c for st, c in zip(starts, self.chunks)]
+            if any(e <= k[0] or st >= k[1] for st, e, k in zip(starts, ends, key)):
+                continue
+
+            chunk = np.load(self._chunk_path(starts))
+            self.n_reads += 1
+
+            src, dst = list(), list()
+            for st, k, size in zip(starts, key, chunk.shape):
+                lo, hi = max(st, k[0]), min(st + size, k[1])
+                src.append(slice(lo - st, hi - st))
+                dst.append(slice(lo - k[0], hi - k[0]))
+
+            out[tuple(dst)] = chunk[tuple(src)]
+
+        return out
+
+
+@pytest.fixture
+def store(tmp_path):
+    data = np.random.default_rng(0).random((50, 30, 40)).astype(np.float32)
+    return DirectoryChunkStore(tmp_path, data, chunks=(8, 16, 16)), data
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        0,
+        -1,
+        (3, slice(None), slice(None)),
+        (slice(5, 20), 4),
+        (slice(None, None, 7), slice(2, 29, 3), slice(None, None, -1)),
+        (range(10, 17), slice(None), slice(None)),
+        (Ellipsis, 7),
+        (12, Ellipsis),
+    ],
+)
+def test_getitem(store, key):
+    store, data = store
+    a = ChunkedArray(store)
+
+    npt.assert_almost_equal(a[key], data[key])
+
+
+def test_chunks(store):
+    store, data = store
+    a = ChunkedArray(store)
+
+    assert a.shape == data.shape
+    assert a.ndim == 3
+    assert a.chunks == ((8,) * 6 + (2,), (16, 14), (16, 16, 8))
+    npt.assert_equal(a.chunk_bounds[0], [0, 8, 16, 24, 32, 40, 48, 50])
+
+    # dask-style explicit chunks
+    a = ChunkedArray(data, chunks=((25, 25), (30,), (40,)))
+    npt.assert_almost_equal(a[30], data[30])
+    assert len(a.cache) == 1
+
+
+def test_chunk_aligned_cache(store):
+    store, data = store
+    cache = ChunkCache()
+    a = ChunkedArray(store, cache=cache)
+
+    # the first frame decodes the 6 chunks that make up frames 0 - 7
+    npt.assert_almost_equal(a[0], data[0])
+    assert store.n_reads == 6
+    assert cache.misses == 6
+
+    # all frames in the same chunk come from the cache
+    for i in range(1, 8):
+        npt.assert_almost_equal(a[i], data[i])
+
+    assert store.n_reads == 6
+    assert cache.hits == 7 * 6
+
+    # window function style read that spans 2 chunks along t
+    npt.assert_almost_equal(a[range(5, 11)].mean(axis=0), data[5:11].mean(axis=0))
+    assert store.n_reads == 12
+
+    # prefetch decodes without returning anything
+    a.prefetch((20, slice(None), slice(None)))
+    assert store.n_reads == 18
+    npt.assert_almost_equal(a[21], data[21])
+    assert store.n_reads == 18
+
+
+def test_lru_eviction(store):
+    store, data = store
+
+    chunk_bytes = 8 * 16 * 16 * 4
+    cache = ChunkCache(max_bytes=6 * chunk_bytes)
+    a = ChunkedArray(store, cache=cache)
+
+    a[0]
+    a[8]
+
+    assert cache.nbytes <= cache.max_bytes
+    assert len(cache) < 12
+
+    # frame 0 chunks were partially evicted
+    n_reads = store.n_reads
+    a[0]
+    assert store.n_reads > n_reads
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_shared_cache(store):
+    store, data = store
+    cache = ChunkCache()
+
+    a = ChunkedArray(store, cache=cache)
+    b = ChunkedArray(data, cache=cache, chunks=(10, 30, 40))
+
+    a[0]
+    b[0]
+
+    # chunks from different arrays do not collide
+    npt.assert_almost_equal(a[0], data[0])
+    npt.assert_almost_equal(b[0], data[0])
+    assert len(cache) == 7
+
+
+def test_subsample(store):
+    store, data = store
+    a = ChunkedArray(store)
+
+    ss = subsample_array(a, max_size=5_000)
+
+    assert ss.ndim == 1
+    assert ss.size <= 5_000
+    assert np.isin(ss, data).all()
+
+    # only whole chunks are read, far fewer than a strided subsample would touch
+    assert store.n_reads <= 3
+
+    # small arrays are not subsampled
+    ss = subsample_array(ChunkedArray(data[:2], chunks=(1, 30, 40)), max_size=5_000)
+    assert ss.size == data[:2].size
@@ -0,0 +1,133 @@
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import fastplotlib as fpl
+
+N_ROWS = 2000
+
+
+@pytest.fixture
+def table():
+    rng = np.random.default_rng(0)
+    table = {name: rng.normal(size=N_ROWS).astype(np.float32) for name in "abcd"}
+    table["d"][::7] = np.nan
+    table["i"] = rng.integers(0, 50, N_ROWS)
+    return table
+
+
+def masks_of(table, ranges):
+    return {
+        name: (
+            np.ones(N_ROWS, dtype=bool)
+            if r is None
+            else (table[name] >= min(r)) & (table[name] <= max(r))
+        )
+        for name, r in ranges.items()
+    }
+
+
+def test_crossfilter(table):
+    fig = fpl.Figure(shape=(1, 3))
+    crossfilter = fpl.Crossfilter(table)
+
+    scatter = fig[0, 0].add_scatter(
+        np.column_stack([table["a"], table["b"]]), alpha=0.8
+    )
+    crossfilter.add_view(scatter, filtered_alpha=0.05)
+    histograms = {
+        "c": crossfilter.add_histogram("c", fig[0, 1], bins=20),
+        "d": crossfilter.add_histogram("d", fig[0, 2], bins=20),
+    }
+
+    rng = np.random.default_rng(1)
+    ranges = dict()
+    for i in range(100):
+        name = "abcdi"[rng.integers(5)]
+        if rng.random() < 0.1:
+            value_range = None
+        elif name == "i":
+            value_range = tuple(rng.uniform(0, 50, 2))
+        else:
+            value_range = tuple(rng.normal(size=2))
+
+        crossfilter.filter_range(name, value_range)
+        ranges[name] = value_range
+
+        masks = masks_of(table, ranges)
+        selected = np.logical_and.reduce(list(masks.values()))
+
+        npt.assert_equal(crossfilter.selected, selected)
+        npt.assert_allclose(scatter.colors.value[:, 3], np.where(selected, 0.8, 0.05))
+
+        # histograms count the rows that pass the filters of the other dimensions
+        for name, graphic in histograms.items():
+            other = np.ones(N_ROWS, dtype=bool)
+            for other_name, mask in masks.items():
+                if other_name != name:
+                    other &= mask
+
+            values = table[name]
+            expected, _ = np.histogram(
+                values[other & np.isfinite(values)],
+                bins=20,
+                range=(np.nanmin(values), np.nanmax(values)),
+            )
+            npt.assert_equal(graphic.data.value[::2, 1], expected)
+
+    assert crossfilter.n_selected == selected.sum()
+    npt.assert_equal(crossfilter.get_selected_indices(), np.flatnonzero(selected))
+
+
+def test_selectors(table):
+    fig = fpl.Figure()
+    crossfilter = fpl.Crossfilter(table)
+
+    scatter = fig[0, 0].add_scatter(np.column_stack([table["a"], table["b"]]))
+    crossfilter.add_view(scatter, filtered_alpha=0)
+
+    rectangle = scatter.add_rectangle_selector()
+    crossfilter.add_selector(rectangle, ("a", None))
+    rectangle.selection = (-1, 0.5, -0.5, 0.5)
+    assert crossfilter.filters == {"a": (-1, 0.5)}
+
+    histogram = crossfilter.add_histogram("c", fig[0, 0])
+    region = histogram.add_linear_region_selector()
+    crossfilter.add_selector(region, "c")
+    region.selection = (0, 1)
+
+    expected = masks_of(table, {"a": (-1, 0.5), "c": tuple(region.selection)})
+    npt.assert_equal(crossfilter.selected, expected["a"] & expected["c"])
+    npt.assert_equal(scatter.colors.value[:, 3], crossfilter.selected.astype(float))
+
+    crossfilter.remove_selector(region)
+    assert crossfilter.filters == {"a": (-1, 0.5)}
+    npt.assert_equal(crossfilter.selected, expected["a"])
+
+    # selection events of removed selectors are ignored
+    region.selection = (1, 2)
+    npt.assert_equal(crossfilter.selected, expected["a"])
+
+    with pytest.raises(TypeError):
+        crossfilter.add_selector(region, ("a", "b"))
+
+    with pytest.raises(TypeError):
+        crossfilter.add_selector(rectangle, "a")
+
+
+def test_invalid(table):
+    fig = fpl.Figure()
+    crossfilter = fpl.Crossfilter(table)
+
+    with pytest.raises(ValueError):
+        fpl.Crossfilter({"a": table["a"], "short": table["b"][:10]}).filter_range(
+            "short", (0, 1)
+        )
+
+    uniform = fig[0, 0].add_scatter(np.random.rand(N_ROWS, 2), uniform_color=True)
+    with pytest.raises(TypeError):
+        crossfilter.add_view(uniform)
+
+    smaller = fig[0, 0].add_scatter(np.random.rand(10, 2))
+    with pytest.raises(ValueError):
+        crossfilter.add_view(smaller)
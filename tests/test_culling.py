@@ -0,0 +1,64 @@
+import numpy as np
+from numpy import testing as npt
+
+import fastplotlib as fpl
+
+
+def test_culling():
+    xs = np.linspace(0, 10, 100)
+    data = np.column_stack([xs, np.sin(xs)])
+
+    fig = fpl.Figure()
+    subplot = fig[0, 0]
+
+    # opt-in
+    assert not subplot.culling
+    subplot.culling = True
+
+    stack = subplot.add_line_stack(np.stack([data] * 50), separation=1)
+    scatter = subplot.add_scatter(data, sizes=5)
+
+    fig.show()
+
+    subplot._render()
+    # everything is visible
+    assert subplot.cull_stats == {"tested": 51, "culled": 0}
+
+    # zoom into the first few lines
+    subplot.camera.width = 12
+    subplot.camera.height = 6
+    subplot.camera.local.position = (5, 3, subplot.camera.local.z)
+    subplot._render()
+
+    stats = subplot.cull_stats
+    assert stats["tested"] == 51
+    assert stats["culled"] > 40
+
+    # culling only applies to the render
+    assert all(line.world_object.visible for line in stack)
+    assert scatter.world_object.visible
+
+    # rendered image is the same without culling
+    fig.canvas.draw()
+    image_culled = np.asarray(fig.canvas.draw()).copy()
+    subplot.culling = False
+    image = np.asarray(fig.canvas.draw())
+    assert subplot.cull_stats == {"tested": 0, "culled": 0}
+    npt.assert_equal(image_culled, image)
+
+    # bounds are updated when the data or offset changes
+    subplot.culling = True
+    line = stack[-1]
+    bounds = line._fpl_world_bounds().copy()
+    line.data[:, 1] = 100
+    assert line._fpl_world_bounds()[1, 1] > bounds[1, 1]
+
+    line.offset = (0, 0, 0)
+    subplot._render()
+    assert not np.isclose(line._fpl_world_bounds(), bounds).all()
+
+    # hidden graphics and packed collections are not tested
+    scatter.visible = False
+    packed = subplot.add_line_collection(np.stack([data] * 10), packed=True)
+    subplot._render()
+    assert subplot.cull_stats["tested"] == 50
@@ -1,4 +1,5 @@
 import numpy as np
+from numpy import testing as npt
 import pytest
 
 import fastplotlib as fpl
@@ -170,3 +171,157 @@ def test_set_controllers_from_existing_controllers():
     assert fig[0, 0].camera is cameras[0][0]
 
     assert fig[0, 1].camera.fov == 50
+
+
+def test_scene_bounds():
+    rng = np.random.default_rng(0)
+
+    fig = fpl.Figure()
+    subplot = fig[0, 0]
+
+    line = subplot.add_line(rng.standard_normal((100, 2)))
+    stack = subplot.add_line_stack(rng.standard_normal((10, 50)), packed=True)
+    collection = subplot.add_line_collection(
+        [rng.standard_normal((20, 2)) for i in range(5)]
+    )
+    scatter = subplot.add_scatter(rng.standard_normal((30, 3)))
+
+    fig.show()
+    fig.canvas.draw()
+
+    npt.assert_almost_equal(
+        subplot._fpl_scene_bounds(),
+        subplot._fpl_graphics_scene.get_world_bounding_box(),
+    )
+
+    # cached
+    assert subplot._fpl_scene_bounds() is subplot._fpl_scene_bounds()
+
+    # updated by offsets and data
+    bounds = subplot._fpl_scene_bounds()
+    line.offset = (100, 0, 0)
+    assert subplot._fpl_scene_bounds()[1, 0] > 100
+
+    stack.offsets = stack.offsets + np.array([0, -200, 0])
+    assert subplot._fpl_scene_bounds()[0, 1] < -150
+
+    collection[2].data[5] = (0, 300, 0)
+    scatter.data[0, 2] = -50
+
+    bbox = subplot._fpl_scene_bounds()
+    assert bbox[1, 1] == 300
+    assert bbox[0, 2] == -50 + scatter.offset[2]
+
+    fig.canvas.draw()
+    npt.assert_almost_equal(bbox, subplot._fpl_graphics_scene.get_world_bounding_box())
+
+    subplot.auto_scale(maintain_aspect=False, zoom=1)
+    npt.assert_almost_equal(subplot.camera.width, np.ptp(bbox[:, 0]))
+    npt.assert_almost_equal(subplot.camera.height, np.ptp(bbox[:, 1]))
+
+
+def test_add_graphics():
+    fig = fpl.Figure()
+    subplot = fig[0, 0]
+
+    subplot.add_line(np.random.rand(10, 2), name="existing")
+    lines = [fpl.LineGraphic(np.random.rand(10, 2), name=f"line-{i}") for i in range(5)]
+
+    subplot.add_graphics(lines)
+
+    assert subplot.graphics[1:] == tuple(lines)
+    assert all(line.world_object.parent is not None for line in lines)
+    # stacked along z like add_graphic
+    npt.assert_equal([line.offset[2] for line in lines], [2, 3, 4, 5, 6])
+
+    # names are validated before any graphic is added
+    new = [fpl.LineGraphic(np.random.rand(10, 2), name=n) for n in ["a", "existing"]]
+    with pytest.raises(ValueError):
+        subplot.add_graphics(new)
+
+    with pytest.raises(ValueError):
+        subplot.add_graphics(
+            [fpl.LineGraphic(np.random.rand(10, 2), name="b") for i in range(2)]
+        )
+
+    assert len(subplot.graphics) == 6
+
+
+def test_deferred():
+    fig = fpl.Figure()
+    subplot = fig[0, 0]
+
+    state = subplot.camera.get_state()
+
+    with subplot.deferred():
+        line = subplot.add_line(np.random.rand(10, 2) * 100, center=True)
+        with subplot.deferred():
+            scatter = subplot.add_scatter(np.random.rand(10, 2), center=True)
+
+        # world objects are added and the camera is centered when the outermost block exits
+        assert line.world_object.parent is None
+        assert scatter.world_object.parent is None
+        assert subplot.graphics == (line, scatter)
+        npt.assert_equal(subplot.camera.get_state()["position"], state["position"])
+
+    assert line.world_object.parent is not None
+    assert scatter.world_object.parent is not None
+
+    center = subplot._fpl_scene_bounds().mean(axis=0)
+    npt.assert_almost_equal(subplot.camera.world.position[:2], center[:2])
+
+    # graphics removed or deleted within the block are not added to the scene
+    with subplot.deferred():
+        removed = subplot.add_line(np.random.rand(10, 2))
+        deleted = subplot.add_scatter(np.random.rand(10, 2))
+        kept = subplot.add_line(np.random.rand(10, 2))
+
+        subplot.remove_graphic(removed)
+        subplot.delete_graphic(deleted)
+
+    assert removed.world_object.parent is None
+    assert removed in subplot
+    assert deleted not in subplot
+    assert kept.world_object.parent is not None
+
+    # a removed graphic can be added back
+    subplot.add_graphic(removed)
+    assert removed.world_object.parent is not None
+
+
+def test_name_index():
+    fig = fpl.Figure()
+    subplot = fig[0, 0]
+
+    line = subplot.add_line(np.random.rand(10, 2), name="line")
+    scatter = subplot.add_scatter(np.random.rand(10, 2))
+    selector = line.add_linear_selector(name="selector")
+
+    assert subplot["line"] is line
+    assert subplot["selector"] is selector
+    assert "line" in subplot and line in subplot and scatter in subplot
+    assert subplot.objects == (line, scatter, selector)
+
+    # cached until the graphics change
+    assert subplot.graphics is subplot.graphics
+
+    # renaming updates the index
+    scatter.name = "scatter"
+    line.name = "renamed"
+    assert subplot["scatter"] is scatter
+    assert subplot["renamed"] is line
+    assert "line" not in subplot
+
+    with pytest.raises(ValueError):
+        scatter.name = "renamed"
+
+    with pytest.raises(ValueError):
+        subplot.add_line(np.random.rand(10, 2), name="scatter")
+
+    subplot.delete_graphic(scatter)
+    assert "scatter" not in subplot
+    assert scatter not in subplot
+    assert subplot.graphics == (line,)
+
+    with pytest.raises(IndexError):
+        subplot["scatter"]
@@ -0,0 +1,119 @@
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import fastplotlib as fpl
+from fastplotlib.tools._histogram_lut import _fast_histogram
+
+
+@pytest.mark.parametrize(
+    "dtype", [np.uint8, np.uint16, np.int16, np.int32, np.int64, np.float32]
+)
+@pytest.mark.parametrize("range", [None, (10, 200)])
+def test_fast_histogram(dtype, range):
+    data = np.random.default_rng(0).integers(0, 250, size=(100, 120)).astype(dtype)
+
+    hist, edges = _fast_histogram(data, 100, range=range)
+    hist_np, edges_np = np.histogram(data, bins=100, range=range)
+
+    npt.assert_equal(hist, hist_np)
+    npt.assert_allclose(edges, edges_np)
+
+
+def make_hlut(data):
+    fig = fpl.Figure()
+
+    ig = fig[0, 0].add_image(data[0])
+    hlut = fpl.HistogramLUTTool(data, ig, name="histogram_lut")
+    fig[0, 0].docks["right"].add_graphic(hlut)
+
+    return hlut
+
+
+def test_frame_histograms():
+    data = (
+        np.random.default_rng(0).integers(0, 1000, size=(10, 50, 60)).astype(np.uint16)
+    )
+    hlut = make_hlut(data)
+
+    assert hlut.histogram_mode == "data"
+
+    hlut.histogram_mode = "running"
+    line_data = hlut._histogram_line.data.value[:, 0].copy()
+
+    for i in [0, 1, 2, 1, 0]:
+        hlut.add_frame(data[i], key=i)
+
+    # frames with a key that was already added are not counted again
+    edges = hlut._edges
+    expected, _ = np.histogram(data[:3], bins=100, range=(edges[0], edges[-1]))
+    npt.assert_equal(hlut._running_histogram, expected)
+    assert len(hlut._frame_histograms) == 3
+
+    # line is only updated once per render
+    npt.assert_equal(hlut._histogram_line.data.value[:, 0], line_data)
+    hlut._update_histogram_line()
+    npt.assert_allclose(
+        hlut._histogram_line.data.value[:, 0], hlut._scale_histogram(expected)
+    )
+    assert hlut._pending_histogram is None
+
+    hlut.histogram_mode = "frame"
+    hlut.add_frame(data[1], key=1)
+    npt.assert_equal(hlut._pending_histogram, hlut._frame_histograms[1])
+
+    # new data changes the edges
+    hlut.set_data(data[5:])
+    assert len(hlut._frame_histograms) == 0
+    assert hlut._running_histogram.sum() == 0
+
+    with pytest.raises(ValueError):
+        hlut.histogram_mode = "all"
+
+
+@pytest.mark.parametrize("scale", [1e-3, 1.0, 1e9])
+def test_colorbar_fixed_size(scale):
+    data = np.random.default_rng(0).random((5, 40, 50)) * scale
+    hlut = make_hlut(data)
+
+    cbar = hlut._colorbar
+
+    # constant number of texels regardless of the data range
+    assert cbar.data.value.shape == (256, 2)
+
+    # colorbar spans the histogram edges in world space
+    edges_flanked = hlut._histogram_line.data.value[:, 1]
+    npt.assert_allclose(
+        cbar.world_object.local.scale_y * 255,
+        np.ptp(edges_flanked),
+        rtol=0.05,
+    )
+
+    # shares the cmap texture with the image
+    assert cbar._material.map is hlut.image_graphic._material.map
+
+    # updated in place with new data
+    hlut.set_data(data * 10)
+    assert hlut._colorbar is cbar
+    assert cbar.data.value.shape == (256, 2)
+
+
+def test_histogram_scale():
+    data = np.zeros((5, 40, 50), dtype=np.uint32)
+    # a few very bright pixels over a dark background
+    data[:, :2, :2] = 10**8
+    hlut = make_hlut(data)
+
+    linear = hlut._histogram_line.data.value[:, 0].copy()
+
+    hlut.histogram_scale = "log"
+    hlut._update_histogram_line()
+
+    log = hlut._histogram_line.data.value[:, 0]
+
+    assert log.max() == pytest.approx(100)
+    # the bright tail is visible with log scaling
+    assert log[linear > 0].min() > 10 * linear[linear > 0].min()
+
+    with pytest.raises(ValueError):
+        hlut.histogram_scale = "sqrt"
@@ -0,0 +1,101 @@
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import fastplotlib as fpl
+
+if not fpl.IMGUI:
+    pytest.skip("ImageWidget requires imgui-bundle", allow_module_level=True)
+
+
+@pytest.fixture
+def sliders():
+    iw = fpl.ImageWidget(np.zeros((10, 4, 4), dtype=np.float32))
+    sliders = iw._image_widget_sliders
+
+    sliders._fps["t"] = 10
+    sliders._frame_time["t"] = 1 / 10
+    sliders._playing["t"] = True
+    sliders._reset_clock("t", 0.0)
+
+    return sliders
+
+
+def index(sliders) -> int:
+    return sliders._image_widget.current_index["t"]
+
+
+def test_fixed_step(sliders):
+    # one frame per frame time, nothing is skipped
+    sliders._play("t", 0.05)
+    assert index(sliders) == 0
+
+    sliders._play("t", 0.1)
+    sliders._play("t", 0.5)
+    assert index(sliders) == 2
+    assert sliders._n_skipped["t"] == 0
+
+    # the speed multiplier shortens the frame time
+    sliders._speed["t"] = 2.0
+    sliders._play("t", 0.55)
+    assert index(sliders) == 3
+
+    # stops after the last frame without looping
+    sliders._image_widget.current_index = {"t": 9}
+    sliders._play("t", 1.0)
+    assert index(sliders) == 9
+    assert not sliders._playing["t"]
+
+
+def test_realtime(sliders):
+    sliders._realtime["t"] = True
+
+    sliders._play("t", 0.05)
+    assert index(sliders) == 0
+
+    # rendering was too slow, the frames in between are skipped
+    sliders._play("t", 0.1)
+    sliders._play("t", 0.4)
+    assert index(sliders) == 4
+    assert sliders._n_skipped["t"] == 2
+
+    # the speed multiplier is applied to the clock
+    sliders._speed["t"] = 2.0
+    sliders._reset_clock("t", 0.4)
+    sliders._play("t", 0.62)
+    assert index(sliders) == 8
+    assert sliders._n_skipped["t"] == 5
+
+    # a target past the end shows the last frame, then playback stops
+    sliders._play("t", 1.0)
+    assert index(sliders) == 9
+    assert sliders._n_skipped["t"] == 5
+    assert not sliders._playing["t"]
+
+
+def test_realtime_loop(sliders):
+    sliders._realtime["t"] = True
+    sliders._loop = True
+
+    sliders._play("t", 0.7)
+    assert index(sliders) == 7
+    assert sliders._n_skipped["t"] == 6
+
+    # past the end, the clock restarts from the first frame
+    sliders._play("t", 1.2)
+    assert index(sliders) == 0
+    assert sliders._n_skipped["t"] == 8
+    assert sliders._playing["t"]
+
+    sliders._play("t", 1.5)
+    assert index(sliders) == 3
+
+
+def test_stats(sliders):
+    sliders._loop = True
+    for i in range(1, 150):
+        sliders._play("t", i * 0.125)
+
+    # moving average of the interval between displayed frames
+    npt.assert_allclose(sliders._display_fps["t"], 8, rtol=1e-3)
+    assert sliders._load_latency["t"] > 0
@@ -0,0 +1,476 @@
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import pygfx
+
+import fastplotlib as fpl
+from fastplotlib.graphics import PackedLine
+
+
+def make_data(n_lines=5, n_points=50):
+    xs = np.linspace(0, 10, n_points)
+    return np.stack(
+        [np.column_stack([xs, np.sin(xs * (i + 1))]) for i in range(n_lines)]
+    )
+
+
+@pytest.mark.parametrize(
+    "colors_kwargs",
+    [
+        dict(colors="r"),
+        dict(colors=["r", "g", "b", "y", "w"]),
+        dict(cmap="viridis"),
+        dict(cmap=["jet", "viridis", "plasma", "gray", "hot"]),
+    ],
+)
+def test_packed_matches_unpacked(colors_kwargs):
+    data = make_data()
+
+    lc = fpl.LineCollection(data, **colors_kwargs)
+    packed = fpl.LineCollection(data, packed=True, **colors_kwargs)
+
+    assert packed.packed
+    assert isinstance(packed[0], PackedLine)
+
+    # entire collection is a single pygfx.Line
+    assert len(packed.world_object.children) == 1
+    assert isinstance(packed.world_object.children[0], pygfx.Line)
+
+    for line, packed_line in zip(lc, packed):
+        npt.assert_almost_equal(packed_line.data.value, line.data.value)
+        npt.assert_almost_equal(packed_line.colors.value, line.colors.value)
+
+    npt.assert_almost_equal(packed.data[:], lc.data[:])
+    npt.assert_almost_equal(packed.colors[:], lc.colors[:])
+
+
+def test_packed_views():
+    data = make_data()
+    packed = fpl.LineCollection(data, packed=True)
+
+    positions = packed.world_object.children[0].geometry.positions.data
+
+    # lines are separated by a row of NaNs
+    assert positions.shape[0] == 5 * 50 + 4
+    assert np.isnan(positions[50]).all()
+
+    # writes go directly to the packed buffer
+    packed[2].data[:, 1] = 7.0
+    npt.assert_almost_equal(positions[102:152, 1], 7.0)
+    npt.assert_almost_equal(positions[51:101, 1], data[1, :, 1])
+
+    packed[3].colors = "r"
+    npt.assert_almost_equal(
+        packed.world_object.children[0].geometry.colors.data[153:203],
+        [[1, 0, 0, 1]] * 50,
+    )
+
+    # collection level setters
+    packed.colors = ["r", "g", "b", "y", "w"]
+    npt.assert_almost_equal(packed[1].colors[0], [0, 1, 0, 1])
+
+    # per line events
+    events = list()
+    packed[4].add_event_handler(events.append, "data")
+    packed[4].data[:5, 1] = 0.0
+    packed[0].data[:5, 1] = 0.0
+    assert len(events) == 1
+    assert events[0].graphic is packed[4]
+
+
+def test_packed_visible():
+    packed = fpl.LineCollection(make_data(), packed=True, cmap="viridis")
+
+    alpha = packed[1].colors.value[:, -1].copy()
+
+    packed[1].visible = False
+    assert not packed[1].visible
+    assert (packed[1].colors.value[:, -1] == 0).all()
+    assert (packed[2].colors.value[:, -1] == 1).all()
+
+    packed.visibles = [True] * 5
+    npt.assert_equal(packed[1].colors.value[:, -1], alpha)
+    assert packed.world_object.children[0].visible
+
+
+@pytest.mark.parametrize("separation_axis", ["x", "y"])
+def test_packed_line_stack(separation_axis):
+    data = make_data()
+
+    stack = fpl.LineStack(data, separation_axis=separation_axis)
+    packed = fpl.LineStack(data, separation_axis=separation_axis, packed=True)
+
+    for line, packed_line in zip(stack, packed):
+        npt.assert_almost_equal(packed_line.offset, line.offset, decimal=5)
+        # the offset is applied to the packed vertex positions, the data of a line does not include it
+        npt.assert_almost_equal(packed_line.data.value, line.data.value, decimal=5)
+        start, stop = packed_line.data.view_range
+        npt.assert_almost_equal(
+            packed._packed_data.value[start:stop],
+            line.data.value + line.offset,
+            decimal=5,
+        )
+
+
+def test_packed_line_stack_writes():
+    data = make_data()
+
+    stack = fpl.LineStack(data, separation=1)
+    packed = fpl.LineStack(data, separation=1, packed=True)
+
+    def check():
+        for line, packed_line in zip(stack, packed):
+            npt.assert_almost_equal(packed_line.data.value, line.data.value, decimal=5)
+            npt.assert_almost_equal(packed_line.offset, line.offset, decimal=5)
+
+        # the lines are drawn at the same positions
+        npt.assert_almost_equal(
+            packed._fpl_bounding_box(), stack._fpl_bounding_box(), decimal=4
+        )
+
+    check()
+
+    # writes keep the separation of the stack
+    for lines in (stack, packed):
+        lines[3].data[:, 1] = np.ones(50)
+        lines[1].data = lines[1].data.value * 2
+        lines[2].offset = (0, -5, 0)
+        lines[2].data[10:20] = 0
+
+    check()
+
+
+def test_packed_line_stack_collection_writes():
+    data = make_data(n_lines=6)
+
+    stack = fpl.LineStack(data, separation=1)
+    packed = fpl.LineStack(data, separation=1, packed=True)
+
+    # lines that exist before the writes
+    packed[2]
+
+    def check():
+        npt.assert_almost_equal(packed.data[:], stack.data[:], decimal=5)
+        npt.assert_almost_equal(packed.offsets, stack.offsets, decimal=5)
+        npt.assert_almost_equal(packed[2].data.value, stack[2].data.value, decimal=5)
+        npt.assert_almost_equal(
+            packed._fpl_bounding_box(), stack._fpl_bounding_box(), decimal=4
+        )
+
+    check()
+
+    # re-baseline all lines at once, the separation of the stack is kept
+    for lines in (stack, packed):
+        lines.data[:, 1] = np.ones(50)
+    check()
+    assert packed._fpl_bounding_box()[1, 1] > 5
+
+    for lines in (stack, packed):
+        lines.data[:10, 1] = 3
+        lines[1::2].data[:, 0] = -1
+        lines[[0, 3, 4]].data[:, 1] = 2
+
+        values = lines.data[:]
+        values[..., 1] = np.arange(6)[:, None]
+        lines.data = values
+    check()
+
+
+def test_packed_invalid_args():
+    data = make_data()
+
+    with pytest.raises(ValueError):
+        fpl.LineCollection(data, thickness=[1, 2, 3, 4, 5], packed=True)
+
+    with pytest.raises(ValueError):
+        fpl.LineCollection(data, uniform_colors=True, packed=True)
+
+    packed = fpl.LineCollection(data, thickness=[3] * 5, packed=True)
+    assert packed[0].thickness == 3
+
+    with pytest.raises(TypeError):
+        packed.add_graphic(fpl.LineGraphic(data[0]))
+
+    with pytest.raises(TypeError):
+        packed[0].rotation = (0, 0, 1, 0)
+
+
+@pytest.mark.parametrize("shape", [(20, 30), (20, 30, 2), (20, 30, 3)])
+def test_packed_from_array(shape):
+    data = np.random.default_rng(0).random(shape).astype(np.float32)
+
+    lc = fpl.LineCollection(data, cmap=["viridis", "jet"] * 10)
+    packed = fpl.LineCollection(data, cmap=["viridis", "jet"] * 10, packed=True)
+
+    # lines are created lazily
+    assert all(g is None for g in packed._graphics)
+    line = packed[7]
+    assert sum(g is not None for g in packed._graphics) == 1
+    assert packed[7] is line
+    assert line.cmap.name == "jet"
+
+    npt.assert_almost_equal(line.data.value, lc[7].data.value)
+    npt.assert_almost_equal(line.colors.value, lc[7].colors.value)
+
+    # slicing only creates the selected lines
+    packed[2:5]
+    assert sum(g is not None for g in packed._graphics) == 4
+
+    npt.assert_almost_equal(packed.data[:], lc.data[:])
+    npt.assert_almost_equal(packed.colors[:], lc.colors[:])
+
+
+def test_packed_line_stack_lazy():
+    data = make_data(n_lines=50)
+
+    stack = fpl.LineStack(data, colors=["r", "g"] * 25)
+    packed = fpl.LineStack(data, colors=["r", "g"] * 25, packed=True)
+
+    # the separation is applied without creating the lines
+    assert all(g is None for g in packed._graphics)
+
+    npt.assert_almost_equal(packed[-1].offset, stack[-1].offset, decimal=4)
+    npt.assert_almost_equal(packed[-1].data.value, stack[-1].data.value, decimal=4)
+    npt.assert_almost_equal(packed.offsets, stack.offsets, decimal=4)
+    npt.assert_almost_equal(packed.colors[:], stack.colors[:])
+
+
+def test_packed_collection_feature_views():
+    data = make_data(n_lines=10)
+
+    lc = fpl.LineCollection(data)
+    packed = fpl.LineCollection(data, packed=True)
+
+    positions = packed.world_object.children[0].geometry.positions
+
+    # views of the packed buffer, without creating the lines
+    ys = packed.data[:, 1]
+    assert ys.shape == (10, 50)
+    assert np.shares_memory(ys, positions.data)
+    assert all(g is None for g in packed._graphics)
+    npt.assert_almost_equal(ys, lc.data[:, 1])
+
+    # one vectorized write for all lines
+    baseline = np.arange(10 * 50).reshape(10, 50)
+    packed.data[:, 1] = baseline
+    lc.data[:, 1] = 5.0
+    npt.assert_almost_equal(positions.data[51:101, 1], baseline[1])
+    assert np.isnan(positions.data[50]).all()
+
+    packed.colors[:, -1] = 0.5
+    assert (packed[3].colors.value[:, -1] == 0.5).all()
+
+    packed.colors = ["r", "g"] * 5
+    npt.assert_almost_equal(packed.colors[0], [[1, 0, 0, 1], [0, 1, 0, 1]] * 5)
+
+    # indexers of evenly spaced lines are views too
+    odd = packed[1::2]
+    assert np.shares_memory(odd.data[:], positions.data)
+    odd.data[:, 1] = -1.0
+    assert (packed.data.value[1::2, :, 1] == -1).all()
+    assert (packed.data.value[::2, :, 1] != -1).all()
+
+    # fancy indexed selection
+    selection = packed[[0, 3, 4]]
+    selection.colors = "b"
+    expected = np.tile([[1, 0, 0, 1], [0, 1, 0, 1]], (5, 1))
+    expected[[0, 3, 4]] = [0, 0, 1, 1]
+    npt.assert_almost_equal(packed.colors[-1], expected)
+
+    # event handlers of existing lines are called
+    events = list()
+    packed[4].add_event_handler(events.append, "data")
+    packed.data[:5, 1] = 0.0
+    assert len(events) == 1
+
+
+def test_packed_offsets():
+    data = make_data()
+    data = np.dstack([data, np.zeros(data.shape[:2])])
+
+    packed = fpl.LineCollection(data, packed=True)
+    line = packed[2]
+
+    offsets = np.arange(15).reshape(5, 3)
+    packed.offsets = offsets
+
+    npt.assert_almost_equal(packed.offsets, offsets)
+    npt.assert_almost_equal(line.offset, offsets[2])
+    npt.assert_almost_equal(packed[4].data.value, data[4], decimal=5)
+    npt.assert_almost_equal(
+        packed._packed_data.value[204:254], data[4] + offsets[4], decimal=5
+    )
+
+    # offsets of the lines and the collection are the same array
+    line.offset = (0, 0, 0)
+    npt.assert_almost_equal(packed.offsets[2], 0)
+    npt.assert_almost_equal(line.data.value, data[2], decimal=5)
+    npt.assert_almost_equal(packed._packed_data.value[102:152], data[2], decimal=5)
+
+    # the offset is added to the values that are set
+    line.offset = (1, 2, 3)
+    line.data[:, 1] = 7
+    npt.assert_almost_equal(line.data.value[:, 1], 7)
+    npt.assert_almost_equal(packed._packed_data.value[102:152, 1], 9)
+
+    npt.assert_equal(packed.rotations, [[0, 0, 0, 1]] * 5)
+
+    with pytest.raises(IndexError):
+        packed.offsets = offsets[:3]
+
+
+def test_packed_view_bounds():
+    packed = fpl.LineCollection(make_data(), packed=True)
+    line, other = packed[1], packed[2]
+
+    npt.assert_almost_equal(line.data.bounds[:, 0], [0, 10])
+    bounds = other.data.bounds.copy()
+
+    # writes to the collection and the offsets invalidate the bounds of the existing lines
+    packed.data[:, 0] = packed.data[:, 0] + 100
+    npt.assert_almost_equal(line.data.bounds[:, 0], [100, 110])
+
+    # offsets move the lines, the data and its bounds do not include them
+    packed.offsets = np.full((5, 3), 5)
+    npt.assert_almost_equal(line.data.bounds[:, 0], [100, 110], decimal=5)
+    npt.assert_almost_equal(packed._packed_data.bounds[:, 0], [105, 115], decimal=5)
+
+    # and so do writes through other lines
+    line.data[:, 1] = 50
+    npt.assert_almost_equal(line.data.bounds[:, 1], [50, 50])
+    npt.assert_almost_equal(packed._packed_data.bounds[1, 1], 55)
+    npt.assert_almost_equal(
+        other.data.bounds[:, :2], bounds[:, :2] + [100, 0], decimal=5
+    )
+
+
+def test_packed_view_bounds_cached():
+    packed = fpl.LineCollection(make_data(), packed=True)
+    line, other = packed[1], packed[2]
+
+    line.data.bounds
+    other.data.bounds
+    version = other.data._version()
+
+    # writes to one line and changes of the offsets keep the cached bounds of the other lines
+    line.data[:, 1] = 50
+    line.data[3] = [1, 2, 3]
+    line.offset = (0, 10, 0)
+    packed.offsets = np.full((5, 3), 5)
+    packed[[0, 1]].data[:, 1] = 2
+    assert other.data._version() == version
+    assert other.data._bounds_version == version
+
+    # writes to the rows of the line invalidate its bounds
+    packed[[2, 3]].data[:, 1] = 7
+    assert other.data._version() != version
+    npt.assert_almost_equal(other.data.bounds[:, 1], [7, 7])
+
+    # the packed rows include the offsets
+    index = other.data.axis_index(0)
+    line.data[:, 0] = 3
+    packed.offsets = np.full((5, 3), 1)
+    assert other.data.axis_index(0) is index
+
+    packed._packed_data[:, 1] = 0
+    npt.assert_almost_equal(other.data.bounds[:, 1], [-1, -1])
+    npt.assert_almost_equal(line.data.bounds[:, 1], [-1, -1])
+
+
+def test_packed_view_axis_index():
+    packed = fpl.LineCollection(make_data(), packed=True)
+    line = packed[1]
+
+    index = line.data.axis_index(0)
+    assert index.sorted
+    npt.assert_equal(index.indices_in_range(0, 1), np.arange(5))
+
+    # reversed x, written through the collection
+    packed.data[:, 0] = packed.data[:, 0][:, ::-1]
+    index = line.data.axis_index(0)
+    assert not index.sorted
+    npt.assert_equal(index.indices_in_range(0, 1), np.arange(45, 50))
+
+    # offsets do not change the data of the lines
+    packed.offsets = np.full((5, 3), 100)
+    npt.assert_equal(line.data.axis_index(0).indices_in_range(0, 1), np.arange(45, 50))
+
+    # writes to one dimension of the line keep the index of the others
+    index = line.data.axis_index(0)
+    line.data[:, 1] = 0
+    assert line.data.axis_index(0) is index
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_collection_selector_queries(packed):
+    # lines of different lengths
+    data = [
+        np.column_stack([np.linspace(0, 10, n), np.sin(np.linspace(0, 10, n))])
+        for n in (50, 80, 30, 60)
+    ]
+
+    fig = fpl.Figure()
+    stack = fig[0, 0].add_line_stack(data, separation=1, packed=packed)
+
+    # points of the lines in the collection space
+    points = [d[:, :2] + np.array(o[:2]) for d, o in zip(data, stack.offsets)]
+
+    # the add_*_selector methods of collections require lines of the same length
+    region = fpl.LinearRegionSelector(
+        (1, 4), limits=(-10, 10), size=10, center=5, axis="y", parent=stack
+    )
+    fig[0, 0].add_graphic(region)
+
+    ixs = region.get_selected_indices()
+    assert len(ixs) == 4
+    for i, p in enumerate(points):
+        ymin, ymax = region.selection
+        expected = np.where((p[:, 1] >= ymin) & (p[:, 1] <= ymax))[0]
+        npt.assert_equal(ixs[i], expected)
+
+    npt.assert_equal(ixs.lengths, [ix.size for ix in ixs])
+    npt.assert_equal(ixs.indices, np.concatenate(list(ixs)))
+
+    for i, selected in enumerate(region.get_selected_data()):
+        if ixs[i].size == 0:
+            assert selected.shape == (0, 3)
+        else:
+            npt.assert_equal(selected, stack[i].data[ixs[i][0] : ixs[i][-1] + 1])
+
+    rectangle = fpl.RectangleSelector(
+        (2, 8, 0, 2), limits=(0, 10, -10, 10), parent=stack
+    )
+    fig[0, 0].add_graphic(rectangle)
+
+    ixs = rectangle.get_selected_indices()
+    for i, p in enumerate(points):
+        xmin, xmax, ymin, ymax = rectangle.selection
+        expected = np.where(
+            (p[:, 0] >= xmin)
+            & (p[:, 0] <= xmax)
+            & (p[:, 1] >= ymin)
+            & (p[:, 1] <= ymax)
+        )[0]
+        npt.assert_equal(ixs[i], expected)
+
+    full = rectangle.get_selected_data(mode="full")
+    partial = rectangle.get_selected_data(mode="partial")
+    ignore = rectangle.get_selected_data(mode="ignore")
+
+    for i in range(len(stack)):
+        if ixs[i].size == 0:
+            assert full[i].shape == partial[i].shape == ignore[i].shape == (0, 3)
+            continue
+
+        start, stop = ixs[i][0], ixs[i][-1] + 1
+        npt.assert_equal(full[i], stack[i].data[start:stop])
+
+        selected = np.isin(np.arange(start, stop), ixs[i])
+        npt.assert_equal(partial[i][selected], full[i][selected])
+        assert np.isnan(partial[i][~selected]).all()
+
+        if selected.all():
+            npt.assert_equal(ignore[i], full[i])
+        else:
+            assert ignore[i].shape == (0, 3)
@@ -0,0 +1,174 @@
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import pygfx
+
+import fastplotlib as fpl
+from fastplotlib.graphics._segment_bvh import SegmentBVH
+
+
+def segment_distances(lines: list[np.ndarray], point, scale=(1.0, 1.0)) -> np.ndarray:
+    """brute force distance from the point to the nearest segment of each line, inf if it has no finite segment"""
+    distances = list()
+    for xy in lines:
+        a, b = xy[:-1, :2].astype(np.float64), xy[1:, :2].astype(np.float64)
+        v = (b - a) / scale
+        w = (np.asarray(point) - a) / scale
+        length2 = (v * v).sum(axis=1)
+        t = np.divide(
+            (w * v).sum(axis=1), length2, out=np.zeros_like(length2), where=length2 > 0
+        )
+        d = np.sqrt(((w - np.clip(t, 0, 1)[:, None] * v) ** 2).sum(axis=1))
+        distances.append(np.nanmin(d, initial=np.inf))
+
+    return np.array(distances)
+
+
+@pytest.fixture
+def lines():
+    rng = np.random.default_rng(0)
+    lines = list()
+    for n in rng.integers(1, 60, 80):
+        xy = np.column_stack([np.sort(rng.uniform(0, 10, n)), rng.normal(size=n)])
+        xy[rng.random(n) < 0.05] = np.nan
+        lines.append(xy.astype(np.float32))
+
+    return lines
+
+
+def test_segment_bvh(lines):
+    n_points = np.array([xy.shape[0] for xy in lines])
+    starts = np.cumsum(n_points) - n_points
+    x, y = np.concatenate(lines).T.copy()
+
+    bvh = SegmentBVH(x, y, starts, n_points, leaf_size=4, branching=3)
+    rng = np.random.default_rng(1)
+
+    for i in range(50):
+        point = rng.uniform((-1, -3), (11, 3))
+        k = int(rng.integers(1, 6))
+        scale = (1.0, rng.uniform(0.1, 10))
+
+        indices, segments, distances = bvh.nearest(point, k=k, scale=scale)
+        expected = segment_distances(lines, point, scale)
+
+        npt.assert_allclose(distances, np.sort(expected)[:k], rtol=1e-6)
+        npt.assert_allclose(expected[indices], distances, rtol=1e-6)
+
+        # the returned segments are at the returned distances
+        for line, segment, distance in zip(indices, segments, distances):
+            xy = lines[line][segment : segment + 2]
+            npt.assert_allclose(segment_distances([xy], point, scale), distance)
+
+    # move some lines and refit their boxes
+    moved = [3, 40, 41]
+    for i in moved:
+        lines[i][:, 1] += 5
+        y[starts[i] : starts[i] + n_points[i]] += 5
+    bvh.refit(moved)
+
+    for i in range(20):
+        point = rng.uniform((-1, -3), (11, 8))
+        indices, segments, distances = bvh.nearest(point, k=3)
+        npt.assert_allclose(
+            distances, np.sort(segment_distances(lines, point))[:3], rtol=1e-6
+        )
+
+    # lines without finite segments are never returned
+    n_finite = np.isfinite(segment_distances(lines, (0, 0))).sum()
+    assert bvh.nearest((0, 0), k=1000)[0].size == n_finite
+
+    with pytest.raises(ValueError):
+        bvh.nearest((0, 0), k=0)
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_nearest(lines, packed):
+    lines = [xy for xy in lines if xy.shape[0] > 1]
+    fig = fpl.Figure()
+    collection = fig[0, 0].add_line_collection(lines, packed=packed)
+    collection.offsets = np.column_stack(
+        [np.zeros(len(lines)), np.arange(len(lines)) * 0.5, np.zeros(len(lines))]
+    )
+
+    def check(n_checks=10):
+        positions = [
+            collection[i].data[:, :2] + collection[i].offset[:2]
+            for i in range(len(lines))
+        ]
+
+        rng = np.random.default_rng(2)
+        for i in range(n_checks):
+            point = rng.uniform((0, -2), (10, len(lines) / 2 + 2))
+            indices, segments, distances = collection.nearest(point, k=3)
+            expected = segment_distances(positions, point)
+
+            npt.assert_allclose(distances, np.sort(expected)[:3], atol=1e-5)
+            npt.assert_equal(indices, np.argsort(expected)[:3])
+
+    check()
+
+    # the BVH is refit after the data of a line changes
+    collection[5].data[:, 1] = collection[5].data[:, 1] + 20
+    check()
+
+    # and after the offset of a line or the offsets of all lines change
+    collection[8].offset = (0, -10, 0)
+    check()
+    collection.offsets = collection.offsets[::-1]
+    check()
+
+    # the position is in world space
+    collection.world_object.world.position = (0, 100, 0)
+    indices, _, distances = collection.nearest((5, 100 + collection.offsets[0, 1]))
+    assert distances[0] < 3
+
+    with pytest.raises(ValueError):
+        collection.nearest((0, 0, 0, 0))
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_pointer_nearest(packed):
+    xs = np.linspace(0, 10, 50)
+    data = np.stack([np.column_stack([xs, np.full(50, i)]) for i in range(10)])
+
+    fig = fpl.Figure()
+    collection = fig[0, 0].add_line_collection(data, packed=packed)
+    assert "pointer_nearest" in collection.supported_events
+
+    events = list()
+
+    @collection.add_event_handler("pointer_nearest")
+    def handler(ev):
+        events.append((ev.graphic, ev.pick_info))
+
+    fig.show()
+    fig[0, 0]._render()
+
+    # pointer at the center of the subplot
+    x, y = fig[0, 0].viewport.rect[:2] + np.array(fig[0, 0].viewport.rect[2:]) / 2
+    world = fig[0, 0].map_screen_to_world((x, y))
+    pixel = abs(fig[0, 0].map_screen_to_world((x, y + 1))[1] - world[1])
+
+    renderer = fig[0, 0].renderer
+    renderer.dispatch_event(pygfx.PointerEvent("pointer_move", x=x, y=y))
+
+    nearest = int(np.clip(np.round(world[1]), 0, 9))
+    graphic, pick_info = events[-1]
+    assert graphic is collection[nearest]
+    assert pick_info["line_index"] == nearest
+    assert pick_info["segment_index"] == int(world[0] / (10 / 49))
+
+    # the distance is in screen pixels
+    npt.assert_allclose(
+        pick_info["distance"], abs(world[1] - nearest) / pixel, rtol=1e-3
+    )
+
+    collection.remove_event_handler(handler, "pointer_nearest")
+    n_events = len(events)
+    renderer.dispatch_event(pygfx.PointerEvent("pointer_move", x=x, y=y))
+    assert len(events) == n_events
+
+    with pytest.raises(KeyError):
+        collection.remove_event_handler(handler, "pointer_nearest")
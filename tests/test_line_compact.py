@@ -0,0 +1,105 @@
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import fastplotlib as fpl
+from fastplotlib.graphics.features import CompactVertexPositions
+
+
+@pytest.fixture
+def ys():
+    return np.sin(np.linspace(0, 20, 1000)).astype(np.float32)
+
+
+def test_compact_data(ys):
+    line = fpl.LineGraphic(CompactVertexPositions(ys, x0=5.0, dx=0.5))
+    regular = fpl.LineGraphic(np.column_stack([5.0 + np.arange(1000) * 0.5, ys]))
+
+    assert line.compact
+    # one float per point
+    assert line.data.buffer.nbytes == ys.nbytes
+
+    npt.assert_almost_equal(line.data.value, regular.data.value)
+    npt.assert_almost_equal(line.data[10:20], regular.data[10:20])
+    npt.assert_almost_equal(line.data[[1, 5, 7], 0], regular.data[[1, 5, 7], 0])
+    npt.assert_equal(line.data[:, 1], ys)
+
+    line.data[:, 1] = 0
+    assert (line.data.y == 0).all()
+
+    line.data = ys
+    npt.assert_equal(line.data.y, ys)
+
+    line.data[:3] = [[5, 1, 0], [5.5, 2, 0], [6, 3, 0]]
+    npt.assert_equal(line.data.y[:3], [1, 2, 3])
+
+    line.data[[10, 4]] = regular.data[[10, 4], :2]
+    npt.assert_equal(line.data.y[[10, 4]], ys[[10, 4]])
+
+    with pytest.raises(ValueError):
+        line.data[:, 0] = 1
+
+    # points with x or z other than those of the compact line are not silently reduced to y
+    with pytest.raises(ValueError):
+        line.data[:3] = [[0, 1, 0], [0, 2, 0], [0, 3, 0]]
+
+    with pytest.raises(ValueError):
+        line.data[5] = [7.5, 1, 2]
+
+    with pytest.raises(ValueError):
+        line.data = np.column_stack([np.arange(1000), ys])
+
+    npt.assert_equal(line.data.y[:3], [1, 2, 3])
+
+
+def test_compact_from_xy(ys):
+    xs = np.linspace(-3, 3, 1000)
+    line = fpl.LineGraphic(np.column_stack([xs, ys]), compact=True)
+
+    assert line.data.x0 == -3
+    npt.assert_almost_equal(line.data.x, xs, decimal=5)
+
+    with pytest.raises(ValueError):
+        fpl.LineGraphic(np.column_stack([xs**2, ys]), compact=True)
+
+    with pytest.raises(ValueError):
+        fpl.LineGraphic(ys, compact=True, lod=True)
+
+
+def test_compact_selectors(ys):
+    fig = fpl.Figure()
+    line = fig[0, 0].add_line(CompactVertexPositions(ys, x0=5.0, dx=0.5))
+    regular = fig[0, 0].add_line(np.column_stack([5.0 + np.arange(1000) * 0.5, ys]))
+
+    selector = line.add_linear_selector(100.3)
+    assert selector.get_selected_index() == selector.get_selected_index(regular) == 191
+
+    region = line.add_linear_region_selector((20.2, 90.0))
+    npt.assert_equal(
+        region.get_selected_indices(), region.get_selected_indices(regular)
+    )
+    npt.assert_almost_equal(
+        region.get_selected_data(), region.get_selected_data(regular)
+    )
+
+
+@pytest.mark.parametrize("thickness", [1.0, 3.0])
+def test_compact_render(ys, thickness):
+    images = list()
+
+    for compact in (False, True):
+        fig = fpl.Figure()
+        line = fig[0, 0].add_line(
+            ys, thickness=thickness, cmap="viridis", compact=compact
+        )
+        fig.show()
+        fig[0, 0].auto_scale()
+
+        npt.assert_almost_equal(
+            line.world_object.get_bounding_box(), [[0, ys.min(), 0], [999, ys.max(), 0]]
+        )
+
+        images.append(np.asarray(fig.canvas.draw()))
+
+    # x is computed in the shader
+    npt.assert_equal(images[0], images[1])
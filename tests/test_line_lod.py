@@ -0,0 +1,172 @@
+import tracemalloc
+
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import pygfx
+
+import fastplotlib as fpl
+from fastplotlib.graphics._lod import MinMaxPyramid
+
+
+@pytest.fixture
+def ys():
+    return np.random.default_rng(0).standard_normal(100_003).astype(np.float32)
+
+
+def test_pyramid(ys):
+    pyramid = MinMaxPyramid(ys)
+
+    assert pyramid.block_sizes[:3] == (16, 64, 256)
+    assert pyramid.extrema == (ys.argmin(), ys.argmax())
+
+    # much smaller than the data
+    assert pyramid.nbytes < ys.nbytes / 2
+
+
+@pytest.mark.parametrize(
+    "start, stop", [(0, 1), (17, 18), (1000, 5000), (99_990, 100_003), (0, 100_003)]
+)
+def test_pyramid_update(ys, start, stop):
+    pyramid = MinMaxPyramid(ys)
+
+    ys[start:stop] = np.random.default_rng(1).uniform(-10, 10, stop - start)
+    pyramid.update(start, stop)
+
+    # same as the pyramid of the changed values
+    expected = MinMaxPyramid(ys)
+    for level in range(len(expected.block_sizes)):
+        npt.assert_equal(pyramid._imin[level], expected._imin[level])
+        npt.assert_equal(pyramid._imax[level], expected._imax[level])
+
+    assert pyramid.extrema == (ys.argmin(), ys.argmax())
+
+
+@pytest.mark.parametrize(
+    "start, stop", [(0, 100_003), (1234, 56_789), (99_000, 100_003)]
+)
+@pytest.mark.parametrize("n_buckets", [50, 1500])
+def test_decimate(ys, start, stop, n_buckets):
+    pyramid = MinMaxPyramid(ys)
+
+    indices = pyramid.decimate(start, stop, n_buckets)
+
+    assert (np.diff(indices) > 0).all()
+    assert indices[0] == start
+    assert indices[-1] == stop - 1
+
+    # at most 4 points per block, and a bucket contains at most 4 blocks of the chosen level
+    assert indices.size <= 16 * n_buckets + 8
+
+    # extrema of the range are preserved
+    assert ys[indices].min() == ys[start:stop].min()
+    assert ys[indices].max() == ys[start:stop].max()
+
+
+def test_decimate_small_range(ys):
+    pyramid = MinMaxPyramid(ys)
+
+    # not decimated if there are fewer points than 16 per bucket
+    npt.assert_equal(pyramid.decimate(100, 1000, 1500), np.arange(100, 1000))
+
+
+def test_line_lod(ys):
+    data = np.column_stack([np.arange(ys.size), ys])
+
+    fig = fpl.Figure()
+    line = fig[0, 0].add_line(data, lod=True, cmap="viridis")
+
+    assert line.lod
+    # full data is available
+    assert line.data.value.shape[0] == ys.size
+
+    positions = line.world_object.geometry.positions
+    assert positions.draw_range[1] < ys.size / 4
+
+    fig.show()
+
+    # zoom into a range of the data
+    camera = fig[0, 0].camera
+    camera.width = 2000
+    camera.local.x = 50_000
+    fig[0, 0]._render()
+
+    indices = line._lod_indices
+    # the first and last points and global extrema are always included
+    visible = np.setdiff1d(indices, [0, ys.size - 1, ys.argmin(), ys.argmax()])
+    assert 48_000 < visible.min() < 50_000 < visible.max() < 52_000
+
+    # display buffers contain the decimated data
+    size = line.world_object.geometry.positions.draw_range[1]
+    npt.assert_equal(
+        line.world_object.geometry.positions.data[:size], line.data.value[indices]
+    )
+    npt.assert_equal(
+        line.world_object.geometry.colors.data[:size], line.colors.value[indices]
+    )
+
+    # picking maps to the index in the full data
+    picked = list()
+    ev = pygfx.PointerEvent("click", x=0, y=0, pick_info={"vertex_index": 10})
+    for i in range(2):
+        line._handle_event(lambda e: picked.append(e.pick_info["vertex_index"]), ev)
+    assert picked == [indices[10]] * 2
+
+    # data changes are uploaded on the next render
+    line.data[:, 1] = 0
+    fig[0, 0]._render()
+    size = line.world_object.geometry.positions.draw_range[1]
+    assert (line.world_object.geometry.positions.data[:size, 1] == 0).all()
+
+
+def test_lod_update_cost():
+    # large enough that a copy of the x column dominates the allocations of an update
+    n = 2_000_000
+    data = np.column_stack([np.arange(n), np.zeros(n)]).astype(np.float32)
+
+    fig = fpl.Figure()
+    line = fig[0, 0].add_line(data, lod=True)
+    fig.show()
+
+    camera = fig[0, 0].camera
+    camera.width = 2000
+    camera.local.x = 500_000
+    fig[0, 0]._render()
+
+    # moving the view searches the x column without copying it
+    camera.local.x = 1_000_000
+    tracemalloc.start()
+    line._update_lod()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    assert peak < n * 4 / 10
+
+    visible = np.setdiff1d(line._lod_indices, [0, n - 1])
+    assert 998_000 < visible.min() < 1_000_000 < visible.max() < 1_002_000
+
+
+def test_lod_unsorted():
+    with pytest.raises(ValueError):
+        fpl.LineGraphic(np.random.rand(100, 2), lod=True)
+
+
+def test_lod_data_changed(ys):
+    data = np.column_stack([np.arange(ys.size), ys])
+    line = fpl.LineGraphic(data, lod=True, cmap="viridis")
+
+    # setting y values updates the pyramid
+    line.data[5000:5010, 1] = 100
+    line.data[-1, 1] = -100
+    assert line._lod_pyramid.extrema == (ys.size - 1, 5000)
+
+    # x values that remain sorted keep the level of detail mode
+    line.data[:, 0] = line.data[:, 0] * 2
+    assert line.lod
+
+    # x values that are not sorted anymore show the full data
+    line.data[10, 0] = 1e6
+    assert not line.lod
+    assert line.world_object.geometry.positions is line.data.buffer
+    assert line.world_object.geometry.colors is line.colors.buffer
@@ -0,0 +1,123 @@
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import pygfx
+
+import fastplotlib as fpl
+from fastplotlib.graphics.features import SegmentPositions, SegmentColors
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    start = rng.uniform(0, 100, (1000, 2))
+    return np.stack([start, start + rng.normal(0, 1, (1000, 2))], axis=1).astype(
+        np.float32
+    )
+
+
+def test_line_segments(data):
+    fig = fpl.Figure()
+    segments = fig[0, 0].add_line_segments(data, colors="r", thickness=3)
+
+    assert isinstance(segments, fpl.LineSegmentsGraphic)
+    assert isinstance(segments.data, SegmentPositions)
+    assert isinstance(segments.colors, SegmentColors)
+    assert isinstance(segments.world_object.material, pygfx.LineSegmentMaterial)
+
+    # one buffer, two rows per segment
+    positions = segments.world_object.geometry.positions.data
+    assert positions.shape == (2000, 3)
+    npt.assert_equal(positions[:, :2], data.reshape(-1, 2))
+    assert segments.data.value.shape == (1000, 2, 3)
+
+    # one color per segment, written to both vertices
+    assert segments.colors.value.shape == (1000, 4)
+    segments.colors[5] = "b"
+    npt.assert_equal(segments.colors[5], [0, 0, 1, 1])
+    colors = segments.world_object.geometry.colors.data
+    npt.assert_equal(colors[10:12], [[0, 0, 1, 1]] * 2)
+    npt.assert_equal(colors[12:14], [[1, 0, 0, 1]] * 2)
+
+    segments.colors[:, -1] = 0.5
+    assert (colors[:, -1] == 0.5).all()
+
+    # keys index segments
+    segments.data[0] = [[0, 0, 0], [1, 1, 0]]
+    segments.data[1:3, 1, 1] = 50
+    npt.assert_equal(positions[:2], [[0, 0, 0], [1, 1, 0]])
+    npt.assert_equal(positions[[3, 5], 1], [50, 50])
+
+    npt.assert_almost_equal(
+        segments.data.bounds,
+        [
+            data.reshape(-1, 2).min(axis=0).tolist() + [0],
+            data.reshape(-1, 2).max(axis=0).tolist() + [0],
+        ],
+    )
+
+
+def test_line_segments_cmap(data):
+    transform = np.arange(1000)[::-1]
+    segments = fpl.LineSegmentsGraphic(data, cmap="viridis", cmap_transform=transform)
+
+    assert segments.cmap.name == "viridis"
+    colors = segments.world_object.geometry.colors.data
+    npt.assert_equal(colors[0::2], colors[1::2])
+    npt.assert_almost_equal(
+        segments.colors.value,
+        fpl.utils.parse_cmap_values(1000, "viridis", transform),
+    )
+
+    # cmap of a range of segments
+    segments = fpl.LineSegmentsGraphic(data, cmap="viridis")
+    segments.cmap[500:] = "jet"
+    npt.assert_almost_equal(
+        segments.colors[500:], fpl.utils.parse_cmap_values(500, "jet")
+    )
+    colors = segments.world_object.geometry.colors.data
+    npt.assert_equal(colors[0::2], colors[1::2])
+
+    uniform = fpl.LineSegmentsGraphic(data, colors="g", uniform_color=True)
+    assert uniform.cmap is None
+    assert uniform.world_object.material.color_mode == "uniform"
+
+    with pytest.raises(ValueError):
+        fpl.LineSegmentsGraphic(data, cmap_transform=transform)
+
+    with pytest.raises(ValueError):
+        fpl.LineSegmentsGraphic(data.reshape(-1, 2))
+
+
+def test_line_segments_selectors(data):
+    fig = fpl.Figure()
+    segments = fig[0, 0].add_line_segments(data)
+    midpoints = data.mean(axis=1)
+
+    region = segments.add_linear_region_selector()
+    region.selection = (20, 40)
+    expected = np.where((midpoints[:, 0] >= 20) & (midpoints[:, 0] <= 40))[0]
+    npt.assert_equal(region.get_selected_indices(), expected)
+    npt.assert_equal(region.get_selected_data(), segments.data[expected])
+
+    rectangle = segments.add_rectangle_selector()
+    rectangle.selection = (20, 40, 10, 60)
+    expected = np.where(
+        (midpoints[:, 0] >= 20)
+        & (midpoints[:, 0] <= 40)
+        & (midpoints[:, 1] >= 10)
+        & (midpoints[:, 1] <= 60)
+    )[0]
+    npt.assert_equal(rectangle.get_selected_indices(), expected)
+    npt.assert_equal(rectangle.get_selected_data(), segments.data[expected])
+
+    linear = segments.add_linear_selector()
+    linear.selection = 50
+    assert linear.get_selected_index() == np.abs(midpoints[:, 0] - 50).argmin()
+
+    # picking maps the vertex to the segment
+    picked = list()
+    ev = pygfx.PointerEvent("click", x=0, y=0, pick_info={"vertex_index": 11})
+    segments._handle_event(lambda e: picked.append(e.pick_info["segment_index"]), ev)
+    assert picked == [5]
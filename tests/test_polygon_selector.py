@@ -0,0 +1,124 @@
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import pygfx
+
+import fastplotlib as fpl
+from fastplotlib.graphics.selectors import PolygonSelector
+
+
+def crossing_number(x, y, vertices):
+    inside = np.zeros(x.size, dtype=bool)
+    for (xa, ya), (xb, yb) in zip(vertices, np.roll(vertices, -1, axis=0)):
+        if ya > yb:
+            xa, ya, xb, yb = xb, yb, xa, ya
+        crossed = (y >= ya) & (y < yb)
+        inside[crossed] ^= x[crossed] < xa + (y[crossed] - ya) * (xb - xa) / (yb - ya)
+    return inside
+
+
+def draw(selector, vertices):
+    # screen positions are mapped to the same world positions
+    for x, y in vertices:
+        selector._add_segment(pygfx.PointerEvent("click", x=x, y=y))
+        selector._move_segment_endpoint(pygfx.PointerEvent("pointer_move", x=x, y=y))
+        selector._finish_segment(pygfx.PointerEvent("click", x=x, y=y))
+
+
+@pytest.fixture
+def subplot():
+    fig = fpl.Figure()
+    subplot = fig[0, 0]
+    subplot.map_screen_to_world = lambda pos, allow_outside=False: np.array(
+        [pos.x, pos.y, 0]
+    )
+    return subplot
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(0)
+    return rng.normal(0, 1, (50_000, 2)).astype(np.float32)
+
+
+star = np.array(
+    [[1.5 * np.cos(t), 1.5 * np.sin(t)] for t in np.linspace(0, 2 * np.pi, 10)[:-1]]
+)
+star[::2] *= 0.4
+
+
+@pytest.mark.parametrize("spatial_index", [False, True])
+def test_polygon_selector_scatter(subplot, points, spatial_index):
+    scatter = subplot.add_scatter(points, spatial_index=spatial_index)
+    if spatial_index:
+        scatter.spatial_index.wait()
+
+    selector = PolygonSelector(parent=scatter)
+    subplot.add_graphic(selector)
+
+    draw(selector, star[:2])
+    selector._add_segment(pygfx.PointerEvent("click", x=star[2, 0], y=star[2, 1]))
+    # the endpoint of the segment that is being drawn is the last vertex
+    selector._move_segment_endpoint(pygfx.PointerEvent("pointer_move", x=0, y=-1))
+    vertices = np.vstack([star[:3], [[0, -1]]])
+    expected = np.flatnonzero(crossing_number(points[:, 0], points[:, 1], vertices))
+    npt.assert_equal(selector.get_selected_indices(), expected)
+
+    # vertices are added and moved, the selection is updated incrementally
+    for i in range(3, star.shape[0]):
+        for t in (0.5, 1.0):
+            x, y = star[i - 1] + t * (star[i] - star[i - 1])
+            selector._move_segment_endpoint(
+                pygfx.PointerEvent("pointer_move", x=x, y=y)
+            )
+
+            vertices = selector._polygon_vertices()
+            expected = crossing_number(points[:, 0], points[:, 1], vertices)
+            npt.assert_equal(selector.get_selected_indices(), np.flatnonzero(expected))
+
+        selector._finish_segment(pygfx.PointerEvent("click", x=x, y=y))
+        selector._add_segment(pygfx.PointerEvent("click", x=x, y=y))
+
+    selector._finish_polygon(
+        pygfx.PointerEvent("double_click", x=star[-1, 0], y=star[-1, 1])
+    )
+    expected = np.flatnonzero(crossing_number(points[:, 0], points[:, 1], star))
+    npt.assert_equal(selector.get_selected_indices(), expected)
+    npt.assert_equal(selector.get_selected_data(), scatter.data[expected])
+
+    # data changes invalidate the selection
+    scatter.data[:100, :2] = 0
+    expected = np.flatnonzero(
+        crossing_number(scatter.data[:, 0], scatter.data[:, 1], star)
+    )
+    npt.assert_equal(selector.get_selected_indices(), expected)
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_polygon_selector_graphics(subplot, points, packed):
+    lines = [np.column_stack([points[:n, 0], points[:n, 1]]) for n in (100, 500, 50)]
+    collection = subplot.add_line_collection(lines, packed=packed)
+    image = subplot.add_image(np.arange(60 * 80, dtype=np.float32).reshape(60, 80))
+
+    selector = PolygonSelector(parent=collection)
+    subplot.add_graphic(selector)
+    draw(selector, star)
+    selector._finish_polygon(
+        pygfx.PointerEvent("double_click", x=star[-1, 0], y=star[-1, 1])
+    )
+
+    ixs = selector.get_selected_indices()
+    data = selector.get_selected_data()
+    for i, line in enumerate(lines):
+        expected = np.flatnonzero(crossing_number(line[:, 0], line[:, 1], star))
+        npt.assert_equal(ixs[i], expected)
+        npt.assert_equal(data[i][:, :2], line[expected])
+
+    # pixel centers of an image
+    mask = selector.get_selected_indices(image)
+    assert mask.shape == (60, 80)
+    rows, cols = np.mgrid[:60, :80]
+    expected = crossing_number(cols.ravel(), rows.ravel(), star).reshape(60, 80)
+    npt.assert_equal(mask, expected)
+    npt.assert_equal(selector.get_selected_data(image), image.data.value[expected])
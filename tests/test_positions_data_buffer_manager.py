@@ -3,13 +3,16 @@ from numpy import testing as npt
 import pytest
 
 import fastplotlib as fpl
-from fastplotlib.graphics.features import VertexPositions, GraphicFeatureEvent
+from fastplotlib.graphics.features import (
+    VertexPositions,
+    CompactVertexPositions,
+    GraphicFeatureEvent,
+)
 from .utils import (
     generate_slice_indices,
     generate_positions_spiral_data,
 )
 
-
 EVENT_RETURN_VALUE: GraphicFeatureEvent = None
 
 
@@ -199,3 +202,81 @@ def test_slice(test_graphic, slice_method: dict, test_axis: str):
                 else:
                     npt.assert_almost_equal(EVENT_RETURN_VALUE.info["key"], s)
                 npt.assert_almost_equal(EVENT_RETURN_VALUE.info["value"], -data[s])
+
+
+def finite_bounds(data):
+    return np.array([np.nanmin(data, axis=0), np.nanmax(data, axis=0)])
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_bounds(compact):
+    rng = np.random.default_rng(0)
+
+    if compact:
+        data = CompactVertexPositions(rng.standard_normal(1000), x0=5, dx=0.5)
+    else:
+        data = VertexPositions(rng.standard_normal((1000, 3)))
+
+    npt.assert_almost_equal(data.bounds, finite_bounds(data.value))
+
+    for i in range(100):
+        # points move inwards and outwards, the bounds are updated or recomputed
+        start = rng.integers(0, 990)
+        data[start : start + 10, 1] = rng.standard_normal(10) * rng.uniform(0.1, 4)
+        data[rng.integers(0, 1000, 3), 1] = np.nan
+        npt.assert_almost_equal(data.bounds, finite_bounds(data.value))
+
+    # only the bounds of the rows that are set are computed if the bounds cannot shrink
+    bounds = data.bounds
+    data[10, 1] = bounds[1, 1] + 1
+    assert data._bounds_version == data._version()
+    npt.assert_almost_equal(data.bounds[1, 1], bounds[1, 1] + 1, decimal=5)
+
+    data[:, 1] = np.nan
+    assert data.bounds is None
+
+
+def test_axis_index():
+    rng = np.random.default_rng(0)
+    x = np.sort(rng.uniform(0, 100, 1000)).astype(np.float32)
+    data = VertexPositions(np.column_stack([x, rng.standard_normal(1000)]))
+
+    index = data.axis_index(0)
+    assert index.sorted
+    # reused until the data along the axis is set
+    assert data.axis_index(0) is index
+
+    npt.assert_equal(index.indices_in_range(20, 40), np.where((x >= 20) & (x <= 40))[0])
+    assert index.nearest(50) == np.abs(x - 50).argmin()
+    assert index.nearest(-10) == 0
+    assert index.nearest(1000) == 999
+
+    # setting other dimensions keeps the index
+    data[:, 1] = 0
+    assert data.axis_index(0) is index
+
+    data[10:20, 0] = np.nan
+    unsorted = data.axis_index(0)
+    assert unsorted is not index
+    assert not unsorted.sorted
+
+    x = data.value[:, 0]
+    npt.assert_equal(
+        unsorted.indices_in_range(0, 30), np.where((x >= 0) & (x <= 30))[0]
+    )
+    assert unsorted.nearest(x[25]) == 25
+
+    # unsorted values are indexed by a permutation
+    y = rng.standard_normal(1000).astype(np.float32)
+    data[:, 1] = y
+    index = data.axis_index(1)
+    assert not index.sorted
+    npt.assert_equal(index.indices_in_range(-0.5, 0.5), np.where(np.abs(y) <= 0.5)[0])
+    assert index.nearest(0.1) == np.abs(y - 0.1).argmin()
+
+    # NaN values are never returned
+    data[:, 1] = np.nan
+    index = data.axis_index(1)
+    npt.assert_equal(index.indices_in_range(-np.inf, np.inf), [])
+    with pytest.raises(ValueError):
+        index.nearest(0.1)
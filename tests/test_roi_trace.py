@@ -0,0 +1,192 @@
+from threading import Event
+
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import fastplotlib as fpl
+from fastplotlib.widgets.image_widget import ChunkedArray, ROITrace
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).random((53, 20, 30)).astype(np.float32)
+
+
+class RecordedArray:
+    """array that records the frames of each read, the first read blocks until ``release`` is set"""
+
+    def __init__(self, data):
+        self._data = data
+        self.shape = data.shape
+        self.dtype = data.dtype
+        self.reads = list()
+        self.reading = Event()
+        self.release = Event()
+
+    def __getitem__(self, key):
+        self.reads.append((key[0].start, key[0].stop))
+        self.reading.set()
+        self.release.wait(10)
+        return self._data[key]
+
+
+@pytest.mark.parametrize("reduction", ["mean", "sum", "max", "min", "std"])
+@pytest.mark.parametrize("chunked", [False, True])
+def test_roi_trace(data, reduction, chunked):
+    if chunked:
+        a = ChunkedArray(data, chunks=(8, 10, 10))
+    else:
+        a = data
+
+    trace = ROITrace(a, reduction=reduction, block_size=7)
+    assert trace.result is None
+
+    trace.roi = (slice(3, 15), slice(5, 20))
+    assert trace.wait(timeout=10)
+    assert trace.progress == 1.0
+    assert trace.n_frames == data.shape[0]
+
+    expected = getattr(np, reduction)(data[:, 3:15, 5:20], axis=(1, 2))
+    npt.assert_allclose(trace.result, expected, rtol=1e-5)
+
+    # ints index a single row
+    trace.roi = (4, slice(None))
+    assert trace.wait(timeout=10)
+    npt.assert_allclose(
+        trace.result, getattr(np, reduction)(data[:, 4], axis=1), rtol=1e-5
+    )
+    trace.cancel()
+
+
+def test_blocks(data):
+    trace = ROITrace(ChunkedArray(data, chunks=(10, 20, 30)), block_size=15)
+    bounds = trace._new_trace(((0, 20), (0, 30)))["bounds"]
+    npt.assert_equal(bounds, [0, 10, 30, 40, 53])
+
+    trace = ROITrace(data, block_size=25)
+    bounds = trace._new_trace(((0, 20), (0, 30)))["bounds"]
+    npt.assert_equal(bounds, [0, 25, 50, 53])
+
+    # by default the number of frames per block depends on the size of the region
+    trace = ROITrace(np.broadcast_to(np.uint8(0), (5000, 512, 512)))
+    assert np.diff(trace._new_trace(((0, 512), (0, 512)))["bounds"]).max() == 64
+    assert np.diff(trace._new_trace(((0, 4), (0, 4)))["bounds"]).max() == 1024
+
+
+def test_restart_and_cache(data):
+    a = RecordedArray(data)
+    trace = ROITrace(a, block_size=10)
+    trace.focus = 35
+
+    # the block of the focus frame is read first
+    trace.roi = (slice(0, 5), slice(0, 5))
+    assert a.reading.wait(10)
+    assert a.reads == [(30, 40)]
+
+    # a new region abandons the pass after the block that is being read
+    trace.roi = (slice(5, 10), slice(5, 10))
+    a.release.set()
+    assert trace.wait(timeout=10)
+    npt.assert_allclose(trace.result, data[:, 5:10, 5:10].mean(axis=(1, 2)), rtol=1e-5)
+
+    # the partial trace of the first region was cached and is continued
+    n_reads = len(a.reads)
+    trace.roi = (slice(0, 5), slice(0, 5))
+    assert trace.wait(timeout=10)
+    assert len(a.reads) - n_reads == 5
+    npt.assert_allclose(trace.result, data[:, :5, :5].mean(axis=(1, 2)), rtol=1e-5)
+
+    # complete traces are not recomputed
+    n_reads = len(a.reads)
+    trace.roi = (slice(5, 10), slice(5, 10))
+    assert trace.done
+    assert len(a.reads) == n_reads
+
+    trace.cancel()
+    with pytest.raises(RuntimeError):
+        trace.roi = (slice(0, 1), slice(0, 1))
+
+
+def test_invalid(data):
+    with pytest.raises(ValueError):
+        ROITrace(data, reduction="median")
+
+    trace = ROITrace(data)
+    with pytest.raises(ValueError):
+        trace.roi = (slice(0, 10, 2), slice(0, 10))
+
+    with pytest.raises(IndexError):
+        trace.roi = (0, 0, 0)
+
+
+@pytest.mark.skipif(not fpl.IMGUI, reason="ImageWidget requires imgui-bundle")
+def test_image_widget(data):
+    iw = fpl.ImageWidget(data)
+    selector = iw.managed_graphics[0].add_rectangle_selector(selection=(5, 20, 3, 15))
+    trace = iw.roi_trace(selector)
+    line = iw.figure[0, 0].docks["bottom"].graphics[0]
+
+    def render():
+        iw.figure._call_animate_functions(iw.figure._animate_funcs_pre)
+
+    trace.wait(timeout=10)
+    render()
+    npt.assert_allclose(
+        line.data.value[:, 1], data[:, 3:15, 5:20].mean(axis=(1, 2)), rtol=1e-5
+    )
+
+    # moving the selector restarts the trace on the next render
+    selector.selection = (0, 10, 0, 10)
+    render()
+    assert trace.roi == (slice(0, 10), slice(0, 10))
+    trace.wait(timeout=10)
+    render()
+    npt.assert_allclose(
+        line.data.value[:, 1], data[:, :10, :10].mean(axis=(1, 2)), rtol=1e-5
+    )
+
+    with pytest.raises(TypeError):
+        iw.roi_trace(line)
+
+    trace.cancel()
+
+
+def test_image_widget_remove(data):
+    iw = fpl.ImageWidget(data)
+    image = iw.managed_graphics[0]
+    dock = iw.figure[0, 0].docks["bottom"]
+
+    def render():
+        iw.figure._call_animate_functions(iw.figure._animate_funcs_pre)
+
+    selectors = [
+        image.add_rectangle_selector(selection=(5, 20, 3, 15)) for i in range(3)
+    ]
+    traces = [iw.roi_trace(s) for s in selectors]
+    render()
+    assert len(dock.graphics) == 3
+
+    # removing a trace cancels it and deletes its line
+    iw.remove_roi_trace(traces[0])
+    assert iw.roi_traces == traces[1:]
+    assert traces[0]._cancelled
+    assert len(dock.graphics) == 2
+
+    with pytest.raises(KeyError):
+        iw.remove_roi_trace(traces[0])
+
+    # traces of selectors that are deleted or removed are removed on the next render
+    iw.figure[0, 0].delete_graphic(selectors[1])
+    iw.figure[0, 0].remove_graphic(selectors[2])
+    render()
+    assert iw.roi_traces == []
+    assert all(t._cancelled for t in traces)
+    assert len(dock.graphics) == 0
+
+    # traces can be added again
+    trace = iw.roi_trace(selectors[0])
+    render()
+    assert iw.roi_traces == [trace]
+    assert iw.figure._animate_funcs_pre.count(iw._update_roi_traces) == 1
+    trace.cancel()
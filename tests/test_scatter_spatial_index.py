@@ -0,0 +1,132 @@
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import pygfx
+
+import fastplotlib as fpl
+from fastplotlib.graphics._spatial_index import SpatialIndex
+
+
+def in_rect(positions, xmin, xmax, ymin, ymax):
+    return np.flatnonzero(
+        (positions[:, 0] >= xmin)
+        & (positions[:, 0] <= xmax)
+        & (positions[:, 1] >= ymin)
+        & (positions[:, 1] <= ymax)
+    )
+
+
+@pytest.fixture
+def positions():
+    rng = np.random.default_rng(0)
+    positions = np.zeros((100_000, 3), dtype=np.float32)
+    positions[:, :2] = rng.normal(0, 1, (100_000, 2))
+    positions[:5000, 0] *= 10
+    positions[[3, 50]] = np.nan
+    return positions
+
+
+@pytest.mark.parametrize("background", [True, False])
+def test_spatial_index(positions, background):
+    index = SpatialIndex(positions, background=background)
+    index.wait()
+    assert index.ready
+
+    for rect in [
+        (-0.1, 0.1, -0.2, 0.3),
+        (0.5, 0.5001, -10, 10),
+        (-30, 30, -0.01, 0.01),
+        (-100, 100, -100, 100),
+        (5, 6, 5, 6),
+        (1, 0, 0, 1),
+    ]:
+        npt.assert_equal(index.query_rect(*rect), in_rect(positions, *rect))
+
+    distance = np.hypot(positions[:, 0] - 0.3, positions[:, 1] + 0.2)
+    npt.assert_equal(
+        index.query_radius((0.3, -0.2), 0.25), np.flatnonzero(distance <= 0.25)
+    )
+
+    distance[np.isnan(distance)] = np.inf
+    npt.assert_equal(index.nearest((0.3, -0.2), k=20), np.argsort(distance)[:20])
+    # outside the points
+    distance = np.hypot(positions[:, 0] - 1000, positions[:, 1] - 1000)
+    assert index.nearest((1000, 1000))[0] == np.nanargmin(distance)
+
+    # written points are found before the grid is rebuilt
+    positions[100:200, :2] = 50
+    index.mark_dirty(slice(100, 200))
+    assert index.n_dirty == 100
+    npt.assert_equal(index.query_rect(49, 51, 49, 51), np.arange(100, 200))
+    npt.assert_equal(index.query_rect(-1, 1, -1, 1), in_rect(positions, -1, 1, -1, 1))
+    npt.assert_equal(index.nearest((60, 60), k=3), [100, 101, 102])
+
+    # rebuilt once more than 5% are dirty
+    positions[:10_000, 1] += 1
+    index.mark_dirty(np.arange(10_000))
+    index.wait()
+    assert index.n_dirty == 0
+    npt.assert_equal(index.query_rect(-1, 1, -1, 1), in_rect(positions, -1, 1, -1, 1))
+
+
+def test_scatter_spatial_index(positions):
+    fig = fpl.Figure()
+    scatter = fig[0, 0].add_scatter(positions, spatial_index=True)
+    scatter.spatial_index.wait()
+
+    assert isinstance(scatter.spatial_index, SpatialIndex)
+
+    # data writes mark the written rows
+    scatter.data[:10] = [20, 20, 0]
+    scatter.data[10:20, 2] = 1
+    assert scatter.spatial_index.n_dirty == 10
+    npt.assert_equal(scatter.spatial_index.query_rect(19, 21, 19, 21), np.arange(10))
+
+    selector = scatter.add_rectangle_selector()
+    selector.selection = (-1, 1, -0.5, 2)
+    expected = in_rect(scatter.data.value, *selector.selection)
+    npt.assert_equal(selector.get_selected_indices(), expected)
+    npt.assert_equal(selector.get_selected_data(), scatter.data[expected])
+
+    # same selection without the spatial index
+    scatter.spatial_index = False
+    assert scatter.spatial_index is None
+    npt.assert_equal(selector.get_selected_indices(), expected)
+
+
+def test_scatter_cpu_picking(positions):
+    fig = fpl.Figure()
+    scatter = fig[0, 0].add_scatter(positions, picking="cpu")
+    scatter.spatial_index.wait()
+
+    assert not scatter.world_object.material.pick_write
+    with pytest.raises(ValueError):
+        scatter.spatial_index = False
+
+    fig.show()
+    fig[0, 0]._render()
+
+    # move a point under the pointer, away from the other points
+    x, y = fig[0, 0].viewport.rect[:2] + np.array(fig[0, 0].viewport.rect[2:]) / 2
+    world = fig[0, 0].map_screen_to_world((x, y))
+    scatter.data[:, :2] = scatter.data[:, :2] + 100
+    scatter.data[7, :2] = world[:2] + 1e-3
+
+    events = list()
+
+    @scatter.add_event_handler("pointer_move", "pointer_enter", "pointer_leave")
+    def handler(ev):
+        events.append((ev.type, ev.pick_info["vertex_index"]))
+
+    scatter._cpu_pick(pygfx.PointerEvent("pointer_move", x=x, y=y))
+    scatter._cpu_pick(pygfx.PointerEvent("pointer_move", x=x + 1, y=y))
+    # far from any point
+    scatter._cpu_pick(pygfx.PointerEvent("pointer_move", x=x + 50, y=y))
+
+    assert events == [
+        ("pointer_enter", 7),
+        ("pointer_move", 7),
+        ("pointer_move", 7),
+        ("pointer_leave", 7),
+    ]
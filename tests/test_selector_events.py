@@ -0,0 +1,161 @@
+import time
+
+import numpy as np
+import pytest
+
+import pygfx
+
+import fastplotlib as fpl
+
+
+@pytest.fixture
+def selector():
+    fig = fpl.Figure()
+    line = fig[0, 0].add_line(np.column_stack([np.arange(100), np.zeros(100)]))
+    return line.add_linear_region_selector()
+
+
+def drag(selector, values):
+    # same state as a pointer drag started on the selector
+    selector._move_start(selector.fill, pygfx.PointerEvent("pointer_down", x=0, y=0))
+    for v in values:
+        selector.selection = (v, v + 10)
+
+
+def record(selector):
+    events = list()
+
+    @selector.add_event_handler("selection")
+    def handler(ev):
+        events.append((ev.info["value"][0], ev.info["final"]))
+
+    return events
+
+
+def test_event_policy_every(selector):
+    events = record(selector)
+
+    drag(selector, [1, 2, 3])
+    selector._move_end(None)
+
+    assert events == [(1, False), (2, False), (3, False)]
+
+    # programmatic selections are emitted immediately
+    selector.selection = (5, 15)
+    assert events[-1] == (5, True)
+
+
+def test_event_policy_per_frame(selector):
+    selector.event_policy = "per_frame"
+    events = record(selector)
+
+    drag(selector, [1, 2, 3])
+    assert events == []
+
+    # the latest selection once per frame
+    selector._selection_event_frame()
+    selector._selection_event_frame()
+    assert events == [(3, False)]
+
+    selector.selection = (4, 14)
+    selector._selection_event_frame()
+    assert events == [(3, False), (4, False)]
+
+    # final selection on release
+    selector._move_end(None)
+    assert events[-1] == (4, True)
+    assert len(events) == 3
+
+    selector.selection = (6, 16)
+    assert events[-1] == (6, True)
+
+
+def test_event_policy_throttle(selector):
+    selector.event_policy = "throttle(50)"
+    events = record(selector)
+
+    drag(selector, [1, 2, 3])
+    # the first event of a drag is emitted immediately
+    assert events == [(1, False)]
+
+    time.sleep(0.06)
+    selector._selection_event_frame()
+    assert events == [(1, False), (3, False)]
+
+    selector._move_end(None)
+    assert events[-1] == (3, True)
+
+
+def test_event_policy_on_release(selector):
+    selector.event_policy = "on_release"
+    events = record(selector)
+
+    drag(selector, [1, 2, 3])
+    selector._selection_event_frame()
+    assert events == []
+
+    selector._move_end(None)
+    assert events == [(3, True)]
+
+    # no drag, the pointer is released without moving the selector
+    selector._move_end(None)
+    assert len(events) == 1
+
+
+@pytest.mark.parametrize("policy", ["always", "throttle", "throttle(-5)"])
+def test_event_policy_invalid(selector, policy):
+    with pytest.raises(ValueError):
+        selector.event_policy = policy
+
+
+def test_selector_manager():
+    fig = fpl.Figure()
+    subplot = fig[0, 0]
+    subplot.map_screen_to_world = lambda pos, allow_outside=False: np.array(
+        [pos.x, pos.y, 0]
+    )
+    renderer = subplot.renderer
+    n_handlers = len(renderer._event_handlers["pointer_move"])
+
+    line = subplot.add_line(np.column_stack([np.arange(100), np.zeros(100)]))
+    selectors = [
+        line.add_linear_region_selector(selection=(i, i + 1)) for i in range(20)
+    ]
+    manager = subplot._selector_manager
+    assert manager.selectors == tuple(selectors)
+
+    # registered once for all selectors
+    assert len(renderer._event_handlers["pointer_move"]) == n_handlers + 1
+
+    # pointer moves only move the dragged selector
+    selectors[3]._move_start(
+        selectors[3].fill, pygfx.PointerEvent("pointer_down", x=0, y=0)
+    )
+    renderer.dispatch_event(pygfx.PointerEvent("pointer_move", x=5, y=0))
+    renderer.dispatch_event(pygfx.PointerEvent("pointer_up", x=5, y=0))
+    renderer.dispatch_event(pygfx.PointerEvent("pointer_move", x=10, y=0))
+
+    np.testing.assert_allclose(selectors[3].selection, (8, 9))
+    for i in (0, 4, 19):
+        np.testing.assert_allclose(selectors[i].selection, (i, i + 1))
+    assert not selectors[3]._moving
+
+    # arrow keys only move selectors with arrow key movements enabled
+    selectors[5].arrow_key_events_enabled = True
+    renderer.dispatch_event(
+        pygfx.KeyboardEvent("key_down", key="ArrowRight", modifiers=("Shift",))
+    )
+    subplot._call_animate_functions(subplot._animate_funcs_pre)
+    renderer.dispatch_event(pygfx.KeyboardEvent("key_up", key="ArrowRight"))
+    subplot._call_animate_functions(subplot._animate_funcs_pre)
+
+    np.testing.assert_allclose(selectors[5].selection, (6, 7))
+    np.testing.assert_allclose(selectors[6].selection, (6, 7))
+
+    # handlers are removed with the last selector
+    for selector in selectors:
+        subplot.delete_graphic(selector)
+
+    assert manager.selectors == tuple()
+    assert len(renderer._event_handlers["pointer_move"]) == n_handlers
+    assert manager._animate not in subplot._animate_funcs_pre
@@ -0,0 +1,105 @@
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import fastplotlib as fpl
+from fastplotlib.graphics.features._summed_area_table import (
+    SummedAreaTable,
+    region_stats,
+)
+
+
+def assert_stats_equal(actual, desired):
+    assert actual.keys() == desired.keys()
+    npt.assert_equal(actual["count"], desired["count"])
+    npt.assert_allclose(actual["sum"], desired["sum"], rtol=1e-9)
+    npt.assert_allclose(actual["mean"], desired["mean"], rtol=1e-9)
+    # the variance is a difference of sums
+    npt.assert_allclose(actual["std"], desired["std"], rtol=1e-6, atol=1e-4)
+
+
+@pytest.fixture(params=[(300, 500), (300, 500, 3)])
+def image(request):
+    rng = np.random.default_rng(0)
+    image = rng.normal(1000, 5, request.param).astype(np.float32)
+    image[rng.random(request.param) < 0.01] = np.nan
+    return image
+
+
+regions = [
+    (slice(10, 50), slice(5, 80)),
+    (slice(0, 300), slice(0, 500)),
+    (slice(299, 300), slice(0, 1)),
+    (slice(5, 5), slice(0, 3)),
+]
+
+
+@pytest.mark.parametrize("background", [True, False])
+def test_summed_area_table(image, background):
+    table = SummedAreaTable(image, background=background)
+    assert not table.ready
+
+    # built on the first query, computed directly until it is ready
+    for rows, cols in regions:
+        assert_stats_equal(table.stats(rows, cols), region_stats(image[rows, cols]))
+
+    table.wait()
+    assert table.ready
+    for rows, cols in regions:
+        assert_stats_equal(table.stats(rows, cols), region_stats(image[rows, cols]))
+
+    empty = table.stats(slice(5, 5), slice(0, 3))
+    npt.assert_equal(empty["count"], 0)
+    assert np.isnan(empty["mean"]).all()
+
+    # small writes are patched
+    key = (slice(20, 30), [3, 9, 7])
+    region = table.written_region(key)
+    old_values = image[region].copy()
+    image[key] = 5
+    image[21, 3] = np.nan
+    table.mark_written(region, old_values)
+
+    assert table.n_patches == 1
+    for rows, cols in regions + [(slice(0, 25), slice(0, 8))]:
+        assert_stats_equal(table.stats(rows, cols), region_stats(image[rows, cols]))
+
+    # large writes are rebuilt
+    assert table.written_region(slice(None)) is None
+    image[:] += 1
+    table.mark_written(None, None)
+    assert not table.ready
+
+    rows, cols = regions[0]
+    assert_stats_equal(table.stats(rows, cols), region_stats(image[rows, cols]))
+    table.wait()
+    assert table.ready
+    assert_stats_equal(table.stats(rows, cols), region_stats(image[rows, cols]))
+
+
+def test_rectangle_selector_stats(image):
+    fig = fpl.Figure()
+    graphic = fig[0, 0].add_image(image, summed_area_table=True)
+    selector = graphic.add_rectangle_selector()
+    selector.selection = (20, 120.5, 10, 70)
+
+    expected = region_stats(selector.get_selected_data())
+    assert_stats_equal(selector.get_selected_stats(), expected)
+    graphic.data.summed_area_table.wait()
+    assert_stats_equal(selector.get_selected_stats(), expected)
+
+    # writes to the texture array are patched
+    graphic.data[30:40, 50:60] = 0
+    assert graphic.data.summed_area_table.n_patches == 1
+    assert_stats_equal(
+        selector.get_selected_stats(), region_stats(selector.get_selected_data())
+    )
+
+    graphic.data.summed_area_table = False
+    assert_stats_equal(
+        selector.get_selected_stats(), region_stats(selector.get_selected_data())
+    )
+
+    line = fig[0, 0].add_line(np.random.rand(10, 2))
+    with pytest.raises(TypeError):
+        selector.get_selected_stats(line)
@@ -0,0 +1,162 @@
+import os
+
+import numpy as np
+from numpy import testing as npt
+import pytest
+
+import fastplotlib as fpl
+from fastplotlib.widgets.image_widget import ChunkedArray, TemporalProjection
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).random((53, 20, 30)).astype(np.float32)
+
+
+@pytest.mark.parametrize("kind", ["mean", "max", "min", "std"])
+@pytest.mark.parametrize("chunked", [False, True])
+def test_projection(data, kind, chunked):
+    if chunked:
+        a = ChunkedArray(data, chunks=(8, 20, 30))
+    else:
+        a = data
+
+    projection = TemporalProjection(a, kind=kind, block_size=7)
+    projection.start()
+
+    assert projection.wait(timeout=10)
+    assert projection.progress == 1.0
+    assert projection.n_frames == data.shape[0]
+
+    npt.assert_allclose(
+        projection.result, getattr(np, kind)(data, axis=0), rtol=1e-5, atol=1e-6
+    )
+
+
+def test_blocks_follow_chunks(data):
+    a = ChunkedArray(data, chunks=(10, 20, 30))
+    projection = TemporalProjection(a)
+
+    npt.assert_equal(projection._block_bounds, [0, 10, 20, 30, 40, 50, 53])
+
+    projection = TemporalProjection(data, block_size=25)
+    npt.assert_equal(projection._block_bounds, [0, 25, 50, 53])
+
+
+def test_partial_result(data):
+    projection = TemporalProjection(data, kind="max", block_size=10)
+
+    assert projection.result is None
+
+    # process the first two blocks without starting the thread
+    projection._update(data[:10])
+    projection._update(data[10:20])
+
+    assert projection.n_frames == 20
+    assert not projection.done
+    npt.assert_allclose(projection.result, data[:20].max(axis=0))
+
+
+def test_disk_cache(data, tmp_path):
+    # nothing is written to disk by default
+    assert TemporalProjection(data).cache_path is None
+
+    projection = TemporalProjection(
+        data, kind="std", cache_dir=tmp_path, cache_key="data"
+    )
+    projection.start()
+    assert projection.wait(timeout=10)
+    assert not projection.from_cache
+    assert projection.cache_path.is_file()
+
+    cached = TemporalProjection(data, kind="std", cache_dir=tmp_path, cache_key="data")
+    cached.start()
+    assert cached.wait(timeout=10)
+    assert cached.from_cache
+    npt.assert_allclose(cached.result, projection.result)
+
+    # different data has a different fingerprint
+    other = TemporalProjection(
+        data + 1, kind="std", cache_dir=tmp_path, cache_key="data"
+    )
+    assert other.cache_path != projection.cache_path
+
+    # data that is not backed by a file requires a key
+    with pytest.raises(ValueError):
+        TemporalProjection(data, cache_dir=tmp_path)
+
+
+def test_disk_cache_file(data, tmp_path):
+    path = tmp_path.joinpath("data.npy")
+    np.save(path, data)
+    memmap = np.load(path, mmap_mode="r+")
+
+    projection = TemporalProjection(memmap, cache_dir=tmp_path)
+    projection.start()
+    assert projection.wait(timeout=10)
+    assert TemporalProjection(memmap, cache_dir=tmp_path).cache_path.is_file()
+
+    # editing the file invalidates the cached result, even if the sampled frames are unchanged
+    memmap[20:30] = 0
+    memmap.flush()
+    mtime = os.stat(path).st_mtime_ns + 10**9
+    os.utime(path, ns=(mtime, mtime))
+
+    edited = TemporalProjection(memmap, cache_dir=tmp_path)
+    assert edited.cache_path != projection.cache_path
+    edited.start()
+    assert edited.wait(timeout=10)
+    assert not edited.from_cache
+    npt.assert_allclose(edited.result, np.asarray(memmap).mean(axis=0), rtol=1e-5)
+
+
+def test_invalid_kind(data):
+    with pytest.raises(ValueError):
+        TemporalProjection(data, kind="median")
+
+
+@pytest.mark.skipif(not fpl.IMGUI, reason="ImageWidget requires imgui-bundle")
+def test_image_widget(data):
+    iw = fpl.ImageWidget(data, figure_shape=(1, 2))
+    subplot = iw.figure[0, 1]
+
+    def render():
+        iw.figure._call_animate_functions(iw.figure._animate_funcs_pre)
+
+    # several projections of the same data array in one subplot
+    projections = [
+        iw.add_projection("mean"),
+        iw.add_projection("mean", subplot=subplot),
+    ]
+    assert iw.projections == projections
+    assert len(subplot.graphics) == 2
+
+    for projection in projections:
+        assert projection.wait(timeout=10)
+    render()
+    for image in subplot.graphics:
+        npt.assert_allclose(image.data.value, data.mean(axis=0), rtol=1e-5)
+
+    # removing a projection cancels it and deletes its image
+    iw.remove_projection(projections[0])
+    assert iw.projections == projections[1:]
+    assert projections[0]._cancel.is_set()
+    assert len(subplot.graphics) == 1
+
+    with pytest.raises(KeyError):
+        iw.remove_projection(projections[0])
+
+    # projections of the data that is replaced are removed
+    iw.set_data(data[:20])
+    assert iw.projections == []
+    assert projections[1]._cancel.is_set()
+    assert len(subplot.graphics) == 0
+
+    # and can be added again
+    projection = iw.add_projection("max")
+    assert projection.wait(timeout=10)
+    render()
+    npt.assert_allclose(subplot.graphics[0].data.value, data[:20].max(axis=0))
+    assert iw.figure._animate_funcs_pre.count(iw._update_projections) == 1
+
+    projection.cancel()